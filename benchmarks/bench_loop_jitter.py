@@ -0,0 +1,92 @@
+#! /usr/bin/env python3
+
+"""Benchmark of the timing jitter of fast `QMI_LoopTask` loops with default and precise pacing.
+
+A loop task records the start time of each iteration. The jitter is the deviation of the
+interval between consecutive iterations from the loop period. The wake-up lateness is taken
+from the loop statistics of the task. Use `--cpu` and `--priority` to also apply a CPU affinity
+and a `SCHED_FIFO` priority to the precisely paced task (which needs the appropriate permission).
+
+Run from the repository root:
+
+    python -m benchmarks.bench_loop_jitter
+"""
+
+import argparse
+import logging
+import statistics
+import time
+
+from qmi.core.config_defs import CfgQmi, CfgContext
+from qmi.core.context import QMI_Context
+from qmi.core.task import QMI_LoopTask
+
+
+class _TimestampTask(QMI_LoopTask):
+    """Loop task which records the start time of each iteration."""
+
+    instances: dict[str, "_TimestampTask"] = {}
+
+    def __init__(self, task_runner, name, loop_period: float) -> None:
+        super().__init__(task_runner, name, loop_period)
+        self.timestamps: list[float] = []
+        _TimestampTask.instances[name] = self
+
+    def loop_iteration(self) -> None:
+        self.timestamps.append(time.monotonic())
+
+
+class _PreciseTimestampTask(_TimestampTask):
+    """Loop task which records the start time of each iteration, with precise pacing."""
+
+    precise_pacing = True
+
+
+def _measure(context: QMI_Context, name: str, task_class: type, period: float, duration: float) -> str:
+    """Run a loop task for the specified duration and return a line with its timing jitter."""
+    proxy = context.make_task(name, task_class, loop_period=period)
+    proxy.enable_loop_statistics(window=100_000)
+    with proxy:
+        time.sleep(duration)
+    stats = proxy.get_loop_statistics()
+    context.remove_rpc_object(proxy)
+
+    timestamps = _TimestampTask.instances[name].timestamps
+    errors = sorted(abs((t1 - t0) - period) * 1.0e6 for (t0, t1) in zip(timestamps, timestamps[1:]))
+    lateness = stats.wakeup_lateness
+    return (f"{name:>10}{len(timestamps):>10}{stats.missed_periods:>8}"
+            f"{statistics.mean(errors):>12.1f}{errors[int(0.99 * len(errors))]:>12.1f}{errors[-1]:>12.1f}"
+            f"{lateness.mean * 1.0e6:>14.1f}{lateness.max * 1.0e6:>14.1f}")
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark QMI_LoopTask pacing jitter.")
+    parser.add_argument("--rate", type=float, default=2000.0, help="loop rate in Hz")
+    parser.add_argument("--duration", type=float, default=5.0, help="measurement duration per task in seconds")
+    parser.add_argument("--cpu", type=int, default=None, help="CPU to which the precisely paced task is restricted")
+    parser.add_argument("--priority", type=int, default=None, help="SCHED_FIFO priority of the precisely paced task")
+    args = parser.parse_args()
+
+    if args.cpu is not None:
+        _PreciseTimestampTask.cpu_affinity = {args.cpu}
+    _PreciseTimestampTask.realtime_priority = args.priority
+
+    # Do not log each missed loop period.
+    logging.getLogger("qmi.core.task").setLevel(logging.ERROR)
+
+    period = 1.0 / args.rate
+    context = QMI_Context("bench_jitter", CfgQmi(contexts={"bench_jitter": CfgContext()}))
+    context.start()
+
+    try:
+        print(f"Loop period {period * 1.0e6:.1f} us")
+        print(f"{'pacing':>10}{'loops':>10}{'missed':>8}"
+              f"{'mean (us)':>12}{'p99 (us)':>12}{'max (us)':>12}{'late mean':>14}{'late max':>14}")
+        print(_measure(context, "default", _TimestampTask, period, args.duration))
+        print(_measure(context, "precise", _PreciseTimestampTask, period, args.duration))
+    finally:
+        context.stop()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,92 @@
+#! /usr/bin/env python3
+
+"""Benchmark of RPC latency and throughput between contexts on the same host.
+
+Two server contexts run in this process: one accepts same-host peer connections via
+a Unix domain socket, the other only via TCP. A client context connects to both
+through the loopback address, and calls RPC methods of an object in each server context.
+Large Numpy arrays are passed in shared memory over the Unix domain socket.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_peer_transport
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qmi.core.config_defs import CfgQmi, CfgContext
+from qmi.core.context import QMI_Context
+from qmi.core.rpc import QMI_RpcObject, rpc_method
+
+
+class _Echo(QMI_RpcObject):
+    """RPC object which returns data to the caller."""
+
+    @rpc_method
+    def ping(self) -> None:
+        pass
+
+    @rpc_method
+    def get_array(self, size: int) -> np.ndarray:
+        return np.ones(size, dtype=np.uint8)
+
+
+def _time_latency(proxy, num_calls: int) -> float:
+    """Return the mean duration of an RPC call without data in microseconds."""
+    tstart = time.perf_counter()
+    for _ in range(num_calls):
+        proxy.ping()
+    return (time.perf_counter() - tstart) / num_calls * 1e6
+
+
+def _time_throughput(proxy, size: int, num_calls: int) -> float:
+    """Return the rate at which arrays of the specified size are fetched, in MB/s."""
+    tstart = time.perf_counter()
+    for _ in range(num_calls):
+        proxy.get_array(size)
+    return size * num_calls / (time.perf_counter() - tstart) / 1e6
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark same-host peer transports.")
+    parser.add_argument("--calls", type=int, default=5000, help="number of RPC calls to measure latency")
+    parser.add_argument("--sizes", type=str, default="1000,100000,1000000,8000000",
+                        help="comma-separated array sizes in bytes to measure throughput")
+    parser.add_argument("--transfer", type=int, default=200_000_000,
+                        help="approximate number of bytes to transfer per array size")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    config = CfgQmi(contexts={
+        "bench_unix": CfgContext(tcp_server_port=0),
+        "bench_tcp": CfgContext(tcp_server_port=0, same_host_transport=False),
+        "bench_client": CfgContext()
+    })
+    contexts = [QMI_Context(name, config) for name in ("bench_unix", "bench_tcp", "bench_client")]
+    for context in contexts:
+        context.start()
+
+    try:
+        client = contexts[2]
+        proxies = {}
+        for server in contexts[:2]:
+            server.make_rpc_object("echo", _Echo)
+            client.connect_to_peer(server.name, f"127.0.0.1:{server.get_tcp_server_port()}")
+            proxies[server.name] = client.get_rpc_object_by_name(f"{server.name}.echo")
+
+        print(f"{'transport':>12}{'latency (us)':>14}" + "".join(f"{f'{size} B (MB/s)':>18}" for size in sizes))
+        for (label, name) in (("unix", "bench_unix"), ("tcp", "bench_tcp")):
+            proxy = proxies[name]
+            latency = _time_latency(proxy, args.calls)
+            rates = [_time_throughput(proxy, size, max(1, args.transfer // size)) for size in sizes]
+            print(f"{label:>12}{latency:>14.1f}" + "".join(f"{rate:>18.1f}" for rate in rates))
+    finally:
+        for context in reversed(contexts):
+            context.stop()
+
+
+if __name__ == "__main__":
+    run()
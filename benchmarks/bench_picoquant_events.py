@@ -0,0 +1,84 @@
+#! /usr/bin/env python3
+
+"""Benchmark of the PicoQuant TTTR event processing pipeline on synthetic T2 and T3 streams.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_picoquant_events
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from qmi.instruments.picoquant.support._decoders import EventDecoder, EventFilterMode, _T2EventDecoder, _T3EventDecoder
+from qmi.instruments.picoquant.support._events import _EventFilter
+from qmi.instruments.picoquant.support._realtime import _RealTimeHistogramProcessor, _SyncTracker
+from tests.instruments.picoquant.synthetic_data import make_t2_fifo_data, make_t3_fifo_data, split_blocks
+
+
+def _time_pipeline(blocks: list[np.ndarray],
+                   make_decoder: Callable[[], EventDecoder],
+                   use_filter: bool,
+                   use_histogram: bool,
+                   repeat: int
+                   ) -> tuple[float, int]:
+    """Run the pipeline over all blocks and return (best duration, number of decoded events)."""
+    best = float("inf")
+    num_events = 0
+    for _ in range(repeat):
+        decoder = make_decoder()
+        sync_tracker = _SyncTracker()
+        event_filter = _EventFilter()
+        event_filter.set_event_filter_config(
+            {0: EventFilterMode.APERTURE, 1: EventFilterMode.APERTURE, 64: EventFilterMode.APERTURE}, (100, 2000)
+        )
+        histogram = _RealTimeHistogramProcessor(lambda hist: None, lambda rate: None)
+        histogram.set_histogram_config([0, 1], 4, 1024, 100)
+        histogram.set_countrate_config((100, 2000), 100)
+
+        num_events = 0
+        tstart = time.perf_counter()
+        for block in blocks:
+            events = decoder.process_data(block)
+            num_events += len(events)
+            sync_info = sync_tracker.process(events)
+            if use_histogram:
+                histogram.process_events(events, sync_info)
+            if use_filter:
+                event_filter.process_events(events, sync_info)
+        best = min(best, time.perf_counter() - tstart)
+    return best, num_events
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark PicoQuant TTTR event processing.")
+    parser.add_argument("--events", type=int, default=2_000_000, help="number of synthetic events per stream")
+    parser.add_argument("--block-size", type=int, default=65536, help="number of FIFO records per read")
+    parser.add_argument("--repeat", type=int, default=3, help="number of repetitions; the best time is reported")
+    args = parser.parse_args()
+
+    streams = {
+        "T2": (make_t2_fifo_data(args.events), _T2EventDecoder),
+        "T3": (make_t3_fifo_data(args.events), lambda: _T3EventDecoder(sync_frequency_hz=5E6, resolution_ps=5.0)),
+    }
+    stages = {
+        "decode": (False, False),
+        "decode+filter": (True, False),
+        "decode+histogram": (False, True),
+        "decode+filter+histogram": (True, True),
+    }
+
+    print(f"{'stream':<8}{'stage':<26}{'events':>12}{'seconds':>10}{'Mevents/s':>12}")
+    for (stream_name, (fifo_data, make_decoder)) in streams.items():
+        blocks = split_blocks(fifo_data, args.block_size)
+        for (stage_name, (use_filter, use_histogram)) in stages.items():
+            duration, num_events = _time_pipeline(blocks, make_decoder, use_filter, use_histogram, args.repeat)
+            rate = num_events / duration / 1e6
+            print(f"{stream_name:<8}{stage_name:<26}{num_events:>12}{duration:>10.3f}{rate:>12.1f}")
+
+
+if __name__ == "__main__":
+    run()
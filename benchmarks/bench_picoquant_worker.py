@@ -0,0 +1,128 @@
+#! /usr/bin/env python3
+
+"""Benchmark of sustained PicoQuant event fetching with in-thread processing versus the decoder worker process.
+
+A synthetic FIFO, served from memory as fast as it is read, feeds the complete event fetching
+thread, including filtering, real-time histograms and collection of the pending events.
+Optionally, additional Python threads keep the GIL busy to mimic the rest of an application.
+The worker process can only improve the event rate if a spare CPU core is available.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_picoquant_worker
+"""
+
+import argparse
+import threading
+import time
+
+import numpy as np
+
+from qmi.instruments.picoquant.support._decoders import EventFilterMode, SYNC_TYPE
+from qmi.instruments.picoquant.support._events import _EventProcessor, _FetchEventsThread, _MODE
+from tests.instruments.picoquant.synthetic_data import make_t2_fifo_data, split_blocks
+
+
+class _SyntheticFifo:
+    """Serve blocks of FIFO data from memory."""
+
+    def __init__(self, blocks: list[np.ndarray]) -> None:
+        self._blocks = blocks
+        self._pos = 0
+
+    def read_fifo(self, fifo_data: np.ndarray) -> int:
+        if self._pos >= len(self._blocks):
+            return 0
+        block = self._blocks[self._pos]
+        self._pos += 1
+        fifo_data[:len(block)] = block
+        return len(block)
+
+
+def _busy_loop(stop: threading.Event) -> None:
+    """Keep the GIL busy with pure Python work."""
+    while not stop.is_set():
+        sum(range(1000))
+
+
+_EVENT_FILTER = ({0: EventFilterMode.APERTURE, 1: EventFilterMode.APERTURE, SYNC_TYPE: EventFilterMode.APERTURE},
+                 (100, 2000))
+
+
+def _count_filtered_events(blocks: list[np.ndarray]) -> int:
+    """Return the number of events that pass the event filter."""
+    processor = _EventProcessor(lambda hist: None, lambda rate: None, lambda corr: None)
+    processor.set_event_filter_config(*_EVENT_FILTER)
+    processor.activate(_MODE.T2, 5E6, 1.0)
+    num_events = 0
+    for block in blocks:
+        (_event_records, filtered_records) = processor.process_data(block, True)
+        assert filtered_records is not None
+        num_events += len(filtered_records)
+    return num_events
+
+
+def _time_fetching(blocks: list[np.ndarray],
+                   block_size: int,
+                   num_filtered_events: int,
+                   use_worker_process: bool,
+                   load_threads: int
+                   ) -> float:
+    """Fetch all blocks through the event fetching thread and return the duration."""
+    fifo = _SyntheticFifo(blocks)
+    thread = _FetchEventsThread(fifo.read_fifo, block_size, lambda hist: None, lambda rate: None, lambda corr: None,
+                                use_worker_process=use_worker_process)
+    thread.set_event_filter_config(*_EVENT_FILTER)
+    thread.set_histogram_config([0, 1], 4, 1024, 100)
+    thread.start()
+
+    stop_load = threading.Event()
+    loaders = [threading.Thread(target=_busy_loop, args=(stop_load,), daemon=True) for _ in range(load_threads)]
+    for loader in loaders:
+        loader.start()
+
+    try:
+        if use_worker_process:
+            # Let the worker process start up before the measurement.
+            time.sleep(2.0)
+        tstart = time.perf_counter()
+        thread.activate(_MODE.T2)
+        # Wait until all blocks are processed.
+        while thread.get_event_buffer_status().pending_events < num_filtered_events:
+            time.sleep(0.001)
+        duration = time.perf_counter() - tstart
+        thread.deactivate()
+    finally:
+        stop_load.set()
+        for loader in loaders:
+            loader.join()
+        thread.shutdown()
+        thread.join()
+    return duration
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark PicoQuant event fetching with and without worker process.")
+    parser.add_argument("--events", type=int, default=5_000_000, help="number of synthetic events")
+    parser.add_argument("--block-size", type=int, default=1 << 20, help="number of FIFO records per read")
+    parser.add_argument("--load-threads", type=int, default=1, help="number of Python threads competing for the GIL")
+    parser.add_argument("--repeat", type=int, default=3, help="number of repetitions; the best time is reported")
+    args = parser.parse_args()
+
+    fifo_data = make_t2_fifo_data(args.events)
+    blocks = split_blocks(fifo_data, args.block_size)
+    num_filtered_events = _count_filtered_events(blocks)
+
+    print(f"{'mode':<12}{'load threads':>14}{'events':>12}{'seconds':>10}{'Mevents/s':>12}")
+    for load_threads in sorted({0, args.load_threads}):
+        for (mode_name, use_worker_process) in (("in-thread", False), ("worker", True)):
+            duration = min(
+                _time_fetching(blocks, args.block_size, num_filtered_events, use_worker_process, load_threads)
+                for _ in range(args.repeat)
+            )
+            rate = args.events / duration / 1e6
+            print(f"{mode_name:<12}{load_threads:>14}{args.events:>12}{duration:>10.3f}{rate:>12.1f}")
+
+
+if __name__ == "__main__":
+    run()
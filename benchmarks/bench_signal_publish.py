@@ -0,0 +1,86 @@
+#! /usr/bin/env python3
+
+"""Benchmark of signal publishing throughput with several threads publishing concurrently.
+
+Each publishing thread publishes its own signal, as separate tasks do, and every signal
+has local subscribers. Use `--subscribers 0` to measure the cost of publishing without subscribers.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_signal_publish
+"""
+
+import argparse
+import threading
+import time
+
+from qmi.core.config_defs import CfgQmi, CfgContext
+from qmi.core.context import QMI_Context
+from qmi.core.pubsub import QMI_Signal, QMI_SignalReceiver
+from qmi.core.rpc import QMI_RpcObject
+
+
+class _Publisher(QMI_RpcObject):
+    """RPC object which publishes one signal."""
+
+    instances: dict[str, "_Publisher"] = {}
+
+    sig_value = QMI_Signal([int])
+
+    def __init__(self, context: QMI_Context, name: str) -> None:
+        super().__init__(context, name)
+        _Publisher.instances[name] = self
+
+
+def _time_publishing(publishers: list[_Publisher], num_signals: int) -> float:
+    """Publish `num_signals` signals from each publisher in its own thread and return the duration."""
+    barrier = threading.Barrier(len(publishers) + 1)
+
+    def publish(publisher: _Publisher) -> None:
+        barrier.wait()
+        for i in range(num_signals):
+            publisher.sig_value.publish(i)
+
+    threads = [threading.Thread(target=publish, args=(publisher,)) for publisher in publishers]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    tstart = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - tstart
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark concurrent signal publishing.")
+    parser.add_argument("--signals", type=int, default=50_000, help="number of signals per publishing thread")
+    parser.add_argument("--threads", type=str, default="1,2,4,8", help="comma-separated numbers of threads")
+    parser.add_argument("--subscribers", type=int, default=2, help="number of local receivers per signal")
+    parser.add_argument("--repeat", type=int, default=3, help="number of repetitions; the best time is reported")
+    args = parser.parse_args()
+
+    thread_counts = [int(count) for count in args.threads.split(",")]
+    context = QMI_Context("bench_publisher", CfgQmi(contexts={"bench_publisher": CfgContext()}))
+    context.start()
+
+    try:
+        publishers = []
+        for index in range(max(thread_counts)):
+            name = f"pub{index}"
+            context.make_rpc_object(name, _Publisher)
+            publisher = context.get_rpc_object_by_name(f"bench_publisher.{name}")
+            for _ in range(args.subscribers):
+                publisher.sig_value.subscribe(QMI_SignalReceiver(max_queue_length=1000))
+            publishers.append(_Publisher.instances[name])
+
+        print(f"{'threads':>8}{'signals':>12}{'seconds':>10}{'ksignals/s':>12}")
+        for num_threads in thread_counts:
+            duration = min(_time_publishing(publishers[:num_threads], args.signals) for _ in range(args.repeat))
+            total = num_threads * args.signals
+            print(f"{num_threads:>8}{total:>12}{duration:>10.3f}{total / duration / 1e3:>12.1f}")
+    finally:
+        context.stop()
+
+
+if __name__ == "__main__":
+    run()
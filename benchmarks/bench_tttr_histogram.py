@@ -0,0 +1,91 @@
+#! /usr/bin/env python3
+
+"""Benchmark of `MultiChannelTttrHistogram` against the previous single-channel `TttrHistogram` implementation.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_tttr_histogram
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from qmi.instruments.picoquant.support._decoders import SYNC_TYPE
+from qmi.instruments.picoquant.support._realtime import MultiChannelTttrHistogram
+from tests.instruments.picoquant.synthetic_data import make_t2_events
+
+
+class _LegacyTttrHistogram:
+    """The `TttrHistogram` implementation before the rewrite, for comparison."""
+
+    def __init__(self, channel: int, numbins: int) -> None:
+        self.channel = channel
+        self.bin_edges = np.arange(numbins + 1)
+        self.counts = np.zeros(numbins, dtype=np.uint64)
+        self.previous = None
+
+    def process(self, events: np.ndarray) -> None:
+        if self.previous is not None:
+            events = np.insert(events, 0, (SYNC_TYPE, self.previous))
+        first_sync_index, = np.where(events["type"] == SYNC_TYPE)
+        if len(first_sync_index) == 0:
+            return
+        first_sync_index = first_sync_index[0]
+        if first_sync_index != 0:
+            events = events[first_sync_index:]
+        idx = np.where(events["type"] == SYNC_TYPE)
+        timestamps = events["timestamp"][idx]
+        increments = np.insert(np.diff(timestamps), 0, events["timestamp"][0])
+        most_recent_synctime = np.zeros_like(events["timestamp"])
+        most_recent_synctime[idx] = increments
+        most_recent_synctime = np.cumsum(most_recent_synctime)
+        deltas = events["timestamp"] - most_recent_synctime
+        deltas = deltas[events["type"] == self.channel]
+        deltas = deltas[deltas < len(self.counts)]
+        hist, _ = np.histogram(deltas, self.bin_edges)
+        self.counts += hist.astype(np.uint64)
+        self.previous = most_recent_synctime[-1]
+
+
+def _time_blocks(blocks: list[np.ndarray], make_histograms: Callable[[], list], repeat: int) -> float:
+    """Process all blocks with fresh histogram objects and return the best duration."""
+    best = float("inf")
+    for _ in range(repeat):
+        histograms = make_histograms()
+        tstart = time.perf_counter()
+        for block in blocks:
+            for histogram in histograms:
+                histogram.process(block)
+        best = min(best, time.perf_counter() - tstart)
+    return best
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark TTTR histogram accumulation.")
+    parser.add_argument("--events", type=int, default=2_000_000, help="number of synthetic events")
+    parser.add_argument("--block-size", type=int, default=65536, help="number of events per block")
+    parser.add_argument("--bins", type=int, default=2500, help="number of histogram bins")
+    parser.add_argument("--repeat", type=int, default=3, help="number of repetitions; the best time is reported")
+    args = parser.parse_args()
+
+    print(f"{'implementation':<28}{'channels':>10}{'events':>12}{'seconds':>10}{'Mevents/s':>12}")
+    for num_channels in (1, 4, 8):
+        channels = list(range(num_channels))
+        events = make_t2_events(args.events, channels=tuple(channels))
+        blocks = [events[pos:pos + args.block_size] for pos in range(0, len(events), args.block_size)]
+        implementations = {
+            "legacy (one per channel)": lambda: [_LegacyTttrHistogram(chan, args.bins) for chan in channels],
+            "multi-channel": lambda: [MultiChannelTttrHistogram(channels, args.bins)],
+            "multi-channel, bin_width 4": lambda: [MultiChannelTttrHistogram(channels, args.bins // 4, 4)],
+        }
+        for (name, make_histograms) in implementations.items():
+            duration = _time_blocks(blocks, make_histograms, args.repeat)
+            rate = len(events) / duration / 1e6
+            print(f"{name:<28}{num_channels:>10}{len(events):>12}{duration:>10.3f}{rate:>12.1f}")
+
+
+if __name__ == "__main__":
+    run()
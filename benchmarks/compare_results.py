@@ -0,0 +1,100 @@
+#! /usr/bin/env python3
+
+"""Compare two result files of the QMI core benchmark suite.
+
+For each measurement present in both files, the relative change from the baseline is
+shown, where a positive change is an improvement: a higher rate or a shorter duration.
+Changes worse than the threshold are marked as regressions.
+
+Run from the repository root:
+
+    python -m benchmarks.compare_results baseline.json results.json --threshold 10
+
+With `--fail-on-regression`, the exit status is 1 when any measurement regressed.
+"""
+
+import argparse
+import json
+import sys
+
+
+def relative_change(baseline: float, value: float, higher_is_better: bool) -> float:
+    """Return the improvement of `value` relative to `baseline` in percent (negative for a regression)."""
+    if baseline == 0.0:
+        return 0.0
+    change = (value - baseline) / baseline * 100.0
+    return change if higher_is_better else -change
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> tuple[list[str], int]:
+    """Compare benchmark results.
+
+    Parameters:
+        baseline: Contents of the baseline result file.
+        current: Contents of the result file to compare with the baseline.
+        threshold: Relative change in percent beyond which a change is reported as a regression or improvement.
+
+    Returns:
+        Tuple (lines, num_regressions) with the lines of the comparison table and the number of regressions.
+    """
+    lines = [f"{'measurement':<40}{'baseline':>14}{'current':>14}{'change':>10}  unit"]
+    num_regressions = 0
+    baseline_results = baseline["results"]
+    current_results = current["results"]
+    for name in sorted(set(baseline_results) | set(current_results)):
+        if name not in current_results:
+            lines.append(f"{name:<40}{baseline_results[name]['value']:>14.2f}{'-':>14}{'':>10}  (missing)")
+            continue
+        if name not in baseline_results:
+            lines.append(f"{name:<40}{'-':>14}{current_results[name]['value']:>14.2f}{'':>10}  (new)")
+            continue
+
+        old = baseline_results[name]
+        new = current_results[name]
+        change = relative_change(old["value"], new["value"], new["higher_is_better"])
+        if change < -threshold:
+            mark = "  REGRESSION"
+            num_regressions += 1
+        elif change > threshold:
+            mark = "  improved"
+        else:
+            mark = ""
+        lines.append(f"{name:<40}{old['value']:>14.2f}{new['value']:>14.2f}{change:>+9.1f}%  {new['unit']}{mark}")
+
+    return (lines, num_regressions)
+
+
+def _describe(result: dict) -> str:
+    commit = result.get("git_commit") or "unknown commit"
+    return f"QMI {result['qmi_version']} ({commit[:12]}), Python {result['python_version']}, {result['timestamp']}"
+
+
+def run() -> int:
+    parser = argparse.ArgumentParser(description="Compare two QMI benchmark result files.")
+    parser.add_argument("baseline", type=str, help="baseline result file")
+    parser.add_argument("current", type=str, help="result file to compare with the baseline")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="relative change in percent which counts as a regression (default: 10)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit with status 1 on any regression")
+    args = parser.parse_args()
+
+    with open(args.baseline, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    with open(args.current, encoding="utf-8") as current_file:
+        current = json.load(current_file)
+
+    print(f"baseline: {_describe(baseline)}")
+    print(f"current:  {_describe(current)}")
+    if baseline.get("platform") != current.get("platform"):
+        print("warning: the results were measured on different platforms")
+    print()
+
+    (lines, num_regressions) = compare(baseline, current, args.threshold)
+    print("\n".join(lines))
+    print()
+    print(f"{num_regressions} regressions beyond {args.threshold:.0f}%")
+    return 1 if (num_regressions and args.fail_on_regression) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -0,0 +1,418 @@
+#! /usr/bin/env python3
+
+"""Benchmark suite for QMI core messaging, RPC and publish/subscribe.
+
+The suite measures, entirely within this process and over the loopback interface:
+
+* RPC latency and pipelined throughput within one context, and between contexts via
+  TCP and via the same-host Unix domain socket, and the transfer rate of large payloads;
+* transfer of large Numpy arrays (skipped when Numpy is not installed);
+* signal publishing with many local receivers, and signal delivery to another context;
+* the time to start a context with many RPC objects and stop it again;
+* the read paths of `QMI_TcpTransport` against a local server.
+
+Results are written as JSON, with the median of several repetitions of each measurement,
+so that runs on different QMI versions can be compared with `benchmarks.compare_results`.
+
+Run from the repository root:
+
+    python -m benchmarks.core_suite --output results.json
+    python -m benchmarks.compare_results baseline.json results.json
+
+Use `--quick` for a short run with fewer iterations, and `--only` to select groups of benchmarks,
+e.g. `--only rpc,signal`.
+"""
+
+import argparse
+import collections
+import datetime
+import json
+import logging
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Callable
+from typing import NamedTuple
+
+import qmi
+from qmi.core.config_defs import CfgQmi, CfgContext
+from qmi.core.context import QMI_Context
+from qmi.core.pubsub import QMI_Signal, QMI_SignalReceiver
+from qmi.core.rpc import QMI_RpcObject, rpc_method
+from qmi.core.transport import QMI_TcpTransport
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Version of the format of the JSON output.
+RESULT_FORMAT = 1
+
+
+class Measurement(NamedTuple):
+    """Result of one measurement.
+
+    Attributes:
+        value: Measured value.
+        unit: Unit of the value.
+        higher_is_better: True for rates, False for durations.
+    """
+    value: float
+    unit: str
+    higher_is_better: bool
+
+
+def _latency(value: float) -> Measurement:
+    """Return a latency measurement in microseconds from a value in seconds."""
+    return Measurement(value * 1.0e6, "us", False)
+
+
+def _rate(value: float, unit: str) -> Measurement:
+    return Measurement(value, unit, True)
+
+
+class _Echo(QMI_RpcObject):
+    """RPC object which returns data to the caller."""
+
+    @rpc_method
+    def ping(self) -> None:
+        pass
+
+    @rpc_method
+    def get_bytes(self, size: int) -> bytes:
+        return bytes(size)
+
+    @rpc_method
+    def get_array(self, size: int):
+        return np.ones(size, dtype=np.uint8)
+
+
+class _Publisher(QMI_RpcObject):
+    """RPC object which publishes a signal."""
+
+    instances: dict[str, "_Publisher"] = {}
+
+    sig_value = QMI_Signal([int])
+
+    def __init__(self, context: QMI_Context, name: str) -> None:
+        super().__init__(context, name)
+        _Publisher.instances[name] = self
+
+
+class _Contexts:
+    """Server contexts which accept peer connections via a Unix domain socket or only via TCP,
+    and a client context connected to both.
+    """
+
+    def __init__(self) -> None:
+        config = CfgQmi(contexts={
+            "bench_unix": CfgContext(tcp_server_port=0),
+            "bench_tcp": CfgContext(tcp_server_port=0, same_host_transport=False),
+            "bench_client": CfgContext()
+        })
+        self.unix_server = QMI_Context("bench_unix", config)
+        self.tcp_server = QMI_Context("bench_tcp", config)
+        self.client = QMI_Context("bench_client", config)
+        for context in (self.unix_server, self.tcp_server, self.client):
+            context.start()
+        for server in (self.unix_server, self.tcp_server):
+            server.make_rpc_object("echo", _Echo)
+            self.client.connect_to_peer(server.name, f"127.0.0.1:{server.get_tcp_server_port()}")
+
+    def stop(self) -> None:
+        for context in (self.client, self.tcp_server, self.unix_server):
+            context.stop()
+
+
+def _time_calls(proxy, num_calls: int) -> float:
+    """Return the mean duration of a blocking RPC call without data."""
+    tstart = time.perf_counter()
+    for _ in range(num_calls):
+        proxy.ping()
+    return (time.perf_counter() - tstart) / num_calls
+
+
+def _time_pipelined_calls(proxy, num_calls: int, window: int = 32) -> float:
+    """Return the rate of non-blocking RPC calls without data, with up to `window` calls in progress.
+
+    The number of calls in progress is bounded because a peer connection reads and writes
+    in one thread: with too many unanswered requests, both sides can block on a full socket buffer.
+    """
+    tstart = time.perf_counter()
+    futures: collections.deque = collections.deque()
+    for _ in range(num_calls):
+        if len(futures) == window:
+            futures.popleft().wait()
+        futures.append(proxy.rpc_nonblocking.ping())
+    for future in futures:
+        future.wait()
+    return num_calls / (time.perf_counter() - tstart)
+
+
+def _time_transfer(call: Callable[[int], object], size: int, num_calls: int) -> float:
+    """Return the rate at which payloads of the specified size are fetched, in MB/s."""
+    tstart = time.perf_counter()
+    for _ in range(num_calls):
+        call(size)
+    return size * num_calls / (time.perf_counter() - tstart) / 1.0e6
+
+
+def bench_rpc(contexts: _Contexts, scale: float) -> dict[str, Measurement]:
+    """RPC latency and throughput within a context and to other contexts."""
+    num_calls = max(100, int(5000 * scale))
+    proxies = {
+        "local": contexts.unix_server.get_rpc_object_by_name("bench_unix.echo"),
+        "unix": contexts.client.get_rpc_object_by_name("bench_unix.echo"),
+        "tcp": contexts.client.get_rpc_object_by_name("bench_tcp.echo")
+    }
+    results = {}
+    for (label, proxy) in proxies.items():
+        results[f"rpc.{label}.latency"] = _latency(_time_calls(proxy, num_calls))
+        results[f"rpc.{label}.pipelined_rate"] = _rate(_time_pipelined_calls(proxy, num_calls), "calls/s")
+        for size in (1000, 1_000_000):
+            rate = _time_transfer(proxy.get_bytes, size, max(5, int(min(2000, 100_000_000 // size) * scale)))
+            results[f"rpc.{label}.bytes_{size}"] = _rate(rate, "MB/s")
+    return results
+
+
+def bench_numpy(contexts: _Contexts, scale: float) -> dict[str, Measurement]:
+    """Transfer rate of large Numpy arrays between contexts."""
+    if np is None:
+        return {}
+    results = {}
+    for (label, name) in (("unix", "bench_unix.echo"), ("tcp", "bench_tcp.echo")):
+        proxy = contexts.client.get_rpc_object_by_name(name)
+        for size in (1_000_000, 8_000_000):
+            rate = _time_transfer(proxy.get_array, size, max(5, int(200_000_000 // size * scale)))
+            results[f"numpy.{label}.array_{size}"] = _rate(rate, "MB/s")
+    return results
+
+
+def _wait_for_signals(receiver: QMI_SignalReceiver, count: int) -> None:
+    """Take the specified number of signals from the receiver."""
+    received = 0
+    while received < count:
+        signals = receiver.get_signals(timeout=10.0)
+        if not signals:
+            raise RuntimeError(f"Timeout after receiving {received} of {count} signals")
+        received += len(signals)
+
+
+def bench_signals(contexts: _Contexts, scale: float) -> dict[str, Measurement]:
+    """Signal publishing to many local receivers, and signal delivery to another context."""
+    num_signals = max(1000, int(20_000 * scale))
+    results = {}
+
+    server = contexts.unix_server
+    name = f"pub{len(_Publisher.instances)}"
+    server.make_rpc_object(name, _Publisher)
+    publisher = _Publisher.instances[name]
+
+    # Fan-out to local receivers.
+    local_proxy = server.get_rpc_object_by_name(f"{server.name}.{name}")
+    for num_receivers in (1, 16):
+        receivers = [QMI_SignalReceiver(max_queue_length=num_signals) for _ in range(num_receivers)]
+        for receiver in receivers:
+            local_proxy.sig_value.subscribe(receiver)
+        tstart = time.perf_counter()
+        for i in range(num_signals):
+            publisher.sig_value.publish(i)
+        duration = time.perf_counter() - tstart
+        for receiver in receivers:
+            local_proxy.sig_value.unsubscribe(receiver)
+        results[f"signal.local_fanout_{num_receivers}.publish_rate"] = _rate(num_signals / duration, "signals/s")
+
+    # Delivery to a receiver in another context.
+    remote_proxy = contexts.client.get_rpc_object_by_name(f"{server.name}.{name}")
+    receiver = QMI_SignalReceiver(max_queue_length=num_signals)
+    remote_proxy.sig_value.subscribe(receiver)
+    publisher.sig_value.publish(-1)
+    _wait_for_signals(receiver, 1)
+    tstart = time.perf_counter()
+    for i in range(num_signals):
+        publisher.sig_value.publish(i)
+    _wait_for_signals(receiver, num_signals)
+    duration = time.perf_counter() - tstart
+    remote_proxy.sig_value.unsubscribe(receiver)
+    results["signal.remote.delivery_rate"] = _rate(num_signals / duration, "signals/s")
+
+    # Latency of a single signal to another context.
+    receiver = QMI_SignalReceiver()
+    remote_proxy.sig_value.subscribe(receiver)
+    publisher.sig_value.publish(-1)
+    _wait_for_signals(receiver, 1)
+    num_pings = max(100, int(2000 * scale))
+    tstart = time.perf_counter()
+    for i in range(num_pings):
+        publisher.sig_value.publish(i)
+        receiver.get_next_signal(timeout=10.0)
+    remote_proxy.sig_value.unsubscribe(receiver)
+    results["signal.remote.latency"] = _latency((time.perf_counter() - tstart) / num_pings)
+    return results
+
+
+def bench_context_startup(scale: float) -> dict[str, Measurement]:
+    """Time to start a context, create RPC objects and stop the context."""
+    results = {}
+    for num_objects in (0, 100):
+        tstart = time.perf_counter()
+        context = QMI_Context("bench_startup", CfgQmi(contexts={"bench_startup": CfgContext(tcp_server_port=0)}))
+        context.start()
+        for index in range(num_objects):
+            context.make_rpc_object(f"echo{index}", _Echo)
+        tstarted = time.perf_counter()
+        context.stop()
+        tstopped = time.perf_counter()
+        results[f"context.objects_{num_objects}.start"] = Measurement((tstarted - tstart) * 1.0e3, "ms", False)
+        results[f"context.objects_{num_objects}.stop"] = Measurement((tstopped - tstarted) * 1.0e3, "ms", False)
+    return results
+
+
+class _InstrumentServer(threading.Thread):
+    """TCP server which answers a text query with a short line, or a block query with binary data."""
+
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self._server = socket.create_server(("127.0.0.1", 0))
+        self.port = self._server.getsockname()[1]
+
+    def run(self) -> None:
+        (conn, _) = self._server.accept()
+        with conn:
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            buf = b""
+            while True:
+                data = conn.recv(4096)
+                if not data:
+                    break
+                buf += data
+                while b"\n" in buf:
+                    (line, buf) = buf.split(b"\n", 1)
+                    if line.startswith(b"BLOCK "):
+                        conn.sendall(bytes(int(line[6:])))
+                    else:
+                        conn.sendall(b"+1.23456789E-03\n")
+        self._server.close()
+
+
+def bench_transport(scale: float) -> dict[str, Measurement]:
+    """Query latency and block read rate of a TCP transport to a local server."""
+    server = _InstrumentServer()
+    server.start()
+    transport = QMI_TcpTransport("127.0.0.1", server.port)
+    transport.open()
+    results = {}
+    try:
+        num_queries = max(100, int(5000 * scale))
+        tstart = time.perf_counter()
+        for _ in range(num_queries):
+            transport.write(b"MEAS?\n")
+            transport.read_until(b"\n", timeout=5.0)
+        results["transport.tcp.query_latency"] = _latency((time.perf_counter() - tstart) / num_queries)
+
+        for size in (10_000, 1_000_000):
+            num_blocks = max(5, int(min(1000, 100_000_000 // size) * scale))
+            tstart = time.perf_counter()
+            for _ in range(num_blocks):
+                transport.write(b"BLOCK %d\n" % size)
+                transport.read(size, timeout=5.0)
+            duration = time.perf_counter() - tstart
+            results[f"transport.tcp.read_{size}"] = _rate(size * num_blocks / duration / 1.0e6, "MB/s")
+    finally:
+        transport.close()
+        server.join()
+    return results
+
+
+def _git_commit() -> str | None:
+    """Return the commit hash of the source tree, if it is a git repository."""
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=5.0,
+                                check=True)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip()
+
+
+def run_suite(repeat: int, scale: float, groups: list[str] | None = None) -> dict:
+    """Run the benchmarks and return the results, ready to be written as JSON.
+
+    Parameters:
+        repeat: Number of repetitions of each benchmark; the median is reported.
+        scale: Factor applied to the number of iterations of each measurement.
+        groups: Optional names of the groups of benchmarks to run; by default all groups are run.
+    """
+    contexts = _Contexts()
+    benchmarks: list[tuple[str, Callable[[], dict[str, Measurement]]]] = [
+        ("rpc", lambda: bench_rpc(contexts, scale)),
+        ("numpy", lambda: bench_numpy(contexts, scale)),
+        ("signal", lambda: bench_signals(contexts, scale)),
+        ("context", lambda: bench_context_startup(scale)),
+        ("transport", lambda: bench_transport(scale))
+    ]
+
+    samples: dict[str, list[Measurement]] = {}
+    try:
+        for (group, benchmark) in benchmarks:
+            if groups is not None and group not in groups:
+                continue
+            for _ in range(repeat):
+                for (name, measurement) in benchmark().items():
+                    samples.setdefault(name, []).append(measurement)
+    finally:
+        contexts.stop()
+
+    results = {}
+    for (name, measurements) in samples.items():
+        results[name] = {
+            "value": statistics.median(m.value for m in measurements),
+            "unit": measurements[0].unit,
+            "higher_is_better": measurements[0].higher_is_better,
+            "samples": [m.value for m in measurements]
+        }
+
+    return {
+        "format": RESULT_FORMAT,
+        "qmi_version": qmi.__version__,
+        "git_commit": _git_commit(),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy_version": None if np is None else np.__version__,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "repeat": repeat,
+        "scale": scale,
+        "results": results
+    }
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark QMI core messaging, RPC and pubsub.")
+    parser.add_argument("--output", type=str, default=None, help="JSON output file (default: standard output)")
+    parser.add_argument("--repeat", type=int, default=3, help="number of repetitions; the median is reported")
+    parser.add_argument("--quick", action="store_true", help="run with 10 times fewer iterations")
+    parser.add_argument("--only", type=str, default=None,
+                        help="comma-separated groups to run (rpc, numpy, signal, context, transport)")
+    args = parser.parse_args()
+
+    # Do not log warnings about e.g. signal queue overflow during the measurements.
+    logging.getLogger("qmi").setLevel(logging.ERROR)
+
+    groups = None if args.only is None else args.only.split(",")
+    result = run_suite(args.repeat, 0.1 if args.quick else 1.0, groups)
+    text = json.dumps(result, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(text + "\n")
+        for (name, entry) in result["results"].items():
+            print(f"{name:<40}{entry['value']:>14.2f} {entry['unit']}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    run()
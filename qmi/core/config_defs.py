@@ -21,6 +21,10 @@ class CfgLogging:
         burst_limit:      Maximum number of log messages than can be logged to file in a short burst.
         max_bytes:        Maximum size of a log file in bytes. Default is 10GB = 10 * 2**30.
         backup_count:     Number of backup files to be used. Default is 5.
+        async_logging:    True to write messages to the log file from a background thread via a bounded queue.
+        async_queue_size: Maximum number of messages waiting to be written with asynchronous logging.
+                          Further messages are dropped and counted until the queue has room again.
+        json_lines:       True to write each message to the log file as a single-line JSON object.
     """
     loglevel:         str            = "INFO"
     console_loglevel: str            = "WARNING"
@@ -30,6 +34,9 @@ class CfgLogging:
     burst_limit:      int            = 1
     max_bytes:        int            = 10 * 2**30
     backup_count:     int            = 5
+    async_logging:    bool           = False
+    async_queue_size: int            = 10000
+    json_lines:       bool           = False
 
 
 @configstruct
@@ -45,6 +52,10 @@ class CfgContext:
         program_args:     Optional arguments passed when starting this context.
         python_path:      Optional Python search path (overrides $PYTHONPATH).
         virtualenv_path:  Optional path to virtual environment to activate.
+        same_host_transport: True to accept and make connections with peer contexts on the same host
+                          via a Unix domain socket instead of TCP, where the platform supports it.
+        trace_file:       Optional path of a file to which spans of traced RPC calls are appended
+                          (see `qmi.core.tracing`), or None to disable tracing.
     """
     host:             str | None = None
     tcp_server_port:  int | None = None
@@ -54,6 +65,8 @@ class CfgContext:
     program_args:     list[str]  = field(default_factory=list)
     python_path:      str | None = None
     virtualenv_path:  str | None = None
+    same_host_transport: bool    = True
+    trace_file:       str | None = None
 
 
 @configstruct
@@ -25,11 +25,12 @@ from qmi.core.exceptions import QMI_UsageException, QMI_DuplicateNameException,
 from qmi.core.instrument import QMI_Instrument
 from qmi.core.messaging import MessageRouter, QMI_Message, QMI_MessageHandlerAddress, \
     QMI_MessageHandler
-from qmi.core.pubsub import SignalManager, QMI_SignalReceiver
+from qmi.core.pubsub import SignalManager, QMI_RegisteredSignal, QMI_SignalReceiver, SignalFilter
 from qmi.core.rpc import QMI_RpcObject, QMI_RpcProxy, RpcObjectManager, rpc_method, \
     RpcObjectDescriptor, \
-    make_interface_descriptor, QMI_LockTokenDescriptor
+    make_interface_descriptor, QMI_LockTokenDescriptor, QMI_RpcMethodStatistics, RpcStatistics
 from qmi.core.task import QMI_Task, QMI_TaskRunner
+from qmi.core.tracing import QMI_Tracer
 from qmi.core.udp_responder_packets import unpack_qmi_udp_packet, \
     QMI_UdpResponderContextInfoRequestPacket, \
     QMI_UdpResponderContextInfoResponsePacket
@@ -165,6 +166,16 @@ class _ContextRpcObject(QMI_RpcObject):
         """Get an RPC descriptor for the object with the given name."""
         return self._context.get_rpc_object_descriptor(rpc_object_name)
 
+    @rpc_method
+    def get_rpc_statistics(self) -> list[QMI_RpcMethodStatistics]:
+        """Return timing statistics of the RPC methods called in or from this context."""
+        return self._context.get_rpc_statistics()
+
+    @rpc_method
+    def reset_rpc_statistics(self) -> None:
+        """Discard the RPC timing statistics collected so far by this context."""
+        self._context.reset_rpc_statistics()
+
     @rpc_method
     def get_pid(self) -> int:
         """Return process ID of Python program."""
@@ -220,6 +231,8 @@ class QMI_Context:
 
     Attributes:
         DEFAULT_UDP_RESPONDER_PORT: Default port number for UDP responses.
+        rpc_statistics: Timing statistics of RPC method calls (for internal use within QMI).
+        tracer: Tracer which records spans of RPC calls, or None if tracing is disabled (for internal use within QMI).
     """
 
     DEFAULT_UDP_RESPONDER_PORT = 35999
@@ -283,6 +296,12 @@ class QMI_Context:
         self._signal_manager = SignalManager(self)
         self._message_router.set_peer_context_callbacks(None, self._signal_manager.handle_peer_context_removed)
 
+        # Timing statistics of RPC method calls handled and made by this context.
+        self.rpc_statistics = RpcStatistics()
+
+        # Tracer for RPC calls, created when the context starts if enabled in the configuration.
+        self.tracer: QMI_Tracer | None = None
+
         # Create RPC object to answer queries about this context.
         self._internal_make_rpc_object("$context", _ContextRpcObject)
 
@@ -523,13 +542,23 @@ class QMI_Context:
         if self._used:
             raise QMI_UsageException("Can not start QMI_Context a second time")
 
+        # Start recording spans of RPC calls if tracing is enabled.
+        ctxcfg = self.get_context_config()
+        if ctxcfg.trace_file:
+            self.tracer = QMI_Tracer(ctxcfg.trace_file, self.name)
+            self.tracer.start()
+            self._message_router.tracer = self.tracer
+
         # Start message router.
         self._message_router.start()
 
         # Start TCP server if a TCP server port is specified in the configuration.
-        ctxcfg = self.get_context_config()
+        # Peer contexts on the same host may connect via a Unix domain socket instead.
+        self._message_router.same_host_transport = ctxcfg.same_host_transport
         if ctxcfg.tcp_server_port is not None:
             self._message_router.start_tcp_server(ctxcfg.tcp_server_port)
+            if ctxcfg.same_host_transport:
+                self._message_router.start_unix_server()
 
         # The UDP responder is mandatory.
         self._message_router.start_udp_responder(self.DEFAULT_UDP_RESPONDER_PORT)
@@ -564,6 +593,7 @@ class QMI_Context:
             del stop_handler
 
         self._message_router.stop()
+        self._signal_manager.stop()
 
         with self._rpc_object_map_lock:
 
@@ -583,6 +613,12 @@ class QMI_Context:
             self.unregister_message_handler(manager)
             manager.stop()
 
+        # Write remaining spans to the trace file.
+        if self.tracer is not None:
+            self._message_router.tracer = None
+            self.tracer.stop()
+            self.tracer = None
+
         # Update number of active contexts.
         _active_context_counter.dec()
 
@@ -804,6 +840,24 @@ class QMI_Context:
                 return rpc_object.rpc_object_descriptor
         return None
 
+    def get_rpc_statistics(self) -> list[QMI_RpcMethodStatistics]:
+        """Return timing statistics of the RPC methods called in or from this context.
+
+        There is one entry per RPC method that was called. For methods of local RPC objects,
+        the entry contains the queue wait time and execution time of the calls.
+        For methods called via a proxy in this context, it contains the round-trip time of the calls.
+
+        This method may safely be called from any thread.
+        """
+        return self.rpc_statistics.get_statistics()
+
+    def reset_rpc_statistics(self) -> None:
+        """Discard the RPC timing statistics collected so far.
+
+        This method may safely be called from any thread.
+        """
+        self.rpc_statistics.reset()
+
     def make_unique_address(self, prefix: str) -> QMI_MessageHandlerAddress:
         """Generate a unique message handler address with a specified prefix."""
         with self._unique_counters_lock:
@@ -1211,13 +1265,23 @@ class QMI_Context:
         publisher_context: str,
         publisher_name: str,
         signal_name: str,
-        receiver: QMI_SignalReceiver
+        receiver: QMI_SignalReceiver,
+        max_rate: float | None = None,
+        signal_filter: SignalFilter | None = None
     ) -> None:
         """Subscribe to a specified signal.
 
         While subscribed, the SignalReceiver object will receive and queue
         all published signals of the specified type.
 
+        A conflating subscription is made by specifying `max_rate`. The publishing
+        context then sends at most `max_rate` signals per second to this context,
+        skipping intermediate values but always sending the most recent value.
+        This is useful for displaying the latest value of a signal that is
+        published at a high rate.
+
+        With `signal_filter`, the publishing context only sends signals which pass the filter.
+
         A SignalReceiver object can be simultaneously subscribed to multiple
         signals (from different publishers). Similarly, multiple receivers
         can be simultaneously subscribed to the same signal. However, it
@@ -1232,8 +1296,11 @@ class QMI_Context:
             publisher_name:    Name of the publisher of the signal (e.g. instrument name).
             signal_name:       Name of the signal to subscribe to.
             receiver:          A SignalReceiver object which will receive the published signals.
+            max_rate:          Optional maximum number of signals per second for a conflating subscription.
+            signal_filter:     Optional `SignalFilter` applied by the publishing context.
         """
-        self._signal_manager.subscribe_signal(publisher_context, publisher_name, signal_name, receiver)
+        self._signal_manager.subscribe_signal(publisher_context, publisher_name, signal_name, receiver,
+                                              max_rate, signal_filter)
 
     def unsubscribe_signal(
         self,
@@ -1268,3 +1335,14 @@ class QMI_Context:
             args:           Additional data to send along with the signal.
         """
         self._signal_manager.publish_signal(publisher_name, signal_name, args)
+
+    def publish_registered_signal(self, signal: QMI_RegisteredSignal, args: tuple) -> None:
+        """Publish a signal of a local RPC object to the QMI network.
+
+        This is used internally by `QMI_RegisteredSignal.publish()`.
+
+        Parameters:
+            signal: Registered signal of an RPC object in this context.
+            args:   Data to send along with the signal.
+        """
+        self._signal_manager.publish_registered_signal(signal, args)
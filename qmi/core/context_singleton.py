@@ -224,7 +224,10 @@ def _init_logging() -> None:
         rate_limit=cfg.logging.rate_limit,
         burst_limit=cfg.logging.burst_limit,
         max_bytes=cfg.logging.max_bytes,
-        backup_count=cfg.logging.backup_count
+        backup_count=cfg.logging.backup_count,
+        async_logging=cfg.logging.async_logging,
+        async_queue_size=cfg.logging.async_queue_size,
+        json_lines=cfg.logging.json_lines
     )
 
 
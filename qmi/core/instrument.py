@@ -129,7 +129,25 @@ class QMI_Instrument(QMI_RpcObject):
         self._check_is_open()
         self._is_open = False
 
+    @rpc_method
+    def get_transport_statistics(self) -> "QMI_TransportStatistics | None":
+        """Return connection statistics of the instrument transport.
+
+        Statistics are only available for drivers which keep their transport in the `_transport`
+        attribute, and only for transports which collect statistics (for example
+        `QMI_ResilientTcpTransport`).
+
+        Returns:
+            Transport statistics, or None if the transport does not collect statistics.
+        """
+        transport = getattr(self, "_transport", None)
+        get_statistics = getattr(transport, "get_statistics", None)
+        if get_statistics is None:
+            return None
+        return get_statistics()
+
 
 # Imports needed only for static typing.
 if TYPE_CHECKING:
     import qmi.core.context
+    from qmi.core.transport import QMI_TransportStatistics
@@ -13,7 +13,9 @@ Logging framework can be configured using the "logging" and "log_dir" sections o
             "qmi.core.task": "ERROR"
         },
         "max_bytes": 1000000,
-        "backup_count": 2
+        "backup_count": 2,
+        "async_logging": true,
+        "json_lines": false
     },
     # Directory to write various log files.
     "log_dir": "${qmi_home}/log_dir",
@@ -27,8 +29,17 @@ setting is overridden with module-specific settings, for modules `qmi.core.rpc`
 
 The default [`log levels`](https://docs.python.org/3/library/logging.html#logging-levels) for QMI are "INFO" for the
 log file and "WARNING" for the console. The standard log file name is 'qmi.log'.
+
+With "async_logging" enabled, log messages for the log file are put in a bounded queue and written to the file
+by a background thread, in batches. This keeps formatting, file rotation checks and disk writes out of the threads
+that log the messages. When the queue is full, messages are dropped and counted; the number of dropped messages is
+reported in the log file. With "json_lines" enabled, the log file contains one JSON object per message.
 """
+import atexit
+import datetime
+import json
 import os.path
+import queue
 import sys
 import logging
 import logging.handlers
@@ -46,6 +57,10 @@ _file_handler: logging.FileHandler | None = None
 # Global variable holding the saved exception hook.
 _saved_except_hook: Callable | None = None
 
+# Global variables holding the queue handler and writer thread for asynchronous logging (if enabled).
+_queue_handler: "_DroppingQueueHandler | None" = None
+_log_writer: "_LogWriterThread | None" = None
+
 
 class _RateLimitFilter(logging.Filter):
     """Rate limiting of log messages.
@@ -128,6 +143,152 @@ class WatchedRotatingFileHandler(logging.handlers.RotatingFileHandler, logging.h
 
         super().emit(record)  # RotatingFileHandler, handles the log file rotation if log file full.
 
+    def handle_batch(self, records: list[logging.LogRecord]) -> None:
+        """Write a batch of log records, checking the log file only once and flushing once at the end."""
+        self.acquire()
+        try:
+            self.reopenIfNeeded()
+            if not os.path.isdir(self._basedir):
+                os.makedirs(self._basedir)
+            for record in records:
+                if not self.filter(record):
+                    continue
+                try:
+                    if self.shouldRollover(record):
+                        self.doRollover()
+                    if self.stream is None:
+                        self.stream = self._open()
+                    self.stream.write(self.format(record) + self.terminator)
+                except Exception:
+                    self.handleError(record)
+            if self.stream is not None:
+                self.stream.flush()
+        finally:
+            self.release()
+
+
+class _JsonLineFormatter(logging.Formatter):
+    """Log formatter which formats each log record as a single-line JSON object."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        timestamp = datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc)
+        entry = {
+            "time": timestamp.isoformat(timespec="milliseconds"),
+            "process": record.process,
+            "thread": record.threadName,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry)
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Log handler which puts log records in a bounded queue, and drops them when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self._dropped_lock = threading.Lock()
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge the message arguments and render the exception traceback, since these may refer to objects
+        # that change before the record is written. Unlike the default implementation, leave all other
+        # formatting to the writer thread.
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+
+class _LogWriterThread(threading.Thread):
+    """Background thread which writes queued log records to the log file in batches."""
+
+    MAX_BATCH_SIZE = 256
+
+    def __init__(self, log_queue: queue.Queue, queue_handler: _DroppingQueueHandler,
+                 file_handler: WatchedRotatingFileHandler) -> None:
+        super().__init__(name="QMI_LogWriter", daemon=True)
+        self._queue = log_queue
+        self._queue_handler = queue_handler
+        self._file_handler = file_handler
+        self._reported_dropped = 0
+
+    def run(self) -> None:
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            while len(batch) < self.MAX_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # A None entry is the request to stop, after writing the records before it.
+            records = []
+            for record in batch:
+                if record is None:
+                    running = False
+                    break
+                records.append(record)
+
+            # Report messages that were dropped because the queue was full.
+            dropped = self._queue_handler.dropped
+            if dropped > self._reported_dropped:
+                records.append(logging.makeLogRecord({
+                    "name": __name__,
+                    "levelno": logging.WARNING,
+                    "levelname": logging.getLevelName(logging.WARNING),
+                    "msg": "%d log messages dropped because the log queue was full",
+                    "args": (dropped - self._reported_dropped,)
+                }))
+                self._reported_dropped = dropped
+
+            if records:
+                self._file_handler.handle_batch(records)
+
+    def stop(self) -> None:
+        """Write all queued log records, then stop the thread."""
+        self._queue.put(None)
+        self.join()
+
+
+def get_dropped_log_messages() -> int:
+    """Return the number of log messages dropped because the asynchronous logging queue was full."""
+    hdlr = _queue_handler
+    return 0 if hdlr is None else hdlr.dropped
+
+
+def _stop_async_logging() -> None:
+    """Write all queued log messages and stop asynchronous logging (if enabled)."""
+    global _queue_handler  # noqa: PLW0603
+    global _log_writer  # noqa: PLW0603
+
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _log_writer is not None:
+        _log_writer.stop()
+        _log_writer = None
+
+
+atexit.register(_stop_async_logging)
+
 
 def _makeLogFormatter(log_process: bool) -> logging.Formatter:
     """Create and return a log formatter instance."""
@@ -154,7 +315,11 @@ def start_logging(
     rate_limit: float | None = None,
     burst_limit: int = 1,
     max_bytes: int = 10 * 2**30,
-    backup_count: int = 5
+    backup_count: int = 5,
+    *,
+    async_logging: bool = False,
+    async_queue_size: int = 10000,
+    json_lines: bool = False
 ) -> None:
     """Initialize the Python logging framework for use by QMI.
 
@@ -179,12 +344,18 @@ def start_logging(
         burst_limit:      Maximum number of messages that can be "saved up" for a short burst of messages.
         max_bytes:        Maximum size of a log file in bytes. Default is 10GB = 10 * 2**30.
         backup_count:     Number of backup files to be used. Default is 5.
+        async_logging:    True to write messages to the log file from a background thread.
+        async_queue_size: Maximum number of messages waiting to be written with asynchronous logging.
+        json_lines:       True to write each message to the log file as a single-line JSON object.
     """
 
     global _file_handler  # noqa: PLW0603
     global _saved_except_hook  # noqa: PLW0603
+    global _queue_handler  # noqa: PLW0603
+    global _log_writer  # noqa: PLW0603
 
     # If there is still an old file log handler, remove it.
+    _stop_async_logging()
     if _file_handler is not None:
         logging.getLogger().removeHandler(_file_handler)
         _file_handler.close()
@@ -211,12 +382,21 @@ def start_logging(
         # This handler will automatically create or re-open the log file if the underlying
         # file is removed, renamed or reached its maximum size, for example as part of log rotation.
         _file_handler = WatchedRotatingFileHandler(logfile, delay=True, maxBytes=max_bytes, backupCount=backup_count)
-        fmt = _makeLogFormatter(log_process=True)
+        fmt = _JsonLineFormatter() if json_lines else _makeLogFormatter(log_process=True)
         _file_handler.setFormatter(fmt)
+        if async_logging:
+            # Log to a bounded queue, written to file by a background thread.
+            log_queue: queue.Queue = queue.Queue(maxsize=async_queue_size)
+            _queue_handler = _DroppingQueueHandler(log_queue)
+            _log_writer = _LogWriterThread(log_queue, _queue_handler, _file_handler)
+            _log_writer.start()
+            log_handler: logging.Handler = _queue_handler
+        else:
+            log_handler = _file_handler
         # Configure rate limiting.
         if rate_limit is not None:
-            _file_handler.addFilter(_RateLimitFilter(rate_limit, burst_limit))
-        logging.getLogger().addHandler(_file_handler)
+            log_handler.addFilter(_RateLimitFilter(rate_limit, burst_limit))
+        logging.getLogger().addHandler(log_handler)
 
     # Set log levels of specific loggers.
     if loglevels:
@@ -8,14 +8,19 @@ import asyncio
 import copy
 import fnmatch
 import functools
+import ipaddress
 import logging
+import mmap
 import os
 import pickle
 import random
 import socket
 import sys
+import tempfile
 import threading
 import time
+from array import array
+from collections import deque
 from collections.abc import Callable
 from typing import Generic, NamedTuple, TypeVar
 
@@ -26,6 +31,7 @@ from qmi.core.exceptions import (
     QMI_DuplicateNameException, QMI_UnknownNameException
 )
 from qmi.core.thread import QMI_Thread
+from qmi.core.tracing import QMI_TraceContext, QMI_Tracer, SpanKind, make_child_trace_context
 from qmi.core.udp_responder_packets import (
     unpack_qmi_udp_packet,
     QMI_UdpResponderContextInfoRequestPacket,
@@ -38,6 +44,12 @@ from qmi.core.util import format_address_and_port, parse_address_and_port
 # Global variable holding the logger for this module.
 _logger = logging.getLogger(__name__)
 
+# Peer contexts on the same host can connect via a Unix domain socket instead of TCP.
+_SAME_HOST_TRANSPORT_SUPPORTED = hasattr(socket, "AF_UNIX") and (sys.platform != "win32")
+
+# Large buffers in messages sent via a Unix domain socket are passed in anonymous shared memory files.
+_SHARED_MEMORY_SUPPORTED = _SAME_HOST_TRANSPORT_SUPPORTED and hasattr(os, "memfd_create")
+
 
 # Full address of a message handler, including its context name.
 class QMI_MessageHandlerAddress(NamedTuple):
@@ -87,9 +99,15 @@ class QMI_RequestMessage(QMI_Message):
     Attributes:
         request_id: Unique ID for this message.
             Automatically initialized to a random 64-bit integer.
+        trace_context: Optional `QMI_TraceContext` of the span which sent the request.
+            This attribute is only set when the request is part of a trace; use
+            ``getattr(message, "trace_context", None)`` to read it. An unset attribute is
+            not pickled, which keeps messages compatible with contexts without tracing support.
     """
 
-    __slots__ = ("request_id",)
+    __slots__ = ("request_id", "trace_context")
+
+    trace_context: QMI_TraceContext | None
 
     def __init__(self,
                  source_address: QMI_MessageHandlerAddress,
@@ -113,9 +131,13 @@ class QMI_ReplyMessage(QMI_Message):
 
     Attributes:
         request_id: Request ID of the `QMI_RequestMessage` to which this message is a reply.
+        trace_context: Optional `QMI_TraceContext` of the span which handled the request.
+            As for `QMI_RequestMessage`, this attribute is only set when the request is part of a trace.
     """
 
-    __slots__ = ("request_id",)
+    __slots__ = ("request_id", "trace_context")
+
+    trace_context: QMI_TraceContext | None
 
     def __init__(self,
                  source_address: QMI_MessageHandlerAddress,
@@ -599,8 +621,12 @@ class _PeerTcpConnection(_SocketWrapper):
         self.local_address = sock.getsockname()
         self.peer_address = None  # type: tuple[str, int] | None
         self._peer_address_str = "[unknown]"
+        self._init_peer_address()
+
+    def _init_peer_address(self) -> None:
+        """Determine the address of the peer, if possible."""
         try:
-            self.peer_address = sock.getpeername()
+            self.peer_address = self._sock.getpeername()
             self._peer_address_str = format_address_and_port(self.peer_address)
         except OSError:
             # Maybe connection already broke - then we don't know the peer address.
@@ -679,7 +705,7 @@ class _PeerTcpConnection(_SocketWrapper):
 
         assert self._socket_manager is not None
 
-        incoming_data = self._sock.recv(4096)
+        incoming_data = self._recv_data()
         if len(incoming_data) == 0:
             # Connection closed by other side.
             _logger.debug("Connection to %s (%s) closed by peer", self._peer_address_str, self.peer_context_name)
@@ -694,36 +720,52 @@ class _PeerTcpConnection(_SocketWrapper):
 
         # Consume any complete messages from the receive buffer.
         while True:
-
-            if len(self._recv_buf) < 1:
+            frame = self._take_frame()
+            if frame is None:
                 break
+            (packed_message, buffers) = frame
+            self._process_message(packed_message, buffers)
 
-            if self._recv_buf[0] != ord(b'P'):
-                raise QMI_RuntimeException("Protocol violation (got {!r} while expecting 'P')"
-                                           .format(self._recv_buf[0:1]))
+    def _recv_data(self) -> bytes:
+        """Receive available data from the socket."""
+        return self._sock.recv(4096)
 
-            if len(self._recv_buf) < 9:
-                break
+    def _take_frame(self) -> tuple[bytearray, list[memoryview]] | None:
+        """Remove the next complete message from the receive buffer.
 
-            pickled_message_size = int.from_bytes(self._recv_buf[1:9], byteorder='little')
+        Returns:
+            Tuple (packed_message, buffers) where `buffers` are the out-of-band buffers of the
+            pickled message, or None if the receive buffer does not yet contain a complete message.
+        """
 
-            if pickled_message_size > self.MAX_MESSAGE_SIZE:
-                # Protocol violation.
-                raise QMI_RuntimeException(f'Protocol packet too big ({pickled_message_size})')
+        if len(self._recv_buf) < 1:
+            return None
 
-            if len(self._recv_buf) < 9 + pickled_message_size:
-                break
+        if self._recv_buf[0] != ord(b'P'):
+            raise QMI_RuntimeException("Protocol violation (got {!r} while expecting 'P')"
+                                       .format(self._recv_buf[0:1]))
+
+        if len(self._recv_buf) < 9:
+            return None
+
+        pickled_message_size = int.from_bytes(self._recv_buf[1:9], byteorder='little')
+
+        if pickled_message_size > self.MAX_MESSAGE_SIZE:
+            # Protocol violation.
+            raise QMI_RuntimeException(f'Protocol packet too big ({pickled_message_size})')
 
-            packed_message = self._recv_buf[9:9 + pickled_message_size]
-            self._recv_buf = self._recv_buf[9 + pickled_message_size:]
+        if len(self._recv_buf) < 9 + pickled_message_size:
+            return None
 
-            self._process_message(packed_message)
+        packed_message = self._recv_buf[9:9 + pickled_message_size]
+        self._recv_buf = self._recv_buf[9 + pickled_message_size:]
+        return (packed_message, [])
 
-    def _process_message(self, packed_message: bytearray) -> None:
+    def _process_message(self, packed_message: bytearray, buffers: list[memoryview] | None = None) -> None:
         """Called when a message has been received from the socket."""
 
         # This may fail.
-        message = pickle.loads(packed_message)
+        message = pickle.loads(packed_message, buffers=buffers)
         if not isinstance(message, QMI_Message):
             raise ValueError("Expected QMI_Message")
 
@@ -803,6 +845,34 @@ class _PeerTcpConnection(_SocketWrapper):
                 message.destination_address.object_id
             )
 
+        # Serialize the message and send it.
+        tracer = self._message_router.tracer
+        trace_context = getattr(message, "trace_context", None)
+        if (tracer is None) or (trace_context is None):
+            self._send_serialized(message)
+        else:
+            start_time = time.monotonic()
+            self._send_serialized(message)
+            tracer.record_span("qmi.send",
+                               SpanKind.INTERNAL,
+                               make_child_trace_context(trace_context),
+                               start_time,
+                               time.monotonic(),
+                               {"qmi.peer_context": str(self.peer_context_name),
+                                "qmi.message_type": type(message).__name__})
+
+        # In case of a request message, add the message to the pending request table.
+        if isinstance(message, QMI_RequestMessage):
+            if message.request_id in self._pending_requests:
+                _logger.warning("Duplicate request_id %r in message to %r",
+                                message.request_id,
+                                message.destination_address)
+            else:
+                self._pending_requests[message.request_id] = (message.source_address, message.destination_address)
+
+    def _send_serialized(self, message: QMI_Message) -> None:
+        """Serialize the message and send it via the socket."""
+
         # Serialize the message.
         pickled_message = pickle.dumps(message)
 
@@ -816,15 +886,6 @@ class _PeerTcpConnection(_SocketWrapper):
         # Send the message via TCP.
         self._sock.sendall(pickled_message)
 
-        # In case of a request message, add the message to the pending request table.
-        if isinstance(message, QMI_RequestMessage):
-            if message.request_id in self._pending_requests:
-                _logger.warning("Duplicate request_id %r in message to %r",
-                                message.request_id,
-                                message.destination_address)
-            else:
-                self._pending_requests[message.request_id] = (message.source_address, message.destination_address)
-
     def send_handshake(self) -> None:
         """Send an initial handshake message to the remote side."""
         message = QMI_InitialHandshakeMessage(
@@ -907,6 +968,185 @@ class _PeerTcpConnection(_SocketWrapper):
         assert self.peer_context_name is not None
 
 
+
+def _same_host_socket_path(tcp_server_port: int) -> str:
+    """Return the path of the Unix domain socket of the context with the specified TCP server port.
+
+    The TCP server port identifies a context uniquely on its host. The Unix domain socket
+    is named after it, so that peer contexts can find it from the TCP address of the context.
+    """
+    return os.path.join(tempfile.gettempdir(), f"qmi_peer_{tcp_server_port}.sock")
+
+
+def _is_local_host(host: str) -> bool:
+    """Return True if the specified host name or IP address refers to the local host."""
+    try:
+        addresses = {str(info[4][0]) for info in socket.getaddrinfo(host, None)}
+        if any(ipaddress.ip_address(address.split("%")[0]).is_loopback for address in addresses):
+            return True
+        local_addresses = {str(info[4][0]) for info in socket.getaddrinfo(socket.gethostname(), None)}
+    except (OSError, ValueError):
+        return False
+    return not addresses.isdisjoint(local_addresses)
+
+
+class _PeerUnixConnection(_PeerTcpConnection):
+    """Encapsulates a Unix domain socket connection to a peer context on the same host.
+
+    Messages are framed in the same way as for TCP connections, except that
+    large buffers in a message (for example the data of Numpy arrays) are not copied
+    into the pickled message. Instead, each such buffer is copied into an anonymous
+    shared memory file, of which the file descriptor is passed through the socket.
+    The receiving side maps the file into memory and unpickles the message directly
+    from the mapped buffers.
+    """
+
+    # Buffers of at least this size (in bytes) are passed in shared memory.
+    SHARED_BUFFER_THRESHOLD = 65536
+
+    # Maximum number of shared memory buffers in one message.
+    # Any further buffers are serialized as part of the pickled message.
+    MAX_SHARED_BUFFERS = 64
+
+    def __init__(self,
+                 message_router: 'MessageRouter',
+                 sock: socket.socket,
+                 peer_context_alias: str,
+                 is_incoming: bool
+                 ) -> None:
+        super().__init__(message_router, sock, peer_context_alias, is_incoming)
+
+        # Received file descriptors of shared memory buffers, not yet claimed by a message.
+        self._recv_fds: deque[int] = deque()
+
+    def _init_peer_address(self) -> None:
+        """Determine the address of the peer, if possible."""
+        # The address of a Unix domain socket is a path; the accepting side has an unnamed peer.
+        try:
+            self._peer_address_str = "unix:" + (self._sock.getpeername() or self._sock.getsockname())
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        """Detach from the event loop, close the wrapped socket and any unclaimed shared memory files."""
+        super().close()
+        while self._recv_fds:
+            os.close(self._recv_fds.popleft())
+
+    def _recv_data(self) -> bytes:
+        """Receive available data and any passed file descriptors from the socket."""
+        fd_size = array("i").itemsize
+        (data, ancdata, msg_flags, _address) = self._sock.recvmsg(
+            65536,
+            socket.CMSG_SPACE(self.MAX_SHARED_BUFFERS * fd_size)
+        )
+        for (cmsg_level, cmsg_type, cmsg_data) in ancdata:
+            if (cmsg_level == socket.SOL_SOCKET) and (cmsg_type == socket.SCM_RIGHTS):
+                fds = array("i")
+                fds.frombytes(cmsg_data[:len(cmsg_data) - (len(cmsg_data) % fd_size)])
+                self._recv_fds.extend(fds)
+        if msg_flags & socket.MSG_CTRUNC:
+            raise QMI_RuntimeException("Protocol violation (too many shared memory buffers)")
+        return data
+
+    def _take_frame(self) -> tuple[bytearray, list[memoryview]] | None:
+        """Remove the next complete message from the receive buffer.
+
+        A message with shared memory buffers has header 'S', followed by the size
+        of the pickled message (8 bytes) and the number of buffers (4 bytes).
+        """
+
+        if (len(self._recv_buf) < 1) or (self._recv_buf[0] != ord(b'S')):
+            return super()._take_frame()
+
+        if len(self._recv_buf) < 13:
+            return None
+
+        pickled_message_size = int.from_bytes(self._recv_buf[1:9], byteorder='little')
+        num_buffers = int.from_bytes(self._recv_buf[9:13], byteorder='little')
+
+        if pickled_message_size > self.MAX_MESSAGE_SIZE:
+            # Protocol violation.
+            raise QMI_RuntimeException(f'Protocol packet too big ({pickled_message_size})')
+
+        if len(self._recv_buf) < 13 + pickled_message_size:
+            return None
+
+        # The file descriptors are passed along with the first byte of the message.
+        if len(self._recv_fds) < num_buffers:
+            raise QMI_RuntimeException("Protocol violation (missing shared memory buffers)")
+
+        packed_message = self._recv_buf[13:13 + pickled_message_size]
+        self._recv_buf = self._recv_buf[13 + pickled_message_size:]
+        fds = [self._recv_fds.popleft() for _ in range(num_buffers)]
+        buffers = []
+        try:
+            for fd in fds:
+                # The mapping stays alive as long as the unpickled objects refer to it.
+                buffers.append(memoryview(mmap.mmap(fd, os.fstat(fd).st_size)))
+        finally:
+            for fd in fds:
+                os.close(fd)
+        return (packed_message, buffers)
+
+    def _send_serialized(self, message: QMI_Message) -> None:
+        """Serialize the message and send it via the socket, passing large buffers in shared memory."""
+
+        if not _SHARED_MEMORY_SUPPORTED:
+            super()._send_serialized(message)
+            return
+
+        shared_buffers: list[memoryview] = []
+
+        def buffer_callback(buf: pickle.PickleBuffer) -> bool:
+            # Return True to serialize the buffer as part of the pickled message.
+            if len(shared_buffers) >= self.MAX_SHARED_BUFFERS:
+                return True
+            try:
+                raw = buf.raw()
+            except BufferError:
+                # Non-contiguous buffer.
+                return True
+            if raw.nbytes < self.SHARED_BUFFER_THRESHOLD:
+                return True
+            shared_buffers.append(raw)
+            return False
+
+        # Serialize the message.
+        pickled_message = pickle.dumps(message, protocol=5, buffer_callback=buffer_callback)
+
+        pickled_message_size = len(pickled_message)
+        if pickled_message_size > self.MAX_MESSAGE_SIZE:
+            raise ValueError("Message exceeds maximum size")
+
+        if not shared_buffers:
+            self._sock.sendall(b'P' + pickled_message_size.to_bytes(8, byteorder='little') + pickled_message)
+            return
+
+        # Copy each large buffer into an anonymous shared memory file.
+        fds: list[int] = []
+        try:
+            for raw in shared_buffers:
+                fd = os.memfd_create("qmi_buffer", os.MFD_CLOEXEC)
+                fds.append(fd)
+                os.ftruncate(fd, raw.nbytes)
+                with mmap.mmap(fd, raw.nbytes) as shm:
+                    shm[:] = raw
+
+            # Send the message with the file descriptors attached to its first byte.
+            data = (b'S'
+                    + pickled_message_size.to_bytes(8, byteorder='little')
+                    + len(fds).to_bytes(4, byteorder='little')
+                    + pickled_message)
+            sent = self._sock.sendmsg([data], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array("i", fds))])
+            if sent < len(data):
+                self._sock.sendall(memoryview(data)[sent:])
+        finally:
+            # The receiving side has its own references to the shared memory files.
+            for fd in fds:
+                os.close(fd)
+
+
 class _TcpServer(_SocketWrapper):
     """Encapsulates a TCP server socket.
 
@@ -971,11 +1211,74 @@ class _TcpServer(_SocketWrapper):
         self._socket_manager.add_incoming_connection(incoming_connection_socket)
 
 
+
+class _UnixServer(_SocketWrapper):
+    """Encapsulates a Unix domain socket server for peer connections from the same host.
+
+    A UnixServer runs in an Asyncio event loop to respond to asynchronous
+    connection events on the server socket.
+
+    Instances of `UnixServer` are managed by the `SocketManager`.
+    """
+
+    def __init__(self,
+                 event_loop: asyncio.AbstractEventLoop,
+                 socket_manager: '_SocketManager',
+                 sock: socket.socket
+                 ) -> None:
+        """Initialize a UnixServer instance.
+
+        Parameters:
+            event_loop: Asyncio event loop to which the socket should attach itself.
+            socket_manager: `SocketManager` instance that manages this server.
+            sock: Unix domain server socket, already bound and listening.
+        """
+
+        self._event_loop = event_loop
+        self._socket_manager = socket_manager
+        self._sock = sock
+        self._path = sock.getsockname()
+
+        # Make the socket non-blocking.
+        self._sock.setblocking(False)
+
+        # Register callback to be invoked when the socket is ready for reading.
+        self._event_loop.add_reader(self._sock.fileno(), self._handle_read)
+
+        _logger.debug("Unix domain socket server ready on %s", self._path)
+
+    def close(self) -> None:
+        """Detach from the event loop, close the wrapped socket and remove the socket file."""
+        _logger.debug("Unix domain socket server on %s closing", self._path)
+        self._event_loop.remove_reader(self._sock.fileno())
+        self._sock.close()
+        try:
+            os.unlink(self._path)
+        except OSError:
+            _logger.debug("Can not remove socket file %s", self._path, exc_info=True)
+
+    def _handle_read(self) -> None:
+        """Called through the event loop when a new connection is established."""
+
+        # Accept new connection.
+        try:
+            (incoming_connection_socket, _address) = self._sock.accept()
+        except OSError:
+            _logger.exception("Accepting new Unix domain socket connection failed")
+            return
+
+        _logger.debug("Incoming connection on %s", self._path)
+
+        # Add new connection to socket manager.
+        self._socket_manager.add_incoming_connection(incoming_connection_socket, _PeerUnixConnection)
+
+
 class _SocketManager:
     """The `SocketManager` manages the UDP and TCP sockets of a context.
 
     The `SocketManager` manages one UDP responder socket, an optional TCP
-    server socket, and possibly multiple TCP peer connection sockets.
+    server socket, an optional Unix domain server socket, and possibly multiple
+    peer connection sockets.
 
     The `SocketManager` runs in a separate thread in an event-driven fashion.
     Unless stated otherwise, the public methods of the `SocketManager` may only
@@ -1005,15 +1308,23 @@ class _SocketManager:
         tcp_server = _TcpServer(self._event_loop, self, sock)
         self._socket_wrappers.append(tcp_server)
 
+    def add_unix_server(self, sock: socket.socket) -> None:
+        """Add a Unix domain server socket."""
+        unix_server = _UnixServer(self._event_loop, self, sock)
+        self._socket_wrappers.append(unix_server)
+
     def add_udp_responder(self, sock: socket.socket) -> None:
         """Add an UDP responder socket."""
         udp_responder = _UdpResponder(self._event_loop, self._message_router, sock)
         self._socket_wrappers.append(udp_responder)
 
-    def add_incoming_connection(self, sock: socket.socket) -> None:
-        """Add an incoming TCP connection from a remote client context.
+    def add_incoming_connection(self,
+                                sock: socket.socket,
+                                connection_class: type[_PeerTcpConnection] = _PeerTcpConnection
+                                ) -> None:
+        """Add an incoming TCP (or Unix domain socket) connection from a remote client context.
 
-        The TCP connection is already accepted.
+        The connection is already accepted.
         A handshake with the client still needs to be performed.
         """
 
@@ -1022,10 +1333,10 @@ class _SocketManager:
         peer_context_alias = f"$client_{self._peer_name_counter}"
 
         # Wrap socket in PeerTcpConnection object.
-        conn = _PeerTcpConnection(self._message_router,
-                                  sock,
-                                  peer_context_alias,
-                                  is_incoming=True)
+        conn = connection_class(self._message_router,
+                                sock,
+                                peer_context_alias,
+                                is_incoming=True)
 
         # Send handshake and attach to event loop.
         try:
@@ -1189,6 +1500,8 @@ class MessageRouter:
         self.context_name = context_name
         self.workgroup_name = workgroup_name
         self.tcp_server_port = QMI_UdpResponderContextDescriptor.UNBOUND_TCP_PORT
+        self.unix_server_path = None  # type: str | None
+        self.same_host_transport = True
         self._thread = None  # type: _EventDrivenThread | None
         self._socket_manager = None  # type: _SocketManager | None
         self._address_to_messagehandler_map = {}  # type: dict[str, QMI_MessageHandler]
@@ -1196,6 +1509,7 @@ class MessageRouter:
         self._cb_peer_context_added = None    # type: Callable[[str], None] | None
         self._cb_peer_context_removed = None  # type: Callable[[str], None] | None
         self._suppress_version_mismatch_warnings = False
+        self.tracer = None  # type: QMI_Tracer | None
 
     @property
     def suppress_version_mismatch_warnings(self) -> bool:
@@ -1314,6 +1628,46 @@ class MessageRouter:
         # Hand the server socket over to the socket manager.
         self._thread.run_in_thread_arg(self._socket_manager.add_tcp_server, sock)
 
+    def start_unix_server(self) -> None:
+        """Start a Unix domain socket server for incoming connections from contexts on the same host.
+
+        The TCP server must already be started. Peer contexts on the same host that connect
+        to the TCP server port use the Unix domain socket instead, if it is available.
+        Nothing happens if the platform does not support Unix domain sockets, and only
+        a warning is logged if the socket can not be created.
+        """
+
+        assert self._thread is not None
+        assert self._socket_manager is not None
+        assert self.tcp_server_port != QMI_UdpResponderContextDescriptor.UNBOUND_TCP_PORT
+        assert self.unix_server_path is None
+
+        if not _SAME_HOST_TRANSPORT_SUPPORTED:
+            return
+
+        path = _same_host_socket_path(self.tcp_server_port)
+        _logger.info("Starting Unix domain socket server on %s ...", path)
+
+        sock = socket.socket(family=socket.AF_UNIX, type=socket.SOCK_STREAM)
+        try:
+            # An existing socket file with this name is stale,
+            # since we are now the owner of the TCP server port.
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            sock.bind(path)
+            sock.listen(5)
+        except OSError:
+            _logger.warning("Can not start Unix domain socket server on %s", path, exc_info=True)
+            sock.close()
+            return
+
+        self.unix_server_path = path
+
+        # Hand the server socket over to the socket manager.
+        self._thread.run_in_thread_arg(self._socket_manager.add_unix_server, sock)
+
     def start_udp_responder(self, udp_server_port: int) -> None:
         """Start UDP responder on the specified UDP port."""
 
@@ -1372,21 +1726,29 @@ class MessageRouter:
                      peer_context_name,
                      format_address_and_port(peer_addr_parsed))
 
-        # Connect to TCP server at remote context.
-        outgoing_connection_socket = socket.create_connection(peer_addr_parsed, timeout=self.CONNECT_TIMEOUT)
+        # Prefer the Unix domain socket of a peer context on the same host. Whether the peer
+        # has one is found out by trying to connect to it; it is not advertised.
+        conn = None  # type: _PeerTcpConnection | None
+        if self.same_host_transport and _SAME_HOST_TRANSPORT_SUPPORTED and _is_local_host(peer_addr_parsed[0]):
+            conn = self._connect_same_host(peer_context_name, peer_addr_parsed[1])
 
-        # Now that the connection is established, increase timeout to infinite
-        # to get normal blocking semantics.
-        outgoing_connection_socket.settimeout(None)
+        if conn is None:
 
-        # Disable delaying of small TCP segments.
-        outgoing_connection_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Connect to TCP server at remote context.
+            outgoing_connection_socket = socket.create_connection(peer_addr_parsed, timeout=self.CONNECT_TIMEOUT)
 
-        # Wrap socket in PeerTcpConnection object.
-        conn = _PeerTcpConnection(self,
-                                  outgoing_connection_socket,
-                                  peer_context_name,
-                                  is_incoming=False)
+            # Now that the connection is established, increase timeout to infinite
+            # to get normal blocking semantics.
+            outgoing_connection_socket.settimeout(None)
+
+            # Disable delaying of small TCP segments.
+            outgoing_connection_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            # Wrap socket in PeerTcpConnection object.
+            conn = _PeerTcpConnection(self,
+                                      outgoing_connection_socket,
+                                      peer_context_name,
+                                      is_incoming=False)
 
         # Send handshake and wait for answer.
         try:
@@ -1413,6 +1775,33 @@ class MessageRouter:
         # Note that this transfers the PeerTcpConnection object to the socket manager thread.
         self._thread.run_in_thread_wait(functools.partial(self._socket_manager.add_outgoing_connection, conn))
 
+    def _connect_same_host(self, peer_context_name: str, peer_port: int) -> _PeerUnixConnection | None:
+        """Connect to the Unix domain socket of a peer context on the same host.
+
+        Parameters:
+            peer_context_name: Name of the peer context.
+            peer_port: TCP server port of the peer context.
+
+        Returns:
+            The new connection, or None if the peer context does not accept connections
+            via a Unix domain socket.
+        """
+        path = _same_host_socket_path(peer_port)
+        sock = socket.socket(family=socket.AF_UNIX, type=socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.CONNECT_TIMEOUT)
+            sock.connect(path)
+        except OSError:
+            # No (live) socket; the peer context may run an older QMI version or have the transport disabled.
+            sock.close()
+            return None
+
+        # Get normal blocking semantics.
+        sock.settimeout(None)
+
+        _logger.debug("Connecting to peer context %s via %s", peer_context_name, path)
+        return _PeerUnixConnection(self, sock, peer_context_name, is_incoming=False)
+
     def disconnect_from_peer(self, peer_context_name: str) -> None:
         """Disconnect from the specified remote QMI context.
 
@@ -78,6 +78,22 @@ the QMI network, and a connection to this peer context has been established.
 A receiver can be subscribed to multiple signals, and multiple
 receivers can be subscribed to the same signal.
 
+When only the latest value of a frequently published signal is of interest
+(for example to display it), a `conflating` subscription can be made by
+specifying the maximum number of signals per second::
+
+    my_task_proxy.sig_alice.subscribe(receiver, max_rate=10)
+
+The publishing context then sends at most 10 signals per second to the
+subscribing context. Signals published in between are skipped, except that
+the most recently published value is always sent at the end of the interval.
+
+A subscriber that only needs some of the published signals can pass a `SignalFilter`,
+which the publishing context applies before sending the signals. For example,
+to receive only signals of which the first argument equals 3 or 4, and only every 10th of them::
+
+    my_task_proxy.sig_alice.subscribe(receiver, signal_filter=SignalFilter(arg_index=0, equals=(3, 4), decimation=10))
+
 Receiving signals
 #################
 
@@ -103,14 +119,34 @@ For example::
     except QMI_TimeoutException:
         print("No signal was received within 1 second")
 
+A receiver that handles many signals per second should take them from the queue
+in batches. The function `get_signals()` returns all waiting signals (or up to
+a specified maximum number) in a single operation::
+
+    for sig in receiver.get_signals(timeout=1.0):
+        print("Received signal", sig.signal_name)
+
+Alternatively, a `QMI_CallbackSignalReceiver` invokes a callback function
+in a background thread, passing a list of all signals received since the previous
+invocation::
+
+    receiver = QMI_CallbackSignalReceiver(lambda signals: print(len(signals), "signals"))
+    my_task_proxy.sig_alice.subscribe(receiver)
+    # ... later
+    my_task_proxy.sig_alice.unsubscribe(receiver)
+    receiver.close()
+
 Reference
 #########
 """
 
+import heapq
 import logging
+import sys
 import threading
+import time
 from collections import deque
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 
 from typing import Any, NamedTuple, Type, TYPE_CHECKING
 
@@ -120,6 +156,7 @@ from qmi.core.exceptions import (
 from qmi.core.messaging import (
     QMI_Message, QMI_RequestMessage, QMI_ReplyMessage, QMI_ErrorReplyMessage,
     QMI_MessageHandler, QMI_MessageHandlerAddress)
+from qmi.core.thread import QMI_Thread
 from qmi.core.util import is_valid_object_name
 
 
@@ -163,6 +200,36 @@ class ReceivedSignal(NamedTuple):
     receiver_seqnr: int
 
 
+class SignalFilter(NamedTuple):
+    """Filter which the publishing context applies to the signals sent to a subscriber.
+
+    The filter selects one value from the signal arguments: argument number `arg_index`, or,
+    if `field` is specified, an attribute or mapping key (when `field` is a string)
+    or an element (when `field` is an integer) of that argument.
+    A signal passes the filter if the selected value equals one of the values in `equals`
+    and lies between `min_value` and `max_value`; conditions which are None are not checked.
+    Of the signals that pass, only the first and then every `decimation`-th signal is sent.
+    A signal is dropped if the value can not be selected or compared.
+
+    A filter contains only plain data, so a subscriber can not make the publishing context
+    run arbitrary code. Attribute names starting with an underscore are not allowed.
+
+    Attributes:
+        arg_index: Index of the signal argument to inspect.
+        field: Attribute name, mapping key or element index within the argument, or None to use the argument itself.
+        equals: Tuple of accepted values, or None to accept any value.
+        min_value: Minimum accepted value, or None.
+        max_value: Maximum accepted value, or None.
+        decimation: Send only every N-th signal that passes the other conditions.
+    """
+    arg_index: int = 0
+    field: str | int | None = None
+    equals: tuple | None = None
+    min_value: float | None = None
+    max_value: float | None = None
+    decimation: int = 1
+
+
 class QMI_Signal:
     """Marker for signal declarations in an RpcObject or Task.
 
@@ -208,7 +275,10 @@ class QMI_RegisteredSignal:
     __slots__ = ("context",
                  "publisher_name",
                  "signal_name",
-                 "arg_types")
+                 "arg_types",
+                 "local_key",
+                 "remote_key",
+                 "source_address")
 
     def __init__(self,
                  context: "qmi.core.context.QMI_Context",
@@ -228,6 +298,12 @@ class QMI_RegisteredSignal:
         self.signal_name = signal_name
         self.arg_types = arg_types
 
+        # Keys of this signal in the subscription tables of the signal manager, and the
+        # source address of its signal messages; computed once to speed up publishing.
+        self.local_key = sys.intern(f"{context.name}.{publisher_name}.{signal_name}")
+        self.remote_key = sys.intern(f"{publisher_name}.{signal_name}")
+        self.source_address = QMI_MessageHandlerAddress(context.name, publisher_name)
+
     def __repr__(self) -> str:
         arg_types = ", ".join(arg_type.__name__ for arg_type in self.arg_types)
         return f"<registered signal {self.publisher_name}.{self.signal_name} ({arg_types})>"
@@ -243,7 +319,7 @@ class QMI_RegisteredSignal:
 
         This method is thread-safe: it may be called from any thread.
         """
-        self.context.publish_signal(self.publisher_name, self.signal_name, *args)
+        self.context.publish_registered_signal(self, args)
 
 
 class QMI_SignalSubscriber:
@@ -287,7 +363,11 @@ class QMI_SignalSubscriber:
         return "<subscriber for signal {}.{}.{} {}>".format(self.publisher_context, self.publisher_name,
                                                             self.signal_name, self.signal_arg_types)
 
-    def subscribe(self, receiver: "QMI_SignalReceiver") -> None:
+    def subscribe(self,
+                  receiver: "QMI_SignalReceiver",
+                  max_rate: float | None = None,
+                  signal_filter: SignalFilter | None = None
+                  ) -> None:
         """Subscribe the specified receiver to this signal type.
 
         While subscribed, the `QMI_SignalReceiver` instance will receive and
@@ -301,8 +381,14 @@ class QMI_SignalSubscriber:
 
         Parameters:
             receiver: A `QMI_SignalReceiver` instance which will receive the published signals.
+            max_rate: Optional maximum number of signals per second. When specified, the subscription
+                is conflating: the publishing context sends at most `max_rate` signals per second,
+                skipping intermediate values but always sending the latest value.
+            signal_filter: Optional `SignalFilter`. When specified, the publishing context only sends
+                signals which pass the filter.
         """
-        self.context.subscribe_signal(self.publisher_context, self.publisher_name, self.signal_name, receiver)
+        self.context.subscribe_signal(self.publisher_context, self.publisher_name, self.signal_name, receiver,
+                                      max_rate, signal_filter)
 
     def unsubscribe(self, receiver: "QMI_SignalReceiver") -> None:
         """Unsubscribe the specified receiver from this signal type.
@@ -325,7 +411,7 @@ def _wait_for_condition(cond: threading.Condition, predicate: Callable[[], bool]
     """
     import qmi.core.task
     thread = threading.current_thread()
-    if isinstance(thread, qmi.core.task._TaskThread):
+    if isinstance(thread, (qmi.core.task._TaskThread, qmi.core.task._LoopTaskWorker)):
         # We are called from a task thread.
         # Use a special method to wait on the condition variable
         # which wakes up if the thread is requested to stop.
@@ -371,6 +457,10 @@ class QMI_SignalReceiver:
         self._queue = deque(maxlen=max_queue_length)  # type: deque
         self._queue_cond = threading.Condition()
         self._receiver_seqnr = 0
+        self._num_waiters = 0
+        # Optional function called when a signal is added to the empty queue,
+        # used by a QMI_ReactiveTask to wait on several receivers at once.
+        self._wakeup: Callable[[], None] | None = None
 
     def discard_all(self) -> None:
         """Discard all pending signals currently waiting in the receive queue.
@@ -417,13 +507,63 @@ class QMI_SignalReceiver:
             QMI_TaskStopException: If the calling task receives a stop request before a signal is received.
         """
         with self._queue_cond:
-            if len(self._queue) == 0:
-                predicate = lambda: (len(self._queue) > 0)
-                if not _wait_for_condition(self._queue_cond, predicate, timeout):
-                    raise QMI_TimeoutException("Timeout while waiting for signal")
-
+            if not self._wait_for_signal(timeout):
+                raise QMI_TimeoutException("Timeout while waiting for signal")
             return self._queue.popleft()
 
+    def get_signals(self, max_count: int | None = None, timeout: float | None = 0) -> list[ReceivedSignal]:
+        """Return the oldest published signals waiting in the receive queue.
+
+        If there is no signal waiting in the queue, optionally wait until
+        a new signal is received, subject to the specified timeout.
+        All returned signals are taken from the queue in a single operation,
+        which is much cheaper than calling `get_next_signal()` for each signal.
+
+        This method is thread-safe.
+
+        Parameters:
+            max_count: Maximum number of signals to return, or None to return all waiting signals.
+            timeout: Maximum time (in seconds) to wait for a new signal
+                if the queue is empty, or None to wait indefinitely.
+
+        Returns:
+            List of `ReceivedSignal` tuples, oldest first.
+            The list is empty if the timeout expires before a signal is received.
+
+        Raises:
+            QMI_TaskStopException: If the calling task receives a stop request before a signal is received.
+        """
+        assert (max_count is None) or (max_count > 0)
+        with self._queue_cond:
+            if not self._wait_for_signal(timeout):
+                return []
+            return self._take_signals(max_count)
+
+    def _wait_for_signal(self, timeout: float | None) -> bool:
+        """Wait until the queue is not empty. Return False if the timeout expires.
+
+        The caller must hold the lock of `_queue_cond`.
+        """
+        if len(self._queue) != 0:
+            return True
+        self._num_waiters += 1
+        try:
+            return _wait_for_condition(self._queue_cond, lambda: (len(self._queue) > 0), timeout)
+        finally:
+            self._num_waiters -= 1
+
+    def _take_signals(self, max_count: int | None) -> list[ReceivedSignal]:
+        """Remove up to `max_count` signals from the queue and return them.
+
+        The caller must hold the lock of `_queue_cond`.
+        """
+        if (max_count is None) or (max_count >= len(self._queue)):
+            signals = list(self._queue)
+            self._queue.clear()
+        else:
+            signals = [self._queue.popleft() for _ in range(max_count)]
+        return signals
+
     def _receive_signal(self, message: "QMI_SignalMessage") -> None:
         """Internal method to add a new received signal to the queue."""
 
@@ -444,10 +584,93 @@ class QMI_SignalReceiver:
 
             # Append new signal to queue.
             # If the queue is full, it will automatically discard the oldest signal.
+            was_empty = (len(self._queue) == 0)
             self._queue.append(sig)
 
-            # Notify any thread waiting for a signal.
-            self._queue_cond.notify_all()
+            # Notify threads waiting for a signal. Threads only wait while the queue is empty,
+            # so signals added to a non-empty queue do not need a notification of their own.
+            if was_empty and (self._num_waiters > 0):
+                self._queue_cond.notify_all()
+            if was_empty and (self._wakeup is not None):
+                self._wakeup()
+
+
+class _SignalCallbackThread(QMI_Thread):
+    """Thread which passes batches of received signals to the callback function of a receiver."""
+
+    def __init__(self, receiver: "QMI_CallbackSignalReceiver") -> None:
+        super().__init__()
+        self.name = "QMI_CallbackSignalReceiver"
+        self._receiver = receiver
+
+    def run(self) -> None:
+        receiver = self._receiver
+        while True:
+            with receiver._queue_cond:
+                receiver._num_waiters += 1
+                try:
+                    while (len(receiver._queue) == 0) and (not self._shutdown_requested):
+                        receiver._queue_cond.wait()
+                finally:
+                    receiver._num_waiters -= 1
+                if len(receiver._queue) == 0:
+                    # Shutdown requested and all signals delivered.
+                    break
+                signals = receiver._take_signals(receiver._max_batch_size)
+            try:
+                receiver._callback(signals)
+            except Exception:
+                _logger.exception("Error in signal callback function")
+
+    def _request_shutdown(self) -> None:
+        with self._receiver._queue_cond:
+            self._receiver._queue_cond.notify_all()
+
+
+class QMI_CallbackSignalReceiver(QMI_SignalReceiver):
+    """A signal receiver which passes received signals to a callback function.
+
+    The callback function is invoked in a background thread with a list of
+    `ReceivedSignal` tuples, oldest first. When signals arrive faster than
+    the callback function handles them, the next invocation receives
+    all signals that arrived in the meantime, up to `max_batch_size`.
+    Exceptions raised by the callback function are logged and otherwise ignored.
+
+    Application code should not call `get_next_signal()` or `get_signals()`
+    on a callback receiver.
+
+    When an instance of `QMI_CallbackSignalReceiver` is no longer needed,
+    it **must** be unsubscribed from all signals and then closed.
+    """
+
+    def __init__(self,
+                 callback: Callable[[list[ReceivedSignal]], None],
+                 max_batch_size: int = 1000,
+                 max_queue_length: int = 10000,
+                 discard_policy: int = QMI_SignalReceiver.DISCARD_OLD
+                 ) -> None:
+        """Create a `QMI_CallbackSignalReceiver` and start its background thread.
+
+        Parameters:
+            callback: Function to call with a list of received signals.
+            max_batch_size: Maximum number of signals passed in a single call to the callback function.
+            max_queue_length: Maximum number of signals to keep in the receive queue.
+            discard_policy: Policy in case the receive queue becomes full (see `QMI_SignalReceiver`).
+        """
+        assert max_batch_size > 0
+        super().__init__(max_queue_length, discard_policy)
+        self._callback = callback
+        self._max_batch_size = max_batch_size
+        self._thread = _SignalCallbackThread(self)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Deliver the signals remaining in the queue, then stop the background thread.
+
+        This method must not be called from the callback function.
+        """
+        self._thread.shutdown()
+        self._thread.join()
 
 
 class QMI_SignalMessage(QMI_Message):
@@ -460,19 +683,27 @@ class QMI_SignalMessage(QMI_Message):
         signal_name: Name of the published signal.
             (The identity of the publisher follows from the `source_address` attribute.)
         args: Tuple of parameter values passed when publishing this signal.
+        subscription_tag: Identifies the subscription options (conflation, filter) under which
+            the signal was sent. This attribute is only set for subscriptions with options,
+            so that signals of plain subscriptions can be received by older QMI versions.
     """
 
-    __slots__ = ("signal_name", "args")
+    __slots__ = ("signal_name", "args", "subscription_tag")
+
+    subscription_tag: str
 
     def __init__(self,
                  source_address: QMI_MessageHandlerAddress,
                  destination_address: QMI_MessageHandlerAddress,
                  signal_name: str,
-                 args: tuple
+                 args: tuple,
+                 subscription_tag: str = ""
                  ) -> None:
         super().__init__(source_address, destination_address)
         self.signal_name = signal_name
         self.args = args
+        if subscription_tag:
+            self.subscription_tag = subscription_tag
 
 
 class QMI_SignalSubscriptionRequest(QMI_RequestMessage):
@@ -489,21 +720,35 @@ class QMI_SignalSubscriptionRequest(QMI_RequestMessage):
         publisher_name: Name of the RPC object that publishes the signal.
         signal_name: Signal name.
         subscribe: `True` to subscribe, `False` to unsubscribe.
+        max_rate: Maximum number of signals per second for a conflating subscription.
+            This attribute is only set for a conflating subscription, so that plain
+            subscription requests can be handled by older QMI versions.
+        signal_filter: `SignalFilter` applied by the publishing context. This attribute is
+            only set for a filtered subscription.
     """
 
-    __slots__ = ("publisher_name", "signal_name", "subscribe")
+    __slots__ = ("publisher_name", "signal_name", "subscribe", "max_rate", "signal_filter")
+
+    max_rate: float
+    signal_filter: SignalFilter
 
     def __init__(self,
                  source_address: QMI_MessageHandlerAddress,
                  destination_address: QMI_MessageHandlerAddress,
                  publisher_name: str,
                  signal_name: str,
-                 subscribe: bool
+                 subscribe: bool,
+                 max_rate: float | None = None,
+                 signal_filter: SignalFilter | None = None
                  ) -> None:
         super().__init__(source_address, destination_address)
         self.publisher_name = publisher_name
         self.signal_name = signal_name
         self.subscribe = subscribe
+        if max_rate is not None:
+            self.max_rate = max_rate
+        if signal_filter is not None:
+            self.signal_filter = signal_filter
 
 
 class QMI_SignalSubscriptionReply(QMI_ReplyMessage):
@@ -560,6 +805,177 @@ class QMI_SignalRemovedMessage(QMI_Message):
         self.signal_name = signal_name
 
 
+_FILTER_VALUE_TYPES = (bool, int, float, str, type(None))
+
+
+def _check_signal_filter(signal_filter: SignalFilter) -> None:
+    """Check that a signal filter contains only supported plain values.
+
+    Raises:
+        QMI_UsageException: If the filter is invalid.
+    """
+    if not isinstance(signal_filter, SignalFilter):
+        raise QMI_UsageException(f"Invalid signal filter {signal_filter!r}")
+    (arg_index, field, equals, min_value, max_value, decimation) = signal_filter
+    valid = (type(arg_index) is int) and (arg_index >= 0)
+    valid = valid and ((field is None)
+                       or (type(field) is int)
+                       or (type(field) is str and not field.startswith("_")))
+    valid = valid and ((equals is None)
+                       or (type(equals) is tuple and all(type(value) in _FILTER_VALUE_TYPES for value in equals)))
+    valid = valid and all((value is None) or (type(value) in (int, float)) for value in (min_value, max_value))
+    valid = valid and (type(decimation) is int) and (decimation >= 1)
+    if not valid:
+        raise QMI_UsageException(f"Invalid signal filter {signal_filter!r}")
+
+
+def _signal_filter_matches(signal_filter: SignalFilter, args: tuple) -> bool:
+    """Return True if the signal arguments pass the value conditions of the filter."""
+    try:
+        value = args[signal_filter.arg_index]
+        field = signal_filter.field
+        if isinstance(field, int):
+            value = value[field]
+        elif isinstance(field, str):
+            value = value[field] if isinstance(value, dict) else getattr(value, field)
+        if (signal_filter.equals is not None) and (value not in signal_filter.equals):
+            return False
+        if (signal_filter.min_value is not None) and (not value >= signal_filter.min_value):
+            return False
+        if (signal_filter.max_value is not None) and (not value <= signal_filter.max_value):
+            return False
+        return True
+    except Exception:
+        return False
+
+
+class _SubscriptionOptions(NamedTuple):
+    """Options which determine which signals the publishing context sends to a subscriber.
+
+    Attributes:
+        max_rate: Maximum number of signals per second for a conflating subscription, or None.
+        signal_filter: Filter applied to the signals, or None.
+    """
+    max_rate: float | None = None
+    signal_filter: SignalFilter | None = None
+
+    @property
+    def tag(self) -> str:
+        """String which identifies the options, or an empty string for a plain subscription."""
+        parts = []
+        if self.max_rate is not None:
+            parts.append(f"max_rate={self.max_rate!r}")
+        if self.signal_filter is not None:
+            parts.append(f"filter={tuple(self.signal_filter)!r}")
+        return ";".join(parts)
+
+    def check(self) -> None:
+        """Check that the options are valid.
+
+        Raises:
+            QMI_UsageException: If the options are invalid.
+        """
+        if (self.max_rate is not None) and not (type(self.max_rate) in (int, float) and self.max_rate > 0):
+            raise QMI_UsageException(f"Invalid maximum signal rate {self.max_rate!r}")
+        if self.signal_filter is not None:
+            _check_signal_filter(self.signal_filter)
+
+
+def _subscription_key(full_name: str, tag: str) -> str:
+    """Return the (interned) key of a local subscription on the signal "<context>.<publisher>.<signal>"
+    with the given tag."""
+    if not tag:
+        return sys.intern(full_name)
+    return sys.intern(full_name + "#" + tag)
+
+
+class _TaggedSubscription:
+    """Publisher-side state of a filtered and/or conflating subscription from one subscriber context.
+
+    Signals which do not pass the filter are dropped. With a maximum rate, signals
+    are sent at most once per `interval` seconds. A signal published within the interval
+    is held back; when another signal is published before it is sent, it is replaced,
+    so that only the latest value is sent at the end of the interval.
+    """
+
+    __slots__ = ("publisher_name", "signal_name", "subscriber_context", "tag", "signal_filter", "num_matched",
+                 "interval", "next_send_time", "pending_args", "active")
+
+    def __init__(self,
+                 publisher_name: str,
+                 signal_name: str,
+                 subscriber_context: str,
+                 options: _SubscriptionOptions
+                 ) -> None:
+        self.publisher_name = publisher_name
+        self.signal_name = signal_name
+        self.subscriber_context = subscriber_context
+        self.tag = options.tag
+        self.signal_filter = options.signal_filter
+        self.num_matched = 0
+        self.interval = None if options.max_rate is None else 1.0 / options.max_rate
+        self.next_send_time = 0.0
+        self.pending_args: tuple | None = None
+        self.active = True
+
+    def accept(self, args: tuple) -> bool:
+        """Apply the signal filter, including decimation. Return True if the signal passes."""
+        signal_filter = self.signal_filter
+        if signal_filter is None:
+            return True
+        if not _signal_filter_matches(signal_filter, args):
+            return False
+        self.num_matched += 1
+        return (self.num_matched - 1) % signal_filter.decimation == 0
+
+
+class _SignalTimerThread(QMI_Thread):
+    """Thread which calls functions at scheduled times, used to send held-back signals of conflating subscriptions."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.name = "QMI_SignalTimer"
+        self._cond = threading.Condition()
+        self._heap: list[tuple[float, int, Callable[[], None]]] = []
+        self._seqnr = 0
+
+    def schedule(self, due_time: float, func: Callable[[], None]) -> None:
+        """Call `func` in this thread at time `due_time` (in terms of `time.monotonic()`).
+
+        This method is thread-safe.
+        """
+        with self._cond:
+            seqnr = self._seqnr
+            self._seqnr += 1
+            heapq.heappush(self._heap, (due_time, seqnr, func))
+            if self._heap[0][1] == seqnr:
+                # The new entry is the first one due; wake up the thread to recompute its wait time.
+                self._cond.notify()
+
+    def run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._shutdown_requested:
+                        return
+                    if self._heap:
+                        delay = self._heap[0][0] - time.monotonic()
+                        if delay <= 0:
+                            (_due_time, _seqnr, func) = heapq.heappop(self._heap)
+                            break
+                        self._cond.wait(delay)
+                    else:
+                        self._cond.wait()
+            try:
+                func()
+            except Exception:
+                _logger.exception("Error in scheduled signal function")
+
+    def _request_shutdown(self) -> None:
+        with self._cond:
+            self._cond.notify()
+
+
 class _PendingSubscriptionRequest:
     """Helper object representing a pending subscription request sent to a remote context."""
 
@@ -567,7 +983,8 @@ class _PendingSubscriptionRequest:
                  publisher_context: str,
                  publisher_name: str,
                  signal_name: str,
-                 subscribe: bool
+                 subscribe: bool,
+                 options: _SubscriptionOptions = _SubscriptionOptions()
                  ) -> None:
         """Initialize a new pending subscription request.
 
@@ -576,11 +993,15 @@ class _PendingSubscriptionRequest:
             publisher_name:     Object ID of the remote publisher.
             signal_name:        Signal name of the signal to subscribe to.
             subscribe:          True when subscribing, False when unsubscribing.
+            options:            Options of the subscription.
         """
         self.publisher_context = publisher_context
         self.publisher_name = publisher_name
         self.signal_name = signal_name
         self.subscribe = subscribe
+        self.options = options
+        self.subscription_key = _subscription_key(publisher_context + "." + publisher_name + "." + signal_name,
+                                                  options.tag)
         self.receivers: set[QMI_SignalReceiver] = set()
         self._completed = threading.Event()
         self._success = False
@@ -633,16 +1054,19 @@ class SignalManager(QMI_MessageHandler):
         self._context = context
 
         # Mutex to guard manipulation of internal data structures.
+        #
+        # The subscription tables below are copy-on-write: their values are never modified
+        # once stored, but replaced while holding the lock. Publishing signals therefore
+        # reads these tables without taking the lock.
         self._lock = threading.Lock()
 
         # Register of subscribers in the local context.
-        # Map "<context>.<publisher>.<signal>" to a set of SignalReceiver objects.
-        self._local_subscriptions: dict[str, set[QMI_SignalReceiver]] = {}
+        # Map "<context>.<publisher>.<signal>" to a tuple of SignalReceiver objects.
+        self._local_subscriptions: dict[str, tuple[QMI_SignalReceiver, ...]] = {}
 
         # Register of remote subscribers to locally published signals.
-        # Type: { "publisher_name": { "signal_name": set_of_context_names } }
-        # Map "<publisher>.<signal>" to a set of remote context names.
-        self._remote_subscriptions: dict[str, set[str]] = {}
+        # Map "<publisher>.<signal>" to a tuple of remote context names.
+        self._remote_subscriptions: dict[str, tuple[str, ...]] = {}
 
         # Register of pending subscription requests by request ID.
         # Each pending subscription request is stored in this dictionary,
@@ -656,15 +1080,45 @@ class SignalManager(QMI_MessageHandler):
         # as well as in "_pending_subscription_request_by_request_id".
         self._pending_subscription_request_by_signal_name: dict[str, _PendingSubscriptionRequest] = {}
 
+        # Options of local subscriptions with a maximum rate or a filter.
+        # Map the subscription key "<context>.<publisher>.<signal>#<tag>" to the subscription options.
+        self._subscription_options: dict[str, _SubscriptionOptions] = {}
+
+        # Register of subscribers (remote or local) with a maximum rate or a filter, to locally published signals.
+        # Map "<publisher>.<signal>" to a dict of { (subscriber_context, tag): _TaggedSubscription }.
+        self._tagged_subscriptions: dict[str, dict[tuple[str, str], _TaggedSubscription]] = {}
+
+        # Thread which sends held-back conflated signals. It is created when first needed.
+        self._timer_thread: _SignalTimerThread | None = None
+        self._stopped = False
+
         context.register_message_handler(self)
 
+    def stop(self) -> None:
+        """Stop sending held-back signals. Called when the context stops."""
+        with self._lock:
+            self._stopped = True
+            timer_thread = self._timer_thread
+            self._timer_thread = None
+        if timer_thread is not None:
+            timer_thread.shutdown()
+            timer_thread.join()
+
     def subscribe_signal(self,
                          publisher_context: str,
                          publisher_name: str,
                          signal_name: str,
-                         receiver: QMI_SignalReceiver) -> None:
+                         receiver: QMI_SignalReceiver,
+                         max_rate: float | None = None,
+                         signal_filter: SignalFilter | None = None) -> None:
         """Subscribe a SignalReceiver to a specified signal.
 
+        When `max_rate` is specified, the subscription is conflating: the publishing
+        context sends at most `max_rate` signals per second to this context,
+        always including the most recently published value.
+        When `signal_filter` is specified, the publishing context only sends
+        signals which pass the filter.
+
         This method blocks until the subscription is established.
         This method is thread-safe and may safely be called from any thread.
 
@@ -681,13 +1135,15 @@ class SignalManager(QMI_MessageHandler):
             raise QMI_UsageException(f"Invalid publisher name {publisher_name!r}")
         if not is_valid_object_name(signal_name):
             raise QMI_UsageException(f"Invalid signal name {signal_name!r}")
+        options = _SubscriptionOptions(max_rate, signal_filter)
+        options.check()
 
         _logger.debug("Subscribing to signal %s.%s.%s", publisher_context, publisher_name, signal_name)
 
         if publisher_context == self._context.name:
-            self._subscribe_local(publisher_context, publisher_name, signal_name, receiver)
+            self._subscribe_local(publisher_context, publisher_name, signal_name, receiver, options)
         else:
-            self._subscribe_remote(publisher_context, publisher_name, signal_name, receiver)
+            self._subscribe_remote(publisher_context, publisher_name, signal_name, receiver, options)
 
     def unsubscribe_signal(self,
                            publisher_context: str,
@@ -718,19 +1174,40 @@ class SignalManager(QMI_MessageHandler):
         else:
             self._unsubscribe_remote(publisher_context, publisher_name, signal_name, receiver)
 
+    def _find_subscription_key(self,
+                               full_name: str,
+                               receiver: QMI_SignalReceiver
+                               ) -> tuple[str, _SubscriptionOptions]:
+        """Return the subscription key and options of the subscription of a receiver to a signal.
+
+        The caller must hold `_lock`.
+        """
+        lsubs = self._local_subscriptions.get(full_name)
+        if (lsubs is None) or (receiver not in lsubs):
+            prefix = full_name + "#"
+            for (subscription_key, options) in self._subscription_options.items():
+                if subscription_key.startswith(prefix):
+                    if receiver in self._local_subscriptions.get(subscription_key, ()):
+                        return (subscription_key, options)
+        return (full_name, _SubscriptionOptions())
+
     def _add_local_subscriber(self,
                               publisher_context: str,
                               publisher_name: str,
                               signal_name: str,
-                              receiver: QMI_SignalReceiver) -> None:
+                              receiver: QMI_SignalReceiver,
+                              options: _SubscriptionOptions = _SubscriptionOptions()) -> None:
         """Add the receiver to the list of local subscribers."""
         full_name = publisher_context + "." + publisher_name + "." + signal_name
+        tag = options.tag
+        subscription_key = _subscription_key(full_name, tag)
         with self._lock:
-            lsubs = self._local_subscriptions.get(full_name)
-            if lsubs is None:
-                lsubs = set()
-                self._local_subscriptions[full_name] = lsubs
-            lsubs.add(receiver)
+            self._add_to_local_subscriptions(subscription_key, (receiver,))
+            if tag:
+                # Filtering and conflation of locally published signals are done
+                # in the same way as for remote subscribers.
+                self._subscription_options[subscription_key] = options
+                self._add_tagged_subscriber(publisher_name, signal_name, self._context.name, options)
 
     def _remove_local_subscriber(self,
                                  publisher_context: str,
@@ -740,35 +1217,109 @@ class SignalManager(QMI_MessageHandler):
         """Remove the receiver from the list of local subscribers."""
         full_name = publisher_context + "." + publisher_name + "." + signal_name
         with self._lock:
-            lsubs = self._local_subscriptions.get(full_name)
-            if lsubs is not None:
-                lsubs.discard(receiver)
-                if len(lsubs) == 0:
-                    self._local_subscriptions.pop(full_name)
+            (subscription_key, options) = self._find_subscription_key(full_name, receiver)
+            if self._remove_from_local_subscriptions(subscription_key, receiver):
+                if options.tag:
+                    self._subscription_options.pop(subscription_key, None)
+                    self._remove_tagged_subscriber(publisher_name, signal_name, self._context.name, options)
+
+    def _add_to_local_subscriptions(self, subscription_key: str, receivers: Iterable[QMI_SignalReceiver]) -> None:
+        """Add receivers to a local subscription. The caller must hold `_lock`."""
+        lsubs = self._local_subscriptions.get(subscription_key, ())
+        new_receivers = tuple(receiver for receiver in receivers if receiver not in lsubs)
+        if new_receivers:
+            self._local_subscriptions[subscription_key] = lsubs + new_receivers
+
+    def _remove_from_local_subscriptions(self, subscription_key: str, receiver: QMI_SignalReceiver) -> bool:
+        """Remove a receiver from a local subscription. The caller must hold `_lock`.
 
-    def _add_remote_subscriber(self, publisher_name: str, signal_name: str, subscriber_context: str) -> None:
+        Returns:
+            True if the receiver was the last one of the subscription, which is then removed.
+        """
+        lsubs = self._local_subscriptions.get(subscription_key)
+        if (lsubs is None) or (receiver not in lsubs):
+            return False
+        if len(lsubs) == 1:
+            self._local_subscriptions.pop(subscription_key)
+            return True
+        self._local_subscriptions[subscription_key] = tuple(lsub for lsub in lsubs if lsub is not receiver)
+        return False
+
+    def _add_tagged_subscriber(self,
+                               publisher_name: str,
+                               signal_name: str,
+                               subscriber_context: str,
+                               options: _SubscriptionOptions) -> None:
+        """Add a filtered or conflating subscriber to a locally published signal. The caller must hold `_lock`."""
+        full_name = sys.intern(publisher_name + "." + signal_name)
+        tsubs = self._tagged_subscriptions.get(full_name, {})
+        tag = options.tag
+        if (subscriber_context, tag) not in tsubs:
+            # Replace the dict, since publishers iterate over it without holding the lock.
+            tsubs = dict(tsubs)
+            tsubs[(subscriber_context, tag)] = _TaggedSubscription(publisher_name,
+                                                                   signal_name,
+                                                                   subscriber_context,
+                                                                   options)
+            self._tagged_subscriptions[full_name] = tsubs
+
+    def _remove_tagged_subscriber(self,
+                                  publisher_name: str,
+                                  signal_name: str,
+                                  subscriber_context: str,
+                                  options: _SubscriptionOptions) -> None:
+        """Remove a filtered or conflating subscriber from a locally published signal.
+
+        The caller must hold `_lock`.
+        """
         full_name = publisher_name + "." + signal_name
+        tsubs = self._tagged_subscriptions.get(full_name)
+        if (tsubs is not None) and ((subscriber_context, options.tag) in tsubs):
+            tsubs = dict(tsubs)
+            tsubs.pop((subscriber_context, options.tag)).active = False
+            if tsubs:
+                self._tagged_subscriptions[full_name] = tsubs
+            else:
+                self._tagged_subscriptions.pop(full_name)
+
+    def _add_remote_subscriber(self,
+                               publisher_name: str,
+                               signal_name: str,
+                               subscriber_context: str,
+                               options: _SubscriptionOptions = _SubscriptionOptions()) -> None:
+        full_name = sys.intern(publisher_name + "." + signal_name)
         with self._lock:
-            rsubs = self._remote_subscriptions.get(full_name)
-            if rsubs is None:
-                rsubs = set()
-                self._remote_subscriptions[full_name] = rsubs
-            rsubs.add(subscriber_context)
-
-    def _remove_remote_subscriber(self, publisher_name: str, signal_name: str, subscriber_context: str) -> None:
+            if options.tag:
+                self._add_tagged_subscriber(publisher_name, signal_name, subscriber_context, options)
+                return
+            rsubs = self._remote_subscriptions.get(full_name, ())
+            if subscriber_context not in rsubs:
+                self._remote_subscriptions[full_name] = rsubs + (subscriber_context,)
+
+    def _remove_remote_subscriber(self,
+                                  publisher_name: str,
+                                  signal_name: str,
+                                  subscriber_context: str,
+                                  options: _SubscriptionOptions = _SubscriptionOptions()) -> None:
         full_name = publisher_name + "." + signal_name
         with self._lock:
-            rsubs = self._remote_subscriptions.get(full_name)
-            if rsubs is not None:
-                rsubs.discard(subscriber_context)
-                if len(rsubs) == 0:
+            if options.tag:
+                self._remove_tagged_subscriber(publisher_name, signal_name, subscriber_context, options)
+                return
+            rsubs = self._remote_subscriptions.get(full_name, ())
+            if subscriber_context in rsubs:
+                rsubs = tuple(rsub for rsub in rsubs if rsub != subscriber_context)
+                if rsubs:
+                    self._remote_subscriptions[full_name] = rsubs
+                else:
                     self._remote_subscriptions.pop(full_name)
 
     def _subscribe_local(self,
                          publisher_context: str,
                          publisher_name: str,
                          signal_name: str,
-                         receiver: QMI_SignalReceiver
+                         receiver: QMI_SignalReceiver,
+                         options: _SubscriptionOptions = _SubscriptionOptions()
                          ) -> None:
         """Subscribe to a signal from a local publisher."""
 
@@ -779,7 +1330,7 @@ class SignalManager(QMI_MessageHandler):
             raise QMI_SignalSubscriptionException(f"Unknown RPC object {publisher_context}.{publisher_name}")
 
         # Add the receiver to the list of local subscribers.
-        self._add_local_subscriber(publisher_context, publisher_name, signal_name, receiver)
+        self._add_local_subscriber(publisher_context, publisher_name, signal_name, receiver, options)
 
         # Check that the publisher still exists.
         if self._context.get_rpc_object_descriptor(publisher_name) is None:
@@ -804,25 +1355,29 @@ class SignalManager(QMI_MessageHandler):
                          publisher_context: str,
                          publisher_name: str,
                          signal_name: str,
-                         receiver: QMI_SignalReceiver
+                         receiver: QMI_SignalReceiver,
+                         options: _SubscriptionOptions = _SubscriptionOptions()
                          ) -> None:
         """Subscribe to a signal from a remote publisher."""
 
         full_name = publisher_context + "." + publisher_name + "." + signal_name
+        subscription_key = _subscription_key(full_name, options.tag)
         request_message = None
 
         with self._lock:
 
-            # Check if there are other local subscribers for the same signal.
-            lsubs = self._local_subscriptions.get(full_name)
-            if lsubs:
+            if options.tag:
+                self._subscription_options[subscription_key] = options
+
+            # Check if there are other local subscribers for the same signal and subscription options.
+            if self._local_subscriptions.get(subscription_key):
                 # There already are some local subscribers.
                 # Just add this receiver to the list and we are subscribed.
-                lsubs.add(receiver)
+                self._add_to_local_subscriptions(subscription_key, (receiver,))
                 return
 
             # Otherwise, check if there is a pending subscription request for this signal.
-            pending_request = self._pending_subscription_request_by_signal_name.get(full_name)
+            pending_request = self._pending_subscription_request_by_signal_name.get(subscription_key)
             if pending_request is None:
                 # Create a subscription request message.
                 request_message = QMI_SignalSubscriptionRequest(
@@ -830,10 +1385,16 @@ class SignalManager(QMI_MessageHandler):
                     destination_address=QMI_MessageHandlerAddress(publisher_context, self.PUBSUB_OBJECT_ID),
                     publisher_name=publisher_name,
                     signal_name=signal_name,
-                    subscribe=True)
+                    subscribe=True,
+                    max_rate=options.max_rate,
+                    signal_filter=options.signal_filter)
                 # Add the new request to the pending subscription table.
-                pending_request = _PendingSubscriptionRequest(publisher_context, publisher_name, signal_name, True)
-                self._pending_subscription_request_by_signal_name[full_name] = pending_request
+                pending_request = _PendingSubscriptionRequest(publisher_context,
+                                                              publisher_name,
+                                                              signal_name,
+                                                              True,
+                                                              options)
+                self._pending_subscription_request_by_signal_name[subscription_key] = pending_request
                 self._pending_subscription_request_by_request_id[request_message.request_id] = pending_request
 
             # Add this receiver to the pending subscription request.
@@ -861,19 +1422,16 @@ class SignalManager(QMI_MessageHandler):
         with self._lock:
 
             # Remove the local subscription on the specified signal.
-            last_subscriber = False
-            lsubs = self._local_subscriptions.get(full_name)
-            if lsubs is not None:
-                lsubs.discard(receiver)
-                if len(lsubs) == 0:
-                    self._local_subscriptions.pop(full_name)
-                    last_subscriber = True
+            (subscription_key, options) = self._find_subscription_key(full_name, receiver)
+            last_subscriber = self._remove_from_local_subscriptions(subscription_key, receiver)
+            if last_subscriber:
+                self._subscription_options.pop(subscription_key, None)
 
             if last_subscriber:
                 # We have just removed the last remaining local subscriber.
                 # Create a remote unsubscribe request (unless there is already
                 # a remote subscription request in progress.)
-                pending_request = self._pending_subscription_request_by_signal_name.get(full_name)
+                pending_request = self._pending_subscription_request_by_signal_name.get(subscription_key)
                 if pending_request is None:
                     # Create an unsubscribe request message.
                     request_message = QMI_SignalSubscriptionRequest(
@@ -881,14 +1439,17 @@ class SignalManager(QMI_MessageHandler):
                         destination_address=QMI_MessageHandlerAddress(publisher_context, self.PUBSUB_OBJECT_ID),
                         publisher_name=publisher_name,
                         signal_name=signal_name,
-                        subscribe=False)
+                        subscribe=False,
+                        max_rate=options.max_rate,
+                        signal_filter=options.signal_filter)
 
                     # Add the new request to the pending subscription table.
                     pending_request = _PendingSubscriptionRequest(publisher_context,
                                                                   publisher_name,
                                                                   signal_name,
-                                                                  False)
-                    self._pending_subscription_request_by_signal_name[full_name] = pending_request
+                                                                  False,
+                                                                  options)
+                    self._pending_subscription_request_by_signal_name[subscription_key] = pending_request
                     self._pending_subscription_request_by_request_id[request_message.request_id] = pending_request
 
         # Send the remote unsubscribe request, if needed.
@@ -904,15 +1465,10 @@ class SignalManager(QMI_MessageHandler):
         full_name = (message.source_address.context_id
                      + "." + message.source_address.object_id
                      + "." + message.signal_name)
+        subscription_key = _subscription_key(full_name, getattr(message, "subscription_tag", ""))
 
-        with self._lock:
-            receiver_set = self._local_subscriptions.get(full_name)
-            if receiver_set is None:
-                receiver_list: list[QMI_SignalReceiver] = []
-            else:
-                receiver_list = list(receiver_set)
-
-        for receiver in receiver_list:
+        # The tuple of receivers is never modified, so it can be used without holding the lock.
+        for receiver in self._local_subscriptions.get(subscription_key, ()):
             receiver._receive_signal(message)
 
     def publish_signal(self, publisher_name: str, signal_name: str, args: tuple) -> None:
@@ -923,40 +1479,134 @@ class SignalManager(QMI_MessageHandler):
         if not is_valid_object_name(signal_name):
             raise QMI_UsageException(f"Invalid signal name {signal_name!r}")
 
-        source_address = QMI_MessageHandlerAddress(self._context.name, publisher_name)
+        self._publish(self._context.name + "." + publisher_name + "." + signal_name,
+                      publisher_name + "." + signal_name,
+                      QMI_MessageHandlerAddress(self._context.name, publisher_name),
+                      signal_name,
+                      args)
 
-        # Local delivery of locally published signal.
-        msg = QMI_SignalMessage(
-            source_address=source_address,
-            destination_address=QMI_MessageHandlerAddress(self._context.name, self.PUBSUB_OBJECT_ID),
-            signal_name=signal_name,
-            args=args
-        )
-        self._deliver_local(msg)
+    def publish_registered_signal(self, signal: QMI_RegisteredSignal, args: tuple) -> None:
+        """Publish a registered signal of a local RPC object to the QMI network.
 
-        # Remote delivery of locally published signal.
-        full_name = publisher_name + "." + signal_name
+        This is the same as `publish_signal()`, using the precomputed names of the signal.
+        """
+        self._publish(signal.local_key, signal.remote_key, signal.source_address, signal.signal_name, args)
 
-        with self._lock:
-            rsubs = self._remote_subscriptions.get(full_name)
-            if rsubs is None:
-                rsubs_list: list[str] = []
-            else:
-                # Copy list of subscribers to avoid race conditions.
-                rsubs_list = list(rsubs)
+    def _publish(self,
+                 local_key: str,
+                 remote_key: str,
+                 source_address: QMI_MessageHandlerAddress,
+                 signal_name: str,
+                 args: tuple
+                 ) -> None:
+        """Deliver a locally published signal to all subscribers.
+
+        Parameters:
+            local_key:      Key "<context>.<publisher>.<signal>" of local subscriptions to the signal.
+            remote_key:     Key "<publisher>.<signal>" of remote and tagged subscriptions to the signal.
+            source_address: Address of the publisher.
+            signal_name:    Name of the signal.
+            args:           Arguments of the signal.
+        """
+
+        # Read the subscription tables without holding the lock. Their values are
+        # immutable, so a concurrent (un)subscription can not disturb the iteration below.
+        lsubs = self._local_subscriptions.get(local_key)
+        rsubs = self._remote_subscriptions.get(remote_key)
+        tsubs = self._tagged_subscriptions.get(remote_key)
 
-        for sub in rsubs_list:
+        # Local delivery of locally published signal.
+        if lsubs:
             msg = QMI_SignalMessage(
                 source_address=source_address,
-                destination_address=QMI_MessageHandlerAddress(sub, self.PUBSUB_OBJECT_ID),
+                destination_address=self.address,
                 signal_name=signal_name,
                 args=args
             )
-            try:
-                self._context.send_message(msg)
-            except QMI_MessageDeliveryException:
-                # Signal could not be delivered to remote context - ignore.
-                _logger.debug("Can not send signal to remote context %s", sub, exc_info=True)
+            for receiver in lsubs:
+                receiver._receive_signal(msg)
+
+        # Remote delivery of locally published signal.
+        if rsubs:
+            for sub in rsubs:
+                msg = QMI_SignalMessage(
+                    source_address=source_address,
+                    destination_address=QMI_MessageHandlerAddress(sub, self.PUBSUB_OBJECT_ID),
+                    signal_name=signal_name,
+                    args=args
+                )
+                try:
+                    self._context.send_message(msg)
+                except QMI_MessageDeliveryException:
+                    # Signal could not be delivered to remote context - ignore.
+                    _logger.debug("Can not send signal to remote context %s", sub, exc_info=True)
+
+        if tsubs:
+            # Apply the filter of each tagged subscriber, then decide whether to send
+            # the signal now, or to hold it back until the end of the current interval.
+            # The lock protects the state of the tagged subscriptions.
+            tagged_send: list[_TaggedSubscription] = []
+            tagged_hold: list[tuple[_TaggedSubscription, float]] = []
+            with self._lock:
+                now = time.monotonic()
+                for tsub in tsubs.values():
+                    if not tsub.accept(args):
+                        continue
+                    if tsub.interval is None:
+                        tagged_send.append(tsub)
+                    elif (tsub.pending_args is None) and (now >= tsub.next_send_time):
+                        tsub.next_send_time = now + tsub.interval
+                        tagged_send.append(tsub)
+                    else:
+                        if tsub.pending_args is None:
+                            tagged_hold.append((tsub, tsub.next_send_time))
+                        # Replace any older held-back value.
+                        tsub.pending_args = args
+
+            for tsub in tagged_send:
+                self._send_tagged_signal(tsub, args)
+            for (tsub, due_time) in tagged_hold:
+                self._schedule_held_signal(tsub, due_time)
+
+    def _send_tagged_signal(self, tsub: _TaggedSubscription, args: tuple) -> None:
+        """Send a signal to a filtered or conflating subscriber."""
+        msg = QMI_SignalMessage(
+            source_address=QMI_MessageHandlerAddress(self._context.name, tsub.publisher_name),
+            destination_address=QMI_MessageHandlerAddress(tsub.subscriber_context, self.PUBSUB_OBJECT_ID),
+            signal_name=tsub.signal_name,
+            args=args,
+            subscription_tag=tsub.tag
+        )
+        if tsub.subscriber_context == self._context.name:
+            self._deliver_local(msg)
+            return
+        try:
+            self._context.send_message(msg)
+        except QMI_MessageDeliveryException:
+            # Signal could not be delivered to remote context - ignore.
+            _logger.debug("Can not send signal to remote context %s", tsub.subscriber_context, exc_info=True)
+
+    def _schedule_held_signal(self, tsub: _TaggedSubscription, due_time: float) -> None:
+        """Arrange for the held-back signal of a conflating subscriber to be sent at the specified time."""
+        with self._lock:
+            if self._stopped:
+                return
+            if self._timer_thread is None:
+                self._timer_thread = _SignalTimerThread()
+                self._timer_thread.start()
+            timer_thread = self._timer_thread
+        timer_thread.schedule(due_time, lambda: self._flush_held_signal(tsub))
+
+    def _flush_held_signal(self, tsub: _TaggedSubscription) -> None:
+        """Send the held-back signal of a conflating subscriber. Called in the timer thread."""
+        with self._lock:
+            args = tsub.pending_args
+            tsub.pending_args = None
+            if (args is None) or (not tsub.active):
+                return
+            assert tsub.interval is not None
+            tsub.next_send_time = time.monotonic() + tsub.interval
+        self._send_tagged_signal(tsub, args)
 
     def _handle_subscription_request(self, request_message: QMI_SignalSubscriptionRequest) -> None:
         """Called when we receive a subscribe/unsubscribe request from a remote subscriber.
@@ -972,6 +1622,8 @@ class SignalManager(QMI_MessageHandler):
         publisher_name = request_message.publisher_name
         signal_name = request_message.signal_name
         subscriber_context = request_message.source_address.context_id
+        options = _SubscriptionOptions(getattr(request_message, "max_rate", None),
+                                       getattr(request_message, "signal_filter", None))
 
         _logger.debug("Got %s request from %s for %s.%s",
                       ("subscribe" if request_message.subscribe else "unsubscribe"),
@@ -983,20 +1635,27 @@ class SignalManager(QMI_MessageHandler):
                 success = False
                 error_msg = f"Unknown RPC object {self._context.name}.{publisher_name}"
             else:
-                # Add the remote context to the table of remote subscribers.
-                self._add_remote_subscriber(publisher_name, signal_name, subscriber_context)
-
-                # Double-check that the publisher still exists.
-                if self._context.get_rpc_object_descriptor(publisher_name) is None:
-                    self._remove_remote_subscriber(publisher_name, signal_name, subscriber_context)
+                # Check the options (in particular the filter), which come from a remote context.
+                try:
+                    options.check()
+                except QMI_UsageException as exc:
                     success = False
-                    error_msg = f"Unknown RPC object {self._context.name}.{publisher_name}"
+                    error_msg = str(exc)
                 else:
-                    success = True
-                    error_msg = ""
+                    # Add the remote context to the table of remote subscribers.
+                    self._add_remote_subscriber(publisher_name, signal_name, subscriber_context, options)
+
+                    # Double-check that the publisher still exists.
+                    if self._context.get_rpc_object_descriptor(publisher_name) is None:
+                        self._remove_remote_subscriber(publisher_name, signal_name, subscriber_context, options)
+                        success = False
+                        error_msg = f"Unknown RPC object {self._context.name}.{publisher_name}"
+                    else:
+                        success = True
+                        error_msg = ""
         else:
             # Unsubscribe. This is always successful.
-            self._remove_remote_subscriber(publisher_name, signal_name, subscriber_context)
+            self._remove_remote_subscriber(publisher_name, signal_name, subscriber_context, options)
             success = True
             error_msg = ""
 
@@ -1026,9 +1685,7 @@ class SignalManager(QMI_MessageHandler):
         with self._lock:
             # Find the pending subscription request and remove it from the table.
             pending_request = self._pending_subscription_request_by_request_id.pop(request_id)
-            full_name = (pending_request.publisher_context
-                         + "." + pending_request.publisher_name
-                         + "." + pending_request.signal_name)
+            full_name = pending_request.subscription_key
             self._pending_subscription_request_by_signal_name.pop(full_name)
 
             _logger.debug("Got reply to %s request for %s, status %s",
@@ -1038,11 +1695,11 @@ class SignalManager(QMI_MessageHandler):
             # On successful completion of a subscribe request, move the waiting
             # subscribers to the list of local subscribers for this signal.
             if pending_request.subscribe and success:
-                lsubs = self._local_subscriptions.get(full_name)
-                if lsubs:
-                    lsubs.update(pending_request.receivers)
-                else:
-                    self._local_subscriptions[full_name] = pending_request.receivers
+                self._add_to_local_subscriptions(full_name, pending_request.receivers)
+
+            # Forget the options of a filtered or conflating subscription that could not be established.
+            if pending_request.subscribe and (not success) and (full_name not in self._local_subscriptions):
+                self._subscription_options.pop(full_name, None)
 
             # When a subscribe request completes, notify all waiting subscribers.
             if pending_request.subscribe:
@@ -1059,7 +1716,9 @@ class SignalManager(QMI_MessageHandler):
                                                                   self.PUBSUB_OBJECT_ID),
                     publisher_name=pending_request.publisher_name,
                     signal_name=pending_request.signal_name,
-                    subscribe=True)
+                    subscribe=True,
+                    max_rate=pending_request.options.max_rate,
+                    signal_filter=pending_request.options.signal_filter)
                 # Add the new request to the pending subscription table.
                 pending_request.subscribe = True
                 self._pending_subscription_request_by_signal_name[full_name] = pending_request
@@ -1082,6 +1741,13 @@ class SignalManager(QMI_MessageHandler):
             if full_name in self._local_subscriptions:
                 self._local_subscriptions.pop(full_name)
 
+            # Drop filtered and conflating subscriptions on the removed signal.
+            prefix = full_name + "#"
+            for subscription_key in list(self._subscription_options):
+                if subscription_key.startswith(prefix):
+                    self._subscription_options.pop(subscription_key)
+                    self._local_subscriptions.pop(subscription_key, None)
+
     def handle_message(self, message: QMI_Message) -> None:
         """Handle messages sent to the signal manager object."""
 
@@ -1126,6 +1792,7 @@ class SignalManager(QMI_MessageHandler):
                     remove_entries.append(full_name)
             for full_name in remove_entries:
                 self._local_subscriptions.pop(full_name)
+                self._subscription_options.pop(full_name, None)
 
             # Drop any remote subscribers in the removed peer context.
             # This is potentially slow.
@@ -1141,6 +1808,17 @@ class SignalManager(QMI_MessageHandler):
                 for subscriber_context in rsubs:
                     notify_subscribers.append((signal_name, subscriber_context))
 
+            # Drop any filtered or conflating subscribers, local or remote.
+            remove_entries = [full_name for full_name in self._tagged_subscriptions if full_name.startswith(pattern)]
+            for full_name in remove_entries:
+                tsubs = self._tagged_subscriptions.pop(full_name)
+                (_publisher_name, signal_name) = full_name.split(".")
+                for tsub in tsubs.values():
+                    tsub.active = False
+                    if (tsub.subscriber_context != self._context.name
+                            and (signal_name, tsub.subscriber_context) not in notify_subscribers):
+                        notify_subscribers.append((signal_name, tsub.subscriber_context))
+
         # Notify remote subscribers that these signals have been removed.
         for (signal_name, subscriber_context) in notify_subscribers:
             _logger.debug("Sending signal removed notification to %s for %s.%s",
@@ -1167,14 +1845,26 @@ class SignalManager(QMI_MessageHandler):
         with self._lock:
             # Drop any remote subscribers in the removed peer context.
             # This is potentially slow, but disconnecting from a peer context should not occur very frequently.
-            remove_entries = []
-            for (full_name, rsubs) in self._remote_subscriptions.items():
+            for (full_name, rsubs) in list(self._remote_subscriptions.items()):
                 if context_name in rsubs:
-                    rsubs.remove(context_name)
-                    if len(rsubs) == 0:
-                        remove_entries.append(full_name)
-            for full_name in remove_entries:
-                self._remote_subscriptions.pop(full_name)
+                    remaining_rsubs = tuple(rsub for rsub in rsubs if rsub != context_name)
+                    if remaining_rsubs:
+                        self._remote_subscriptions[full_name] = remaining_rsubs
+                    else:
+                        self._remote_subscriptions.pop(full_name)
+
+            # Drop any filtered or conflating subscribers in the removed peer context.
+            for (full_name, tsubs) in list(self._tagged_subscriptions.items()):
+                remaining = {}
+                for ((subscriber_context, tag), tsub) in tsubs.items():
+                    if subscriber_context == context_name:
+                        tsub.active = False
+                    else:
+                        remaining[(subscriber_context, tag)] = tsub
+                if not remaining:
+                    self._tagged_subscriptions.pop(full_name)
+                elif len(remaining) < len(tsubs):
+                    self._tagged_subscriptions[full_name] = remaining
 
             # Drop any local subscriptions on signals published by the remote context.
             # This is potentially slow.
@@ -1185,6 +1875,7 @@ class SignalManager(QMI_MessageHandler):
                     remove_entries.append(full_name)
             for full_name in remove_entries:
                 self._local_subscriptions.pop(full_name)
+                self._subscription_options.pop(full_name, None)
 
 
 # Imports needed only for static typing.
@@ -132,20 +132,68 @@ Example 2::
     # Then finally stop the "object provider"
     c1.stop()
 
+RPC statistics
+##############
+
+Each context records timing statistics of RPC method calls per (object, method):
+the time a request waits in the queue of a local RPC object, the execution time of
+the method, and the round-trip time of calls made from the context. The statistics
+are kept in cumulative logarithmic histograms, so recording a call takes constant
+time and memory.
+
+Use `QMI_Context.get_rpc_statistics()` to get them for the local context, or the
+`get_rpc_statistics()` RPC method of the context RPC object of another context::
+
+    proxy = qmi.context().make_peer_context_proxy("other_context")
+    for stats in proxy.get_rpc_statistics():
+        print(stats.object_name, stats.method_name, stats.calls, stats.execution_time.mean)
+
+The command ``qmi_tool top`` shows a live view of these statistics for all contexts in a workgroup.
+
+Request priorities
+##################
+
+Each RPC object executes its methods one at a time, so a call normally waits for
+all calls that were requested before it. Control methods that must not wait behind
+long-running calls, such as aborting a measurement, can be declared with a higher priority::
+
+    class MyInstrument(QMI_Instrument):
+
+        @rpc_method(priority=QMI_RpcPriority.HIGH)
+        def abort(self) -> None:
+            ...
+
+Pending requests of higher priority are handled first; a request which is already
+executing is not interrupted. A caller can override the priority of a single call
+with the `rpc_priority` keyword argument::
+
+    instr.get_status(rpc_priority=QMI_RpcPriority.HIGH)
+
+Querying the lock state with `is_locked()` is always handled with high priority.
+
+Note that a request with an explicit `rpc_priority` can not be unpickled by a peer
+running an older version of QMI; only use it towards peers which support priorities.
+
+Methods which are safe to run concurrently with the other methods of the object
+can be declared with ``@rpc_method(thread_safe=True)``. If the class sets
+`_rpc_max_concurrency` to a positive number, such methods bypass the queue and run
+in a pool of worker threads, so they do not wait for a long-running call at all.
+
 Reference
 #########
 """
 
+import heapq
 import inspect
 import logging
 import threading
 import time
 import enum
 from abc import ABCMeta
-from collections import deque
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
-from typing import Any, NamedTuple, Type, TypeVar, TYPE_CHECKING
+from typing import Any, NamedTuple, Type, TypeVar, TYPE_CHECKING, overload
 
 from qmi.core.exceptions import (
     QMI_RuntimeException,
@@ -158,7 +206,10 @@ from qmi.core.messaging import (
     QMI_MessageHandler, QMI_MessageHandlerAddress)
 from qmi.core.pubsub import SignalDescription, QMI_Signal, QMI_RegisteredSignal, QMI_SignalSubscriber
 from qmi.core.thread import QMI_Thread
-from qmi.core.util import is_valid_object_name
+from qmi.core.tracing import (
+    QMI_TraceContext, SpanKind, get_current_trace_context, set_current_trace_context, make_child_trace_context
+)
+from qmi.core.util import is_valid_object_name, QMI_TimingHistogram, TimingHistogram
 
 
 # Global variable holding the logger for this module.
@@ -264,6 +315,13 @@ class QMI_RpcFutureState(enum.Enum):
     OBJECT_IS_LOCKED = 4
 
 
+class QMI_RpcPriority(enum.IntEnum):
+    """Priority of an RPC request; pending requests of higher priority are handled first."""
+    LOW = -1
+    NORMAL = 0
+    HIGH = 1
+
+
 class QMI_LockRpcAction(enum.Enum):
     """Actions that can be performed on a lock."""
     ACQUIRE = 1
@@ -335,8 +393,12 @@ class QMI_MethodRpcRequestMessage(QMI_RequestMessage):
         method_args:    Tuple of positional arguments to the method.
         method_kwargs:  Dictionary of keyword arguments to the method.
         lock_token:     The unique token to use for the lock.
+        priority:       Optional priority requested by the caller (a `QMI_RpcPriority` value).
+                        This attribute is only set when the caller specifies a priority.
     """
-    __slots__ = ("method_name", "method_args", "method_kwargs", "lock_token")
+    __slots__ = ("method_name", "method_args", "method_kwargs", "lock_token", "priority")
+
+    priority: int
 
     def __init__(self,
                  source_address: QMI_MessageHandlerAddress,
@@ -374,6 +436,104 @@ class QMI_MethodRpcReplyMessage(QMI_ReplyMessage):
         self.result = result
 
 
+class QMI_RpcMethodStatistics(NamedTuple):
+    """Timing statistics of one RPC method, as collected by a single context.
+
+    The context that hosts the RPC object measures how long requests wait in the queue
+    of the object and how long the method takes to run. The context that calls
+    the method measures the round-trip time from sending the request until the reply
+    arrives. For calls within one context, all three are measured by the same context.
+
+    Attributes:
+        object_name: Full name of the RPC object (`<context_name>.<object_name>`).
+        method_name: Name of the RPC method.
+        calls: Number of calls executed by this context.
+        errors: Number of executed calls that raised an exception.
+        queue_wait: Time between receiving a request and starting to execute it.
+        execution_time: Duration of the method call.
+        round_trip_time: Time between sending a request and receiving the reply, for calls made by this context.
+    """
+    object_name: str
+    method_name: str
+    calls: int
+    errors: int
+    queue_wait: QMI_TimingHistogram
+    execution_time: QMI_TimingHistogram
+    round_trip_time: QMI_TimingHistogram
+
+
+class _RpcMethodTiming:
+    """Timing histograms of one RPC method."""
+
+    __slots__ = ("calls", "errors", "queue_wait", "execution_time", "round_trip_time")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.queue_wait = TimingHistogram()
+        self.execution_time = TimingHistogram()
+        self.round_trip_time = TimingHistogram()
+
+
+class RpcStatistics:
+    """Collects timing statistics of RPC method calls per (object, method).
+
+    An instance of this class is owned by the context. It is updated by the
+    RPC threads of the local objects and by the futures of outgoing calls.
+
+    This class is intended for internal use within QMI. Application programs
+    should not interact with this class directly.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._methods: dict[tuple[str, str], _RpcMethodTiming] = {}
+
+    def _get_timing(self, address: QMI_MessageHandlerAddress, method_name: str) -> _RpcMethodTiming:
+        key = (f"{address.context_id}.{address.object_id}", method_name)
+        timing = self._methods.get(key)
+        if timing is None:
+            timing = self._methods[key] = _RpcMethodTiming()
+        return timing
+
+    def record_execution(self,
+                         address: QMI_MessageHandlerAddress,
+                         method_name: str,
+                         queue_wait: float,
+                         execution_time: float,
+                         failed: bool
+                         ) -> None:
+        """Record the queue wait time and execution time of a method call handled by a local RPC object."""
+        with self._lock:
+            timing = self._get_timing(address, method_name)
+            timing.calls += 1
+            timing.errors += failed
+            timing.queue_wait.add(queue_wait)
+            timing.execution_time.add(execution_time)
+
+    def record_round_trip(self, address: QMI_MessageHandlerAddress, method_name: str, round_trip_time: float) -> None:
+        """Record the round-trip time of a method call made from the local context."""
+        with self._lock:
+            self._get_timing(address, method_name).round_trip_time.add(round_trip_time)
+
+    def get_statistics(self) -> list[QMI_RpcMethodStatistics]:
+        """Return the statistics of all RPC methods that were called, sorted by object and method name."""
+        with self._lock:
+            return [QMI_RpcMethodStatistics(object_name=object_name,
+                                            method_name=method_name,
+                                            calls=timing.calls,
+                                            errors=timing.errors,
+                                            queue_wait=timing.queue_wait.snapshot(),
+                                            execution_time=timing.execution_time.snapshot(),
+                                            round_trip_time=timing.round_trip_time.snapshot())
+                    for ((object_name, method_name), timing) in sorted(self._methods.items())]
+
+    def reset(self) -> None:
+        """Discard all statistics collected so far."""
+        with self._lock:
+            self._methods.clear()
+
+
 class QMI_RpcFuture(QMI_MessageHandler):
     """Representation of the future completion of a method invoked via RPC.
 
@@ -403,13 +563,17 @@ class QMI_RpcFuture(QMI_MessageHandler):
         self._cv = threading.Condition(threading.Lock())
         self.rpc_object_address = rpc_object_address
         self.lock_token = lock_token
+        self._method_name: str | None = None
+        self._send_time = 0.0
+        self._trace_context: QMI_TraceContext | None = None
 
         context.register_message_handler(self)
 
     def send_method_rpc_request_message(self,
                                         rpc_method_name: str,
                                         rpc_method_args: tuple,
-                                        rpc_method_kwargs: dict
+                                        rpc_method_kwargs: dict,
+                                        rpc_priority: QMI_RpcPriority | None = None
                                         ) -> None:
         """Send a request message to the RPC object to invoke the specified method.
 
@@ -417,6 +581,8 @@ class QMI_RpcFuture(QMI_MessageHandler):
             rpc_method_name: Name of the method to call.
             rpc_method_args: Tuple of positional arguments.
             rpc_method_kwargs: Dictionary of keyword arguments.
+            rpc_priority: Optional priority of the request. By default, the priority declared by the method is used.
+                A request with an explicit priority can not be unpickled by peers running an older QMI version.
         """
         request = QMI_MethodRpcRequestMessage(
             self.address,
@@ -426,12 +592,42 @@ class QMI_RpcFuture(QMI_MessageHandler):
             rpc_method_kwargs,
             self.lock_token
         )
-
+        if rpc_priority is not None:
+            request.priority = int(QMI_RpcPriority(rpc_priority))
+
+        # Propagate the trace context of the calling thread; record a client span if tracing is enabled.
+        trace_context = get_current_trace_context()
+        if self._context.tracer is not None:
+            trace_context = self._trace_context = make_child_trace_context(trace_context)
+        if trace_context is not None:
+            request.trace_context = trace_context
+
+        self._method_name = rpc_method_name
+        self._send_time = time.monotonic()
         try:
             self._context.send_message(request)
         except QMI_MessageDeliveryException as exc:
+            self._end_trace_span(str(exc))
             self._set_result(QMI_RpcFutureState.RESULT_IS_EXCEPTION, exc)
 
+    def _end_trace_span(self, error: str | None) -> None:
+        """Record the client span of the method call, if tracing is enabled and the span was not yet recorded."""
+        trace_context = self._trace_context
+        tracer = self._context.tracer
+        if (trace_context is None) or (tracer is None):
+            return
+        self._trace_context = None
+        address = self.rpc_object_address
+        tracer.record_span(f"{address.context_id}.{address.object_id}/{self._method_name}",
+                           SpanKind.CLIENT,
+                           trace_context,
+                           self._send_time,
+                           time.monotonic(),
+                           {"rpc.system": "qmi",
+                            "rpc.service": f"{address.context_id}.{address.object_id}",
+                            "rpc.method": str(self._method_name)},
+                           error)
+
     def send_lock_rpc_request_message(self, action: QMI_LockRpcAction) -> None:
         request = QMI_LockRpcRequestMessage(self.address, self.rpc_object_address, self.lock_token, action)
         try:
@@ -444,12 +640,19 @@ class QMI_RpcFuture(QMI_MessageHandler):
 
         if isinstance(message, QMI_MethodRpcReplyMessage):
             # Received result from RPC call.
+            if self._method_name is not None:
+                self._context.rpc_statistics.record_round_trip(self.rpc_object_address,
+                                                               self._method_name,
+                                                               time.monotonic() - self._send_time)
+                self._end_trace_span(None if message.state == QMI_RpcFutureState.RESULT_IS_VALUE
+                                     else message.state.name)
             self._set_result(message.state, message.result)
         elif isinstance(message, QMI_LockRpcReplyMessage):
             # Response to lock request message.
             self._set_result(QMI_RpcFutureState.RESULT_IS_VALUE, message.lock_token)
         elif isinstance(message, QMI_ErrorReplyMessage):
             # Delivery of RPC request failed.
+            self._end_trace_span(message.error_msg or "Delivery of RPC request failed")
             self._set_result(QMI_RpcFutureState.RESULT_IS_EXCEPTION,
                              QMI_MessageDeliveryException(message.error_msg))
         else:
@@ -521,6 +724,7 @@ class QMI_RpcFuture(QMI_MessageHandler):
 
                     if not wait_result:
                         # Timeout expired!
+                        self._end_trace_span("Timeout in RPC call.")
                         raise QMI_RpcTimeoutException("Timeout in RPC call.")
 
         finally:
@@ -539,8 +743,9 @@ def non_blocking_rpc_method_call(context: "qmi.core.context.QMI_Context",
     if "rpc_timeout" in kwargs:
         raise RuntimeError("rpc_timeout parameter makes no sense for non-blocking invocation.")
 
+    rpc_priority = kwargs.pop("rpc_priority", None)
     future = QMI_RpcFuture(context, rpc_object_address, rpc_lock_token)
-    future.send_method_rpc_request_message(method_name, args, kwargs)
+    future.send_method_rpc_request_message(method_name, args, kwargs, rpc_priority)
     return future
 
 
@@ -550,11 +755,12 @@ def blocking_rpc_method_call(context: "qmi.core.context.QMI_Context",
                              rpc_lock_token: QMI_LockTokenDescriptor | None,
                              *args: Any,
                              rpc_timeout: float | None = None,
+                             rpc_priority: QMI_RpcPriority | None = None,
                              **kwargs: Any
                              ) -> Any:
     """Helper function that performs a blocking call to a specific method of the target RPC object."""
     future = QMI_RpcFuture(context, rpc_object_address, rpc_lock_token)
-    future.send_method_rpc_request_message(method_name, args, kwargs)
+    future.send_method_rpc_request_message(method_name, args, kwargs, rpc_priority)
     return future.wait(rpc_timeout)
 
 
@@ -808,10 +1014,40 @@ class QMI_RpcProxy:
         return lock_token is not None
 
 
-def rpc_method(method: _T) -> _T:
-    """Decorator to indicate that a method can be called via RPC."""
-    method._rpc_method = True  # type: ignore
-    return method
+@overload
+def rpc_method(method: _T) -> _T: ...
+
+
+@overload
+def rpc_method(*, priority: QMI_RpcPriority = ..., thread_safe: bool = ...) -> Callable[[_T], _T]: ...
+
+
+def rpc_method(method: Any = None,
+               *,
+               priority: QMI_RpcPriority = QMI_RpcPriority.NORMAL,
+               thread_safe: bool = False
+               ) -> Any:
+    """Decorator to indicate that a method can be called via RPC.
+
+    The decorator can be applied as ``@rpc_method``, or with options as
+    ``@rpc_method(priority=QMI_RpcPriority.HIGH)``.
+
+    Parameters:
+        priority: Priority of requests for this method. Pending requests of higher priority
+            are handled before requests of lower priority. A caller may override the priority
+            of a single request with the `rpc_priority` keyword argument.
+        thread_safe: True if the method may run concurrently with other methods of the object.
+            This has effect only if the class allows concurrent calls via `_rpc_max_concurrency`.
+    """
+    def decorate(func: _T) -> _T:
+        func._rpc_method = True  # type: ignore
+        func._rpc_priority = QMI_RpcPriority(priority)  # type: ignore
+        func._rpc_thread_safe = thread_safe  # type: ignore
+        return func
+
+    if method is None:
+        return decorate
+    return decorate(method)
 
 
 def is_rpc_method(object: Any) -> bool:
@@ -871,8 +1107,15 @@ class QMI_RpcObject(metaclass=_RpcObjectMetaClass):
     Instances of `QMI_RpcObject` may publish QMI signals. Each instance may
     register a set of signals. Once registered, such signals can be published
     into the QMI network and routed to subscribed receivers.
+
+    By default, RPC methods are executed one at a time in the thread of the object.
+    Subclasses may set the class attribute `_rpc_max_concurrency` to a positive number
+    to run methods marked with ``@rpc_method(thread_safe=True)`` in a pool of up to that
+    many worker threads, concurrently with the other methods of the object.
     """
 
+    _rpc_max_concurrency = 0
+
     @classmethod
     def get_category(cls) -> str | None:
         """Return the optional name of the category this object belongs to.
@@ -1075,6 +1318,10 @@ class _RpcThread(QMI_Thread):
     of `QMI_RpcObject`. A separate instance of `RpcThread` is created for each
     RPC object instance.
 
+    Pending requests are kept in a priority queue and handled in order of priority,
+    and in order of arrival among requests of equal priority. Requests for thread-safe
+    methods bypass the queue and run in a worker pool if the object allows concurrent calls.
+
     This class is intended for internal use within QMI. Application programs
     should not interact with this class directly.
     """
@@ -1088,7 +1335,10 @@ class _RpcThread(QMI_Thread):
         self._rpc_object_maker = rpc_object_maker
         self._locking_token: QMI_LockTokenDescriptor | None = None  # thread maintains lock token
         self._cv = threading.Condition(threading.Lock())
-        self._fifo: deque = deque()
+        self._queue: list[tuple[int, int, QMI_MethodRpcRequestMessage | QMI_LockRpcRequestMessage, float]] = []
+        self._seqnr = 0
+        self._method_options: dict[str, tuple[QMI_RpcPriority, bool]] = {}
+        self._executor: ThreadPoolExecutor | None = None
         self._rpc_object: QMI_RpcObject | None = None
         self._exception:  BaseException | None = None
 
@@ -1156,14 +1406,32 @@ class _RpcThread(QMI_Thread):
         )
         return reply
 
-    def _handle_method_rpc_request(self, request: QMI_MethodRpcRequestMessage) -> QMI_MethodRpcReplyMessage:
-        """Handle RPC method request."""
+    def _handle_method_rpc_request(self,
+                                   request: QMI_MethodRpcRequestMessage,
+                                   receive_time: float,
+                                   trace_context: QMI_TraceContext | None = None
+                                   ) -> QMI_MethodRpcReplyMessage:
+        """Handle RPC method request.
+
+        Parameters:
+            request: The request message.
+            receive_time: Time at which the request was received, according to `time.monotonic()`.
+            trace_context: Trace context of the server span of this request, if it is part of a trace.
+        """
         assert self._rpc_object is not None
+        tracer = self._context.tracer
 
         # RPC method call - need to check if the caller may invoke the RPC method: allowed if the object is not
         # locked (token is None) or if the provided lock token matches the locking token.
         if self._locking_token is None or self._locking_token == request.lock_token:
+            # RPC calls made by the method become part of the trace of this request.
+            execute_trace_context = trace_context
+            if tracer is not None and trace_context is not None:
+                execute_trace_context = make_child_trace_context(trace_context)
+            previous_trace_context = set_current_trace_context(execute_trace_context)
+
             # Invoke the method; this can raise an exception or return a result.
+            start_time = time.monotonic()
             try:
                 method = self._check_and_get_method(request)
                 result_type = QMI_RpcFutureState.RESULT_IS_VALUE
@@ -1173,6 +1441,29 @@ class _RpcThread(QMI_Thread):
                 _logger.debug("RPC method call failed", exc_info=True)
                 result_type = QMI_RpcFutureState.RESULT_IS_EXCEPTION
                 result = exception
+
+            end_time = time.monotonic()
+            set_current_trace_context(previous_trace_context)
+            failed = (result_type == QMI_RpcFutureState.RESULT_IS_EXCEPTION)
+            self._context.rpc_statistics.record_execution(request.destination_address,
+                                                          request.method_name,
+                                                          start_time - receive_time,
+                                                          end_time - start_time,
+                                                          failed)
+
+            if tracer is not None and trace_context is not None:
+                assert execute_trace_context is not None
+                tracer.record_span("qmi.rpc.queue",
+                                   SpanKind.INTERNAL,
+                                   make_child_trace_context(trace_context),
+                                   receive_time,
+                                   start_time)
+                tracer.record_span("qmi.rpc.execute",
+                                   SpanKind.INTERNAL,
+                                   execute_trace_context,
+                                   start_time,
+                                   end_time,
+                                   error=repr(result) if failed else None)
         else:
             _logger.error("%s locked, method request without lock token is denied", self._rpc_object._name)
             result_type = QMI_RpcFutureState.OBJECT_IS_LOCKED
@@ -1185,8 +1476,39 @@ class _RpcThread(QMI_Thread):
             state=result_type,
             result=result
         )
+        # Only a peer which sent a trace context can unpickle a reply that carries one.
+        if (tracer is not None) and (trace_context is not None) \
+                and (getattr(request, "trace_context", None) is not None):
+            reply.trace_context = trace_context
         return reply
 
+    def _record_server_spans(self,
+                             request: QMI_MethodRpcRequestMessage,
+                             trace_context: QMI_TraceContext,
+                             receive_time: float,
+                             reply_time: float
+                             ) -> None:
+        """Record the span of sending the reply, and the server span of the complete request."""
+        tracer = self._context.tracer
+        if tracer is None:
+            return
+        end_time = time.monotonic()
+        tracer.record_span("qmi.rpc.reply",
+                           SpanKind.INTERNAL,
+                           make_child_trace_context(trace_context),
+                           reply_time,
+                           end_time)
+        address = request.destination_address
+        tracer.record_span(f"{address.context_id}.{address.object_id}/{request.method_name}",
+                           SpanKind.SERVER,
+                           trace_context,
+                           receive_time,
+                           end_time,
+                           {"rpc.system": "qmi",
+                            "rpc.service": f"{address.context_id}.{address.object_id}",
+                            "rpc.method": request.method_name,
+                            "qmi.caller": request.source_address.context_id})
+
     def _check_and_get_method(self, request: QMI_MethodRpcRequestMessage):
         """Check if the object has the method requested and is RPC callable; if so, return it."""
         assert self._rpc_object is not None
@@ -1212,9 +1534,9 @@ class _RpcThread(QMI_Thread):
         while True:
             # Get next pending request.
             with self._cv:
-                if not self._fifo:
+                if not self._queue:
                     break
-                request = self._fifo.popleft()
+                (_, _, request, _) = heapq.heappop(self._queue)
 
             # Sanity check (this has already been checked by the RpcObjectManager).
             assert isinstance(request, (QMI_MethodRpcRequestMessage, QMI_LockRpcRequestMessage))
@@ -1278,47 +1600,49 @@ class _RpcThread(QMI_Thread):
             _logger.info("Stopping RPC thread (initialization failed)")
             return
 
+        # Collect the priority and thread-safety of the RPC methods.
+        method_options = {name: (getattr(method, "_rpc_priority", QMI_RpcPriority.NORMAL),
+                                 getattr(method, "_rpc_thread_safe", False))
+                          for (name, method) in inspect.getmembers(type(rpc_object), is_rpc_method)}
+        executor = None
+        if rpc_object._rpc_max_concurrency > 0:
+            executor = ThreadPoolExecutor(max_workers=rpc_object._rpc_max_concurrency,
+                                          thread_name_prefix=f"QMI_RpcWorker_{rpc_object.get_name()}")
+
         # Notify the outside world that initialization is finished.
         with self._cv:
             self._rpc_object = rpc_object
+            self._method_options = method_options
+            self._executor = executor
+
+            # Requests received during initialization are queued without the priority declared by their method.
+            queued = [(request, receive_time) for (_, _, request, receive_time) in self._queue]
+            self._queue.clear()
+            for (request, receive_time) in queued:
+                self._enqueue_request(request, receive_time)
+
             self._cv.notify_all()
 
         # Request handling phase.
         while True:
             with self._cv:
                 # Wait for RPC request or shutdown request.
-                while (not self._shutdown_requested) and (not self._fifo):
+                while (not self._shutdown_requested) and (not self._queue):
                     self._cv.wait()
 
                 # End the request loop if shutdown requested.
                 if self._shutdown_requested:
+                    self._executor = None
                     break
 
-                request = self._fifo.popleft()
-
-            # Process request.
-            reply: QMI_MethodRpcReplyMessage | QMI_LockRpcReplyMessage | None
-            if isinstance(request, QMI_MethodRpcRequestMessage):
-                reply = self._handle_method_rpc_request(request)
-            elif isinstance(request, QMI_LockRpcRequestMessage):
-                reply = self._handle_lock_rpc_request(request)
-            else:
-                raise ValueError(f"Unknown request type: {type(request)}")
+                (_, _, request, receive_time) = heapq.heappop(self._queue)
 
-            # Send reply.
-            try:
-                self._context.send_message(reply)
-            except QMI_MessageDeliveryException:
-                # Catch exceptions from sending message (avoid crashing the RPC thread on message delivery error).
-                _logger.error(
-                    "Failed to send RPC reply message from %s.%s to %s.%s",
-                    request.destination_address.context_id,
-                    request.destination_address.object_id,
-                    request.source_address.context_id,
-                    request.source_address.object_id
-                )
+            self._process_request(request, receive_time)
+            del request
 
-            del request, reply
+        # Wait until concurrent method calls are finished.
+        if executor is not None:
+            executor.shutdown(wait=True)
 
         # Reject any requests that are still in our queue.
         self._reject_remaining_requests()
@@ -1332,11 +1656,85 @@ class _RpcThread(QMI_Thread):
 
         _logger.debug("Stopping RPC thread")
 
-    def push_rpc_request(self, rpc_request: QMI_MethodRpcRequestMessage | QMI_LockRpcRequestMessage  | None) -> None:
+    def _process_request(self,
+                         request: QMI_MethodRpcRequestMessage | QMI_LockRpcRequestMessage,
+                         receive_time: float
+                         ) -> None:
+        """Handle an RPC request and send the reply.
+
+        This runs in the RPC thread, or in a worker thread for concurrent calls of thread-safe methods.
+        """
+        reply: QMI_MethodRpcReplyMessage | QMI_LockRpcReplyMessage | None
+        trace_context: QMI_TraceContext | None = None
+        if isinstance(request, QMI_MethodRpcRequestMessage):
+            # Continue the trace of the caller; start a server span if tracing is enabled.
+            trace_context = getattr(request, "trace_context", None)
+            if self._context.tracer is not None:
+                trace_context = make_child_trace_context(trace_context)
+            reply = self._handle_method_rpc_request(request, receive_time, trace_context)
+        elif isinstance(request, QMI_LockRpcRequestMessage):
+            reply = self._handle_lock_rpc_request(request)
+        else:
+            raise ValueError(f"Unknown request type: {type(request)}")
+
+        # Send reply.
+        reply_time = time.monotonic()
+        try:
+            self._context.send_message(reply)
+        except QMI_MessageDeliveryException:
+            # Catch exceptions from sending message (avoid crashing the RPC thread on message delivery error).
+            _logger.error(
+                "Failed to send RPC reply message from %s.%s to %s.%s",
+                request.destination_address.context_id,
+                request.destination_address.object_id,
+                request.source_address.context_id,
+                request.source_address.object_id
+            )
+
+        if trace_context is not None:
+            assert isinstance(request, QMI_MethodRpcRequestMessage)
+            self._record_server_spans(request, trace_context, receive_time, reply_time)
+
+    def _process_concurrent_request(self,
+                                    request: QMI_MethodRpcRequestMessage | QMI_LockRpcRequestMessage,
+                                    receive_time: float
+                                    ) -> None:
+        """Handle a request in a worker thread; the worker pool would silently drop any exception."""
+        try:
+            self._process_request(request, receive_time)
+        except BaseException:
+            _logger.exception("Failed to handle concurrent RPC request %s", request.request_id)
+
+    def _enqueue_request(self,
+                         request: QMI_MethodRpcRequestMessage | QMI_LockRpcRequestMessage,
+                         receive_time: float
+                         ) -> None:
+        """Queue a request according to its priority, or start it in the worker pool. Called with `_cv` held."""
+        if isinstance(request, QMI_LockRpcRequestMessage):
+            # Querying the lock state does not change it and may overtake other requests.
+            # Acquiring and releasing the lock stay in order with the method calls.
+            thread_safe = False
+            if request.lock_action == QMI_LockRpcAction.QUERY:
+                priority = QMI_RpcPriority.HIGH
+            else:
+                priority = QMI_RpcPriority.NORMAL
+        else:
+            (priority, thread_safe) = self._method_options.get(request.method_name,
+                                                               (QMI_RpcPriority.NORMAL, False))
+            priority = getattr(request, "priority", priority)
+
+        if thread_safe and (self._executor is not None):
+            self._executor.submit(self._process_concurrent_request, request, receive_time)
+        else:
+            heapq.heappush(self._queue, (-priority, self._seqnr, request, receive_time))
+            self._seqnr += 1
+            self._cv.notify_all()
+
+    def push_rpc_request(self, rpc_request: QMI_MethodRpcRequestMessage | QMI_LockRpcRequestMessage) -> None:
         """Push an RPC request into the request queue and notify the thread."""
+        receive_time = time.monotonic()
         with self._cv:
-            self._fifo.append(rpc_request)
-            self._cv.notify_all()
+            self._enqueue_request(rpc_request, receive_time)
 
 
 class RpcObjectManager(QMI_MessageHandler):
@@ -96,30 +96,106 @@ Example of a custom task runner::
     proxy.stop()
     proxy.join()
 
+Reactive tasks
+##############
+
+Tasks that react to signals or settings changes can subclass `QMI_ReactiveTask`
+instead of polling a `QMI_SignalReceiver` in a `QMI_LoopTask`. The task thread
+sleeps until new settings or signals arrive, or until the task is stopped,
+and then immediately calls `on_settings()` or `on_signals()`.
+
+Scheduled loop tasks
+####################
+
+Each task normally runs in its own dedicated thread. Applications with many
+`QMI_LoopTask` instances can instead run loop tasks on a central scheduler,
+which keeps waiting tasks in a timer wheel and runs due loop iterations on a
+small pool of shared worker threads. A loop task opts in by setting the class
+attribute ``use_scheduler = True``::
+
+    class MyLoopTask(QMI_LoopTask):
+        use_scheduler = True
+        ...
+
+Scheduled loop tasks use the same loop hooks and missed-loop policies as
+loop tasks in a dedicated thread. Since the worker threads are shared, a loop
+iteration should not block for long; a blocking iteration delays other tasks.
+The delay between the moment an iteration is due and the moment it actually
+starts can be inspected via `QMI_TaskRunner.get_scheduling_statistics()`.
+
+Precise loop pacing
+###################
+
+By default, a `QMI_LoopTask` waits for its next iteration with `QMI_Task.sleep()`,
+which typically wakes up tens to hundreds of microseconds late. Fast feedback loops
+can set the class attribute ``precise_pacing = True``. The task then sleeps until
+shortly before the deadline of the next iteration and busy-waits for the rest, and
+reduces the timer slack of its thread on Linux. The busy-wait time is calibrated
+when the task starts, or set via ``pacing_spin_time``.
+
+The class attributes ``cpu_affinity`` and ``realtime_priority`` restrict the task thread
+to a set of CPUs and give it a `SCHED_FIFO` real-time priority. These are hints:
+if the operating system does not support them or the process lacks permission,
+a warning is logged and the task runs normally. Loop tasks on the central scheduler
+can not use precise pacing or these hints.
+
+Loop timing statistics
+######################
+
+A `QMI_LoopTask` can record the timing of its iterations: the lateness of each
+wake-up, the duration of `loop_iteration()`, the overhead of processing settings,
+status and signals, and the number of missed loop periods. Recording is off
+by default and is switched on through the task proxy::
+
+    proxy.enable_loop_statistics(window=1000, publish_interval=10.0)
+    ...
+    stats = proxy.get_loop_statistics()
+    print("99th percentile lateness:", stats.wakeup_lateness.percentile(99))
+
+When a publish interval is given, the task also publishes the statistics
+via its `sig_loop_statistics` signal.
+
 Reference
 #########
 """
 
+import array
 import collections
+import ctypes
 import enum
 import inspect
 import logging
+import math
+import os
+import queue
+import sys
 import threading
 import time
-from typing import Any, Generic, Type, TypeVar, TYPE_CHECKING
+from typing import Any, Generic, NamedTuple, Type, TypeVar, TYPE_CHECKING
 from collections.abc import Callable
 
 from qmi.core.rpc import QMI_RpcObject, rpc_method
-from qmi.core.pubsub import SignalDescription, QMI_Signal, QMI_RegisteredSignal
+from qmi.core.pubsub import (
+    SignalDescription, QMI_Signal, QMI_RegisteredSignal, QMI_SignalReceiver, ReceivedSignal)
 from qmi.core.thread import QMI_Thread
 from qmi.core.exceptions import (
     QMI_TaskInitException, QMI_TaskRunException, QMI_TaskStopException,
     QMI_UsageException, QMI_WrongThreadException)
-from qmi.core.util import is_valid_object_name
+from qmi.core.util import is_valid_object_name, QMI_TimingHistogram, TIMING_HISTOGRAM_BIN_EDGES, \
+    TIMING_HISTOGRAM_NUM_BINS, timing_histogram_bin
 
 # Global variable holding the logger for this module.
 _logger = logging.getLogger(__name__)
 
+# Linux prctl() function, used to reduce the timer slack of precisely paced loop tasks.
+_PR_SET_TIMERSLACK = 29
+_prctl = None
+if sys.platform.startswith("linux"):
+    try:
+        _prctl = ctypes.CDLL(None, use_errno=True).prctl
+    except (AttributeError, OSError):
+        pass
+
 # Global definitions for type variables used in this module
 _SET = TypeVar("_SET")  # task settings
 _STS = TypeVar("_STS")  # task status
@@ -197,7 +273,7 @@ class QMI_Task(Generic[_SET, _STS], metaclass=_TaskMetaClass):
         """
 
         # Check that task is initialized inside the task thread.
-        if task_runner._thread is not threading.current_thread():
+        if not task_runner._thread.in_task_thread():
             raise QMI_WrongThreadException()
 
         _logger.debug("Initializing task %s", name)
@@ -249,7 +325,7 @@ class QMI_Task(Generic[_SET, _STS], metaclass=_TaskMetaClass):
         """
 
         # Check that this method is called only from within the task thread.
-        if self._task_runner._thread is not threading.current_thread():
+        if not self._task_runner._thread.in_task_thread():
             raise QMI_WrongThreadException()
 
         if self._stop_requested.wait(duration):
@@ -269,7 +345,7 @@ class QMI_Task(Generic[_SET, _STS], metaclass=_TaskMetaClass):
         """
 
         # Check that this method is called only from within the task thread.
-        if self._task_runner._thread is not threading.current_thread():
+        if not self._task_runner._thread.in_task_thread():
             raise QMI_WrongThreadException()
 
         # Try to obtain new settings.
@@ -280,6 +356,14 @@ class QMI_Task(Generic[_SET, _STS], metaclass=_TaskMetaClass):
 
         return False
 
+    def _notify_new_settings(self) -> None:
+        """Called by the task runner after new settings are sent to the task.
+
+        Subclasses may override this method to wake up the task thread.
+        The default implementation does nothing.
+        """
+        pass
+
     def run(self) -> None:
         """Main function of the task.
 
@@ -289,10 +373,10 @@ class QMI_Task(Generic[_SET, _STS], metaclass=_TaskMetaClass):
         raise NotImplementedError()
 
 
-class _TaskThread(QMI_Thread):
-    """A TaskThread is a dedicated thread which runs a QMI task.
+class _TaskControl:
+    """State and control of a task instance, independent of how the task runs.
 
-    This is an internal QMI class, used exclusively by the QMI_TaskRunner.
+    This is an internal QMI class, used by `_TaskThread` and `_ScheduledLoopTask`.
     This class should never be used or accessed directly in application code.
     """
 
@@ -313,7 +397,6 @@ class _TaskThread(QMI_Thread):
                  task_args: tuple,
                  task_kwargs: dict
                  ) -> None:
-        super().__init__()
         self._task_runner = task_runner
         self._task_name = task_name
         self._task_class = task_class
@@ -321,13 +404,21 @@ class _TaskThread(QMI_Thread):
         self._task_kwargs = task_kwargs
         self.task: QMI_Task | None = None
         self._exception: BaseException | None = None
-        self._state = _TaskThread.State.INITIAL
+        self._state = _TaskControl.State.INITIAL
         self._state_cond = threading.Condition()
         self._wait_cond_lock = threading.Lock()
         self._wait_cond: threading.Condition | None = None
 
-    def run(self) -> None:
-        """Main function inside the thread."""
+    def in_task_thread(self) -> bool:
+        """Return True if called from the thread which currently runs the task code."""
+        raise NotImplementedError()
+
+    def _create_task(self) -> bool:
+        """Create the task instance. This must be called in the thread which runs the task code.
+
+        Returns:
+            True if the task was created, False if initialization of the task failed.
+        """
 
         try:
             # Create the task instance.
@@ -336,58 +427,22 @@ class _TaskThread(QMI_Thread):
                                          *self._task_args,
                                          **self._task_kwargs)
         except BaseException as exception:
-            # Initialization failed. Report exception and stop the thread.
+            # Initialization failed. Report exception.
             with self._state_cond:
                 _logger.warning("Initialization of task %s failed", self._task_name, exc_info=True)
                 self._exception = exception
-                self._state = _TaskThread.State.EXCEPTION_WHILE_INSTANTIATING_TASK
+                self._state = _TaskControl.State.EXCEPTION_WHILE_INSTANTIATING_TASK
                 self._state_cond.notify_all()
-                return
+                return False
 
         # Notify the outside world that the task was initialized.
         with self._state_cond:
-            assert self._state in (_TaskThread.State.INITIAL, _TaskThread.State.TASK_STOPPED_BEFORE_START)
-            if self._state == _TaskThread.State.INITIAL:
-                self._state = _TaskThread.State.READY_TO_RUN
+            assert self._state in (_TaskControl.State.INITIAL, _TaskControl.State.TASK_STOPPED_BEFORE_START)
+            if self._state == _TaskControl.State.INITIAL:
+                self._state = _TaskControl.State.READY_TO_RUN
                 self._state_cond.notify_all()
 
-        _logger.debug("Task thread %s ready to run", self._task_name)
-
-        # Wait until the outside world tells us to continue.
-        with self._state_cond:
-            while self._state == _TaskThread.State.READY_TO_RUN:
-                self._state_cond.wait()
-            if self._state != _TaskThread.State.RUNNING:
-                # The task was stopped before it was even started.
-                # Do not call the task run() method, just stop the thread.
-                _logger.debug("Task thread %s stopped before start", self._task_name)
-                return
-
-        _logger.debug("Task thread %s starts running", self._task_name)
-
-        try:
-            # Invoke the task main function.
-            self.task.run()
-        except QMI_TaskStopException:
-            # The task was stopped via QMI_TaskStopException.
-            # Log this, but don't re-raise the exception.
-            _logger.warning("Task %s stopped on QMI_TaskStopException", self._task_name, exc_info=True)
-        except BaseException as exception:
-            # The task main function raised an exception.
-            # Report the exception and stop the thread.
-            with self._state_cond:
-                _logger.warning("Exception in task %s", self._task_name, exc_info=True)
-                self._exception = exception
-                self._state = _TaskThread.State.EXCEPTION_WHILE_RUNNING_TASK
-                self._state_cond.notify_all()
-                return
-
-        # Notify the outside world that the task is finished.
-        with self._state_cond:
-            self._state = _TaskThread.State.TASK_COMPLETED_NORMALLY
-            self._state_cond.notify_all()
-
-        _logger.debug("Task thread %s completed normally", self._task_name)
+        return True
 
     def get_state(self) -> tuple[State, BaseException | None]:
         """Return task state and any exception that occurred in the task."""
@@ -397,7 +452,7 @@ class _TaskThread(QMI_Thread):
     def wait_until_initialized(self) -> None:
         """Block until initialization of the task is finished."""
         with self._state_cond:
-            while self._state == _TaskThread.State.INITIAL:
+            while self._state == _TaskControl.State.INITIAL:
                 self._state_cond.wait()
 
     def start_task(self) -> None:
@@ -410,12 +465,12 @@ class _TaskThread(QMI_Thread):
         """
         with self._state_cond:
             # Wait until initialization finished.
-            while self._state == _TaskThread.State.INITIAL:
+            while self._state == _TaskControl.State.INITIAL:
                 self._state_cond.wait()
             # Sanity check on task state.
-            assert self._state == _TaskThread.State.READY_TO_RUN
+            assert self._state == _TaskControl.State.READY_TO_RUN
             # Kick task to RUNNING state.
-            self._state = _TaskThread.State.RUNNING
+            self._state = _TaskControl.State.RUNNING
             self._state_cond.notify_all()
 
     def stop_task(self) -> None:
@@ -431,21 +486,21 @@ class _TaskThread(QMI_Thread):
 
         with self._state_cond:
 
-            if self._state == _TaskThread.State.EXCEPTION_WHILE_INSTANTIATING_TASK:
+            if self._state == _TaskControl.State.EXCEPTION_WHILE_INSTANTIATING_TASK:
                 # Task already stopped.
                 return
 
-            if self._state in (_TaskThread.State.INITIAL, _TaskThread.State.READY_TO_RUN):
+            if self._state in (_TaskControl.State.INITIAL, _TaskControl.State.READY_TO_RUN):
                 # Task is still waiting to start. Stop it now.
-                self._state = _TaskThread.State.TASK_STOPPED_BEFORE_START
+                self._state = _TaskControl.State.TASK_STOPPED_BEFORE_START
                 self._state_cond.notify_all()
                 return
 
             # Sanity check on task state.
-            assert self._state in (_TaskThread.State.RUNNING,
-                                   _TaskThread.State.TASK_COMPLETED_NORMALLY,
-                                   _TaskThread.State.EXCEPTION_WHILE_RUNNING_TASK,
-                                   _TaskThread.State.TASK_STOPPED_BEFORE_START)
+            assert self._state in (_TaskControl.State.RUNNING,
+                                   _TaskControl.State.TASK_COMPLETED_NORMALLY,
+                                   _TaskControl.State.EXCEPTION_WHILE_RUNNING_TASK,
+                                   _TaskControl.State.TASK_STOPPED_BEFORE_START)
             assert self.task is not None
 
         # Set flag to make task code stop.
@@ -454,7 +509,7 @@ class _TaskThread(QMI_Thread):
         # If the task is waiting on a condition, force it to wake up.
         with self._wait_cond_lock:
             # DO NOT hold self._wait_cond_lock while locking the condition lock.
-            # Doing so could cause deadlock since] wait_for_condition() holds
+            # Doing so could cause deadlock since wait_for_condition() holds
             # the condition lock while locking self._wait_cond_lock.
             wait_cond = self._wait_cond
 
@@ -462,11 +517,6 @@ class _TaskThread(QMI_Thread):
             with wait_cond:
                 wait_cond.notify_all()
 
-    def _request_shutdown(self) -> None:
-        # Stop the task during Python shutdown.
-        _logger.warning("Stopping task %s during shutdown", self._task_name)
-        self.stop_task()
-
     def wait_for_condition(self,
                            cond: threading.Condition,
                            predicate: Callable[[], bool],
@@ -479,8 +529,7 @@ class _TaskThread(QMI_Thread):
         This is done by internally notifying the condition variable when a stop
         request is received.
 
-        This function may only be called from the thread that is represented
-        by this instance of `_TaskThread`.
+        This function may only be called from the thread that currently runs the task code.
 
         Parameters:
             cond:       Condition variable to wait on. The calling thread
@@ -501,8 +550,8 @@ class _TaskThread(QMI_Thread):
                 the condition becomes true.
         """
 
-        # Check that this method is called from within this thread.
-        assert threading.current_thread() is self
+        # Check that this method is called from within the task thread.
+        assert self.in_task_thread()
         assert self.task is not None
 
         # Register the condition variable on which we are going to wait.
@@ -529,6 +578,525 @@ class _TaskThread(QMI_Thread):
                 self._wait_cond = None
 
 
+class _TaskThread(QMI_Thread, _TaskControl):
+    """A TaskThread is a dedicated thread which runs a QMI task.
+
+    This is an internal QMI class, used exclusively by the QMI_TaskRunner.
+    This class should never be used or accessed directly in application code.
+    """
+
+    def __init__(self,
+                 task_runner: 'QMI_TaskRunner',
+                 task_name: str,
+                 task_class: Type[QMI_Task],
+                 task_args: tuple,
+                 task_kwargs: dict
+                 ) -> None:
+        QMI_Thread.__init__(self)
+        _TaskControl.__init__(self, task_runner, task_name, task_class, task_args, task_kwargs)
+
+    def in_task_thread(self) -> bool:
+        return threading.current_thread() is self
+
+    def run(self) -> None:
+        """Main function inside the thread."""
+
+        # Create the task instance.
+        if not self._create_task():
+            # Initialization failed. Stop the thread.
+            return
+
+        _logger.debug("Task thread %s ready to run", self._task_name)
+
+        # Wait until the outside world tells us to continue.
+        with self._state_cond:
+            while self._state == _TaskControl.State.READY_TO_RUN:
+                self._state_cond.wait()
+            if self._state != _TaskControl.State.RUNNING:
+                # The task was stopped before it was even started.
+                # Do not call the task run() method, just stop the thread.
+                _logger.debug("Task thread %s stopped before start", self._task_name)
+                return
+
+        _logger.debug("Task thread %s starts running", self._task_name)
+
+        try:
+            # Invoke the task main function.
+            assert self.task is not None
+            self.task.run()
+        except QMI_TaskStopException:
+            # The task was stopped via QMI_TaskStopException.
+            # Log this, but don't re-raise the exception.
+            _logger.warning("Task %s stopped on QMI_TaskStopException", self._task_name, exc_info=True)
+        except BaseException as exception:
+            # The task main function raised an exception.
+            # Report the exception and stop the thread.
+            with self._state_cond:
+                _logger.warning("Exception in task %s", self._task_name, exc_info=True)
+                self._exception = exception
+                self._state = _TaskControl.State.EXCEPTION_WHILE_RUNNING_TASK
+                self._state_cond.notify_all()
+                return
+
+        # Notify the outside world that the task is finished.
+        with self._state_cond:
+            self._state = _TaskControl.State.TASK_COMPLETED_NORMALLY
+            self._state_cond.notify_all()
+
+        _logger.debug("Task thread %s completed normally", self._task_name)
+
+    def _request_shutdown(self) -> None:
+        # Stop the task during Python shutdown.
+        _logger.warning("Stopping task %s during shutdown", self._task_name)
+        self.stop_task()
+
+
+class QMI_LoopTaskStatistics(NamedTuple):
+    """Timing statistics of a `QMI_LoopTask`.
+
+    The histograms cover a rolling window of the most recent loop iterations.
+    The totals count all iterations since statistics were enabled.
+
+    Attributes:
+        iterations: Total number of loop iterations.
+        missed_periods: Total number of loop periods that started late or were skipped.
+        wakeup_lateness: Delay between the due time of an iteration and its actual start.
+        iteration_duration: Duration of `loop_iteration()`.
+        overhead: Time spent processing settings, updating status and publishing signals.
+    """
+    iterations: int
+    missed_periods: int
+    wakeup_lateness: QMI_TimingHistogram
+    iteration_duration: QMI_TimingHistogram
+    overhead: QMI_TimingHistogram
+
+
+class _RollingHistogram:
+    """Logarithmic histogram of the most recent values of a timing quantity.
+
+    The histogram is updated only by the task thread. Other threads take snapshots
+    without locking; a snapshot taken during an update may be off by one value.
+    """
+
+    def __init__(self, window: int) -> None:
+        self._values = array.array("d", [0.0]) * window
+        self._bins = array.array("B", [0]) * window
+        self._counts = array.array("L", [0]) * TIMING_HISTOGRAM_NUM_BINS
+        self._window = window
+        self._index = 0
+        self._count = 0
+
+    def add(self, value: float) -> None:
+        """Add a value in seconds, replacing the oldest value when the window is full."""
+        index = self._index
+        if self._count == self._window:
+            self._counts[self._bins[index]] -= 1
+        else:
+            self._count += 1
+        bin_index = timing_histogram_bin(value)
+        self._values[index] = value
+        self._bins[index] = bin_index
+        self._counts[bin_index] += 1
+        self._index = (index + 1) % self._window
+
+    def snapshot(self) -> QMI_TimingHistogram:
+        count = self._count
+        values = self._values[:count]
+        return QMI_TimingHistogram(num_values=count,
+                                   mean=(sum(values) / count) if count else 0.0,
+                                   max=max(values, default=0.0),
+                                   bin_edges=TIMING_HISTOGRAM_BIN_EDGES,
+                                   counts=tuple(self._counts))
+
+
+class _LoopStatistics:
+    """Timing statistics collected by a `QMI_LoopTask` while enabled.
+
+    This is an internal QMI class, used by `QMI_LoopTask` and `QMI_TaskRunner`.
+    """
+
+    def __init__(self, window: int, publish_interval: float | None) -> None:
+        self.iterations = 0
+        self.missed_periods = 0
+        self.wakeup_lateness = _RollingHistogram(window)
+        self.iteration_duration = _RollingHistogram(window)
+        self.overhead = _RollingHistogram(window)
+        self.publish_interval = publish_interval
+        self.next_publish_time = time.monotonic() + publish_interval if publish_interval else math.inf
+
+    def snapshot(self) -> QMI_LoopTaskStatistics:
+        return QMI_LoopTaskStatistics(iterations=self.iterations,
+                                      missed_periods=self.missed_periods,
+                                      wakeup_lateness=self.wakeup_lateness.snapshot(),
+                                      iteration_duration=self.iteration_duration.snapshot(),
+                                      overhead=self.overhead.snapshot())
+
+
+class QMI_LoopTaskSchedulingStatistics(NamedTuple):
+    """Scheduling statistics of a loop task which runs on the central loop task scheduler.
+
+    The scheduling latency of an iteration is the delay between the moment the iteration
+    was due to start and the moment a worker thread actually started it.
+
+    Attributes:
+        iterations: Number of loop iterations that were started.
+        mean_latency: Mean scheduling latency in seconds.
+        max_latency: Maximum scheduling latency in seconds.
+        last_latency: Scheduling latency of the most recent iteration in seconds.
+    """
+    iterations: int
+    mean_latency: float
+    max_latency: float
+    last_latency: float
+
+
+class _ScheduledLoopTask(_TaskControl):
+    """Runs a `QMI_LoopTask` on the central loop task scheduler instead of a dedicated thread.
+
+    Each step runs one loop iteration in one of the shared worker threads,
+    then hands the task back to the timer wheel until the next iteration is due.
+
+    This is an internal QMI class, used exclusively by the QMI_TaskRunner.
+    This class should never be used or accessed directly in application code.
+    """
+
+    def __init__(self,
+                 task_runner: 'QMI_TaskRunner',
+                 task_name: str,
+                 task_class: Type[QMI_Task],
+                 task_args: tuple,
+                 task_kwargs: dict
+                 ) -> None:
+        super().__init__(task_runner, task_name, task_class, task_args, task_kwargs)
+        self._scheduler: _LoopTaskScheduler | None = None
+        self._current_thread: threading.Thread | None = None
+        self._next_time: float | None = None
+        self._due_time = 0.0
+        self._iterations = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+        self._last_latency = 0.0
+
+        # Fields managed by the scheduler, protected by the scheduler lock.
+        self.timer_tick: int | None = None
+
+    def in_task_thread(self) -> bool:
+        return threading.current_thread() is self._current_thread
+
+    def start(self) -> None:
+        """Create the task instance in the calling thread."""
+        self._current_thread = threading.current_thread()
+        try:
+            self._create_task()
+        finally:
+            self._current_thread = None
+
+    def join(self) -> None:
+        """Wait until the task is finished, then release the scheduler."""
+        with self._state_cond:
+            while self._state in (_TaskControl.State.INITIAL,
+                                  _TaskControl.State.READY_TO_RUN,
+                                  _TaskControl.State.RUNNING):
+                self._state_cond.wait()
+        if self._scheduler is not None:
+            self._scheduler.release()
+            self._scheduler = None
+
+    def start_task(self) -> None:
+        super().start_task()
+        _logger.debug("Submitting task %s to loop task scheduler", self._task_name)
+        self._scheduler = _LoopTaskScheduler.acquire()
+        self._due_time = time.monotonic()
+        self._scheduler.submit(self)
+
+    def stop_task(self) -> None:
+        super().stop_task()
+        # Run the task as soon as possible if it is waiting for its next iteration.
+        scheduler = self._scheduler
+        if scheduler is not None:
+            scheduler.wake(self)
+
+    def stop_requested(self) -> bool:
+        """Return True if the task should stop."""
+        assert self.task is not None
+        return self.task._stop_requested.is_set()
+
+    def get_statistics(self) -> QMI_LoopTaskSchedulingStatistics:
+        """Return scheduling statistics of the task."""
+        with self._state_cond:
+            iterations = self._iterations
+            mean_latency = (self._total_latency / iterations) if iterations else 0.0
+            return QMI_LoopTaskSchedulingStatistics(iterations=iterations,
+                                                    mean_latency=mean_latency,
+                                                    max_latency=self._max_latency,
+                                                    last_latency=self._last_latency)
+
+    def run_step(self) -> None:
+        """Run one iteration of the task. This is called by a worker thread of the scheduler."""
+
+        latency = max(0.0, time.monotonic() - self._due_time)
+
+        self._current_thread = threading.current_thread()
+        try:
+            (finished, wake_time) = self._run_iteration(latency)
+        except BaseException as exception:
+            # The task raised an exception. Report the exception and drop the task.
+            with self._state_cond:
+                _logger.warning("Exception in task %s", self._task_name, exc_info=True)
+                self._exception = exception
+                self._state = _TaskControl.State.EXCEPTION_WHILE_RUNNING_TASK
+                self._state_cond.notify_all()
+            return
+        finally:
+            self._current_thread = None
+
+        if finished:
+            # Notify the outside world that the task is finished.
+            with self._state_cond:
+                self._state = _TaskControl.State.TASK_COMPLETED_NORMALLY
+                self._state_cond.notify_all()
+            _logger.debug("Scheduled task %s completed normally", self._task_name)
+            return
+
+        # Hand the task back to the scheduler until the next iteration is due.
+        assert self._scheduler is not None
+        self._due_time = time.monotonic() if wake_time is None else wake_time
+        self._scheduler.schedule(self, self._due_time)
+
+    def _run_iteration(self, latency: float) -> tuple[bool, float | None]:
+        """Run one iteration of the loop task.
+
+        This mirrors one pass through the loop in `QMI_LoopTask.run()`.
+
+        Parameters:
+            latency: Delay in seconds between the due time of this step and its actual start.
+
+        Returns:
+            Tuple (finished, wake_time) where `finished` is True if the task has stopped,
+            and `wake_time` is the monotonic time at which the next iteration is due,
+            or None to run the next iteration immediately.
+        """
+        task = self.task
+        assert isinstance(task, QMI_LoopTask)
+
+        due_time = self._due_time
+        if self._next_time is None:
+            _logger.info("[%s] Starting...", self._task_name)
+            task.loop_prepare()
+            due_time = time.monotonic()
+            self._next_time = due_time + task._loop_period
+
+        finished = True
+        wake_time = None
+        try:
+            if not task.stop_requested():
+                with self._state_cond:
+                    self._iterations += 1
+                    self._total_latency += latency
+                    self._max_latency = max(self._max_latency, latency)
+                    self._last_latency = latency
+                task._loop_step(due_time)
+                (wake_time, self._next_time) = task._plan_next_iteration(self._next_time)
+                finished = task.stop_requested()
+        except QMI_TaskStopException:
+            pass  # not an error
+        finally:
+            if finished:
+                task.loop_finalize()
+
+        if finished:
+            _logger.info("[%s] Stopped", self._task_name)
+
+        return (finished, wake_time)
+
+
+class _LoopTaskWorker(QMI_Thread):
+    """Worker thread of the central loop task scheduler.
+
+    This is an internal QMI class, used exclusively by `_LoopTaskScheduler`.
+    """
+
+    def __init__(self, work_queue: queue.SimpleQueue) -> None:
+        super().__init__()
+        self._work_queue = work_queue
+        self.current_task: _ScheduledLoopTask | None = None
+
+    def run(self) -> None:
+        while True:
+            driver = self._work_queue.get()
+            if driver is None:
+                break
+            self.current_task = driver
+            try:
+                driver.run_step()
+            finally:
+                self.current_task = None
+
+    def _request_shutdown(self) -> None:
+        self._work_queue.put(None)
+
+    def wait_for_condition(self,
+                           cond: threading.Condition,
+                           predicate: Callable[[], bool],
+                           timeout: float | None
+                           ) -> bool:
+        """Wait until a condition becomes true, or until the current task is stopped."""
+        driver = self.current_task
+        if driver is None:
+            return cond.wait_for(predicate, timeout)
+        return driver.wait_for_condition(cond, predicate, timeout)
+
+
+class _LoopTaskScheduler(QMI_Thread):
+    """Central scheduler which runs many loop tasks on a small pool of worker threads.
+
+    Tasks that wait for their next iteration are kept in a hashed timer wheel.
+    The wheel consists of `NUM_SLOTS` slots of `TICK` seconds each; a task is placed
+    in the slot of the tick at which it becomes due, so that advancing the wheel only
+    inspects the tasks in the slots of elapsed ticks. The scheduler thread advances
+    the wheel, submits due tasks to the worker threads, and sleeps until the next
+    tick at which a task becomes due.
+
+    A single scheduler instance is shared by all loop tasks in the process.
+    It is started when the first scheduled task starts, and shut down when
+    the last scheduled task is joined.
+
+    This is an internal QMI class, used exclusively by the QMI_TaskRunner.
+    """
+
+    TICK = 0.005
+    NUM_SLOTS = 512
+    NUM_WORKERS = 4
+
+    _instance: '_LoopTaskScheduler | None' = None
+    _instance_refcount = 0
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def acquire(cls) -> '_LoopTaskScheduler':
+        """Return the shared scheduler instance, starting it if necessary."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = _LoopTaskScheduler()
+                cls._instance.start()
+            cls._instance_refcount += 1
+            return cls._instance
+
+    def release(self) -> None:
+        """Release a reference to the shared scheduler, stopping it when no longer used."""
+        cls = type(self)
+        with cls._instance_lock:
+            assert cls._instance is self
+            cls._instance_refcount -= 1
+            if cls._instance_refcount > 0:
+                return
+            cls._instance = None
+        self.shutdown()
+        self.join()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._cond = threading.Condition()
+        self._slots: list[list[_ScheduledLoopTask]] = [[] for _ in range(self.NUM_SLOTS)]
+        self._num_timers = 0
+        self._tick = self._current_tick()
+        self._wake_tick: float = math.inf
+        self._work_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._workers = [_LoopTaskWorker(self._work_queue) for _ in range(self.NUM_WORKERS)]
+
+    @classmethod
+    def _current_tick(cls) -> int:
+        return int(time.monotonic() / cls.TICK)
+
+    def submit(self, driver: _ScheduledLoopTask) -> None:
+        """Run the next step of the task as soon as a worker thread is available."""
+        self._work_queue.put(driver)
+
+    def schedule(self, driver: _ScheduledLoopTask, due_time: float) -> None:
+        """Run the next step of the task at the specified monotonic time."""
+        due_tick = math.ceil(due_time / self.TICK)
+        with self._cond:
+            if (due_tick <= self._current_tick()) or driver.stop_requested():
+                # Due now, or the task must stop as soon as possible.
+                self.submit(driver)
+                return
+            assert driver.timer_tick is None
+            driver.timer_tick = due_tick
+            self._slots[due_tick % self.NUM_SLOTS].append(driver)
+            self._num_timers += 1
+            if due_tick < self._wake_tick:
+                # Wake up the scheduler thread to recompute its wait time.
+                self._cond.notify()
+
+    def wake(self, driver: _ScheduledLoopTask) -> None:
+        """Run the next step of the task immediately if it is waiting in the timer wheel."""
+        with self._cond:
+            if driver.timer_tick is None:
+                # Task is running or already submitted; it checks for a stop request before rescheduling.
+                return
+            self._slots[driver.timer_tick % self.NUM_SLOTS].remove(driver)
+            driver.timer_tick = None
+            self._num_timers -= 1
+        self.submit(driver)
+
+    def _next_due_tick(self) -> int:
+        """Return the first tick after the current tick at which a task in the wheel becomes due.
+
+        At most one revolution of the wheel is scanned. If no task becomes due within it,
+        the tick one revolution ahead is returned, at which the wheel is scanned again.
+        """
+        for tick in range(self._tick + 1, self._tick + self.NUM_SLOTS):
+            for driver in self._slots[tick % self.NUM_SLOTS]:
+                if driver.timer_tick == tick:
+                    return tick
+        return self._tick + self.NUM_SLOTS
+
+    def run(self) -> None:
+        """Main function of the scheduler thread."""
+
+        for worker in self._workers:
+            worker.start()
+
+        with self._cond:
+            while not self._shutdown_requested:
+
+                if self._num_timers == 0:
+                    # Nothing to do until a task is scheduled.
+                    self._wake_tick = math.inf
+                    self._cond.wait()
+                    continue
+
+                # Advance the wheel over all elapsed ticks, visiting each slot at most once.
+                now_tick = self._current_tick()
+                for tick in range(self._tick + 1, min(now_tick, self._tick + self.NUM_SLOTS) + 1):
+                    slot = self._slots[tick % self.NUM_SLOTS]
+                    if slot:
+                        pending = []
+                        for driver in slot:
+                            assert driver.timer_tick is not None
+                            if driver.timer_tick <= now_tick:
+                                driver.timer_tick = None
+                                self._num_timers -= 1
+                                self.submit(driver)
+                            else:
+                                pending.append(driver)
+                        slot[:] = pending
+                self._tick = max(self._tick, now_tick)
+
+                # Sleep until the next task becomes due, or until a task is scheduled before that.
+                self._wake_tick = self._next_due_tick()
+                self._cond.wait(self._wake_tick * self.TICK - time.monotonic())
+
+        for worker in self._workers:
+            worker.shutdown()
+        for worker in self._workers:
+            worker.join()
+
+    def _request_shutdown(self) -> None:
+        with self._cond:
+            self._cond.notify_all()
+
+
 class QMI_TaskRunner(QMI_RpcObject):
     """Manager for a single task.
 
@@ -584,7 +1152,17 @@ class QMI_TaskRunner(QMI_RpcObject):
         self._policy = None
 
         # Create thread and start it.
-        self._thread = _TaskThread(self, name, task_class, task_args, task_kwargs)
+        # Loop tasks which opt in run on the central loop task scheduler instead.
+        self._thread: _TaskThread | _ScheduledLoopTask
+        if issubclass(task_class, QMI_LoopTask) and task_class.use_scheduler:
+            if (task_class.precise_pacing
+                    or (task_class.cpu_affinity is not None)
+                    or (task_class.realtime_priority is not None)):
+                raise QMI_UsageException(
+                    f"Task {name} on the loop task scheduler can not use precise pacing or thread hints")
+            self._thread = _ScheduledLoopTask(self, name, task_class, task_args, task_kwargs)
+        else:
+            self._thread = _TaskThread(self, name, task_class, task_args, task_kwargs)
         self._thread.start()
 
         # The thread will create an instance of the QMI_Task subclass.
@@ -592,14 +1170,14 @@ class QMI_TaskRunner(QMI_RpcObject):
         self._thread.wait_until_initialized()
         (state, exception) = self._thread.get_state()
 
-        if state == _TaskThread.State.EXCEPTION_WHILE_INSTANTIATING_TASK:
+        if state == _TaskControl.State.EXCEPTION_WHILE_INSTANTIATING_TASK:
             # An exception occurred during initialization.
             # Clean up task and re-raise the exception here.
             self._thread.join()
             assert isinstance(exception, BaseException)
             raise QMI_TaskInitException(f"Failed to initialize task {self._name}") from exception
 
-        assert state == _TaskThread.State.READY_TO_RUN
+        assert state == _TaskControl.State.READY_TO_RUN
         assert self._thread.task is not None
 
     @rpc_method
@@ -636,7 +1214,7 @@ class QMI_TaskRunner(QMI_RpcObject):
 
         # Check that task was not yet started.
         (state, dummy_exception) = self._thread.get_state()
-        if state != _TaskThread.State.READY_TO_RUN:
+        if state != _TaskControl.State.READY_TO_RUN:
             raise QMI_UsageException(f"Task {self._name} can not be started more than once")
 
         _logger.debug("Starting task %s", self._name)
@@ -681,9 +1259,9 @@ class QMI_TaskRunner(QMI_RpcObject):
 
         # Get the task state.
         (state, exception) = self._thread.get_state()
-        assert state in (_TaskThread.State.TASK_COMPLETED_NORMALLY,
-                         _TaskThread.State.EXCEPTION_WHILE_RUNNING_TASK,
-                         _TaskThread.State.TASK_STOPPED_BEFORE_START)
+        assert state in (_TaskControl.State.TASK_COMPLETED_NORMALLY,
+                         _TaskControl.State.EXCEPTION_WHILE_RUNNING_TASK,
+                         _TaskControl.State.TASK_STOPPED_BEFORE_START)
 
         # Break the reference cycle between QMI_TaskRunner and QMI_Task.
         assert self._thread.task is not None
@@ -692,7 +1270,7 @@ class QMI_TaskRunner(QMI_RpcObject):
         # Mark the task as joined (safe to be released).
         self._joined = True
 
-        if state == _TaskThread.State.EXCEPTION_WHILE_RUNNING_TASK:
+        if state == _TaskControl.State.EXCEPTION_WHILE_RUNNING_TASK:
             # An exception occurred while running the task.
             # Re-raise the exception to report it to the application.
             assert isinstance(exception, BaseException)
@@ -706,7 +1284,7 @@ class QMI_TaskRunner(QMI_RpcObject):
         stopped and has not raised an exception.
         """
         (state, dummy_exception) = self._thread.get_state()
-        return state == _TaskThread.State.RUNNING
+        return state == _TaskControl.State.RUNNING
 
     @rpc_method
     def set_settings(self, new_settings: Any) -> None:
@@ -721,6 +1299,7 @@ class QMI_TaskRunner(QMI_RpcObject):
         """
         assert self._thread.task is not None
         self._thread.task._settings_fifo.append(new_settings)
+        self._thread.task._notify_new_settings()
 
     @rpc_method
     def get_settings(self) -> Any:
@@ -759,6 +1338,59 @@ class QMI_TaskRunner(QMI_RpcObject):
         assert self._thread.task is not None
         return self._thread.task.status
 
+    @rpc_method
+    def get_scheduling_statistics(self) -> QMI_LoopTaskSchedulingStatistics | None:
+        """Return scheduling statistics of a loop task which runs on the central loop task scheduler.
+
+        Returns:
+            A `QMI_LoopTaskSchedulingStatistics` instance, or None if the task runs in a dedicated thread.
+        """
+        if isinstance(self._thread, _ScheduledLoopTask):
+            return self._thread.get_statistics()
+        return None
+
+    @rpc_method
+    def enable_loop_statistics(self, window: int = 1000, publish_interval: float | None = None) -> None:
+        """Start collecting timing statistics of a loop task.
+
+        Any previously collected statistics are discarded.
+
+        Parameters:
+            window: Number of most recent loop iterations covered by the timing histograms.
+            publish_interval: Interval in seconds at which the statistics are published
+                via the `sig_loop_statistics` signal of the task, or None to not publish them.
+
+        Raises:
+            QMI_UsageException: If the task is not a `QMI_LoopTask` or a parameter is invalid.
+        """
+        if not issubclass(self._task_class, QMI_LoopTask):
+            raise QMI_UsageException(f"Task {self._name} is not a loop task")
+        if window < 1:
+            raise QMI_UsageException("Statistics window must contain at least one iteration")
+        if (publish_interval is not None) and (publish_interval <= 0):
+            raise QMI_UsageException("Statistics publish interval must be positive")
+        assert isinstance(self._thread.task, QMI_LoopTask)
+        self._thread.task._loop_statistics = _LoopStatistics(window, publish_interval)
+
+    @rpc_method
+    def disable_loop_statistics(self) -> None:
+        """Stop collecting timing statistics of a loop task."""
+        if isinstance(self._thread.task, QMI_LoopTask):
+            self._thread.task._loop_statistics = None
+
+    @rpc_method
+    def get_loop_statistics(self) -> QMI_LoopTaskStatistics | None:
+        """Return timing statistics of a loop task.
+
+        Returns:
+            A `QMI_LoopTaskStatistics` instance, or None if loop statistics are not enabled.
+        """
+        task = self._thread.task
+        stats = task._loop_statistics if isinstance(task, QMI_LoopTask) else None
+        if stats is None:
+            return None
+        return stats.snapshot()
+
     @rpc_method
     def get_task_class_name(self) -> str:
         """Return the name of the QMI_Task class managed by this task runner."""
@@ -777,8 +1409,31 @@ class QMI_LoopTask(QMI_Task):
         sig_status_updated: Signal used to publish the latest status when updated. Can be used by clients who need
                               to know when the status might have changed by another client. Users need to re-define
                               this signal with appropriate type, if necessary.
+        sig_loop_statistics:  Signal used to periodically publish loop timing statistics, when enabled via
+                              `QMI_TaskRunner.enable_loop_statistics()`.
+        use_scheduler:        Set to True in a subclass to run the task on the central loop task scheduler
+                              instead of in a dedicated thread.
+        precise_pacing:       Set to True in a subclass to start iterations at their deadline with microsecond
+                              precision, by sleeping until shortly before the deadline and spinning for the rest.
+        pacing_spin_time:     Duration in seconds of the spin before each deadline with precise pacing,
+                              or None to calibrate it from the wake-up latency of the operating system.
+        cpu_affinity:         Set of CPU numbers to which the task thread is restricted, or None for no restriction.
+        realtime_priority:    `SCHED_FIFO` priority of the task thread, or None to keep the normal scheduling policy.
     """
     sig_status_updated = QMI_Signal([type(None)])
+    sig_loop_statistics = QMI_Signal([QMI_LoopTaskStatistics])
+
+    use_scheduler = False
+    precise_pacing = False
+    pacing_spin_time: float | None = None
+    cpu_affinity: set[int] | None = None
+    realtime_priority: int | None = None
+
+    # Wait on the stop event until this long before the final sleep of precise pacing.
+    _PACING_EVENT_MARGIN = 0.002
+    # Bounds of the calibrated spin time of precise pacing.
+    _PACING_MIN_SPIN_TIME = 20.0e-6
+    _PACING_MAX_SPIN_TIME = 0.001
 
     def __init__(self, task_runner, name, loop_period: float = 1.0,
                  policy: QMI_LoopTaskMissedLoopPolicy = QMI_LoopTaskMissedLoopPolicy.IMMEDIATE) -> None:
@@ -802,6 +1457,8 @@ class QMI_LoopTask(QMI_Task):
         self._loop_period = loop_period
         self._policy = policy
         self._status_fifo: collections.deque = collections.deque(maxlen=1)
+        self._loop_statistics: _LoopStatistics | None = None
+        self._spin_time = 0.0
 
         declared_signals = self._qmi_signals  # type: ignore
         # Create an instance of QMI_RegisteredSignal for sig_status_updated, published by this class.
@@ -825,45 +1482,28 @@ class QMI_LoopTask(QMI_Task):
 
         _logger.info("[%s] Starting...", self._name)
 
+        self._apply_thread_hints()
+        if self.precise_pacing:
+            self._spin_time = self._calibrate_spin_time()
+
         self.loop_prepare()
-        next_time = time.monotonic() + self._loop_period
+        due_time = time.monotonic()
+        next_time = due_time + self._loop_period
         try:
             while not self.stop_requested():
 
-                # Check for updated settings. If updated, process them
-                if self.update_settings():
-                    self.process_new_settings()
-
-                # Do work.
-                self.loop_iteration()
-
-                # Check for updates status. If updated, publish new status.
-                if self.update_status():
-                    self.sig_status_updated.publish(self.status)
-
-                # Update other signals (if present).
-                self.publish_signals()
+                self._loop_step(due_time)
 
                 # Sleep until next iteration.
-                time_to_sleep = next_time - time.monotonic()
-                if time_to_sleep > 0:
-                    self.sleep(time_to_sleep)
-                    next_time += self._loop_period
-
+                (wake_time, next_time) = self._plan_next_iteration(next_time)
+                if wake_time is not None:
+                    if self.precise_pacing:
+                        self._sleep_until(wake_time)
+                    else:
+                        self.sleep(wake_time - time.monotonic())
+                    due_time = wake_time
                 else:
-                    _logger.warning("[%s] Missed loop time: %.3f seconds late", self._name, -time_to_sleep)
-                    if self._policy == QMI_LoopTaskMissedLoopPolicy.IMMEDIATE:
-                        # Try to do the next one as soon as possible, but do not miss any steps
-                        next_time = time.monotonic() + self._loop_period
-
-                    elif self._policy == QMI_LoopTaskMissedLoopPolicy.SKIP:
-                        # Check how many loop periods were missed and set the next one after those
-                        periods_missed = int((self._loop_period - time_to_sleep) / self._loop_period)
-                        next_time += self._loop_period * periods_missed
-
-                    elif self._policy == QMI_LoopTaskMissedLoopPolicy.TERMINATE:
-                        # Stop loop
-                        self._task_runner.stop()
+                    due_time = time.monotonic()
 
         except QMI_TaskStopException:
             pass  # not an error
@@ -873,6 +1513,146 @@ class QMI_LoopTask(QMI_Task):
 
         _logger.info("[%s] Stopped", self._name)
 
+    def _apply_thread_hints(self) -> None:
+        """Apply the CPU affinity and real-time priority of the task to the calling thread, where permitted."""
+
+        if self.cpu_affinity is not None:
+            try:
+                os.sched_setaffinity(0, self.cpu_affinity)
+            except (AttributeError, OSError) as exc:
+                _logger.warning("[%s] Can not set CPU affinity: %s", self._name, exc)
+
+        if self.realtime_priority is not None:
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self.realtime_priority))
+            except (AttributeError, OSError) as exc:
+                _logger.warning("[%s] Can not set real-time priority: %s", self._name, exc)
+
+        if self.precise_pacing and (_prctl is not None):
+            # Reduce the timer slack of the thread (50 microseconds by default on Linux) to 1 nanosecond.
+            if _prctl(_PR_SET_TIMERSLACK, 1, 0, 0, 0) != 0:
+                _logger.warning("[%s] Can not reduce timer slack", self._name)
+
+    def _calibrate_spin_time(self) -> float:
+        """Return the spin time for precise pacing, measuring the wake-up latency of short sleeps if necessary."""
+
+        if self.pacing_spin_time is not None:
+            return self.pacing_spin_time
+
+        latencies = []
+        for _ in range(20):
+            tstart = time.monotonic()
+            time.sleep(0.0005)
+            latencies.append(time.monotonic() - tstart - 0.0005)
+        latencies.sort()
+        spin_time = 2 * latencies[int(0.9 * len(latencies))]
+        spin_time = min(max(spin_time, self._PACING_MIN_SPIN_TIME), self._PACING_MAX_SPIN_TIME)
+        _logger.debug("[%s] Calibrated pacing spin time: %.1f us", self._name, spin_time * 1.0e6)
+        return spin_time
+
+    def _sleep_until(self, deadline: float) -> None:
+        """Sleep until the specified monotonic time with precise pacing.
+
+        Long waits are done on the stop event so that a stop request is handled promptly.
+        The last part is a plain sleep (an absolute-deadline `clock_nanosleep()` on Linux),
+        ending the spin time before the deadline, followed by busy-waiting until the deadline.
+
+        Raises:
+            ~qmi.core.exceptions.QMI_TaskStopException: If the task received a stop request.
+        """
+
+        sleep_end = deadline - self._spin_time
+        remaining = sleep_end - self._PACING_EVENT_MARGIN - time.monotonic()
+        if remaining > 0:
+            if self._stop_requested.wait(remaining):
+                raise QMI_TaskStopException()
+
+        remaining = sleep_end - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+        while time.monotonic() < deadline:
+            pass
+
+        if self._stop_requested.is_set():
+            raise QMI_TaskStopException()
+
+    def _loop_step(self, due_time: float) -> None:
+        """Run the actions of a single loop iteration.
+
+        Parameters:
+            due_time: Monotonic time at which the iteration was due to start.
+        """
+
+        # Timestamps are only taken while loop statistics are enabled.
+        stats = self._loop_statistics
+        if stats is not None:
+            start_time = time.monotonic()
+
+        # Check for updated settings. If updated, process them
+        if self.update_settings():
+            self.process_new_settings()
+
+        # Do work.
+        if stats is not None:
+            iteration_start_time = time.monotonic()
+        self.loop_iteration()
+        if stats is not None:
+            iteration_end_time = time.monotonic()
+
+        # Check for updates status. If updated, publish new status.
+        if self.update_status():
+            self.sig_status_updated.publish(self.status)
+
+        # Update other signals (if present).
+        self.publish_signals()
+
+        if stats is not None:
+            end_time = time.monotonic()
+            stats.iterations += 1
+            stats.wakeup_lateness.add(max(0.0, start_time - due_time))
+            stats.iteration_duration.add(iteration_end_time - iteration_start_time)
+            stats.overhead.add((iteration_start_time - start_time) + (end_time - iteration_end_time))
+            if end_time >= stats.next_publish_time:
+                assert stats.publish_interval is not None
+                stats.next_publish_time = end_time + stats.publish_interval
+                self.sig_loop_statistics.publish(stats.snapshot())
+
+    def _plan_next_iteration(self, next_time: float) -> tuple[float | None, float]:
+        """Determine when to start the next loop iteration, applying the missed loop policy.
+
+        Parameters:
+            next_time: Monotonic time at which the next iteration is due.
+
+        Returns:
+            Tuple (wake_time, next_time) where `wake_time` is the monotonic time at which
+            to start the next iteration, or None to start it immediately, and `next_time`
+            is the due time of the iteration after that.
+        """
+        time_to_sleep = next_time - time.monotonic()
+        if time_to_sleep > 0:
+            return (next_time, next_time + self._loop_period)
+
+        _logger.warning("[%s] Missed loop time: %.3f seconds late", self._name, -time_to_sleep)
+        periods_missed = int((self._loop_period - time_to_sleep) / self._loop_period)
+        stats = self._loop_statistics
+        if stats is not None:
+            stats.missed_periods += periods_missed
+
+        if self._policy == QMI_LoopTaskMissedLoopPolicy.IMMEDIATE:
+            # Try to do the next one as soon as possible, but do not miss any steps
+            next_time = time.monotonic() + self._loop_period
+
+        elif self._policy == QMI_LoopTaskMissedLoopPolicy.SKIP:
+            # Check how many loop periods were missed and set the next one after those
+            next_time += self._loop_period * periods_missed
+
+        elif self._policy == QMI_LoopTaskMissedLoopPolicy.TERMINATE:
+            # Stop loop
+            self._task_runner.stop()
+
+        return (None, next_time)
+
     def loop_prepare(self) -> None:
         """Method to prepare the task loop.
 
@@ -928,6 +1708,196 @@ class QMI_LoopTask(QMI_Task):
         pass
 
 
+
+class QMI_ReactiveTask(QMI_Task):
+    """
+    QMI_ReactiveTask is a subclass of `QMI_Task` for tasks which react to signals and settings.
+
+    Instead of polling at a fixed period, the task thread sleeps until new settings arrive,
+    a signal arrives in one of its signal receivers, or the task is stopped. Events are then
+    handled immediately: new settings by `on_settings()`, received signals by `on_signals()`.
+    Signals that arrive in a burst are handed over in batches of up to `max_batch_size` signals.
+
+    The task has a signal receiver `self.receiver` which can be subscribed to signals
+    in `__init__()` or `on_start()`. Additional receivers can be added via `add_signal_receiver()`.
+    The task must unsubscribe its receivers when they are no longer needed, e.g. in `on_stop()`.
+
+    Example of a reactive task::
+
+        class MyReactiveTask(QMI_ReactiveTask):
+            def on_start(self):
+                self._publisher = qmi.get_instrument("context.instrument")
+                self._publisher.sig_measurement.subscribe(self.receiver)
+            def on_signal(self, signal):
+                ...
+            def on_stop(self):
+                self._publisher.sig_measurement.unsubscribe(self.receiver)
+
+    Attributes:
+        max_batch_size: Maximum number of signals from one receiver passed to a single `on_signals()` call.
+        idle_timeout:   Time in seconds without events after which `on_timeout()` is called,
+                        or None to wait indefinitely.
+    """
+
+    max_batch_size = 100
+    idle_timeout: float | None = None
+
+    def __init__(self, task_runner: 'QMI_TaskRunner', name: str) -> None:
+        """Initialize the reactive task.
+
+        Subclasses of QMI_ReactiveTask may override this method, with the same rules as for `QMI_Task`.
+
+        Parameters:
+            task_runner: The `QMI_TaskRunner` instance which manages this task.
+            name: The RPC object name of this task instance.
+        """
+        super().__init__(task_runner, name)
+        self._event_cond = threading.Condition()
+        self._receivers: tuple[QMI_SignalReceiver, ...] = ()
+        self.receiver = QMI_SignalReceiver()
+        self.add_signal_receiver(self.receiver)
+
+    def add_signal_receiver(self, receiver: QMI_SignalReceiver) -> None:
+        """Wake up the task when a signal arrives in the specified receiver.
+
+        A receiver can be used by only one reactive task at a time.
+
+        Parameters:
+            receiver: Signal receiver of which the signals are passed to `on_signals()`.
+        """
+        if receiver._wakeup is not None:
+            raise QMI_UsageException("Signal receiver is already used by a reactive task")
+        receiver._wakeup = self._wakeup
+        self._receivers = self._receivers + (receiver,)
+        self._wakeup()
+
+    def remove_signal_receiver(self, receiver: QMI_SignalReceiver) -> None:
+        """Stop waking up the task for signals that arrive in the specified receiver.
+
+        Signals remaining in the receiver are no longer passed to the task.
+
+        Parameters:
+            receiver: Signal receiver which was added via `add_signal_receiver()`.
+        """
+        if receiver not in self._receivers:
+            raise QMI_UsageException("Signal receiver is not used by this task")
+        receiver._wakeup = None
+        self._receivers = tuple(r for r in self._receivers if r is not receiver)
+
+    def _wakeup(self) -> None:
+        """Wake up the task thread if it is waiting for an event."""
+        with self._event_cond:
+            self._event_cond.notify()
+
+    def _notify_new_settings(self) -> None:
+        self._wakeup()
+
+    def _has_event(self) -> bool:
+        """Return True if new settings or signals are waiting."""
+        return bool(self._settings_fifo) or any(len(receiver._queue) > 0 for receiver in self._receivers)
+
+    def run(self) -> None:
+        """
+        Main function inside the task thread. This overrides the base class implementation.
+
+        The task calls `on_start()`, then waits for events and dispatches them to `on_settings()`,
+        `on_signals()` and `on_timeout()` until the task is stopped, and finally calls `on_stop()`.
+        """
+
+        _logger.info("[%s] Starting...", self._name)
+
+        self.on_start()
+        try:
+            while not self.stop_requested():
+
+                # Wait for new settings, signals or a stop request.
+                # A stop request interrupts the wait via QMI_TaskStopException.
+                # Handlers run without holding the lock, so that publishers are never blocked by them.
+                with self._event_cond:
+                    has_event = self._task_runner._thread.wait_for_condition(self._event_cond,
+                                                                            self._has_event,
+                                                                            self.idle_timeout)
+                if not has_event:
+                    self.on_timeout()
+                    continue
+
+                # Check for updated settings. If updated, process them.
+                if self.update_settings():
+                    self.on_settings()
+
+                # Take a batch of signals from each receiver that has signals waiting.
+                for receiver in self._receivers:
+                    signals = receiver.get_signals(self.max_batch_size)
+                    if signals:
+                        self.on_signals(signals)
+
+        except QMI_TaskStopException:
+            pass  # not an error
+
+        finally:
+            self.on_stop()
+            for receiver in self._receivers:
+                receiver._wakeup = None
+
+        _logger.info("[%s] Stopped", self._name)
+
+    def on_start(self) -> None:
+        """Method to prepare the task before it waits for events.
+
+        Subclasses may override this method to prepare the task.
+        The default implementation does nothing.
+        """
+        pass
+
+    def on_settings(self) -> None:
+        """Method for processing new settings, which are available in `self.settings`.
+
+        Subclasses may override this method to handle new task settings.
+        The default implementation does nothing.
+        """
+        pass
+
+    def on_signals(self, signals: list[ReceivedSignal]) -> None:
+        """Method for handling a batch of received signals.
+
+        Subclasses may override this method to handle bursts of signals at once.
+        The default implementation calls `on_signal()` for each signal.
+
+        Parameters:
+            signals: Received signals from one receiver, oldest first.
+        """
+        for signal in signals:
+            self.on_signal(signal)
+
+    def on_signal(self, signal: ReceivedSignal) -> None:
+        """Method for handling a single received signal.
+
+        Subclasses may override this method to handle received signals.
+        The default implementation does nothing.
+
+        Parameters:
+            signal: The received signal.
+        """
+        pass
+
+    def on_timeout(self) -> None:
+        """Method called when no event occurred during `idle_timeout` seconds.
+
+        Subclasses may override this method to do periodic housekeeping while idle.
+        The default implementation does nothing.
+        """
+        pass
+
+    def on_stop(self) -> None:
+        """Method to clean up when the task stops.
+
+        Subclasses may override this method to specify finalizing actions,
+        such as unsubscribing signal receivers.
+        The default implementation does nothing.
+        """
+        pass
+
+
 # Imports needed only for static typing.
 if TYPE_CHECKING:
     import qmi.core.context
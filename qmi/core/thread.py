@@ -31,11 +31,11 @@ class QMI_Thread(threading.Thread):
     daemonic, we ensure that we get to the execution of the at-exit handlers, which will properly
     tear down any remaining QMI_Contexts; This will shut down all active QMI_Threads in an orderly way.
 
-    The QMI_Thread class currently has three specializations:
+    The QMI_Thread class currently has these specializations:
 
     - _EventDrivenThread in qmi.core.messaging;
     - _RpcThread in qmi.core.rpc;
-    - _TaskThread in qmi.core.task.
+    - _TaskThread, _LoopTaskScheduler and _LoopTaskWorker in qmi.core.task.
 
     Important:
         QMI_Threads are part of the core QMI machinery.
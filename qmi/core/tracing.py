@@ -0,0 +1,237 @@
+"""Tracing of RPC calls across QMI contexts.
+
+When tracing is enabled for a context, the context records `spans`: named time intervals
+which together show where the time of an RPC call was spent. Spans of the same call,
+possibly recorded by different contexts, share a `trace ID`; each span refers to its
+parent span, so that the complete call tree can be reconstructed offline.
+
+Enabling tracing
+################
+
+Tracing is enabled per context with the ``trace_file`` setting in the context
+configuration, for example::
+
+    {
+        "contexts": {
+            "my_context": {
+                "trace_file": "/tmp/my_context_trace.jsonl"
+            }
+        }
+    }
+
+Spans are written to the file by a background thread, as JSON lines in the
+OpenTelemetry protocol (OTLP) JSON encoding: each line is an object with a
+``resourceSpans`` list, in the same format as written by the file exporter of
+the OpenTelemetry collector. Trace files of several contexts can be merged and
+loaded in any tool which reads this format.
+
+Recorded spans
+##############
+
+For each RPC method call, the following spans are recorded when tracing is enabled:
+
+* The calling context records a `client` span from sending the request until the reply arrives.
+* The context of the RPC object records a `server` span from receiving the request until the
+  reply is sent, with child spans for waiting in the request queue (``qmi.rpc.queue``),
+  executing the method (``qmi.rpc.execute``) and sending the reply (``qmi.rpc.reply``).
+* Sending a request or reply to another context is recorded as a ``qmi.send`` span, which
+  includes serialization of the message.
+
+The trace context is passed along in request and reply messages. RPC calls made while an
+RPC method executes, e.g. a task which calls methods of instruments in other contexts, become
+children of the span of that method, also when the intermediate context does not record spans itself.
+
+Reference
+#########
+"""
+
+import enum
+import json
+import queue
+import random
+import threading
+import time
+from typing import Any, NamedTuple, TextIO
+
+import qmi
+from qmi.core.thread import QMI_Thread
+
+
+class QMI_TraceContext(NamedTuple):
+    """Identifies a span within a trace.
+
+    Attributes:
+        trace_id: Trace ID as 32 hexadecimal digits, shared by all spans of the trace.
+        span_id: Span ID as 16 hexadecimal digits.
+        parent_span_id: Span ID of the parent span, or None for the root span of the trace.
+    """
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None = None
+
+
+class SpanKind(enum.IntEnum):
+    """Kind of span, with the values used by OpenTelemetry."""
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+
+
+# Trace context of the span in which the current thread runs.
+_current = threading.local()
+
+
+def get_current_trace_context() -> QMI_TraceContext | None:
+    """Return the trace context of the span in which the current thread runs, if any."""
+    return getattr(_current, "trace_context", None)
+
+
+def set_current_trace_context(trace_context: QMI_TraceContext | None) -> QMI_TraceContext | None:
+    """Set the trace context of the span in which the current thread runs.
+
+    Returns:
+        The previous trace context of the current thread, to be restored afterwards.
+    """
+    previous = getattr(_current, "trace_context", None)
+    _current.trace_context = trace_context
+    return previous
+
+
+def make_child_trace_context(parent: QMI_TraceContext | None) -> QMI_TraceContext:
+    """Return the trace context for a new span with the specified parent.
+
+    If `parent` is None, the new span is the root span of a new trace.
+    """
+    span_id = f"{random.getrandbits(64):016x}"
+    if parent is None:
+        return QMI_TraceContext(f"{random.getrandbits(128):032x}", span_id)
+    return QMI_TraceContext(parent.trace_id, span_id, parent.span_id)
+
+
+def _attribute_value(value: Any) -> dict:
+    """Encode an attribute value as an OTLP JSON `AnyValue`."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class _TraceWriterThread(QMI_Thread):
+    """Background thread which writes recorded spans to the trace file in batches."""
+
+    MAX_BATCH_SIZE = 512
+
+    def __init__(self, trace_file: TextIO, resource: dict) -> None:
+        super().__init__()
+        self._trace_file = trace_file
+        self._resource = resource
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    def put(self, span: dict | None) -> None:
+        self._queue.put(span)
+
+    def _request_shutdown(self) -> None:
+        # A None entry is the request to stop, after writing the spans before it.
+        self._queue.put(None)
+
+    def run(self) -> None:
+        with self._trace_file as trace_file:
+            running = True
+            while running:
+                batch = [self._queue.get()]
+                while len(batch) < self.MAX_BATCH_SIZE:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                spans = []
+                for span in batch:
+                    if span is None:
+                        running = False
+                        break
+                    spans.append(span)
+
+                if spans:
+                    line = {
+                        "resourceSpans": [{
+                            "resource": self._resource,
+                            "scopeSpans": [{
+                                "scope": {"name": "qmi", "version": qmi.__version__},
+                                "spans": spans
+                            }]
+                        }]
+                    }
+                    trace_file.write(json.dumps(line, separators=(",", ":")) + "\n")
+                    trace_file.flush()
+
+
+class QMI_Tracer:
+    """Records spans of a context and writes them to a trace file.
+
+    An instance of this class is created by the context when tracing is enabled
+    in its configuration. Spans are written to the file by a background thread,
+    so that recording a span does not wait for file I/O.
+
+    This class is intended for internal use within QMI. Application programs
+    should not interact with this class directly.
+    """
+
+    def __init__(self, path: str, context_name: str) -> None:
+        """Initialize the tracer.
+
+        Parameters:
+            path: Path of the trace file. Spans are appended to the file.
+            context_name: Name of the context, used as OpenTelemetry service name.
+        """
+        self.context_name = context_name
+        self._clock_offset = time.time() - time.monotonic()
+        resource = {"attributes": [{"key": "service.name", "value": _attribute_value(context_name)}]}
+        self._writer = _TraceWriterThread(open(path, "a", encoding="utf-8"), resource)
+
+    def start(self) -> None:
+        """Start the background thread which writes the trace file."""
+        self._writer.start()
+
+    def stop(self) -> None:
+        """Write all recorded spans to the trace file, then stop the background thread."""
+        self._writer.shutdown()
+        self._writer.join()
+
+    def record_span(self,
+                    name: str,
+                    kind: SpanKind,
+                    trace_context: QMI_TraceContext,
+                    start_time: float,
+                    end_time: float,
+                    attributes: dict[str, Any] | None = None,
+                    error: str | None = None
+                    ) -> None:
+        """Record a completed span.
+
+        Parameters:
+            name: Name of the span.
+            kind: Kind of span.
+            trace_context: Trace context of the span itself.
+            start_time: Start time of the span according to `time.monotonic()`.
+            end_time: End time of the span according to `time.monotonic()`.
+            attributes: Optional attributes of the span.
+            error: Error message if the operation failed, otherwise None.
+        """
+        span = {
+            "traceId": trace_context.trace_id,
+            "spanId": trace_context.span_id,
+            "name": name,
+            "kind": int(kind),
+            "startTimeUnixNano": str(int((start_time + self._clock_offset) * 1.0e9)),
+            "endTimeUnixNano": str(int((end_time + self._clock_offset) * 1.0e9)),
+            "attributes": [{"key": key, "value": _attribute_value(value)}
+                           for (key, value) in (attributes or {}).items()],
+            "status": {"code": 2, "message": error} if error is not None else {}
+        }
+        if trace_context.parent_span_id is not None:
+            span["parentSpanId"] = trace_context.parent_span_id
+        self._writer.put(span)
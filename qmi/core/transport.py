@@ -6,7 +6,7 @@ import socket
 import sys
 import time
 from collections.abc import Mapping
-from typing import Any, Type
+from typing import Any, NamedTuple, Type
 
 import serial
 import vxi11  # type: ignore
@@ -22,6 +22,19 @@ from qmi.core.util import format_address_and_port
 _logger = logging.getLogger(__name__)
 
 
+class QMI_TransportStatistics(NamedTuple):
+    """Connection statistics kept by transports which support them.
+
+    Attributes:
+        bytes_read: Total number of bytes received from the instrument.
+        bytes_written: Total number of bytes sent to the instrument.
+        reconnects: Number of times the connection was re-established after it was lost.
+    """
+    bytes_read: int
+    bytes_written: int
+    reconnects: int
+
+
 class QMI_Transport:
     """QMI_Transport is the base class for bidirectional byte stream transport implementations,
     typically used to talk to instruments.
@@ -327,7 +340,10 @@ TcpTransportDescriptorParser = TransportDescriptorParser(
     "tcp",
     [("host", (str, True)),
      ('port', (int, True))],
-    {'connect_timeout': (float, False)}
+    {'connect_timeout': (float, False),
+     'keepalive': (bool, False),
+     'reconnect': (int, False),
+     'standby': (bool, False)}
 )
 
 UdpTransportDescriptorParser = TransportDescriptorParser(
@@ -359,6 +375,13 @@ Vxi11TransportDescriptorParser = TransportDescriptorParser(
     {}
 )
 
+MuxTransportDescriptorParser = TransportDescriptorParser(
+    "mux",
+    [("name", (str, True)),
+     ("address", (int, True))],
+    {'request_timeout': (float, False)}
+)
+
 
 class QMI_SerialTransport(QMI_Transport):
     """Byte stream transport via serial port.
@@ -865,17 +888,30 @@ class QMI_TcpTransport(QMI_SocketTransport):
         DEFAULT_CONNECT_TIMEOUT: A default timeout period for connecting to TCP client. Default is 10 seconds.
         MIN_PACKET_SIZE: The minimum packet size to read with `read` method.
         MAX_PACKET_SIZE: The maximum packet size to read with `read_until` method.
+        KEEPALIVE_IDLE: Idle time in seconds before the first TCP keepalive probe is sent.
+        KEEPALIVE_INTERVAL: Time in seconds between TCP keepalive probes.
+        KEEPALIVE_COUNT: Number of unanswered keepalive probes before the connection is considered dead.
     """
 
     DEFAULT_CONNECT_TIMEOUT = 10
     MIN_PACKET_SIZE = 0
     MAX_PACKET_SIZE = 512
-
-    def __init__(self, host: str, port: int, connect_timeout: float | None = DEFAULT_CONNECT_TIMEOUT) -> None:
+    KEEPALIVE_IDLE = 10
+    KEEPALIVE_INTERVAL = 5
+    KEEPALIVE_COUNT = 3
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        connect_timeout: float | None = DEFAULT_CONNECT_TIMEOUT,
+        keepalive: bool = False
+    ) -> None:
         """Initialize the TCP transport by connecting to the specified address.
 
         Parameters:
             connect_timeout: Maximum time to connect in seconds.
+            keepalive:       True to enable TCP keepalive probes, so that a silently dropped connection is detected.
 
         Raises:
             ~qmi.core.exceptions.QMI_TimeoutException: If connecting takes longer than the specified connection
@@ -883,23 +919,41 @@ class QMI_TcpTransport(QMI_SocketTransport):
         """
         super().__init__(host, port)
         self._connect_timeout = connect_timeout
+        self._keepalive = keepalive
 
     def __str__(self) -> str:
         remote_addr = format_address_and_port(self._address)
         return f"QMI_TcpTransport(remote={remote_addr})"
 
-    def _open_transport(self) -> None:
-        super()._open_transport()
-        # Create socket and connect.
-        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self._socket.settimeout(self._connect_timeout)
+    def _connect_socket(self) -> socket.socket:
+        """Create a new socket and connect it to the remote address."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(self._connect_timeout)
         # Set TCP_NODELAY socket option.
-        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self._keepalive:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Fine-grained keepalive options are not available on all platforms.
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.KEEPALIVE_IDLE)
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, self.KEEPALIVE_INTERVAL)
+            if hasattr(socket, "TCP_KEEPCNT"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, self.KEEPALIVE_COUNT)
         try:
-            self._socket.connect(self._address)
+            sock.connect(self._address)
         except socket.timeout as e:
-            self._socket.close()
+            sock.close()
             raise QMI_TimeoutException(f"Timeout while connecting to {self._address}") from e
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def _open_transport(self) -> None:
+        super()._open_transport()
+        # Create socket and connect.
+        self._socket = self._connect_socket()
 
     def close(self) -> None:
         _logger.debug("Closing TCP transport %s", self)
@@ -912,6 +966,188 @@ class QMI_TcpTransport(QMI_SocketTransport):
         self._safe_socket.sendall(data)
 
 
+class QMI_ResilientTcpTransport(QMI_TcpTransport):
+    """TCP transport which transparently re-establishes a lost connection.
+
+    When the connection is dropped by the instrument or by the network, the next
+    operation on the transport reconnects with exponential backoff instead of failing
+    until the transport is explicitly closed and re-opened. Keepalive probes are enabled
+    by default so that silently dropped connections are detected.
+
+    Data which was in flight when the connection was lost can not be recovered. A read
+    that is interrupted by a connection loss still raises `QMI_EndOfInputException`
+    (after any buffered bytes have been returned); subsequent calls use a new connection.
+
+    Optionally, a standby connection is opened in advance and used as replacement when
+    the active connection fails. This only works with instruments that accept multiple
+    concurrent connections.
+
+    Attributes:
+        RECONNECT_INITIAL_DELAY: Delay in seconds before the second reconnect attempt.
+        RECONNECT_MAX_DELAY: Upper limit in seconds of the delay between reconnect attempts.
+    """
+
+    RECONNECT_INITIAL_DELAY = 0.1
+    RECONNECT_MAX_DELAY = 5.0
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        connect_timeout: float | None = QMI_TcpTransport.DEFAULT_CONNECT_TIMEOUT,
+        keepalive: bool = True,
+        reconnect: int = 5,
+        standby: bool = False
+    ) -> None:
+        """Initialize the resilient TCP transport.
+
+        Parameters:
+            connect_timeout: Maximum time to connect in seconds.
+            keepalive:       True to enable TCP keepalive probes.
+            reconnect:       Maximum number of reconnect attempts after the connection is lost.
+            standby:         True to keep a pre-warmed standby connection to the instrument.
+        """
+        super().__init__(host, port, connect_timeout, keepalive)
+        if reconnect < 1:
+            raise QMI_TransportDescriptorException(f"Invalid number of reconnect attempts ({reconnect})")
+        self._max_reconnects = reconnect
+        self._use_standby = standby
+        self._standby_socket: socket.socket | None = None
+        self._connection_lost = False
+        self._bytes_read = 0
+        self._bytes_written = 0
+        self._reconnects = 0
+
+    def __str__(self) -> str:
+        remote_addr = format_address_and_port(self._address)
+        return f"QMI_ResilientTcpTransport(remote={remote_addr})"
+
+    def _open_standby(self) -> None:
+        """Try to open a standby connection. Failure is not fatal."""
+        try:
+            self._standby_socket = self._connect_socket()
+        except (OSError, QMI_TimeoutException) as exc:
+            _logger.warning("Can not open standby connection for %s: %s", self, exc)
+            self._standby_socket = None
+
+    def _take_standby(self) -> socket.socket | None:
+        """Return the standby connection if it is still alive, otherwise None."""
+        sock = self._standby_socket
+        self._standby_socket = None
+        if sock is None:
+            return None
+        try:
+            sock.settimeout(0)
+            alive = (sock.recv(1, socket.MSG_PEEK) != b"")
+        except (BlockingIOError, socket.timeout):
+            # No data pending; connection is alive.
+            alive = True
+        except OSError:
+            alive = False
+        if not alive:
+            sock.close()
+            return None
+        sock.settimeout(None)
+        return sock
+
+    def _reconnect(self) -> None:
+        """Replace the lost connection, retrying with exponential backoff.
+
+        The new connection gets the timeout of the lost connection, which may have been set by
+        the read operation that triggered the reconnect.
+        """
+        timeout = self._safe_socket.gettimeout()
+        self._safe_socket.close()
+        delay = self.RECONNECT_INITIAL_DELAY
+        last_error: Exception | None = None
+        for attempt in range(self._max_reconnects):
+            if attempt > 0:
+                time.sleep(delay)
+                delay = min(2 * delay, self.RECONNECT_MAX_DELAY)
+            sock = self._take_standby()
+            try:
+                if sock is None:
+                    sock = self._connect_socket()
+            except (OSError, QMI_TimeoutException) as exc:
+                _logger.warning("Reconnect attempt %d of %s failed: %s", attempt + 1, self, exc)
+                last_error = exc
+                continue
+            sock.settimeout(timeout)
+            self._socket = sock
+            self._connection_lost = False
+            self._reconnects += 1
+            _logger.info("Reconnected %s", self)
+            if self._use_standby:
+                self._open_standby()
+            return
+
+        raise QMI_EndOfInputException(
+            f"Failed to reconnect {self} after {self._max_reconnects} attempts"
+        ) from last_error
+
+    def _ensure_connected(self) -> None:
+        if self._connection_lost:
+            self._reconnect()
+
+    def _open_transport(self) -> None:
+        super()._open_transport()
+        self._connection_lost = False
+        if self._use_standby:
+            self._open_standby()
+
+    def close(self) -> None:
+        super().close()
+        if self._standby_socket is not None:
+            self._standby_socket.close()
+            self._standby_socket = None
+
+    def _read_from_socket(self, packet_size: int) -> tuple[bytes, Any]:
+        self._ensure_connected()
+        try:
+            b = self._safe_socket.recv(max(packet_size, 1))
+        except (BlockingIOError, socket.timeout):
+            raise
+        except OSError as err:
+            self._connection_lost = True
+            raise QMI_EndOfInputException(
+                f"Lost connection to {format_address_and_port(self._address)}"
+            ) from err
+
+        if not b:
+            self._connection_lost = True
+            raise QMI_EndOfInputException(
+                f"Reached end of input from socket {format_address_and_port(self._address)}"
+            )
+        self._bytes_read += len(b)
+        return b, self._address
+
+    def write(self, data: bytes) -> None:
+        self._check_is_open()
+        self._ensure_connected()
+        try:
+            super().write(data)
+        except OSError as exc:
+            # Connection lost while writing; reconnect and send the data again.
+            _logger.warning("Connection %s lost during write: %s", self, exc)
+            self._connection_lost = True
+            self._reconnect()
+            super().write(data)
+        self._bytes_written += len(data)
+
+    def discard_read(self) -> None:
+        self._check_is_open()
+        self._ensure_connected()
+        super().discard_read()
+
+    def get_statistics(self) -> QMI_TransportStatistics:
+        """Return the number of transferred bytes and the number of reconnects."""
+        return QMI_TransportStatistics(
+            bytes_read=self._bytes_read,
+            bytes_written=self._bytes_written,
+            reconnects=self._reconnects
+        )
+
+
 class QMI_UsbTmcTransport(QMI_Transport):
     """Transport SCPI commands via USBTMC device class.
 
@@ -1310,16 +1546,21 @@ def create_transport(
     String format:
       - VXI-11 instrument: "vxi11:host"
       - UDP connection:    "udp:host<:port>"
-      - TCP connection:    "tcp:host<:port><:connect_timeout=10>"
+      - TCP connection:    "tcp:host<:port><:connect_timeout=10><:keepalive=False><:reconnect=0><:standby=False>"
       - Serial port:       "serial:device<:baudrate=115200><:databits=8><:parity=N><:stopbits=1>"
       - USBTMC device:     "usbtmc:vendorid:productid:serialnr"
       - GPIB device:       "gpib:<board=None:>primary_addr<:secondary_addr=None><:connect_timeout=30.0>"
+      - Shared bus device: "mux:name:address<:request_timeout=5.0>"
 
     UDP, TCP and VXI-11:
       - "host" (for UDP, TCP & VXI-11 transports) specifies the host name or IP address of the UDP server/TCP client.
         Numerical IPv6 addresses must be enclosed in square brackets, e.g. "tcp:[2620:0:2d0:200::8]:5000".
       - "port" (for UDP and TCP transports) specifies the UDP/TCP port number of the server/client.
       - "connect_timeout" is TCP connection timeout.
+      - "keepalive" enables TCP keepalive probes (TCP only).
+      - "reconnect" is the maximum number of attempts to re-establish a lost connection (TCP only).
+        When larger than 0, a `QMI_ResilientTcpTransport` is created, which has keepalive enabled by default.
+      - "standby" keeps a pre-warmed standby connection to replace a lost connection (TCP only, implies reconnect).
 
     Serial:
       - "device" is the name of the serial port, for example "COM3" or "/dev/ttyUSB0".
@@ -1344,6 +1585,11 @@ def create_transport(
       - "board" is optional GPIB interface number (in VISA syntax GPIB[board]::...).
       - "secondary_addr" is optional secondary device address number.
       - "connect_timeout" is for opening resource for GPIB device, in seconds.
+
+    Shared bus (see `qmi.core.transport_mux`):
+      - "name" is the name of a transport multiplexer created with `create_transport_multiplexer()`.
+      - "address" is the device address on the shared bus (decimal integer).
+      - "request_timeout" is the maximum time to wait for access to the bus, in seconds.
     """
     if SerialTransportDescriptorParser.match_interface(transport_descriptor):
         attributes = SerialTransportDescriptorParser.parse_parameter_strings(transport_descriptor, default_attributes)
@@ -1353,6 +1599,12 @@ def create_transport(
         return QMI_UdpTransport(**attributes)
     elif TcpTransportDescriptorParser.match_interface(transport_descriptor):
         attributes = TcpTransportDescriptorParser.parse_parameter_strings(transport_descriptor, default_attributes)
+        reconnect = attributes.pop("reconnect", 0)
+        standby = attributes.pop("standby", False)
+        if reconnect > 0 or standby:
+            if reconnect > 0:
+                attributes["reconnect"] = reconnect
+            return QMI_ResilientTcpTransport(**attributes, standby=standby)
         return QMI_TcpTransport(**attributes)
     elif UsbTmcTransportDescriptorParser.match_interface(transport_descriptor):
         attributes = UsbTmcTransportDescriptorParser.parse_parameter_strings(transport_descriptor, default_attributes)
@@ -1378,5 +1630,10 @@ def create_transport(
     elif Vxi11TransportDescriptorParser.match_interface(transport_descriptor):
         attributes = Vxi11TransportDescriptorParser.parse_parameter_strings(transport_descriptor, default_attributes)
         return QMI_Vxi11Transport(**attributes)
+
+    elif MuxTransportDescriptorParser.match_interface(transport_descriptor):
+        attributes = MuxTransportDescriptorParser.parse_parameter_strings(transport_descriptor, default_attributes)
+        from qmi.core.transport_mux import QMI_MuxTransport
+        return QMI_MuxTransport(**attributes)
     else:
         raise QMI_TransportDescriptorException(f"Unknown type in transport descriptor {transport_descriptor!r}")
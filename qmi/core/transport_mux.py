@@ -0,0 +1,292 @@
+"""Sharing of a single transport between multiple instrument drivers.
+
+Some instruments are daisy-chained on one serial bus and are selected by a device address
+(for example multiple motion controllers behind one RS-485 adapter). Each QMI instrument
+normally owns its transport exclusively, which makes it impossible to expose every device
+on the bus as a separate instrument.
+
+A `QMI_TransportMultiplexer` owns the shared transport and arbitrates access from multiple
+`QMI_MuxTransport` instances. A multiplexer is created once per process::
+
+    qmi.core.transport_mux.create_transport_multiplexer("bus1", "serial:/dev/ttyUSB0:baudrate=57600")
+
+after which instrument drivers can use transport descriptors ``"mux:bus1:<address>"``.
+
+Access to the bus is granted as a lease. A client acquires the lease when it starts an
+operation, keeps it for consecutive operations (typically a command followed by reading the
+response) and releases it when a read operation completes. A lease which is not used for
+`lease_timeout` seconds expires, so that clients which only write commands do not block the
+bus. Clients waiting for the bus are served in first-come-first-served order.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+
+from qmi.core.exceptions import (
+    QMI_InvalidOperationException, QMI_TimeoutException, QMI_TransportDescriptorException, QMI_UsageException
+)
+from qmi.core.transport import QMI_Transport, create_transport
+
+# Global variable holding the logger for this module.
+_logger = logging.getLogger(__name__)
+
+# Registry of transport multiplexers in this process.
+_multiplexers: dict[str, "QMI_TransportMultiplexer"] = {}
+_multiplexers_lock = threading.Lock()
+
+
+class QMI_TransportMultiplexer:
+    """Arbitrates access to a transport shared by multiple `QMI_MuxTransport` instances.
+
+    The shared transport is opened when the first client is opened and closed when
+    the last client is closed.
+
+    Attributes:
+        DEFAULT_LEASE_TIMEOUT: Default time in seconds after which an unused lease expires.
+    """
+
+    DEFAULT_LEASE_TIMEOUT = 0.5
+
+    def __init__(self, name: str, transport: QMI_Transport, lease_timeout: float = DEFAULT_LEASE_TIMEOUT) -> None:
+        """Initialize the multiplexer.
+
+        Parameters:
+            name:          Name of the multiplexer, used in ``"mux:<name>:<address>"`` descriptors.
+            transport:     Transport to be shared. The multiplexer takes ownership of this transport.
+            lease_timeout: Time in seconds after which an unused lease expires.
+        """
+        self.name = name
+        self._transport = transport
+        self._lease_timeout = lease_timeout
+        self._cond = threading.Condition(threading.Lock())
+        self._open_clients: dict[int, "QMI_MuxTransport"] = {}
+        self._waiting: deque["QMI_MuxTransport"] = deque()
+        self._owner: "QMI_MuxTransport | None" = None
+        self._busy = False
+        self._lease_expiry = 0.0
+
+    def __str__(self) -> str:
+        return f"QMI_TransportMultiplexer({self.name!r}, {self._transport})"
+
+    @property
+    def transport(self) -> QMI_Transport:
+        """The shared transport."""
+        return self._transport
+
+    def open_client(self, client: "QMI_MuxTransport") -> None:
+        """Register an opened client and open the shared transport if necessary."""
+        with self._cond:
+            if client.address in self._open_clients:
+                raise QMI_InvalidOperationException(
+                    f"Address {client.address} on multiplexer {self.name!r} is already in use")
+            if not self._open_clients:
+                _logger.debug("Opening shared transport %s", self._transport)
+                self._transport.open()
+            self._open_clients[client.address] = client
+
+    def close_client(self, client: "QMI_MuxTransport") -> None:
+        """Unregister a closed client and close the shared transport if it was the last client."""
+        with self._cond:
+            self._open_clients.pop(client.address, None)
+            if self._owner is client:
+                self._owner = None
+                self._busy = False
+                self._cond.notify_all()
+            if not self._open_clients:
+                _logger.debug("Closing shared transport %s", self._transport)
+                self._transport.close()
+
+    def has_open_clients(self) -> bool:
+        """Return True if any client of the multiplexer is open."""
+        with self._cond:
+            return bool(self._open_clients)
+
+    def _lease_expired(self) -> bool:
+        return (self._owner is not None) and (not self._busy) and (time.monotonic() >= self._lease_expiry)
+
+    def acquire(self, client: "QMI_MuxTransport", timeout: float | None) -> None:
+        """Wait until the client is granted access to the shared transport and start an operation.
+
+        If the client already holds the lease, access is granted immediately. The lease can not expire
+        until the operation is ended by a call to `finish()`.
+
+        Parameters:
+            client:  The client requesting access.
+            timeout: Maximum time to wait for access in seconds, or None to wait indefinitely.
+
+        Raises:
+            ~qmi.core.exceptions.QMI_TimeoutException: If access was not granted within the timeout.
+        """
+        with self._cond:
+            if self._owner is not client:
+                deadline = None if timeout is None else time.monotonic() + timeout
+                self._waiting.append(client)
+                try:
+                    while True:
+                        if self._lease_expired():
+                            _logger.debug("Lease of %s on %s expired", self._owner, self.name)
+                            self._owner = None
+                        if self._owner is None and self._waiting[0] is client:
+                            break
+                        now = time.monotonic()
+                        wait_time = None if deadline is None else deadline - now
+                        if wait_time is not None and wait_time <= 0:
+                            raise QMI_TimeoutException(
+                                f"Timeout while waiting for access to multiplexer {self.name!r}")
+                        if self._owner is not None and not self._busy:
+                            lease_remaining = self._lease_expiry - now
+                            wait_time = lease_remaining if wait_time is None else min(wait_time, lease_remaining)
+                        self._cond.wait(wait_time)
+                finally:
+                    self._waiting.remove(client)
+                    self._cond.notify_all()
+                self._owner = client
+            self._busy = True
+
+    def finish(self, client: "QMI_MuxTransport", release: bool) -> None:
+        """End an operation started with `acquire()`.
+
+        Parameters:
+            client:  The client which performed the operation.
+            release: True to release the lease, False to keep it for a subsequent operation.
+        """
+        with self._cond:
+            if self._owner is client:
+                self._busy = False
+                if release:
+                    self._owner = None
+                else:
+                    self._lease_expiry = time.monotonic() + self._lease_timeout
+                self._cond.notify_all()
+
+
+class QMI_MuxTransport(QMI_Transport):
+    """Transport to one device on a bus shared through a `QMI_TransportMultiplexer`.
+
+    Attributes:
+        DEFAULT_REQUEST_TIMEOUT: Default maximum time in seconds to wait for access to the bus.
+    """
+
+    DEFAULT_REQUEST_TIMEOUT = 5.0
+
+    def __init__(self, name: str, address: int, request_timeout: float = DEFAULT_REQUEST_TIMEOUT) -> None:
+        """Initialize the multiplexed transport.
+
+        Parameters:
+            name:            Name of the multiplexer.
+            address:         Device address on the bus. Only one open transport can use an address.
+            request_timeout: Maximum time in seconds to wait for access to the bus.
+
+        Raises:
+            ~qmi.core.exceptions.QMI_TransportDescriptorException: If the multiplexer does not exist.
+        """
+        super().__init__()
+        self._multiplexer = get_transport_multiplexer(name)
+        self.address = address
+        self._request_timeout = request_timeout
+
+    def __str__(self) -> str:
+        return f"QMI_MuxTransport({self._multiplexer.name!r}, address={self.address})"
+
+    def _open_transport(self) -> None:
+        self._multiplexer.open_client(self)
+
+    def close(self) -> None:
+        super().close()
+        self._multiplexer.close_client(self)
+
+    def write(self, data: bytes) -> None:
+        self._check_is_open()
+        self._multiplexer.acquire(self, self._request_timeout)
+        try:
+            self._multiplexer.transport.write(data)
+        finally:
+            self._multiplexer.finish(self, release=False)
+
+    def read(self, nbytes: int, timeout: float | None) -> bytes:
+        self._check_is_open()
+        self._multiplexer.acquire(self, self._request_timeout)
+        try:
+            return self._multiplexer.transport.read(nbytes, timeout)
+        finally:
+            self._multiplexer.finish(self, release=True)
+
+    def read_until(self, message_terminator: bytes, timeout: float | None) -> bytes:
+        self._check_is_open()
+        self._multiplexer.acquire(self, self._request_timeout)
+        try:
+            return self._multiplexer.transport.read_until(message_terminator, timeout)
+        finally:
+            self._multiplexer.finish(self, release=True)
+
+    def read_until_timeout(self, nbytes: int, timeout: float) -> bytes:
+        self._check_is_open()
+        self._multiplexer.acquire(self, self._request_timeout)
+        try:
+            return self._multiplexer.transport.read_until_timeout(nbytes, timeout)
+        finally:
+            self._multiplexer.finish(self, release=True)
+
+    def discard_read(self) -> None:
+        self._check_is_open()
+        self._multiplexer.acquire(self, self._request_timeout)
+        try:
+            self._multiplexer.transport.discard_read()
+        finally:
+            self._multiplexer.finish(self, release=False)
+
+
+def create_transport_multiplexer(
+        name: str,
+        transport_descriptor: str,
+        lease_timeout: float = QMI_TransportMultiplexer.DEFAULT_LEASE_TIMEOUT
+) -> QMI_TransportMultiplexer:
+    """Create a transport multiplexer and make it available to ``"mux:<name>:<address>"`` transports.
+
+    Parameters:
+        name:                 Name of the multiplexer.
+        transport_descriptor: Descriptor of the shared transport, typically a serial port.
+        lease_timeout:        Time in seconds after which an unused lease on the transport expires.
+
+    Returns:
+        The new multiplexer.
+
+    Raises:
+        ~qmi.core.exceptions.QMI_UsageException: If a multiplexer with this name already exists.
+    """
+    with _multiplexers_lock:
+        if name in _multiplexers:
+            raise QMI_UsageException(f"Transport multiplexer {name!r} already exists")
+        multiplexer = QMI_TransportMultiplexer(name, create_transport(transport_descriptor), lease_timeout)
+        _multiplexers[name] = multiplexer
+    return multiplexer
+
+
+def get_transport_multiplexer(name: str) -> QMI_TransportMultiplexer:
+    """Return the transport multiplexer with the specified name.
+
+    Raises:
+        ~qmi.core.exceptions.QMI_TransportDescriptorException: If the multiplexer does not exist.
+    """
+    with _multiplexers_lock:
+        multiplexer = _multiplexers.get(name)
+    if multiplexer is None:
+        raise QMI_TransportDescriptorException(f"Unknown transport multiplexer {name!r}")
+    return multiplexer
+
+
+def remove_transport_multiplexer(name: str) -> None:
+    """Remove a transport multiplexer which is no longer in use.
+
+    Raises:
+        ~qmi.core.exceptions.QMI_UsageException: If the multiplexer still has open clients.
+    """
+    with _multiplexers_lock:
+        multiplexer = _multiplexers.get(name)
+        if multiplexer is None:
+            raise QMI_UsageException(f"Unknown transport multiplexer {name!r}")
+        if multiplexer.has_open_clients():
+            raise QMI_UsageException(f"Transport multiplexer {name!r} is still in use")
+        del _multiplexers[name]
@@ -1,7 +1,9 @@
 """Utility functions for QMI."""
 
+import math
 import re
 import threading
+from typing import NamedTuple
 
 
 def is_valid_object_name(name: str) -> bool:
@@ -103,3 +105,81 @@ class AtomicCounter:
         """Return the current counter value."""
         with self.lock:
             return self.count
+
+
+class QMI_TimingHistogram(NamedTuple):
+    """Histogram of a timing quantity, such as a duration or a latency.
+
+    The histogram bins are logarithmic: bin 0 counts values below 1 microsecond,
+    and bin ``i > 0`` counts values from ``bin_edges[i - 1]`` up to ``bin_edges[i]``.
+    The last bin also counts all larger values.
+
+    Attributes:
+        num_values: Number of values in the histogram.
+        mean: Mean value in seconds.
+        max: Maximum value in seconds.
+        bin_edges: Upper edge of each bin in seconds.
+        counts: Number of values in each bin.
+    """
+    num_values: int
+    mean: float
+    max: float
+    bin_edges: tuple[float, ...]
+    counts: tuple[int, ...]
+
+    def percentile(self, q: float) -> float:
+        """Return an upper bound for the q-th percentile (0 <= q <= 100) of the values in seconds.
+
+        The result is the upper edge of the bin that contains the percentile,
+        limited to the maximum value.
+        """
+        if self.num_values == 0:
+            return 0.0
+        target = q / 100.0 * self.num_values
+        total = 0
+        for (edge, count) in zip(self.bin_edges, self.counts):
+            total += count
+            if total >= target:
+                return min(edge, self.max)
+        return self.max
+
+
+TIMING_HISTOGRAM_NUM_BINS = 24
+TIMING_HISTOGRAM_BIN_EDGES = tuple(1.0e-6 * 2**i for i in range(TIMING_HISTOGRAM_NUM_BINS))
+
+
+def timing_histogram_bin(value: float) -> int:
+    """Return the index of the `QMI_TimingHistogram` bin for a value in seconds."""
+    exponent = math.frexp(value * 1.0e6)[1]
+    return min(max(exponent, 0), TIMING_HISTOGRAM_NUM_BINS - 1)
+
+
+class TimingHistogram:
+    """Cumulative logarithmic histogram of a timing quantity.
+
+    Only the counts per bin, the sum and the maximum are stored, so adding a value
+    takes constant time and memory. The histogram does not lock; the caller must
+    serialize updates.
+    """
+
+    def __init__(self) -> None:
+        self._counts = [0] * TIMING_HISTOGRAM_NUM_BINS
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    def add(self, value: float) -> None:
+        """Add a value in seconds."""
+        self._counts[timing_histogram_bin(value)] += 1
+        self._count += 1
+        self._total += value
+        self._max = max(self._max, value)
+
+    def snapshot(self) -> QMI_TimingHistogram:
+        """Return the current contents of the histogram."""
+        count = self._count
+        return QMI_TimingHistogram(num_values=count,
+                                   mean=(self._total / count) if count else 0.0,
+                                   max=self._max,
+                                   bin_edges=TIMING_HISTOGRAM_BIN_EDGES,
+                                   counts=tuple(self._counts))
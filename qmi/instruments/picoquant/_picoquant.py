@@ -11,14 +11,18 @@ from typing import TypeVar, Type
 import numpy as np
 
 from qmi.core.context import QMI_Context
-from qmi.core.exceptions import QMI_InvalidOperationException, QMI_InstrumentException
+from qmi.core.exceptions import QMI_InvalidOperationException, QMI_InstrumentException, QMI_RuntimeException
 from qmi.core.instrument import QMI_Instrument
 from qmi.core.messaging import _PeerTcpConnection
 from qmi.core.pubsub import QMI_Signal
 from qmi.core.rpc import rpc_method
+from qmi.instruments.picoquant.support._correlator import CorrelationMode, RealTimeCorrelation
 from qmi.instruments.picoquant.support._decoders import EventFilterMode, SYNC_TYPE
 from qmi.instruments.picoquant.support._realtime import RealTimeHistogram, RealTimeCountRate, NUM_CHANNELS
 from qmi.instruments.picoquant.support._events import _FetchEventsThread, _MODE
+from qmi.instruments.picoquant.support._recording import RecordingFormat, RecordingStatus, _EventRecorder
+from qmi.instruments.picoquant.support._ringbuffer import EventBufferStatus, EventOverflowPolicy
+from qmi.instruments.picoquant.support._streaming import EventChunk
 from qmi.instruments.picoquant.support._library_wrapper import _LibWrapper
 
 _logger = logging.getLogger(__name__)
@@ -87,7 +91,21 @@ class _PicoquantHarp(QMI_Instrument):
     # Signal published to report real-time count rates based on T2 event data.
     sig_countrate = QMI_Signal([RealTimeCountRate])
 
-    def __init__(self, context: QMI_Context, name: str, serial_number: str, max_pending_events: int = 10 ** 8) -> None:
+    # Signal published to report real-time correlation histograms based on T2 or T3 event data.
+    sig_correlation = QMI_Signal([RealTimeCorrelation])
+
+    # Signal published to stream T2 or T3 event data in chunks, when enabled.
+    sig_events = QMI_Signal([EventChunk])
+
+    def __init__(
+        self,
+        context: QMI_Context,
+        name: str,
+        serial_number: str,
+        max_pending_events: int = 10 ** 8,
+        overflow_policy: EventOverflowPolicy = EventOverflowPolicy.RAISE,
+        use_worker_process: bool = False,
+    ) -> None:
         """Instantiate the instrument driver. This is the base class for all *Harp instruments.
 
         Parameters:
@@ -95,10 +113,19 @@ class _PicoquantHarp(QMI_Instrument):
             name: the name of the instrument instance
             serial_number: the serial number of the instrument to be opened.
             max_pending_events: Only Relevant for T2 capturing. Defaults to 10e8 events.
+            overflow_policy: Policy applied when events do not fit in the pending event buffer.
+                Defaults to `EventOverflowPolicy.RAISE`, which discards all pending events and raises
+                an exception from the next call to `get_events()`.
+            use_worker_process: Decode, analyze and filter T2/T3 event data in a separate worker process
+                instead of the event fetching thread. Raw FIFO data is passed to the worker through shared memory.
+                This avoids contention for the Python GIL at high event rates, at the cost of starting a process
+                when the instrument is opened.
         """
         super().__init__(context, name)
         self._serial_number = serial_number
         self._max_pending_events = max_pending_events
+        self._overflow_policy = overflow_policy
+        self._use_worker_process = use_worker_process
         self._lazy_lib: _LibWrapper | None = None
         self._devidx = -1
         self._lib_version: str = ""
@@ -132,7 +159,7 @@ class _PicoquantHarp(QMI_Instrument):
     def _lib(self) -> _LibWrapper:
         raise NotImplementedError
 
-    def _read_fifo(self) -> np.ndarray:
+    def _read_fifo(self, fifo_data: np.ndarray) -> int:
         """Read event FIFO data.
 
         This is an internal method. It gets called by the background thread when measuring in T2 mode.
@@ -141,15 +168,19 @@ class _PicoquantHarp(QMI_Instrument):
         timeout period of approximately 1 ms if no more data could be fetched. The actual time to return may vary
         towards 2..3 ms due to USB overhead and operating system latencies.
 
+        Parameters:
+            fifo_data: Buffer of 32-bit unsigned integers with room for at least `_ttreadmax` records.
+                The instrument library writes the raw FIFO data directly into this buffer.
+
         Returns:
-            Raw FIFO data as a 1-dimensional array of 32-bit unsigned integers.
+            Number of records written to the buffer.
 
         Raises:
             QMI_InstrumentException: in case of a library error.
         """
         self._check_is_open()
+        assert len(fifo_data) >= self._ttreadmax and fifo_data.dtype == np.uint32 and fifo_data.flags.c_contiguous
         with self._device_lock:
-            fifo_data = np.empty(self._ttreadmax, dtype=np.uint32)
             buffer = fifo_data.ctypes.data_as(ctypes.POINTER(ctypes.c_uint32))
             n_actual = ctypes.c_int()
             if self._model == "MH":
@@ -158,8 +189,7 @@ class _PicoquantHarp(QMI_Instrument):
             else:
                 self._lib.ReadFiFo(self._devidx, buffer, self._ttreadmax, n_actual)
 
-            n_actual_int = n_actual.value
-            return fifo_data[:n_actual_int].copy()
+            return n_actual.value
 
     @rpc_method
     def open(self) -> None:
@@ -214,9 +244,14 @@ class _PicoquantHarp(QMI_Instrument):
                 raise QMI_InstrumentException(f"No device with serial number {self._serial_number!r} found.")
 
         self._fetch_events_thread = _FetchEventsThread(self._read_fifo,
+                                                       self._ttreadmax,
                                                        self.sig_histogram.publish,  # type: ignore
                                                        self.sig_countrate.publish,  # type: ignore
-                                                       self._max_pending_events)
+                                                       self.sig_correlation.publish,  # type: ignore
+                                                       self._max_pending_events,
+                                                       self._overflow_policy,
+                                                       self._use_worker_process,
+                                                       self.sig_events.publish)  # type: ignore
         self._fetch_events_thread.start()
 
         super().open()
@@ -231,6 +266,11 @@ class _PicoquantHarp(QMI_Instrument):
         self._check_is_open()
 
         assert (self._fetch_events_thread is not None)
+        recorder = self._fetch_events_thread.stop_recording()
+        if recorder is not None:
+            _logger.warning("[%s] Stopping recording to %s", self._name, recorder.path)
+            recorder.shutdown()
+            recorder.join()
         self._fetch_events_thread.shutdown()
         self._fetch_events_thread.join()
         self._fetch_events_thread = None
@@ -605,6 +645,90 @@ class _PicoquantHarp(QMI_Instrument):
         _logger.info("[%s] Fetching timestamped events from thread in mode %r", self._name, self._mode)
         return self._fetch_events_thread.get_events(self.MAX_EVENTS_PER_CALL)
 
+    @rpc_method
+    def get_event_buffer_status(self) -> EventBufferStatus:
+        """Return the status of the buffer of pending events in T2 or T3 mode.
+
+        Returns:
+            `EventBufferStatus` tuple with the capacity and fill level of the buffer, and the number of
+            events dropped due to buffer overflow since the start of the current measurement.
+        """
+        self._check_is_open()
+        assert self._fetch_events_thread is not None
+        return self._fetch_events_thread.get_event_buffer_status()
+
+    @rpc_method
+    def start_recording(self, path: str, format_str: str = "HDF5") -> None:
+        """Start recording all events in T2 or T3 mode directly to a file.
+
+        While recording, the background thread passes every block of records read from the instrument
+        to a separate writer thread, independent of the event filter and of `set_block_events()`.
+        Recorded events do not pass through the RPC mechanism, and can still be fetched with `get_events()`.
+
+        The recording remains active across measurements until `stop_recording()` is called.
+
+        Parameters:
+            path: Path of the file to create on the computer running this instrument driver.
+                An existing file is overwritten.
+            format_str: File format, either "HDF5" for decoded event records in the dataset ``events``,
+                or "PTU" for raw 32-bit FIFO records in a PicoQuant PTU file.
+
+        Raises:
+            QMI_InvalidOperationException: If not in T2 or T3 mode, or if a recording is already active.
+        """
+        file_format = _str_to_enum(RecordingFormat, format_str)
+        self._check_is_open()
+        assert self._fetch_events_thread is not None
+        if self._mode not in (_MODE.T2, _MODE.T3):
+            raise QMI_InvalidOperationException("Recording is only possible in T2 or T3 mode")
+        if self._fetch_events_thread.is_recording():
+            raise QMI_InvalidOperationException("Already recording")
+
+        if self._mode == _MODE.T2:
+            (base_resolution_ps, _binsteps) = self.get_base_resolution()
+            global_resolution = base_resolution_ps * 1e-12
+            resolution = global_resolution
+        else:
+            sync_rate = self.get_sync_rate()
+            global_resolution = 1.0 / sync_rate if sync_rate > 0 else 0.0
+            resolution = self.get_resolution() * 1e-12
+
+        recorder = _EventRecorder(path, file_format, self._model, self._mode.name, global_resolution, resolution)
+        recorder.start()
+        try:
+            self._fetch_events_thread.start_recording(recorder)
+        except QMI_InvalidOperationException:
+            recorder.shutdown()
+            recorder.join()
+            raise
+        _logger.info("[%s] Started recording to %s", self._name, path)
+
+    @rpc_method
+    def stop_recording(self) -> RecordingStatus:
+        """Stop recording events to a file.
+
+        All records received up to this call are written before the file is closed.
+
+        Returns:
+            `RecordingStatus` tuple with the number of written and dropped records.
+
+        Raises:
+            QMI_InvalidOperationException: If no recording is active.
+            QMI_RuntimeException: If an error occurred while writing the file.
+        """
+        self._check_is_open()
+        assert self._fetch_events_thread is not None
+        recorder = self._fetch_events_thread.stop_recording()
+        if recorder is None:
+            raise QMI_InvalidOperationException("Not recording")
+
+        recorder.shutdown()
+        recorder.join()
+        _logger.info("[%s] Stopped recording to %s", self._name, recorder.path)
+        if recorder.error is not None:
+            raise QMI_RuntimeException(f"Error while recording to {recorder.path}: {recorder.error}")
+        return recorder.get_status()
+
     @rpc_method
     def get_resolution(self) -> float:
         """Get time resolution.
@@ -806,6 +930,72 @@ class _PicoquantHarp(QMI_Instrument):
             self._name, channels, bin_resolution, num_bins, num_sync
         )
 
+    @rpc_method
+    def set_realtime_correlation(self,
+                                 channel_pairs: list[tuple[int, int]],
+                                 bin_resolution: int,
+                                 num_bins: int,
+                                 integration_time: int,
+                                 mode_str: str = "MULTI_STOP"
+                                 ) -> None:
+        """Configure real-time correlation histograms.
+
+        When measuring in T2 or T3 mode, the driver can optionally compute correlation histograms
+        between pairs of channels, for example for second-order (g2) correlation measurements.
+        The delay of a pair of events is the stop event timestamp minus the start event timestamp.
+        The histograms are integrated during a configurable time and then published via `sig_correlation`.
+        Correlation is computed on all events, independent of the event filter.
+
+        Parameters:
+            channel_pairs:    List of (start_channel, stop_channel) pairs. Channel 64 represents SYNC events.
+            bin_resolution:   Resolution of each histogram bin, in units of the event timestamps
+                              (the instrument base resolution in T2 mode, picoseconds in T3 mode).
+            num_bins:         Number of bins in the histogram. Specify 0 to disable real-time correlation.
+            integration_time: Time to integrate before publishing the histograms, in units of the event timestamps.
+            mode_str:         Correlation mode. "MULTI_STOP" (default) counts all pairs in a delay window
+                              centered around zero; "START_STOP" pairs each start event with the first
+                              subsequent stop event.
+        """
+        mode = _str_to_enum(CorrelationMode, mode_str)
+        if bin_resolution < 1:
+            raise ValueError("Invalid bin_resolution")
+        self._check_is_open()
+        assert self._fetch_events_thread is not None
+        self._fetch_events_thread.set_correlation_config(
+            channel_pairs, bin_resolution, num_bins, integration_time, mode
+        )
+        _logger.info(
+            "[%s] Set %s correlation for channel pairs %s to have resolution of %i with %i bins and integration %i",
+            self._name, mode.name, channel_pairs, bin_resolution, num_bins, integration_time
+        )
+
+    @rpc_method
+    def set_event_streaming(self, max_chunk_events: int, max_chunk_age: float = 0.1) -> None:
+        """Enable or disable streaming of events via `sig_events`.
+
+        When streaming is enabled, events that pass the event filter are published in chunks
+        via `sig_events`, instead of being stored until they are fetched with `get_events()`.
+        A chunk is published as soon as it holds `max_chunk_events` events, or when its oldest event
+        has waited for `max_chunk_age` seconds, and when the measurement stops.
+        Each chunk carries a sequence number, starting at 0 for every measurement,
+        so that subscribers can detect lost chunks.
+
+        Parameters:
+            max_chunk_events: Maximum number of events per chunk. Specify 0 to disable event streaming.
+            max_chunk_age:    Maximum time in seconds that an event waits before its chunk is published.
+        """
+        if not 0 <= max_chunk_events <= self.MAX_EVENTS_PER_CALL:
+            raise ValueError("Invalid max_chunk_events")
+        if max_chunk_age < 0:
+            raise ValueError("Invalid max_chunk_age")
+        self._check_is_open()
+        assert self._fetch_events_thread is not None
+        self._fetch_events_thread.set_event_streaming(max_chunk_events, max_chunk_age)
+        _logger.info(
+            "[%s] Set event streaming with at most %i events per chunk and a maximum age of %.3f s",
+            self._name, max_chunk_events, max_chunk_age
+        )
+
     @rpc_method
     def set_realtime_countrate(self, sync_aperture: tuple[int, int], num_sync: int) -> None:
         """Configure real-time count rate reporting.
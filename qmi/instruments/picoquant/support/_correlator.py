@@ -0,0 +1,230 @@
+from collections.abc import Callable
+from enum import Enum
+from typing import NamedTuple
+
+import numpy as np
+
+
+class CorrelationMode(Enum):
+    """The correlation modes of the real-time correlator.
+
+    START_STOP - each event on the start channel is paired with the next event on the stop channel.
+                 Delays are non-negative, the first histogram bin starts at delay 0.
+    MULTI_STOP - every pair of a start event and a stop event within the delay window is counted
+                 (multi-start, multi-stop). The delay window is centered around 0, as needed for g2 measurements.
+    """
+    START_STOP = "start_stop"
+    MULTI_STOP = "multi_stop"
+
+
+class RealTimeCorrelation(NamedTuple):
+    """Real-time correlation histograms from T2 or T3 event data.
+
+    The delay of a pair of events is `stop_timestamp - start_timestamp`.
+    Histogram bin `k` counts pairs with delay in the range
+    `[min_delay + k * bin_resolution, min_delay + (k + 1) * bin_resolution)`.
+
+    Attributes:
+        start_timestamp:  Timestamp of the start of the integration interval.
+        integration_time: Length of the integration interval, in units of the event timestamps.
+        bin_resolution:   Histogram bin width, in units of the event timestamps.
+        min_delay:        Delay at the start of the first histogram bin.
+        mode:             Correlation mode.
+        channel_pairs:    List of (start_channel, stop_channel) pairs.
+        histogram_data:   2D array of shape (num_pairs, num_bins) containing counts for each bin.
+    """
+    start_timestamp: int
+    integration_time: int
+    bin_resolution: int
+    min_delay: int
+    mode: CorrelationMode
+    channel_pairs: list[tuple[int, int]]
+    histogram_data: np.ndarray
+
+
+def _count_pairs(start_timestamps: np.ndarray,
+                 stop_timestamps: np.ndarray,
+                 min_delay: int,
+                 max_delay: int
+                 ) -> np.ndarray:
+    """Return the delays of all pairs with `min_delay <= stop - start < max_delay`.
+
+    Both arrays must be sorted.
+    """
+    first = np.searchsorted(stop_timestamps, start_timestamps + min_delay, side="left")
+    last = np.searchsorted(stop_timestamps, start_timestamps + max_delay, side="left")
+    num_stops = last - first
+    num_pairs = int(np.sum(num_stops))
+    if num_pairs == 0:
+        return np.empty(0, dtype=np.int64)
+
+    # Expand to one entry per pair: the start index is repeated for each matching stop,
+    # the stop index runs from `first` to `last` for each start.
+    start_idx = np.repeat(np.arange(len(start_timestamps)), num_stops)
+    pair_offset = np.arange(num_pairs) - np.repeat(np.cumsum(num_stops) - num_stops, num_stops)
+    stop_idx = first[start_idx] + pair_offset
+    return stop_timestamps[stop_idx] - start_timestamps[start_idx]
+
+
+class _PairCorrelator:
+    """Correlation state for a single channel pair."""
+
+    def __init__(self, start_channel: int, stop_channel: int) -> None:
+        self.start_channel = start_channel
+        self.stop_channel = stop_channel
+        # Events of the previous blocks which may still pair with future events.
+        self.start_history = np.empty(0, dtype=np.int64)
+        self.stop_history = np.empty(0, dtype=np.int64)
+
+
+class _RealTimeCorrelator:
+    """Compute real-time correlation histograms between channel pairs from event data."""
+
+    def __init__(self, publish_correlation_func: Callable) -> None:
+        """Initialize correlation processing.
+
+        Parameters:
+            publish_correlation_func: A call-back function for publishing the correlation histograms.
+        """
+        self._publish_correlation_func = publish_correlation_func
+        self._pairs: list[_PairCorrelator] = []
+        self._mode = CorrelationMode.MULTI_STOP
+        self._bin_resolution = 1
+        self._num_bins = 0
+        self._integration_time = 0
+        self._min_delay = 0
+        self._histogram_data = np.zeros((0, 0), dtype=np.uint32)
+        self._interval_start = -1
+
+    def set_correlation_config(self,
+                               channel_pairs: list[tuple[int, int]],
+                               bin_resolution: int,
+                               num_bins: int,
+                               integration_time: int,
+                               mode: CorrelationMode
+                               ) -> None:
+        """Configure real-time correlation histograms and clear the accumulated data.
+
+        Parameters:
+            channel_pairs:    List of (start_channel, stop_channel) pairs.
+            bin_resolution:   Histogram bin width, in units of the event timestamps.
+            num_bins:         Number of histogram bins. Specify 0 to disable correlation.
+            integration_time: Time to integrate before publishing the histograms, in units of the event timestamps.
+            mode:             Correlation mode.
+        """
+        assert bin_resolution > 0
+        self._pairs = [_PairCorrelator(start, stop) for (start, stop) in channel_pairs]
+        self._mode = mode
+        self._bin_resolution = bin_resolution
+        self._num_bins = num_bins
+        self._integration_time = integration_time
+        if mode == CorrelationMode.MULTI_STOP:
+            self._min_delay = -(num_bins // 2) * bin_resolution
+        else:
+            self._min_delay = 0
+        self._histogram_data = np.zeros((len(channel_pairs), num_bins), dtype=np.uint32)
+        self._interval_start = -1
+
+    @property
+    def _max_delay(self) -> int:
+        return self._min_delay + self._num_bins * self._bin_resolution
+
+    def process_events(self, event_records: np.ndarray) -> None:
+        """Process a block of event records and publish completed correlation histograms.
+
+        The correlator keeps the recent events of each channel pair, so the sequence of calls
+        to this method must correspond to a single TTTR event stream, processed in order.
+
+        Parameters:
+            event_records: Numpy array of EventDataType records.
+        """
+        # Do nothing if correlation is disabled.
+        if (self._num_bins < 1) or (self._integration_time < 1) or (not self._pairs):
+            return
+        if len(event_records) == 0:
+            return
+
+        timestamps = event_records["timestamp"].astype(np.int64)
+        event_types = event_records["type"]
+        if self._interval_start < 0:
+            self._interval_start = int(timestamps[0])
+
+        # Split the block at the ends of integration intervals.
+        # Pairs are assigned to the interval of the later event of the pair.
+        next_start = self._interval_start + self._integration_time
+        num_intervals = max(0, (int(timestamps[-1]) - next_start) // self._integration_time + 1)
+        boundaries = next_start + self._integration_time * np.arange(num_intervals, dtype=np.int64)
+        split_idx = np.searchsorted(timestamps, boundaries, side="left")
+
+        pos = 0
+        for (boundary, idx) in zip(boundaries, split_idx):
+            self._correlate(timestamps[pos:idx], event_types[pos:idx])
+            self._publish(int(boundary))
+            pos = idx
+        self._correlate(timestamps[pos:], event_types[pos:])
+
+    def _correlate(self, timestamps: np.ndarray, event_types: np.ndarray) -> None:
+        """Add the pairs involving events in this part of the event stream to the histograms."""
+        if len(timestamps) == 0:
+            return
+
+        min_delay = self._min_delay
+        max_delay = self._max_delay
+        last_timestamp = int(timestamps[-1])
+        channel_positions: dict[int, np.ndarray] = {}
+
+        for (pair_pos, pair) in enumerate(self._pairs):
+            for chan in (pair.start_channel, pair.stop_channel):
+                if chan not in channel_positions:
+                    channel_positions[chan] = np.flatnonzero(event_types == chan)
+            new_starts = timestamps[channel_positions[pair.start_channel]]
+            new_stops = timestamps[channel_positions[pair.stop_channel]]
+
+            if self._mode == CorrelationMode.MULTI_STOP:
+                # Count each pair exactly once, when the later event of the pair arrives:
+                # new starts with all known stops, and previous starts with new stops.
+                all_stops = np.concatenate((pair.stop_history, new_stops))
+                delays = np.concatenate((_count_pairs(new_starts, all_stops, min_delay, max_delay),
+                                         _count_pairs(pair.start_history, new_stops, min_delay, max_delay)))
+                all_starts = np.concatenate((pair.start_history, new_starts))
+
+                # Keep events which may still pair with future events.
+                pair.start_history = all_starts[all_starts > last_timestamp - max_delay]
+                pair.stop_history = all_stops[all_stops >= last_timestamp + min_delay]
+
+            else:
+                # Pair each start with the first stop that follows it in the event stream.
+                # Starts which did not find a stop yet are followed by the first new stop.
+                all_starts = np.concatenate((pair.start_history, new_starts))
+                stop_idx = np.concatenate((
+                    np.zeros(len(pair.start_history), dtype=np.int64),
+                    np.searchsorted(channel_positions[pair.stop_channel],
+                                    channel_positions[pair.start_channel],
+                                    side="right")))
+                has_stop = (stop_idx < len(new_stops))
+                delays = new_stops[stop_idx[has_stop]] - all_starts[has_stop]
+                delays = delays[delays < max_delay]
+
+                # Keep starts which did not find a stop yet, and which are still within the delay window.
+                pending_starts = all_starts[~has_stop]
+                pair.start_history = pending_starts[pending_starts > last_timestamp - max_delay]
+
+            # Note: output from bincount will be dtype int64
+            counts = np.bincount((delays - min_delay) // self._bin_resolution, minlength=self._num_bins)
+            if (self._mode == CorrelationMode.MULTI_STOP) and (pair.start_channel == pair.stop_channel):
+                # For auto-correlation, do not count each event paired with itself.
+                counts[-min_delay // self._bin_resolution] -= len(new_starts)
+            self._histogram_data[pair_pos] += counts.astype(np.uint32)
+
+    def _publish(self, next_start: int) -> None:
+        """Publish the histograms of the completed integration interval and start a new interval."""
+        self._publish_correlation_func(RealTimeCorrelation(
+            start_timestamp=self._interval_start,
+            integration_time=self._integration_time,
+            bin_resolution=self._bin_resolution,
+            min_delay=self._min_delay,
+            mode=self._mode,
+            channel_pairs=[(pair.start_channel, pair.stop_channel) for pair in self._pairs],
+            histogram_data=self._histogram_data))
+        self._histogram_data = np.zeros((len(self._pairs), self._num_bins), dtype=np.uint32)
+        self._interval_start = next_start
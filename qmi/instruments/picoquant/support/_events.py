@@ -1,5 +1,7 @@
 import enum
+import logging
 import time
+from functools import partial
 from threading import Condition, Lock
 from collections.abc import Callable
 
@@ -7,10 +9,20 @@ import numpy as np
 
 from qmi.core.exceptions import QMI_InvalidOperationException, QMI_RuntimeException, QMI_UsageException
 from qmi.core.thread import QMI_Thread
+from qmi.instruments.picoquant.support._correlator import CorrelationMode, _RealTimeCorrelator
 from qmi.instruments.picoquant.support._decoders import (
     EventDataType, EventDecoder, EventFilterMode, SYNC_TYPE, _T2EventDecoder, _T3EventDecoder
 )
-from qmi.instruments.picoquant.support._realtime import _RealTimeHistogramProcessor, _get_sync_deltas
+from qmi.instruments.picoquant.support._realtime import (
+    _RealTimeHistogramProcessor, _ScratchBuffer, _SyncInfo, _SyncTracker
+)
+from qmi.instruments.picoquant.support._recording import _EventRecorder
+from qmi.instruments.picoquant.support._ringbuffer import EventBufferStatus, EventOverflowPolicy, _EventRingBuffer
+from qmi.instruments.picoquant.support._streaming import EventChunk, _EventStreamer
+from qmi.instruments.picoquant.support._worker import _DecoderWorker, _WorkerResult
+
+# Global variable holding the logger for this module.
+_logger = logging.getLogger(__name__)
 
 
 @enum.unique
@@ -29,37 +41,69 @@ class _MODE(enum.Enum):
     """Continuous Mode"""
 
 
-class _FetchEventsThread(QMI_Thread):
-    """This thread continuously fetches event data from the MultiHarp via USB."""
+class _FifoBufferPool:
+    """Pool of reusable buffers for raw FIFO data.
 
-    _LOOP_SLEEP_DURATION = 0.01
+    Reading the FIFO into a recycled buffer avoids allocating a large array for every read.
+    A buffer is normally released as soon as its data is processed, but it may be held longer
+    by the file recording, in which case a new buffer is allocated.
+
+    This class is thread-safe.
+    """
+
+    def __init__(self, buffer_size: int, max_free_buffers: int = 4) -> None:
+        """Initialize an empty pool.
+
+        Parameters:
+            buffer_size:      Number of 32-bit words in each buffer.
+            max_free_buffers: Maximum number of unused buffers kept for reuse.
+        """
+        self.buffer_size = buffer_size
+        self._max_free_buffers = max_free_buffers
+        self._free_buffers: list[np.ndarray] = []
+        self._lock = Lock()
+
+    def acquire(self) -> np.ndarray:
+        """Return an unused buffer."""
+        with self._lock:
+            if self._free_buffers:
+                return self._free_buffers.pop()
+        return np.empty(self.buffer_size, dtype=np.uint32)
+
+    def release(self, buffer: np.ndarray) -> None:
+        """Return a buffer to the pool once its data is no longer used."""
+        with self._lock:
+            if len(self._free_buffers) < self._max_free_buffers:
+                self._free_buffers.append(buffer)
+
+
+class _EventProcessor:
+    """Decode, analyze and filter the TTTR data stream of a measurement.
+
+    This class combines the decoder, the real-time histogram and correlation processing and the event filter.
+    It keeps the configuration of each stage, so that the configuration can be reapplied when a new
+    measurement is started. It runs in the event fetching thread, or in the decoder worker process.
+
+    This class is not thread-safe.
+    """
 
     def __init__(self,
-                 read_fifo_func: Callable[[], np.ndarray],
                  publish_histogram_func: Callable,
                  publish_countrate_func: Callable,
-                 max_pending_events: int = 10**8
+                 publish_correlation_func: Callable
                  ) -> None:
-        """Initialize background event fetching thread.
+        """Initialize the event processing.
 
         Parameters:
-            read_fifo_func: Callable that can be used to obtain an ndarray of FIFO data.
             publish_histogram_func: Callable used to publish histogram data.
-            publish_countrate_func: callable used to countrate histogram data.
-            max_pending_events: The purpose of this limit is to avoid consuming an excessive amount of memory.
-                By default allow at most 10**8 events in the queue (~ 900 MByte). It is not expected that this limit
-                will be exceeded in a properly working setup.
-
+            publish_countrate_func: Callable used to publish count rate data.
+            publish_correlation_func: Callable used to publish correlation histograms.
         """
-        super().__init__()
-        self._read_fifo_func = read_fifo_func
-        self._publish_histogram_func = publish_histogram_func
-        self._publish_countrate_func = publish_countrate_func
-        self._mode = _MODE.HIST  # Start up _mode class variable in HIST mode to give a value. Will be T2 or T3 later.
-        self._condition = Condition(Lock())
         self._decoder = EventDecoder()
+        self._sync_tracker = _SyncTracker()
         self._event_filter = _EventFilter()
         self._histogram_processor = _RealTimeHistogramProcessor(publish_histogram_func, publish_countrate_func)
+        self._correlator = _RealTimeCorrelator(publish_correlation_func)
         self._event_filter_channels: dict[int, EventFilterMode] = {}
         self._event_filter_aperture = (0, 0)
         self._histogram_channels: list[int] = []
@@ -68,58 +112,334 @@ class _FetchEventsThread(QMI_Thread):
         self._histogram_num_sync = 0
         self._countrate_aperture = (0, 0)
         self._countrate_num_sync = 0
+        self._correlation_channel_pairs: list[tuple[int, int]] = []
+        self._correlation_resolution = 1
+        self._correlation_num_bins = 0
+        self._correlation_integration_time = 0
+        self._correlation_mode = CorrelationMode.MULTI_STOP
+
+    def activate(self, mode: _MODE, sync_frequency_hz: float, resolution_ps: float) -> None:
+        """Prepare for a new TTTR data stream and clear the state of all processing stages.
+
+        Parameters:
+            mode: The measurement mode, _MODE.T2 or _MODE.T3.
+            sync_frequency_hz: The synchronization signal frequency (in Hz). Applicable only in T3 mode.
+            resolution_ps: The resolution of a 15-bit d_time bit in picoseconds. Applicable only in T3 mode.
+        """
+        if mode == _MODE.T2:
+            self._decoder = _T2EventDecoder()
+
+        elif mode == _MODE.T3:
+            self._decoder = _T3EventDecoder(sync_frequency_hz, resolution_ps)
+
+        else:
+            raise QMI_UsageException(f"No event processing decoder for mode {mode}")
+
+        self._sync_tracker.reset()
+        self._event_filter.set_event_filter_config(self._event_filter_channels,
+                                                   self._event_filter_aperture)
+        self._histogram_processor.set_histogram_config(self._histogram_channels,
+                                                       self._histogram_resolution,
+                                                       self._histogram_num_bins,
+                                                       self._histogram_num_sync)
+        self._histogram_processor.set_countrate_config(self._countrate_aperture,
+                                                       self._countrate_num_sync)
+        self._correlator.set_correlation_config(self._correlation_channel_pairs,
+                                                self._correlation_resolution,
+                                                self._correlation_num_bins,
+                                                self._correlation_integration_time,
+                                                self._correlation_mode)
+
+    def set_event_filter_config(self,
+                                channel_filter: dict[int, EventFilterMode],
+                                sync_aperture: tuple[int, int]
+                                ) -> None:
+        """Update event filter parameters. See `_FetchEventsThread.set_event_filter_config()`."""
+        self._event_filter_channels = channel_filter
+        self._event_filter_aperture = sync_aperture
+        self._event_filter.set_event_filter_config(channel_filter, sync_aperture)
+
+    def set_histogram_config(self, channels: list[int], bin_resolution_ps: int, num_bins: int, num_sync: int) -> None:
+        """Configure real-time histograms. See `_FetchEventsThread.set_histogram_config()`."""
+        self._histogram_channels = channels
+        self._histogram_resolution = bin_resolution_ps
+        self._histogram_num_bins = num_bins
+        self._histogram_num_sync = num_sync
+        self._histogram_processor.set_histogram_config(channels, bin_resolution_ps, num_bins, num_sync)
+
+    def set_countrate_config(self, sync_aperture: tuple[int, int], num_sync: int) -> None:
+        """Configure real-time count rate reporting. See `_FetchEventsThread.set_countrate_config()`."""
+        self._countrate_aperture = sync_aperture
+        self._countrate_num_sync = num_sync
+        self._histogram_processor.set_countrate_config(sync_aperture, num_sync)
+
+    def set_correlation_config(self,
+                               channel_pairs: list[tuple[int, int]],
+                               bin_resolution: int,
+                               num_bins: int,
+                               integration_time: int,
+                               mode: CorrelationMode
+                               ) -> None:
+        """Configure real-time correlation histograms. See `_FetchEventsThread.set_correlation_config()`."""
+        self._correlation_channel_pairs = channel_pairs
+        self._correlation_resolution = bin_resolution
+        self._correlation_num_bins = num_bins
+        self._correlation_integration_time = integration_time
+        self._correlation_mode = mode
+        self._correlator.set_correlation_config(channel_pairs, bin_resolution, num_bins, integration_time, mode)
+
+    def process_data(self, fifo_data: np.ndarray, filter_events: bool) -> tuple[np.ndarray, np.ndarray | None]:
+        """Process a block of raw FIFO data.
+
+        Parameters:
+            fifo_data: Numpy array of 32-bit raw event records.
+            filter_events: True to apply the event filter to the decoded events.
+
+        Returns:
+            Tuple (event_records, filtered_records) with all decoded event records and the records
+            that passed the event filter, or None if `filter_events` is False.
+        """
+        # Decode event records.
+        event_records = self._decoder.process_data(fifo_data)
+        # Locate SYNC events once, for use by both the histogram processing and the event filter.
+        sync_info = self._sync_tracker.process(event_records)
+        # Update real-time histogram
+        self._histogram_processor.process_events(event_records, sync_info)
+        # Update real-time correlation histograms.
+        self._correlator.process_events(event_records)
+
+        if not filter_events:
+            return event_records, None
+
+        return event_records, self._event_filter.process_events(event_records, sync_info)
+
+
+class _FetchEventsThread(QMI_Thread):
+    """This thread continuously fetches event data from the MultiHarp via USB.
+
+    When a FIFO read returns a full buffer, more data is likely waiting in the instrument,
+    so the FIFO is read again immediately. Otherwise the thread sleeps for `_LOOP_SLEEP_DURATION`.
+
+    By default, the event data is processed in this thread. Optionally, the processing runs in
+    a separate worker process, which receives the raw FIFO data through shared memory. This thread
+    then only reads the FIFO and collects the results, so that the processing does not compete for
+    the Python GIL with the rest of the application.
+    """
+
+    _LOOP_SLEEP_DURATION = 0.01
+
+    def __init__(self,
+                 read_fifo_func: Callable[[np.ndarray], int],
+                 fifo_buffer_size: int,
+                 publish_histogram_func: Callable,
+                 publish_countrate_func: Callable,
+                 publish_correlation_func: Callable,
+                 max_pending_events: int = 10**8,
+                 overflow_policy: EventOverflowPolicy = EventOverflowPolicy.RAISE,
+                 use_worker_process: bool = False,
+                 publish_events_func: Callable[[EventChunk], None] | None = None
+                 ) -> None:
+        """Initialize background event fetching thread.
+
+        Parameters:
+            read_fifo_func: Callable that reads FIFO data into the specified uint32 array
+                and returns the number of words read.
+            fifo_buffer_size: Maximum number of 32-bit words returned by a single FIFO read.
+            publish_histogram_func: Callable used to publish histogram data.
+            publish_countrate_func: callable used to countrate histogram data.
+            publish_correlation_func: Callable used to publish correlation histograms.
+            max_pending_events: The purpose of this limit is to avoid consuming an excessive amount of memory.
+                By default allow at most 10**8 events in the queue (~ 900 MByte). It is not expected that this limit
+                will be exceeded in a properly working setup.
+            overflow_policy: Policy applied when new events do not fit in the pending event buffer.
+                By default, the overflow is reported by discarding all pending events and raising an exception
+                from the next call to `get_events()`.
+            use_worker_process: True to process the event data in a separate worker process.
+            publish_events_func: Callable used to publish event chunks while event streaming is enabled.
+        """
+        super().__init__()
+        self._read_fifo_func = read_fifo_func
+        self._fifo_buffers = _FifoBufferPool(fifo_buffer_size)
+        self._publish_funcs = {
+            "histogram": publish_histogram_func,
+            "countrate": publish_countrate_func,
+            "correlation": publish_correlation_func
+        }
+        self._mode = _MODE.HIST  # Start up _mode class variable in HIST mode to give a value. Will be T2 or T3 later.
+        self._condition = Condition(Lock())
+        self._processor = _EventProcessor(publish_histogram_func, publish_countrate_func, publish_correlation_func)
+        self._worker = _DecoderWorker(_EventProcessor, fifo_buffer_size) if use_worker_process else None
+        self._worker_error: str | None = None
         self._active = False
+        self._activation_count = 0
         self._count_read_fifo = 0
         self._block_events = False
-        self._data: list[np.ndarray] = []
+        self._event_buffer = _EventRingBuffer(max_pending_events, overflow_policy)
+        self._event_streamer = _EventStreamer(publish_events_func)
         self._data_timestamp = 0.0
-        self._num_pending_events = 0
-        self._pending_events_overflow = False
-        self._max_pending_events = max_pending_events
+        self._recorder: _EventRecorder | None = None
 
-    def _process_fifo_data(self, fifo_data: np.ndarray, fifo_data_timestamp: float) -> None:
+    def _process_fifo_data(self, fifo_buffer: np.ndarray, num_words: int, fifo_data_timestamp: float) -> None:
         """Process new received raw event records from the multiharp, hydraharp.
 
         This function will be called in the background 'run' thread while holding the "self._condition" lock.
+        It takes ownership of `fifo_buffer` and returns it to the buffer pool when the data is no longer needed.
         """
-        # Decode event records.
-        event_records = self._decoder.process_data(fifo_data)
-        # Update real-time histogram
-        self._histogram_processor.process_events(event_records)
+        fifo_data = fifo_buffer[:num_words]
+        (event_records, filtered_records) = self._processor.process_data(fifo_data, not self._block_events)
+
+        # Pass all records to the file recording, if active.
+        if self._recorder is None:
+            self._fifo_buffers.release(fifo_buffer)
+        elif self._recorder.raw:
+            # The recorder returns the buffer to the pool after writing it.
+            self._recorder.submit(fifo_data, partial(self._fifo_buffers.release, fifo_buffer))
+        else:
+            self._fifo_buffers.release(fifo_buffer)
+            self._recorder.submit(event_records)
 
-        if not self._block_events:
+        if filtered_records is not None:
+            self._store_events(filtered_records, fifo_data_timestamp)
 
-            event_records = self._event_filter.process_events(event_records)
+    def _store_events(self, event_records: np.ndarray, fifo_data_timestamp: float) -> None:
+        """Pass filtered events to the event stream, if enabled, or store them in the pending event buffer.
 
-            # Store filtered events.
-            num_events = len(event_records)
-            if num_events > 0:
-                if self._num_pending_events + num_events > self._max_pending_events:
-                    self._pending_events_overflow = True
-                else:
-                    self._data.append(event_records)
-                    self._num_pending_events += num_events
-                    self._data_timestamp = fifo_data_timestamp
+        This function will be called in the background 'run' thread while holding the "self._condition" lock.
+        """
+        if len(event_records) == 0:
+            return
+        if self._event_streamer.enabled:
+            self._event_streamer.append(event_records, fifo_data_timestamp)
+        else:
+            self._event_buffer.append(event_records)
+        self._data_timestamp = fifo_data_timestamp
+
+    def _process_worker_result(self, result: _WorkerResult) -> None:
+        """Handle the result of a block of FIFO data processed by the worker process.
+
+        This function will be called in the background 'run' thread while holding the "self._condition" lock.
+        """
+        (activation_count, fifo_data_timestamp) = result.tag
+        # Discard results if a new measurement was started in the mean time.
+        if activation_count != self._activation_count:
+            return
+
+        for (kind, value) in result.published:
+            self._publish_funcs[kind](value)
+
+        if (result.event_records is not None) and (self._recorder is not None) and (not self._recorder.raw):
+            # The result refers to shared memory which is reused by the worker.
+            self._recorder.submit(result.event_records.copy())
+
+        if result.filtered_records is not None:
+            self._store_events(result.filtered_records, fifo_data_timestamp)
 
     def run(self) -> None:
         """Main function running in the background thread."""
-        with self._condition:
-            while not self._shutdown_requested:
-                if self._active:
-                    # Read data from a Harp, if any.
-                    fifo_data = self._read_fifo_func()
-                    fifo_data_timestamp = time.time()
-                    if len(fifo_data) > 0:
-                        # Process received event records.
-                        self._process_fifo_data(fifo_data, fifo_data_timestamp)
+        if self._worker is not None:
+            self._run_with_worker(self._worker)
+            return
+
+        while True:
+            with self._condition:
+                if not self._active:
+                    # Publish the remaining events of the measurement.
+                    self._event_streamer.flush()
+                # Wait until we are activated.
+                while (not self._active) and (not self._shutdown_requested):
+                    self._condition.wait()
+                if self._shutdown_requested:
+                    break
+                activation_count = self._activation_count
+
+            # Read data from a Harp, if any.
+            # This is done without holding the lock, so that other threads are not blocked
+            # while the instrument library waits for data.
+            fifo_buffer = self._fifo_buffers.acquire()
+            num_words = self._read_fifo_func(fifo_buffer)
+            fifo_data_timestamp = time.time()
+
+            with self._condition:
+                # Discard data if a new measurement was started in the mean time.
+                if (num_words > 0) and (activation_count == self._activation_count):
+                    # Process received event records.
+                    self._process_fifo_data(fifo_buffer, num_words, fifo_data_timestamp)
+                else:
+                    self._fifo_buffers.release(fifo_buffer)
 
-                    self._count_read_fifo += 1
+                self._count_read_fifo += 1
+                self._event_streamer.poll()
+                if (num_words < len(fifo_buffer)) and self._active and (not self._shutdown_requested):
                     # Sleep and wake up again in 10ms.
                     self._condition.wait(self._LOOP_SLEEP_DURATION)
 
-                else:
-                    # Wait until we are activated.
-                    self._condition.wait()
+    def _run_with_worker(self, worker: _DecoderWorker) -> None:
+        """Main loop of the background thread when the event data is processed by the worker process.
+
+        The FIFO is read directly into the shared memory of the worker. While the worker processes
+        a block, the next block is read. Results are collected in the same order.
+        """
+        worker.start()
+        try:
+            while True:
+                with self._condition:
+                    if (not self._active) and (worker.num_pending == 0):
+                        # Publish the remaining events of the measurement.
+                        self._event_streamer.flush()
+                    # Wait until we are activated, or until the results of the last blocks are in.
+                    while (not self._active) and (worker.num_pending == 0) and (not self._shutdown_requested):
+                        self._condition.wait()
+                    if self._shutdown_requested:
+                        break
+                    active = self._active
+                    activation_count = self._activation_count
+
+                # Read data into a free input slot, if any, without holding the lock.
+                fifo_buffer = worker.input_buffer() if active else None
+                full_read = False
+                if fifo_buffer is not None:
+                    num_words = self._read_fifo_func(fifo_buffer)
+                    fifo_data_timestamp = time.time()
+                    full_read = (num_words == len(fifo_buffer))
+                    with self._condition:
+                        # Discard data if a new measurement was started in the mean time.
+                        if (num_words > 0) and (activation_count == self._activation_count):
+                            recorder = self._recorder
+                            if (recorder is not None) and recorder.raw:
+                                # The input slot is reused as soon as the worker is done with it.
+                                recorder.submit(fifo_buffer[:num_words].copy())
+                            worker.submit_block(num_words,
+                                                filter_events=(not self._block_events),
+                                                return_decoded=(recorder is not None) and (not recorder.raw),
+                                                tag=(activation_count, fifo_data_timestamp))
+                        self._count_read_fifo += 1
+
+                # Collect results. Only wait for a result when the FIFO does not need to be read again immediately.
+                timeout = 0.0 if full_read else self._LOOP_SLEEP_DURATION
+                if worker.num_pending == 0:
+                    with self._condition:
+                        self._event_streamer.poll()
+                        if (timeout > 0) and self._active and (not self._shutdown_requested):
+                            # Sleep and wake up again in 10ms.
+                            self._condition.wait(timeout)
+                    continue
+
+                result = worker.get_result(timeout)
+                while result is not None:
+                    with self._condition:
+                        self._process_worker_result(result)
+                    worker.release_result(result)
+                    result = worker.get_result(0.0) if worker.num_pending > 0 else None
+                with self._condition:
+                    self._event_streamer.poll()
+
+        except QMI_RuntimeException as exc:
+            _logger.error("Event processing stopped: %s", exc)
+            with self._condition:
+                self._worker_error = str(exc)
+
+        finally:
+            worker.stop()
 
     def activate(self, mode: _MODE = _MODE.T2, sync_frequency_hz: float = 5E6, resolution_ps: float = 1.0) -> None:
         """Activate background event fetching.
@@ -140,28 +460,15 @@ class _FetchEventsThread(QMI_Thread):
             if self._active:
                 raise QMI_InvalidOperationException("Already active")
 
-            if self._mode == _MODE.T2:
-                self._decoder = _T2EventDecoder()
+            self._processor.activate(mode, sync_frequency_hz, resolution_ps)
+            if self._worker is not None:
+                self._worker.call("activate", mode, sync_frequency_hz, resolution_ps)
 
-            elif self._mode == _MODE.T3:
-                self._decoder = _T3EventDecoder(sync_frequency_hz, resolution_ps)
-
-            else:
-                raise QMI_UsageException(f"No event processing decoder for mode {self._mode}")
-
-            self._event_filter.set_event_filter_config(self._event_filter_channels,
-                                                       self._event_filter_aperture)
-            self._histogram_processor.set_histogram_config(self._histogram_channels,
-                                                           self._histogram_resolution,
-                                                           self._histogram_num_bins,
-                                                           self._histogram_num_sync)
-            self._histogram_processor.set_countrate_config(self._countrate_aperture,
-                                                           self._countrate_num_sync)
             self._count_read_fifo = 0
+            self._activation_count += 1
             self._active = True
-            self._data = []
-            self._num_pending_events = 0
-            self._pending_events_overflow = False
+            self._event_buffer.clear()
+            self._event_streamer.reset()
             self._condition.notify_all()
 
     def deactivate(self) -> None:
@@ -191,6 +498,58 @@ class _FetchEventsThread(QMI_Thread):
         with self._condition:
             self._block_events = blocked
 
+    def start_recording(self, recorder: _EventRecorder) -> None:
+        """Start passing all fetched records to a recorder.
+
+        This method is thread-safe.
+        It will be called in the thread that owns the `PicoQuant_MultiHarp150`, `PicoQuant_HydraHarp400` instance.
+
+        Parameters:
+            recorder: Running recorder thread which writes the records to a file.
+        """
+        with self._condition:
+            if self._recorder is not None:
+                raise QMI_InvalidOperationException("Already recording")
+            self._recorder = recorder
+
+    def is_recording(self) -> bool:
+        """Return True if fetched records are passed to a recorder.
+
+        This method is thread-safe.
+        """
+        with self._condition:
+            return self._recorder is not None
+
+    def stop_recording(self) -> _EventRecorder | None:
+        """Stop passing fetched records to the recorder.
+
+        This method is thread-safe.
+        It will be called in the thread that owns the `PicoQuant_MultiHarp150`, `PicoQuant_HydraHarp400` instance.
+
+        Returns:
+            The recorder that was active, or None if no recording was active.
+            The caller is responsible for shutting down the recorder thread.
+        """
+        with self._condition:
+            recorder = self._recorder
+            self._recorder = None
+            return recorder
+
+    def set_event_streaming(self, max_chunk_events: int, max_chunk_age: float) -> None:
+        """Enable or disable publishing of filtered events in chunks instead of storing them as pending events.
+
+        Pending events of the current chunk are published before the configuration changes.
+
+        This method is thread-safe.
+        It will be called in the thread that owns the `PicoQuant_MultiHarp150`, `PicoQuant_HydraHarp400` instance.
+
+        Parameters:
+            max_chunk_events: Maximum number of events per chunk. Specify 0 to disable streaming.
+            max_chunk_age: Maximum time in seconds that an event waits before its chunk is published.
+        """
+        with self._condition:
+            self._event_streamer.configure(max_chunk_events, max_chunk_age)
+
     def set_event_filter_config(self,
                                 channel_filter: dict[int, EventFilterMode],
                                 sync_aperture: tuple[int, int]
@@ -205,9 +564,9 @@ class _FetchEventsThread(QMI_Thread):
             sync_aperture: [min, max] aperture times respective to the synchronization moment per channel.
         """
         with self._condition:
-            self._event_filter_channels = channel_filter
-            self._event_filter_aperture = sync_aperture
-            self._event_filter.set_event_filter_config(channel_filter, sync_aperture)
+            self._processor.set_event_filter_config(channel_filter, sync_aperture)
+            if self._worker is not None:
+                self._worker.call("set_event_filter_config", channel_filter, sync_aperture)
 
     def set_histogram_config(self, channels: list[int], bin_resolution_ps: int, num_bins: int, num_sync: int) -> None:
         """Configure real-time histograms.
@@ -222,11 +581,9 @@ class _FetchEventsThread(QMI_Thread):
             num_sync: The number of synchronizations to collect the histogram data for.
         """
         with self._condition:
-            self._histogram_channels = channels
-            self._histogram_resolution = bin_resolution_ps
-            self._histogram_num_bins = num_bins
-            self._histogram_num_sync = num_sync
-            self._histogram_processor.set_histogram_config(channels, bin_resolution_ps, num_bins, num_sync)
+            self._processor.set_histogram_config(channels, bin_resolution_ps, num_bins, num_sync)
+            if self._worker is not None:
+                self._worker.call("set_histogram_config", channels, bin_resolution_ps, num_bins, num_sync)
 
     def set_countrate_config(self, sync_aperture: tuple[int, int], num_sync: int) -> None:
         """Configure real-time count rate reporting.
@@ -239,9 +596,34 @@ class _FetchEventsThread(QMI_Thread):
             num_sync: The number of synchronizations to collect the count rate for.
         """
         with self._condition:
-            self._countrate_aperture = sync_aperture
-            self._countrate_num_sync = num_sync
-            self._histogram_processor.set_countrate_config(sync_aperture, num_sync)
+            self._processor.set_countrate_config(sync_aperture, num_sync)
+            if self._worker is not None:
+                self._worker.call("set_countrate_config", sync_aperture, num_sync)
+
+    def set_correlation_config(self,
+                               channel_pairs: list[tuple[int, int]],
+                               bin_resolution: int,
+                               num_bins: int,
+                               integration_time: int,
+                               mode: CorrelationMode
+                               ) -> None:
+        """Configure real-time correlation histograms.
+
+        This method is thread-safe.
+        It will be called in the thread that owns the `PicoQuant_MultiHarp150`, `PicoQuant_HydraHarp400` instance.
+
+        Parameters:
+            channel_pairs: List of (start_channel, stop_channel) pairs.
+            bin_resolution: Histogram bin width, in units of the event timestamps.
+            num_bins: The number of bins in the histogram.
+            integration_time: Time to integrate before publishing the histograms, in units of the event timestamps.
+            mode: Correlation mode.
+        """
+        with self._condition:
+            self._processor.set_correlation_config(channel_pairs, bin_resolution, num_bins, integration_time, mode)
+            if self._worker is not None:
+                self._worker.call("set_correlation_config",
+                                  channel_pairs, bin_resolution, num_bins, integration_time, mode)
 
     def _request_shutdown(self) -> None:
         with self._condition:
@@ -266,57 +648,43 @@ class _FetchEventsThread(QMI_Thread):
 
             data_timestamp = self._data_timestamp
 
-            if self._pending_events_overflow:
+            if self._worker_error is not None:
+                raise QMI_RuntimeException(f"Event processing failed: {self._worker_error}")
+
+            if self._event_buffer.overflow:
                 # Events got dropped because there were too many pending events.
                 # Discard all pending events and clear the overflow flag, then raise an exception.
-                # TODO: Handle the events up to 'max' anyhow first and only then discard the rest?
-                self._data = []
-                self._num_pending_events = 0
-                self._pending_events_overflow = False
+                self._event_buffer.discard()
                 raise QMI_RuntimeException("Too many pending events from time tagger, pending events discarded.")
 
-            if self._num_pending_events <= max_events:
-                # Accept all pending events.
-                data = self._data
-                self._data = []
-                self._num_pending_events = 0
-
-            else:
-                # Split the set of pending events.
-                room_left = max_events
-                split_pos = 0
-                while True:
-                    num_events = len(self._data[split_pos])
-                    if num_events > room_left:
-                        break
-                    room_left -= num_events
-                    split_pos += 1
-                data = self._data[:split_pos]
-                self._data = self._data[split_pos:]
-                if room_left > 0:
-                    data.append(self._data[0][:room_left])
-                    self._data[0] = self._data[0][room_left:]
-                self._num_pending_events -= max_events
-
-        # Concatenate the event arrays to be returned.
-        if len(data) == 0:
-            event_data = np.empty(0, dtype=EventDataType)
-        else:
-            event_data = np.concatenate(data)
+            event_data = self._event_buffer.pop(max_events)
 
         return data_timestamp, event_data
 
+    def get_event_buffer_status(self) -> EventBufferStatus:
+        """Return the fill level and overflow counters of the pending event buffer.
+
+        This method is thread-safe.
+        It will be called in the thread that owns the `PicoQuant_MultiHarp150`, `PicoQuant_HydraHarp400` instance.
+        """
+        with self._condition:
+            return self._event_buffer.get_status()
+
 
 class _EventFilter:
     """Filter T2 event records."""
 
     def __init__(self) -> None:
         """Initialize the event filter."""
-        self._previous_sync_timestamp = -1
+        self._sync_tracker = _SyncTracker()
         self._previous_sync_reported = False
         self._sync_aperture = (0, 0)
         self._channel_filter_map = np.zeros(128, dtype=np.uint8)
         self._aperture_filter_enabled = False
+        self._record_filter_modes = _ScratchBuffer(np.uint8)
+        self._events_selected_bool = _ScratchBuffer(np.bool_)
+        self._events_aperture_bool = _ScratchBuffer(np.bool_)
+        self._events_in_aperture_bool = _ScratchBuffer(np.bool_)
 
     def set_event_filter_config(self,
                                 channel_filter: dict[int, EventFilterMode],
@@ -341,84 +709,97 @@ class _EventFilter:
             if filter_mode == EventFilterMode.APERTURE:
                 self._aperture_filter_enabled = True
 
-    def process_events(self, event_records: np.ndarray) -> np.ndarray:
+    def process_events(self, event_records: np.ndarray, sync_info: _SyncInfo | None = None) -> np.ndarray:
         """Filter MultiHarp event records.
 
         This function filters a sequence of event records and returns only
         the events that are considered to be interesting according to the
         configured filter rules.
 
-        The `_EventFilter` instance keeps track of the most recent SYNC event.
-        The sequence of calls to this method must therefore correspond to
-        a single TTTR event stream, processed in order, without missing events.
+        The most recent SYNC event is tracked across calls, either by this instance
+        or by the caller through `sync_info`. The sequence of calls to this method
+        must therefore correspond to a single TTTR event stream, processed in order,
+        without missing events.
 
         Parameters:
             event_records: Numpy array of EventDataType records.
+            sync_info:     SYNC information for these event records, if already determined by the caller.
+                           If not specified, SYNC events are tracked by this instance.
 
         Returns:
             Numpy array of event records that pass the filter.
         """
+        if sync_info is None:
+            sync_info = self._sync_tracker.process(event_records)
 
         # Do not waste time processing an empty array.
-        if len(event_records) == 0:
+        num_events = len(event_records)
+        if num_events == 0:
             return event_records
 
-        # Prepend the previous SYNC event, if there is any.
-        # This simplifies processing of the aperture filter.
-        previous_sync_inserted = False
-        if self._aperture_filter_enabled and (self._previous_sync_timestamp >= 0):
-            event_records = np.insert(event_records, 0, (SYNC_TYPE, self._previous_sync_timestamp))
-            previous_sync_inserted = True
+        sync_filter_mode = self._channel_filter_map[SYNC_TYPE]
+        sync_events_idx = sync_info.sync_events_idx
+        previous_sync_known = self._aperture_filter_enabled and (sync_info.previous_sync_timestamp >= 0)
+
+        # A previous SYNC event which was held back, may still have to be reported
+        # if the first selected event in this block is not a SYNC event.
+        previous_sync_pending = (
+            previous_sync_known
+            and (not self._previous_sync_reported)
+            and (sync_filter_mode in (EventFilterMode.ALL_EVENTS, EventFilterMode.APERTURE))
+        )
 
         # Map event type of each record to the corresponding filter mode.
-        record_filter_modes = self._channel_filter_map[event_records["type"]]
+        record_filter_modes = self._record_filter_modes.get(num_events)
+        np.take(self._channel_filter_map, event_records["type"], out=record_filter_modes)
 
         # Select events on channels that are unconditionally enabled.
-        events_selected_bool = (record_filter_modes == EventFilterMode.ALL_EVENTS)
-
-        # Find the indexes of SYNC events.
-        (sync_events_idx,) = np.where(event_records["type"] == SYNC_TYPE)
+        events_selected_bool = self._events_selected_bool.get(num_events)
+        np.equal(record_filter_modes, EventFilterMode.ALL_EVENTS, out=events_selected_bool)
 
         # Handle aperture filter, if necessary.
-        if self._aperture_filter_enabled and (len(sync_events_idx) > 0):
+        first_valid_idx = sync_info.first_valid_idx
+        if self._aperture_filter_enabled and (first_valid_idx < num_events):
 
             # For each event, determine time delta since the last SYNC event.
-            # The result is only valid for event past the first SYNC.
-            first_sync_idx = sync_events_idx[0]
-            sync_deltas = _get_sync_deltas(event_records, sync_events_idx)
+            # The result is only valid for events past the first known SYNC.
+            sync_deltas = sync_info.sync_deltas
 
             # Mark all events on channels that are configured to use aperture filtering.
-            events_aperture_bool = (record_filter_modes == EventFilterMode.APERTURE)
+            events_aperture_bool = self._events_aperture_bool.get(num_events)
+            np.equal(record_filter_modes, EventFilterMode.APERTURE, out=events_aperture_bool)
 
             # Reject events that do not pass the SYNC aperture.
             (delta_min, delta_max) = self._sync_aperture
-            events_aperture_bool[:first_sync_idx] = False
-            events_aperture_bool &= (sync_deltas >= delta_min)
-            events_aperture_bool &= (sync_deltas <= delta_max)
+            events_in_aperture_bool = self._events_in_aperture_bool.get(num_events)
+            events_aperture_bool[:first_valid_idx] = False
+            np.greater_equal(sync_deltas, delta_min, out=events_in_aperture_bool)
+            events_aperture_bool &= events_in_aperture_bool
+            np.less_equal(sync_deltas, delta_max, out=events_in_aperture_bool)
+            events_aperture_bool &= events_in_aperture_bool
 
             # Select events that pass the aperture filter.
             events_selected_bool |= events_aperture_bool
 
             # If aperture filtering is enabled on the SYNC channel, temporarily select all SYNC events.
-            if self._channel_filter_map[SYNC_TYPE] == EventFilterMode.APERTURE:
+            if sync_filter_mode == EventFilterMode.APERTURE:
                 events_selected_bool[sync_events_idx] = True
 
-        # If we prepended a previous, already reported SYNC event,
-        # drop that event now to avoid reporting it a second time.
-        if previous_sync_inserted and self._previous_sync_reported:
-            events_selected_bool[0] = False
-
-        # Update the timestamp of the last SYNC event.
-        if len(sync_events_idx) > 0:
-            self._previous_sync_timestamp = event_records[sync_events_idx[-1]]["timestamp"]
+        # Any SYNC event seen so far is now considered reported, unless held back below.
+        if previous_sync_known or (len(sync_events_idx) > 0):
             self._previous_sync_reported = True
 
         # Discard rejected events.
         event_records = event_records[events_selected_bool]
 
+        # Put the pending previous SYNC event in front of the selected events.
+        if previous_sync_pending:
+            previous_sync = np.array([(SYNC_TYPE, sync_info.previous_sync_timestamp)], dtype=EventDataType)
+            event_records = np.concatenate((previous_sync, event_records))
+
         # If aperture filtering is enabled on the SYNC channel,
         # reject SYNC events unless they are followed by a non-SYNC event.
-        if self._channel_filter_map[SYNC_TYPE] == EventFilterMode.APERTURE:
+        if sync_filter_mode == EventFilterMode.APERTURE:
 
             # Select non-SYNC events.
             events_selected_bool = (event_records["type"] != SYNC_TYPE)
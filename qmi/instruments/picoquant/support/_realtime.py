@@ -39,8 +39,152 @@ class RealTimeCountRate(NamedTuple):
     counts: np.ndarray
 
 
+class _ScratchBuffer:
+    """Reusable array for intermediate results, to avoid allocating new arrays for every block of events.
+
+    The buffer grows when a larger array is requested. Arrays returned by `get()` are views into
+    the buffer and are only valid until the next call to `get()`.
+    """
+
+    def __init__(self, dtype: type) -> None:
+        self._data: np.ndarray = np.empty(0, dtype=dtype)
+
+    def get(self, size: int) -> np.ndarray:
+        """Return an uninitialized array of the specified size."""
+        if len(self._data) < size:
+            self._data = np.empty(max(size, 2 * len(self._data)), dtype=self._data.dtype)
+        return self._data[:size]
+
+
+class _SyncInfo:
+    """Location of SYNC events in a block of event records.
+
+    Attributes:
+        sync_events_idx:         Array of indexes of the SYNC events in the block.
+        previous_sync_timestamp: Timestamp of the last SYNC event before this block, or -1 if there was none.
+        first_valid_idx:         Index of the first event that is preceded by a known SYNC event,
+                                 either in this block or in a previous block.
+    """
+
+    def __init__(self,
+                 tracker: "_SyncTracker",
+                 event_records: np.ndarray,
+                 sync_events_idx: np.ndarray,
+                 previous_sync_timestamp: int
+                 ) -> None:
+        self.sync_events_idx = sync_events_idx
+        self.previous_sync_timestamp = previous_sync_timestamp
+        if previous_sync_timestamp >= 0:
+            self.first_valid_idx = 0
+        elif len(sync_events_idx) > 0:
+            self.first_valid_idx = int(sync_events_idx[0])
+        else:
+            self.first_valid_idx = len(event_records)
+        self._tracker = tracker
+        self._event_records = event_records
+        self._sync_deltas: np.ndarray | None = None
+
+    @property
+    def sync_deltas(self) -> np.ndarray:
+        """Array with, for each event record, the time delta since the most recent SYNC event.
+
+        The deltas are calculated on first access. The values for records before `first_valid_idx`
+        are invalid. The array is only valid until the next block is processed by the `_SyncTracker`.
+        """
+        if self._sync_deltas is None:
+            self._sync_deltas = self._tracker.get_sync_deltas(
+                self._event_records, self.sync_events_idx, self.previous_sync_timestamp
+            )
+        return self._sync_deltas
+
+
+class _SyncTracker:
+    """Find SYNC events in a stream of event records.
+
+    The `_SyncTracker` keeps track of the most recent SYNC event, so that time deltas can be
+    calculated for events at the start of a block, without prepending the previous SYNC event
+    to the block. The sequence of calls to `process()` must therefore correspond to a single
+    TTTR event stream, processed in order, without missing events.
+
+    The results are shared by the event filter and the real-time histogram processing.
+    """
+
+    def __init__(self) -> None:
+        self.previous_sync_timestamp = -1
+        self._is_sync = _ScratchBuffer(np.bool_)
+        self._sync_increments = _ScratchBuffer(np.uint64)
+        self._sync_deltas = _ScratchBuffer(np.uint64)
+
+    def reset(self) -> None:
+        """Forget the most recent SYNC event, for example when a new measurement starts."""
+        self.previous_sync_timestamp = -1
+
+    def process(self, event_records: np.ndarray) -> _SyncInfo:
+        """Find the SYNC events in the next block of event records.
+
+        Parameters:
+            event_records: Numpy array of EventDataType records.
+
+        Returns:
+            SYNC information for this block of event records.
+        """
+        is_sync = self._is_sync.get(len(event_records))
+        np.equal(event_records["type"], SYNC_TYPE, out=is_sync)
+        sync_events_idx = np.flatnonzero(is_sync)
+        sync_info = _SyncInfo(self, event_records, sync_events_idx, self.previous_sync_timestamp)
+        if len(sync_events_idx) > 0:
+            self.previous_sync_timestamp = int(event_records["timestamp"][sync_events_idx[-1]])
+        return sync_info
+
+    def get_sync_deltas(self,
+                        event_records: np.ndarray,
+                        sync_events_idx: np.ndarray,
+                        previous_sync_timestamp: int
+                        ) -> np.ndarray:
+        """For each event record, determine the time delta since the most recent SYNC event.
+
+        Parameters:
+            event_records:           Array of structured event records with "type" and "timestamp" fields.
+            sync_events_idx:         Array of indexes into `event_records` corresponding to SYNC events.
+            previous_sync_timestamp: Timestamp of the last SYNC event before this block, or -1.
+
+        Returns:
+            Array of time deltas since SYNC event for each event record.
+            This array has the same length as `event_records`.
+            The returned values for records occurring before the first known SYNC record will be invalid.
+        """
+        num_events = len(event_records)
+        event_timestamps = event_records["timestamp"]
+        base_timestamp = max(previous_sync_timestamp, 0)
+
+        # Prepare an array holding, for each SYNC event, the increment of the most recent SYNC timestamp.
+        # The running sum of this array gives, for each event record, the timestamp of the most recent SYNC event.
+        sync_increments = self._sync_increments.get(num_events)
+        sync_increments.fill(0)
+        if len(sync_events_idx) > 0:
+            sync_timestamps = event_timestamps[sync_events_idx]
+            sync_increments[sync_events_idx[1:]] = np.diff(sync_timestamps)
+            sync_increments[sync_events_idx[0]] = sync_timestamps[0] - np.uint64(base_timestamp)
+        if num_events > 0:
+            sync_increments[0] += np.uint64(base_timestamp)
+
+        # Calculate the elapsed time since the most recent SYNC event, in place.
+        sync_deltas = self._sync_deltas.get(num_events)
+        np.cumsum(sync_increments, out=sync_deltas)
+        np.subtract(event_timestamps, sync_deltas, out=sync_deltas)
+        return sync_deltas
+
+
 class _RealTimeHistogramProcessor:
-    """Extract real-time histograms and count rates from event data."""
+    """Extract real-time histograms and count rates from event data.
+
+    Attributes:
+        MAX_HISTOGRAM_CELLS: Maximum number of histogram bins (over all channels and integration intervals)
+                             counted in a single `np.bincount` call. Limits the temporary memory use when many
+                             short integration intervals complete within one block of events.
+    """
+
+    MAX_HISTOGRAM_CELLS = 1 << 22
 
     def __init__(self, publish_histogram_func: Callable, publish_countrate_func: Callable) -> None:
         """Initialize histogram processing.
@@ -51,9 +195,11 @@ class _RealTimeHistogramProcessor:
         """
         self._publish_histogram_func = publish_histogram_func
         self._publish_countrate_func = publish_countrate_func
-        self._previous_sync_timestamp = -1
+        self._sync_tracker = _SyncTracker()
 
         self._histogram_channels: list[int] = []
+        self._histogram_channel_map = np.full(256, -1, dtype=np.int16)
+        self._histogram_channel_pos = _ScratchBuffer(np.int16)
         self._histogram_resolution = 1
         self._histogram_num_bins = 0
         self._histogram_num_sync = 0
@@ -79,6 +225,13 @@ class _RealTimeHistogramProcessor:
 
         assert bin_resolution_ps > 0
         self._histogram_channels = channels
+
+        # Map event type to the position of the channel in the histogram data.
+        self._histogram_channel_map[:] = -1
+        for (chan_pos, chan) in enumerate(channels):
+            if 0 <= chan < len(self._histogram_channel_map):
+                self._histogram_channel_map[chan] = chan_pos
+
         self._histogram_resolution = bin_resolution_ps
         self._histogram_num_bins = num_bins
         self._histogram_num_sync = num_sync
@@ -101,47 +254,31 @@ class _RealTimeHistogramProcessor:
         self._countrate_data = np.zeros(NUM_CHANNELS, dtype=np.uint64)
         self._countrate_sync_counter = -1
 
-    def process_events(self, event_records: np.ndarray) -> None:
+    def process_events(self, event_records: np.ndarray, sync_info: _SyncInfo | None = None) -> None:
         """Process event records and update histogram and count rates.
 
         Parameters:
             event_records: An array of (SYNC_TYPE, timestamp) event records.
+            sync_info:     SYNC information for these event records, if already determined by the caller.
+                           If not specified, SYNC events are tracked by this instance.
         """
+        if sync_info is None:
+            sync_info = self._sync_tracker.process(event_records)
 
         # Do nothing if histogram and count rate features are both disabled.
         if (self._histogram_num_sync == 0) and (self._countrate_num_sync == 0):
             return
 
-        # Prepend the previous SYNC event, if there is any.
-        # This simplifies calculation of time deltas since last SYNC.
-        previous_sync_inserted = False
-        if self._previous_sync_timestamp >= 0:
-            event_records = np.insert(event_records, 0, (SYNC_TYPE, self._previous_sync_timestamp))
-            previous_sync_inserted = True
-
-        # Find the indexes of SYNC events.
-        (sync_events_idx,) = np.where(event_records["type"] == SYNC_TYPE)
-
         # Do nothing before we get the first SYNC event.
-        if len(sync_events_idx) == 0:
+        first_valid_idx = sync_info.first_valid_idx
+        if first_valid_idx >= len(event_records):
             return
 
-        # Update the timestamp of the last SYNC event.
-        self._previous_sync_timestamp = event_records[sync_events_idx[-1]]["timestamp"]
-
         # For each event, determine time delta since the last SYNC event.
-        # The result is only valid for event past the first SYNC.
-        first_sync_idx = sync_events_idx[0]
-        sync_deltas = _get_sync_deltas(event_records, sync_events_idx)
-
         # Discard all events before the first SYNC.
-        # Also discard the previous SYNC, if we prepended it to the current dataset.
-        if previous_sync_inserted:
-            first_sync_idx += 1
-            sync_events_idx = sync_events_idx[1:]
-        event_records = event_records[first_sync_idx:]
-        sync_deltas = sync_deltas[first_sync_idx:]
-        sync_events_idx -= first_sync_idx
+        sync_deltas = sync_info.sync_deltas[first_valid_idx:]
+        event_records = event_records[first_valid_idx:]
+        sync_events_idx = sync_info.sync_events_idx - first_valid_idx
 
         # Update real-time histograms.
         if self._histogram_num_sync > 0:
@@ -166,58 +303,71 @@ class _RealTimeHistogramProcessor:
         if (num_sync < 1) or (num_bins < 1) or (len(channels) < 1):
             return
 
-        # Convert delta time to histogram bin index.
-        # Clip to maximum bin index.
-        event_bins = sync_deltas // self._histogram_resolution
-        event_bins = np.minimum(event_bins, num_bins - 1)
-
         # Skip events before the first SYNC.
-        next_idx = 0
+        start_idx = 0
         if self._histogram_sync_counter < 0:
             if len(sync_events_idx) == 0:
                 return
-            next_idx = sync_events_idx[0]
-            self._histogram_start_timestamp = event_records[next_idx]["timestamp"]
-
-        # Visit each SYNC record which ends a histogram integration interval.
-        event_types = event_records["type"]
-        for sync_idx in sync_events_idx[num_sync-self._histogram_sync_counter-1::num_sync]:
-
-            # Update histogram up to the end of the current integration interval.
-            # Process each channel separately.
-            for (chan_pos, chan) in enumerate(channels):
-                chan_bool = (event_types[next_idx:sync_idx] == chan)
-                chan_bins = event_bins[next_idx:sync_idx][chan_bool]
-                # Note: input to bincount MUST be dtype int64
-                #       output from bincount will be dtype int64
-                self._histogram_data[chan_pos] += np.bincount(chan_bins.astype(np.int64),
-                                                              minlength=num_bins
-                                                              ).astype(np.uint32)
-
-            # Publish completed histogram.
-            self._publish_histogram_func(RealTimeHistogram(
-                start_timestamp=self._histogram_start_timestamp,
-                bin_resolution=self._histogram_resolution,
-                num_sync=num_sync,
-                channels=channels,
-                histogram_data=self._histogram_data))
+            start_idx = sync_events_idx[0]
+            self._histogram_start_timestamp = event_records[start_idx]["timestamp"]
 
-            # Reset histogram for new integration interval.
-            self._histogram_data = np.zeros((len(channels), num_bins), dtype=np.uint32)
-            self._histogram_start_timestamp = event_records[sync_idx]["timestamp"]
-            next_idx = sync_idx
+        # Find the SYNC records which end a histogram integration interval.
+        end_sync_idx = sync_events_idx[num_sync-self._histogram_sync_counter-1::num_sync]
 
         # Update the SYNC counter.
         self._histogram_sync_counter = (self._histogram_sync_counter + len(sync_events_idx)) % num_sync
 
-        # Update histogram for remaining events.
-        # Process each channel separately.
-        for (chan_pos, chan) in enumerate(channels):
-            chan_bool = (event_types[next_idx:] == chan)
-            chan_bins = event_bins[next_idx:][chan_bool]
-            self._histogram_data[chan_pos] += np.bincount(chan_bins.astype(np.int64),
-                                                          minlength=num_bins
-                                                          ).astype(np.uint32)
+        # Select the events on histogram channels and map them to their channel position.
+        channel_pos = self._histogram_channel_pos.get(len(event_records))
+        np.take(self._histogram_channel_map, event_records["type"], out=channel_pos)
+        event_idx = np.flatnonzero(channel_pos[start_idx:] >= 0) + start_idx
+        event_chan = channel_pos[event_idx].astype(np.int64)
+
+        # Convert delta time to histogram bin index.
+        # Clip to maximum bin index.
+        event_bins = np.minimum(sync_deltas[event_idx] // np.uint64(self._histogram_resolution),
+                                np.uint64(num_bins - 1)).astype(np.int64)
+
+        # Determine the integration interval of each event.
+        # Interval 0 is the interval in progress; the last interval is not yet complete.
+        event_interval = np.searchsorted(end_sync_idx, event_idx, side="right")
+
+        # Combine interval, channel and bin into a single index, so that all channels of
+        # many intervals are counted with one `np.bincount` call.
+        num_channels = len(channels)
+        hist_size = num_channels * num_bins
+        flat_index = (event_interval * num_channels + event_chan) * num_bins + event_bins
+
+        num_intervals = len(end_sync_idx) + 1
+        max_chunk_intervals = max(1, self.MAX_HISTOGRAM_CELLS // hist_size)
+        first_interval = 0
+        while first_interval < num_intervals:
+            last_interval = min(first_interval + max_chunk_intervals, num_intervals)
+            (lo, hi) = np.searchsorted(event_interval, [first_interval, last_interval])
+            # Note: output from bincount will be dtype int64
+            counts = np.bincount(flat_index[lo:hi] - first_interval * hist_size,
+                                 minlength=(last_interval - first_interval) * hist_size
+                                 ).reshape(-1, num_channels, num_bins)
+
+            for (interval, interval_counts) in enumerate(counts, start=first_interval):
+                np.add(self._histogram_data, interval_counts, out=self._histogram_data, casting="unsafe")
+                if interval == num_intervals - 1:
+                    # Integration interval not yet complete.
+                    break
+
+                # Publish completed histogram.
+                self._publish_histogram_func(RealTimeHistogram(
+                    start_timestamp=self._histogram_start_timestamp,
+                    bin_resolution=self._histogram_resolution,
+                    num_sync=num_sync,
+                    channels=channels,
+                    histogram_data=self._histogram_data))
+
+                # Reset histogram for new integration interval.
+                self._histogram_data = np.zeros((num_channels, num_bins), dtype=np.uint32)
+                self._histogram_start_timestamp = event_records[end_sync_idx[interval]]["timestamp"]
+
+            first_interval = last_interval
 
     def _update_countrate(self,
                           event_records: np.ndarray,
@@ -279,126 +429,148 @@ class _RealTimeHistogramProcessor:
                                             ).astype(np.uint64)
 
 
-def _get_sync_deltas(event_records: np.ndarray, sync_events_idx: np.ndarray) -> np.ndarray:
-    """For each event record, determine the time delta since the last SYNC event.
-
-    Parameters:
-        event_records:   Array of structured event records with "type" and "timestamp" fields.
-        sync_events_idx: Array of indexes into `event_records` corresponding to SYNC events.
-
-    Returns:
-        Array of time deltas since SYNC event for each event record.
-        This array has the same length as `event_records`.
-        The returned values for records occurring before the first SYNC record will be invalid.
-    """
-
-    # Extract timestamps of SYNC events.
-    event_timestamps = event_records["timestamp"]
-    sync_timestamps = event_timestamps[sync_events_idx]
-
-    # If there is no SYNC record, return dummy invalid data.
-    if len(sync_events_idx) == 0:
-        return np.zeros_like(event_timestamps)
-
-    # Find index of the first SYNC event.
-    first_sync_idx = sync_events_idx[0]
+class MultiChannelTttrHistogram:
+    """Accumulate histograms from Time Tagged Time Resolved (TTTR) T2-mode data for several channels.
 
-    # Prepare an array holding, for each event record, the timestamp of the most recent SYNC event.
-    most_recent_sync_timestamp = np.zeros_like(event_timestamps)
-    most_recent_sync_timestamp[first_sync_idx] = sync_timestamps[0]
-    most_recent_sync_timestamp[sync_events_idx[1:]] = np.diff(sync_timestamps)
-    most_recent_sync_timestamp = np.cumsum(most_recent_sync_timestamp)
+    For each event on one of the configured channels, the time since the most recent SYNC event
+    is counted in the histogram of that channel. Histograms of all channels are accumulated with
+    a single `np.bincount` call per block of events.
 
-    # Prepare an array holding, for each event record, the elapsed time since the most recent SYNC event.
-    sync_deltas = event_timestamps - most_recent_sync_timestamp
+    The most recent SYNC event is carried over between calls, so the sequence of calls to `process()`
+    must correspond to a single TTTR event stream, processed in order.
 
-    return sync_deltas
-
-
-class TttrHistogram:
-    """Class to make histograms from Time Tagged Time Resolved (TTTR) T2-mode data."""
+    Attributes:
+        channels:       List of channel numbers to collect histograms for.
+        bin_width:      Histogram bin width as multiple of the instrument base resolution.
+        bins:           Array of bin indexes.
+        bin_edges:      Array of bin edges in units of the instrument base resolution.
+        histogram_data: 2D array of shape (num_channels, num_bins) containing counts for each bin.
+        previous:       Timestamp of the most recent SYNC event, or None if no SYNC event was seen yet.
+    """
 
-    def __init__(self, channel: int, numbins: int):
-        """Initialization of histogram bins, counts and deltas. In T2 mode the default bin size is 1E-12 s.
+    def __init__(self, channels: list[int], numbins: int, bin_width: int = 1) -> None:
+        """Initialization of histogram bins and counts.
 
         Parameters:
-            channel: The channel number to collect TTTR histogram data for.
-            numbins: The number of bins to divide the data for.
+            channels:  The channel numbers to collect TTTR histogram data for.
+            numbins:   The number of bins of each histogram.
+            bin_width: The bin width as multiple of the instrument base resolution. Default 1.
         """
-        self.channel = channel
+        if bin_width < 1:
+            raise ValueError("Bin width must be at least 1")
+        self.channels = list(channels)
+        self.bin_width = bin_width
         self.bins = np.arange(numbins)
-        self.bin_edges = np.arange(numbins + 1)
+        self.bin_edges = np.arange(numbins + 1) * bin_width
+        self.histogram_data = np.zeros((len(self.channels), numbins), dtype=np.uint64)
+        self.previous: int | None = None  # No timestamp carried from previous events.
 
-        self.counts = np.zeros(numbins, dtype=np.uint64)
-        self.deltas = None
-        self.previous = None  # No timestamp carried from previous events.
+        # Map event type to the position of the channel in the histogram data.
+        self._channel_map = np.full(256, -1, dtype=np.int16)
+        for (chan_pos, chan) in enumerate(self.channels):
+            self._channel_map[chan] = chan_pos
+        self._sync_tracker = _SyncTracker()
+        self._channel_pos = _ScratchBuffer(np.int16)
 
     def reset(self) -> None:
-        """Reset counts, deltas and previous timestamp."""
-        self.counts.fill(0)
-        self.deltas = None
+        """Reset counts and previous timestamp."""
+        self.histogram_data.fill(0)
         self.previous = None  # No timestamp carried from previous events.
+        self._sync_tracker.reset()
 
-    def process(self, events: np.ndarray) -> None:
-        """Process events, and filter by aperture (if applicable).
+    def _accumulate(self, events: np.ndarray) -> tuple[np.ndarray, np.ndarray] | None:
+        """Add events to the histograms.
 
-        Parameters:
-            events: An array of (SYNC_TYPE, timestamp) event records.
+        Returns:
+            Tuple (channel_pos, deltas) with the channel position and SYNC delta of each counted event,
+            or None if no SYNC event is known yet.
         """
+        sync_info = self._sync_tracker.process(events)
+        if self._sync_tracker.previous_sync_timestamp >= 0:
+            self.previous = self._sync_tracker.previous_sync_timestamp
+
+        first_valid_idx = sync_info.first_valid_idx
+        if first_valid_idx >= len(events):
+            # No SYNC event known. Discard these events.
+            return None
+
+        # Select events on histogram channels within the histogram range.
+        num_bins = len(self.bins)
+        sync_deltas = sync_info.sync_deltas
+        channel_pos = self._channel_pos.get(len(events))
+        np.take(self._channel_map, events["type"], out=channel_pos)
+        event_idx = np.flatnonzero(channel_pos[first_valid_idx:] >= 0) + first_valid_idx
+        deltas = sync_deltas[event_idx]
+        in_range = (deltas < np.uint64(num_bins * self.bin_width))
+        event_idx = event_idx[in_range]
+        deltas = deltas[in_range]
+        event_chan = channel_pos[event_idx].astype(np.int64)
+
+        # Count all channels at once, using a combined channel/bin index.
+        flat_index = event_chan * num_bins + (deltas // np.uint64(self.bin_width)).astype(np.int64)
+        # Note: output from bincount will be dtype int64
+        counts = np.bincount(flat_index, minlength=self.histogram_data.size)
+        self.histogram_data += counts.reshape(self.histogram_data.shape).astype(np.uint64)
+        return event_chan, deltas
 
-        sync_type = 64  # The type of SYNC events.
-
-        # If we have a previously recorded SYNC timestamp, we prepend it to the EVENTS array.
-        if self.previous is not None:
-            events = np.insert(events, 0, (sync_type, self.previous))
-
-        # Find the first SYNC event.
-        first_sync_index, = np.where(events["type"] == sync_type)
-        if len(first_sync_index) == 0:
-            # No sync event found. Discard these events.
-            return
-
-        # Discard all events before the first SYNC event.
-        first_sync_index = first_sync_index[0]
-        if first_sync_index != 0:
-            events = events[first_sync_index:]  # type: ignore
-
-        # At this point, the first event is guaranteed to be a SYNC,
-        #   which simplifies matters significantly.
+    def process(self, events: np.ndarray) -> None:
+        """Process events and add them to the histograms.
 
-        assert events["type"][0] == sync_type
+        Parameters:
+            events: An array of (type, timestamp) event records.
+        """
+        self._accumulate(events)
 
-        idx = np.where(events["type"] == sync_type)  # This includes the first event.
-        timestamps = events["timestamp"][idx]  # The timestamps of the SYNC events.
+    def get_plot_data(self, bin_resolution_s: float) -> tuple[ArrayLike, ArrayLike, int]:
+        """Convenience function for plotting to return bin values and counts to the caller.
 
-        increments = np.insert(np.diff(timestamps), 0, events["timestamp"][0])
+        Parameters:
+            bin_resolution_s: Instrument base resolution. Unit is seconds.
 
-        most_recent_synctime = np.zeros_like(events["timestamp"])
-        most_recent_synctime[idx] = increments
-        most_recent_synctime = np.cumsum(most_recent_synctime)
+        Returns:
+            Tuple of (bin start times in nanoseconds, self.histogram_data, number of bins)
+        """
+        return self.bins * self.bin_width * bin_resolution_s / 1e-9, self.histogram_data, len(self.bins)
 
-        deltas = events["timestamp"] - most_recent_synctime
 
-        deltas = deltas[events["type"] == self.channel]
-        deltas = deltas[deltas < len(self.counts)]
+class TttrHistogram(MultiChannelTttrHistogram):
+    """Class to make histograms from Time Tagged Time Resolved (TTTR) T2-mode data for a single channel."""
 
-        self.deltas = deltas
+    def __init__(self, channel: int, numbins: int, bin_width: int = 1) -> None:
+        """Initialization of histogram bins, counts and deltas. In T2 mode the default bin size is 1E-12 s.
 
-        hist, _ = np.histogram(deltas, self.bin_edges)
+        Parameters:
+            channel:   The channel number to collect TTTR histogram data for.
+            numbins:   The number of bins to divide the data for.
+            bin_width: The bin width as multiple of the instrument base resolution. Default 1.
+        """
+        super().__init__([channel], numbins, bin_width)
+        self.channel = channel
+        self.counts = self.histogram_data[0]
+        self.deltas: np.ndarray | None = None
 
-        hist = hist.astype(np.uint64)
+    def reset(self) -> None:
+        """Reset counts, deltas and previous timestamp."""
+        super().reset()
+        self.deltas = None
 
-        self.counts += hist
+    def process(self, events: np.ndarray) -> None:
+        """Process events and add them to the histogram.
 
-        self.previous = most_recent_synctime[-1]
+        Parameters:
+            events: An array of (type, timestamp) event records.
+        """
+        result = self._accumulate(events)
+        if result is not None:
+            (_event_chan, self.deltas) = result
 
     def get_plot_data(self, bin_resolution_s: float) -> tuple[ArrayLike, ArrayLike, int]:
         """Convenience function for plotting to return bin values and counts to the caller.
 
         Parameters:
-            bin_resolution_s: bin resolution for the histogram. Unit is seconds.
+            bin_resolution_s: Instrument base resolution. Unit is seconds.
 
         Returns:
-            Tuple of (bin values data, self.counts, number of bins in self.bins)
+            Tuple of (bin start times in nanoseconds, self.counts, number of bins in self.bins)
         """
-        return self.bins * bin_resolution_s / 1e-9, self.counts, len(self.bins)
+        return self.bins * self.bin_width * bin_resolution_s / 1e-9, self.counts, len(self.bins)
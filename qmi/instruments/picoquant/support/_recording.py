@@ -0,0 +1,298 @@
+import logging
+import struct
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable
+from enum import Enum
+from threading import Condition, Lock
+from typing import BinaryIO, NamedTuple
+
+import h5py
+import numpy as np
+
+from qmi.core.thread import QMI_Thread
+from qmi.instruments.picoquant.support._decoders import EventDataType
+
+# Global variable holding the logger for this module.
+_logger = logging.getLogger(__name__)
+
+
+class RecordingFormat(Enum):
+    """The file formats for recording TTTR events to disk.
+
+    HDF5 - decoded event records (`EventDataType`) in a chunked dataset ``events``.
+    PTU - raw 32-bit FIFO records with a PicoQuant PTU file header, readable by PicoQuant software.
+    """
+    HDF5 = "hdf5"
+    PTU = "ptu"
+
+
+class RecordingStatus(NamedTuple):
+    """Status of a recording of TTTR events to disk.
+
+    Attributes:
+        path:            Path of the file being recorded.
+        file_format:     File format of the recording.
+        records_written: Number of records written to the file.
+        records_dropped: Number of records dropped because the writer could not keep up.
+    """
+    path: str
+    file_format: RecordingFormat
+    records_written: int
+    records_dropped: int
+
+
+# PTU "TTResultFormat_TTTRRecType" codes for each (model, mode) combination.
+_PTU_RECORD_TYPES = {
+    ("PH", "T2"): 0x00010203,
+    ("PH", "T3"): 0x00010303,
+    ("HH", "T2"): 0x01010204,
+    ("HH", "T3"): 0x01010304,
+    ("MH", "T2"): 0x00010207,
+    ("MH", "T3"): 0x00010307,
+}
+
+# PTU tag types.
+_PTU_TY_EMPTY8 = 0xFFFF0008
+_PTU_TY_INT8 = 0x10000008
+_PTU_TY_FLOAT8 = 0x20000008
+_PTU_TY_ANSI_STRING = 0x4001FFFF
+
+
+class _RecordingWriter(ABC):
+    """Base class for writing blocks of records to a file."""
+
+    @abstractmethod
+    def write(self, records: np.ndarray) -> None:
+        """Append a block of records to the file."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Flush and close the file."""
+
+
+class _Hdf5RecordingWriter(_RecordingWriter):
+    """Write decoded event records to a resizable, chunked HDF5 dataset."""
+
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, path: str, attributes: dict[str, str | float]) -> None:
+        self._file = h5py.File(path, "w")
+        try:
+            self._dataset = self._file.create_dataset("events",
+                                                      shape=(0,),
+                                                      maxshape=(None,),
+                                                      dtype=EventDataType,
+                                                      chunks=(self.CHUNK_SIZE,))
+            self._dataset.attrs.update(attributes)
+        except Exception:
+            self._file.close()
+            raise
+        self._num_records = 0
+
+    def write(self, records: np.ndarray) -> None:
+        num_records = self._num_records + len(records)
+        self._dataset.resize((num_records,))
+        self._dataset[self._num_records:num_records] = records
+        self._num_records = num_records
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _PtuRecordingWriter(_RecordingWriter):
+    """Write raw 32-bit FIFO records to a PicoQuant PTU file.
+
+    The number of records in the header is updated when the file is closed.
+    """
+
+    def __init__(self, path: str, record_type: int, global_resolution: float, resolution: float) -> None:
+        self._file: BinaryIO = open(path, "wb")
+        try:
+            self._num_records_offset = self._write_header(record_type, global_resolution, resolution)
+        except Exception:
+            self._file.close()
+            raise
+        self._num_records = 0
+
+    def _write_tag(self, ident: str, tag_type: int, value: int | float | str) -> int:
+        """Write a PTU header tag and return the file offset of the tag value."""
+        self._file.write(struct.pack("<32siI", ident.encode("ascii"), -1, tag_type))
+        offset = self._file.tell()
+        if tag_type == _PTU_TY_FLOAT8:
+            self._file.write(struct.pack("<d", value))
+        elif tag_type == _PTU_TY_ANSI_STRING:
+            assert isinstance(value, str)
+            data = value.encode("ascii") + b"\0"
+            data += b"\0" * (-len(data) % 8)
+            self._file.write(struct.pack("<q", len(data)))
+            self._file.write(data)
+        else:
+            self._file.write(struct.pack("<q", value))
+        return offset
+
+    def _write_header(self, record_type: int, global_resolution: float, resolution: float) -> int:
+        self._file.write(b"PQTTTR\0\0")
+        self._file.write(b"1.0.00\0\0")
+        self._write_tag("CreatorSW_Name", _PTU_TY_ANSI_STRING, "QMI")
+        self._write_tag("File_CreatingTime", _PTU_TY_ANSI_STRING, time.strftime("%Y-%m-%d %H:%M:%S"))
+        self._write_tag("Measurement_Mode", _PTU_TY_INT8, (record_type >> 8) & 0xff)
+        self._write_tag("Measurement_SubMode", _PTU_TY_INT8, 0)
+        self._write_tag("MeasDesc_GlobalResolution", _PTU_TY_FLOAT8, global_resolution)
+        self._write_tag("MeasDesc_Resolution", _PTU_TY_FLOAT8, resolution)
+        self._write_tag("TTResultFormat_TTTRRecType", _PTU_TY_INT8, record_type)
+        self._write_tag("TTResultFormat_BitsPerRecord", _PTU_TY_INT8, 32)
+        num_records_offset = self._write_tag("TTResult_NumberOfRecords", _PTU_TY_INT8, 0)
+        self._write_tag("Header_End", _PTU_TY_EMPTY8, 0)
+        return num_records_offset
+
+    def write(self, records: np.ndarray) -> None:
+        self._file.write(records.astype("<u4", copy=False).tobytes())
+        self._num_records += len(records)
+
+    def close(self) -> None:
+        try:
+            self._file.seek(self._num_records_offset)
+            self._file.write(struct.pack("<q", self._num_records))
+        finally:
+            self._file.close()
+
+
+class _EventRecorder(QMI_Thread):
+    """This thread writes TTTR records to a file.
+
+    The event fetching thread submits blocks of records, which are queued and written
+    to the file by this thread, so that file I/O does not delay reading the instrument FIFO.
+    When the queue is full, new blocks are dropped.
+    """
+
+    DEFAULT_MAX_QUEUED_RECORDS = 10**7
+
+    def __init__(self,
+                 path: str,
+                 file_format: RecordingFormat,
+                 model: str,
+                 mode: str,
+                 global_resolution: float,
+                 resolution: float,
+                 max_queued_records: int = DEFAULT_MAX_QUEUED_RECORDS
+                 ) -> None:
+        """Create the file and initialize the recording thread.
+
+        Parameters:
+            path:               Path of the file to create. An existing file is overwritten.
+            file_format:        File format of the recording.
+            model:              Instrument model ("MH", "HH" or "PH").
+            mode:               Measurement mode ("T2" or "T3").
+            global_resolution:  Resolution of the T2 time tags, or the SYNC period in T3 mode, in seconds.
+            resolution:         Resolution of the T3 start-stop times, or the T2 time tag resolution, in seconds.
+            max_queued_records: Maximum number of records waiting to be written.
+        """
+        super().__init__()
+        self.path = path
+        self.file_format = file_format
+        self._writer: _RecordingWriter
+        if file_format == RecordingFormat.PTU:
+            self._writer = _PtuRecordingWriter(path, _PTU_RECORD_TYPES[(model, mode)], global_resolution, resolution)
+        else:
+            self._writer = _Hdf5RecordingWriter(path, {"model": model,
+                                                       "mode": mode,
+                                                       "global_resolution": global_resolution,
+                                                       "resolution": resolution,
+                                                       "start_time": time.time()})
+        self._condition = Condition(Lock())
+        self._queue: deque[tuple[np.ndarray, Callable[[], None] | None]] = deque()
+        self._num_queued_records = 0
+        self._max_queued_records = max_queued_records
+        self._records_written = 0
+        self._records_dropped = 0
+        self._error: Exception | None = None
+
+    @property
+    def raw(self) -> bool:
+        """True if the recording expects raw FIFO records, False if it expects decoded event records."""
+        return self.file_format == RecordingFormat.PTU
+
+    @property
+    def error(self) -> Exception | None:
+        """Exception which stopped the writing of records, or None."""
+        return self._error
+
+    def submit(self, records: np.ndarray, release_func: Callable[[], None] | None = None) -> None:
+        """Queue a block of records to be written.
+
+        The recorder keeps a reference to the array, so the caller must not modify it
+        until `release_func` is called.
+
+        This method is thread-safe.
+        It will be called in the event fetching thread.
+
+        Parameters:
+            records:      Array of records.
+            release_func: Optional function called when the recorder no longer uses the array.
+        """
+        with self._condition:
+            if (self._error is not None) or (self._num_queued_records + len(records) > self._max_queued_records):
+                self._records_dropped += len(records)
+                if release_func is not None:
+                    release_func()
+                return
+            self._queue.append((records, release_func))
+            self._num_queued_records += len(records)
+            self._condition.notify_all()
+
+    def get_status(self) -> RecordingStatus:
+        """Return the number of written and dropped records.
+
+        This method is thread-safe.
+        """
+        with self._condition:
+            return RecordingStatus(path=self.path,
+                                   file_format=self.file_format,
+                                   records_written=self._records_written,
+                                   records_dropped=self._records_dropped)
+
+    def run(self) -> None:
+        """Main function running in the background thread.
+
+        After shutdown is requested, all queued records are written before the file is closed.
+        """
+        try:
+            while True:
+                with self._condition:
+                    while (not self._queue) and (not self._shutdown_requested):
+                        self._condition.wait()
+                    if not self._queue:
+                        break
+                    (records, release_func) = self._queue.popleft()
+                    self._num_queued_records -= len(records)
+
+                if self._error is None:
+                    try:
+                        self._writer.write(records)
+                    except Exception as exc:
+                        _logger.exception("Error while writing TTTR records to %s", self.path)
+                        with self._condition:
+                            self._error = exc
+                            self._records_dropped += len(records)
+                    else:
+                        with self._condition:
+                            self._records_written += len(records)
+                else:
+                    with self._condition:
+                        self._records_dropped += len(records)
+
+                if release_func is not None:
+                    release_func()
+        finally:
+            try:
+                self._writer.close()
+            except Exception as exc:
+                _logger.exception("Error while closing %s", self.path)
+                if self._error is None:
+                    self._error = exc
+
+    def _request_shutdown(self) -> None:
+        with self._condition:
+            self._condition.notify_all()
@@ -0,0 +1,184 @@
+from enum import Enum
+from typing import NamedTuple
+
+import numpy as np
+
+from qmi.instruments.picoquant.support._decoders import EventDataType
+
+
+class EventOverflowPolicy(Enum):
+    """The policies for handling events that do not fit in the pending event buffer.
+
+    DROP_OLDEST - discard the oldest pending events to make room for new events.
+    DROP_NEWEST - discard new events that do not fit in the buffer.
+    RAISE - discard new events that do not fit, and report the overflow by discarding all pending events
+            and raising an exception on the next attempt to fetch events.
+    """
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    RAISE = "raise"
+
+
+class EventBufferStatus(NamedTuple):
+    """Status of the pending event buffer.
+
+    Attributes:
+        capacity:        Maximum number of pending events.
+        pending_events:  Number of events currently in the buffer.
+        dropped_events:  Number of events discarded due to buffer overflow since the start of the measurement.
+        overflow_policy: Policy applied when events do not fit in the buffer.
+    """
+    capacity: int
+    pending_events: int
+    dropped_events: int
+    overflow_policy: EventOverflowPolicy
+
+
+class _EventRingBuffer:
+    """Fixed-capacity FIFO buffer of `EventDataType` records.
+
+    Events are stored in a circular structured array. Storage is allocated on demand,
+    starting at `INITIAL_SIZE` records and growing by doubling up to the capacity of the buffer,
+    so that a large capacity does not commit memory that is never used.
+
+    This class is not thread-safe.
+    """
+
+    INITIAL_SIZE = 1 << 20
+
+    def __init__(self, capacity: int, overflow_policy: EventOverflowPolicy = EventOverflowPolicy.RAISE) -> None:
+        """Initialize an empty buffer.
+
+        Parameters:
+            capacity:        Maximum number of events in the buffer.
+            overflow_policy: Policy applied when events do not fit in the buffer.
+        """
+        assert capacity > 0
+        self._capacity = capacity
+        self._overflow_policy = overflow_policy
+        self._storage = np.empty(0, dtype=EventDataType)
+        self._head = 0
+        self._count = 0
+        self._dropped_events = 0
+        self._overflow = False
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of events in the buffer."""
+        return self._capacity
+
+    @property
+    def overflow(self) -> bool:
+        """True if events were discarded under the `RAISE` policy and the overflow was not yet reported."""
+        return self._overflow
+
+    def get_status(self) -> EventBufferStatus:
+        """Return the fill level and overflow counters of the buffer."""
+        return EventBufferStatus(capacity=self._capacity,
+                                 pending_events=self._count,
+                                 dropped_events=self._dropped_events,
+                                 overflow_policy=self._overflow_policy)
+
+    def clear(self) -> None:
+        """Remove all events and reset the overflow counters."""
+        self._head = 0
+        self._count = 0
+        self._dropped_events = 0
+        self._overflow = False
+
+    def discard(self) -> None:
+        """Discard all pending events and clear the overflow flag.
+
+        Discarded events are counted as dropped events.
+        """
+        self._dropped_events += self._count
+        self._head = 0
+        self._count = 0
+        self._overflow = False
+
+    def _reserve(self, num_events: int) -> None:
+        """Make sure the storage can hold `num_events` records."""
+        size = len(self._storage)
+        if num_events <= size:
+            return
+        new_size = min(self._capacity, max(num_events, 2 * size, self.INITIAL_SIZE))
+        storage = np.empty(new_size, dtype=EventDataType)
+        first_part = min(self._count, size - self._head)
+        storage[:first_part] = self._storage[self._head:self._head + first_part]
+        storage[first_part:self._count] = self._storage[:self._count - first_part]
+        self._storage = storage
+        self._head = 0
+
+    def append(self, event_records: np.ndarray) -> None:
+        """Add events to the end of the buffer, applying the overflow policy if they do not fit.
+
+        Parameters:
+            event_records: Numpy array of `EventDataType` records.
+        """
+        num_events = len(event_records)
+        if num_events == 0:
+            return
+
+        room_left = self._capacity - self._count
+        if num_events > room_left:
+            if self._overflow_policy == EventOverflowPolicy.DROP_OLDEST:
+                if num_events >= self._capacity:
+                    # Only the most recent events fit in the buffer.
+                    self._dropped_events += self._count + num_events - self._capacity
+                    event_records = event_records[num_events - self._capacity:]
+                    num_events = self._capacity
+                    self._head = 0
+                    self._count = 0
+                else:
+                    num_drop = num_events - room_left
+                    self._dropped_events += num_drop
+                    self._head = (self._head + num_drop) % max(len(self._storage), 1)
+                    self._count -= num_drop
+            elif self._overflow_policy == EventOverflowPolicy.DROP_NEWEST:
+                self._dropped_events += num_events - room_left
+                event_records = event_records[:room_left]
+                num_events = room_left
+            else:
+                self._dropped_events += num_events
+                self._overflow = True
+                return
+
+        if num_events == 0:
+            return
+
+        # Copy events to the tail of the circular storage, wrapping around if necessary.
+        self._reserve(self._count + num_events)
+        size = len(self._storage)
+        tail = (self._head + self._count) % size
+        first_part = min(num_events, size - tail)
+        self._storage[tail:tail + first_part] = event_records[:first_part]
+        self._storage[:num_events - first_part] = event_records[first_part:]
+        self._count += num_events
+
+    def pop(self, max_events: int) -> np.ndarray:
+        """Remove and return the oldest events from the buffer.
+
+        Parameters:
+            max_events: Maximum number of events to return.
+
+        Returns:
+            Numpy array of `EventDataType` records. The array does not share memory with the buffer.
+        """
+        num_events = min(max_events, self._count)
+        if num_events == 0:
+            return np.empty(0, dtype=EventDataType)
+
+        size = len(self._storage)
+        first_part = min(num_events, size - self._head)
+        if first_part == num_events:
+            # Contiguous range; a single copy.
+            event_records = self._storage[self._head:self._head + num_events].copy()
+        else:
+            event_records = np.concatenate((self._storage[self._head:], self._storage[:num_events - first_part]))
+
+        self._count -= num_events
+        self._head = 0 if self._count == 0 else (self._head + num_events) % size
+        return event_records
@@ -0,0 +1,111 @@
+import time
+from collections.abc import Callable
+from typing import NamedTuple
+
+import numpy as np
+
+from qmi.instruments.picoquant.support._decoders import EventDataType
+
+
+class EventChunk(NamedTuple):
+    """Chunk of TTTR event records, published while event streaming is enabled.
+
+    Attributes:
+        sequence_number: Number of the chunk within the current measurement, starting at 0.
+                         A gap in the sequence numbers indicates that chunks were lost by the subscriber.
+        timestamp:       Approximate wall-clock time when the last event record of the chunk was received.
+        events:          Numpy array of `EventDataType` records.
+    """
+    sequence_number: int
+    timestamp: float
+    events: np.ndarray
+
+
+class _EventStreamer:
+    """Collect event records in chunks and publish each chunk.
+
+    A chunk is published as soon as it holds `max_chunk_events` records, or when its oldest record
+    has been waiting for `max_chunk_age` seconds. The age is checked when events are added and when
+    `poll()` is called, so the latency is bounded by `max_chunk_age` plus the polling interval.
+
+    This class is not thread-safe.
+    """
+
+    def __init__(self, publish_events_func: Callable[[EventChunk], None] | None) -> None:
+        """Initialize event streaming, initially disabled.
+
+        Parameters:
+            publish_events_func: A call-back function for publishing event chunks.
+        """
+        self._publish_events_func = publish_events_func
+        self._max_chunk_events = 0
+        self._max_chunk_age = 0.0
+        self._chunk = np.empty(0, dtype=EventDataType)
+        self._num_events = 0
+        self._chunk_start_time = 0.0
+        self._chunk_timestamp = 0.0
+        self._sequence_number = 0
+
+    @property
+    def enabled(self) -> bool:
+        """True if events are streamed."""
+        return self._max_chunk_events > 0
+
+    def configure(self, max_chunk_events: int, max_chunk_age: float) -> None:
+        """Publish any pending events, then change the chunk limits.
+
+        Parameters:
+            max_chunk_events: Maximum number of events per chunk. Specify 0 to disable streaming.
+            max_chunk_age:    Maximum time in seconds that an event waits before its chunk is published.
+        """
+        self.flush()
+        if (max_chunk_events > 0) and (self._publish_events_func is None):
+            raise ValueError("No function for publishing events")
+        self._max_chunk_events = max_chunk_events
+        self._max_chunk_age = max_chunk_age
+        self._chunk = np.empty(max_chunk_events, dtype=EventDataType)
+
+    def reset(self) -> None:
+        """Discard pending events and restart the sequence numbers, for example when a new measurement starts."""
+        self._num_events = 0
+        self._sequence_number = 0
+
+    def append(self, event_records: np.ndarray, timestamp: float) -> None:
+        """Add events to the stream, publishing each chunk that becomes full.
+
+        The events are copied, so the caller may reuse the array.
+
+        Parameters:
+            event_records: Numpy array of `EventDataType` records.
+            timestamp:     Approximate wall-clock time when the records were received.
+        """
+        pos = 0
+        while pos < len(event_records):
+            if self._num_events == 0:
+                self._chunk_start_time = time.monotonic()
+            num_copy = min(len(event_records) - pos, self._max_chunk_events - self._num_events)
+            self._chunk[self._num_events:self._num_events + num_copy] = event_records[pos:pos + num_copy]
+            self._num_events += num_copy
+            self._chunk_timestamp = timestamp
+            pos += num_copy
+            if self._num_events == self._max_chunk_events:
+                self.flush()
+        self.poll()
+
+    def poll(self) -> None:
+        """Publish the pending events if the oldest of them has reached the maximum age."""
+        if (self._num_events > 0) and (time.monotonic() - self._chunk_start_time >= self._max_chunk_age):
+            self.flush()
+
+    def flush(self) -> None:
+        """Publish the pending events, if any."""
+        if self._num_events == 0:
+            return
+        assert self._publish_events_func is not None
+        # The published array is handed over to the subscribers; continue in a new array.
+        events = self._chunk[:self._num_events]
+        self._chunk = np.empty(self._max_chunk_events, dtype=EventDataType)
+        self._num_events = 0
+        chunk = EventChunk(sequence_number=self._sequence_number, timestamp=self._chunk_timestamp, events=events)
+        self._sequence_number += 1
+        self._publish_events_func(chunk)
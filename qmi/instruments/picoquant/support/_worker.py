@@ -0,0 +1,331 @@
+import logging
+import multiprocessing
+import queue
+import time
+import traceback
+from collections.abc import Callable
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, NamedTuple, TYPE_CHECKING
+
+import numpy as np
+
+from qmi.core.exceptions import QMI_RuntimeException
+from qmi.instruments.picoquant.support._decoders import EventDataType
+
+if TYPE_CHECKING:
+    from qmi.instruments.picoquant.support._events import _EventProcessor
+
+# Global variable holding the logger for this module.
+_logger = logging.getLogger(__name__)
+
+# Bound on the number of output records per FIFO word: decoding yields at most two records per word
+# (an event and its SYNC in T3 mode), filtering at most one more record (the previous SYNC).
+_MAX_OUTPUT_RECORDS_PER_WORD = 4
+
+# Size of the header in front of the output ring; it holds the read position of the parent process.
+_OUTPUT_HEADER_SIZE = 8
+
+# Polling interval for conditions that are not signalled through a queue.
+_POLL_INTERVAL = 0.1
+
+
+class _WorkerResult(NamedTuple):
+    """Result of processing one block of FIFO data in the decoder worker process.
+
+    The record arrays are views into shared memory. They remain valid until the result is
+    released with `_DecoderWorker.release_result()`.
+
+    Attributes:
+        tag:           Value passed to `_DecoderWorker.submit_block()` together with the block.
+        event_records: All decoded event records, or None if not requested.
+        filtered_records: Event records that passed the event filter, or None if filtering was disabled.
+        published:     List of (kind, value) tuples published by the real-time processing while processing
+                       the block, where `kind` is "histogram", "countrate" or "correlation".
+        output_end:    Position in the output ring following this result.
+    """
+    tag: Any
+    event_records: np.ndarray | None
+    filtered_records: np.ndarray | None
+    published: list[tuple[str, Any]]
+    output_end: int
+
+
+class _PublishCollector:
+    """Collect values published by the event processor in the worker process."""
+
+    def __init__(self) -> None:
+        self._published: list[tuple[str, Any]] = []
+
+    def publish_histogram(self, value: Any) -> None:
+        self._published.append(("histogram", value))
+
+    def publish_countrate(self, value: Any) -> None:
+        self._published.append(("countrate", value))
+
+    def publish_correlation(self, value: Any) -> None:
+        self._published.append(("correlation", value))
+
+    def take(self) -> list[tuple[str, Any]]:
+        """Return the values published since the previous call."""
+        (published, self._published) = (self._published, [])
+        return published
+
+
+def _worker_main(processor_factory: Callable[..., "_EventProcessor"],
+                 command_queue: "multiprocessing.Queue",
+                 result_queue: "multiprocessing.Queue",
+                 input_name: str,
+                 output_name: str,
+                 num_slots: int,
+                 slot_size: int,
+                 output_capacity: int
+                 ) -> None:
+    """Main function of the decoder worker process.
+
+    The worker executes commands from `command_queue` in order:
+        ("call", method_name, args) - call a configuration method of the event processor;
+        ("block", slot, num_words, filter_events, return_decoded, tag) - process a block of FIFO data;
+        ("stop",) - terminate the worker.
+
+    For each block, the output records are written to the output ring and a tuple
+    (slot, output_start, output_end, num_decoded, num_filtered, published, tag) is put in `result_queue`.
+    Results are produced in the same order as the blocks.
+    """
+    input_shm = SharedMemory(input_name)
+    output_shm = SharedMemory(output_name)
+    parent = multiprocessing.parent_process()
+    try:
+        input_slots = np.ndarray((num_slots, slot_size), dtype=np.uint32, buffer=input_shm.buf)
+        read_position = np.ndarray(1, dtype=np.uint64, buffer=output_shm.buf)
+        output = np.ndarray(output_capacity, dtype=EventDataType, buffer=output_shm.buf, offset=_OUTPUT_HEADER_SIZE)
+        collector = _PublishCollector()
+        processor = processor_factory(collector.publish_histogram,
+                                      collector.publish_countrate,
+                                      collector.publish_correlation)
+        write_position = 0
+
+        while True:
+            try:
+                command = command_queue.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                if (parent is not None) and (not parent.is_alive()):
+                    break
+                continue
+
+            if command[0] == "stop":
+                break
+
+            if command[0] == "call":
+                (_, method_name, args) = command
+                getattr(processor, method_name)(*args)
+                continue
+
+            (_, slot, num_words, filter_events, return_decoded, tag) = command
+            (event_records, filtered_records) = processor.process_data(input_slots[slot, :num_words], filter_events)
+            num_decoded = len(event_records) if return_decoded else -1
+            num_filtered = -1 if filtered_records is None else len(filtered_records)
+            size = max(num_decoded, 0) + max(num_filtered, 0)
+
+            # Keep each result contiguous: skip to the start of the ring if it does not fit at the end.
+            start = write_position
+            if (start % output_capacity) + size > output_capacity:
+                start += output_capacity - (start % output_capacity)
+            end = start + size
+
+            # Wait until the parent process has consumed enough of the previous results.
+            while True:
+                consumed = int(read_position[0])
+                if (consumed == write_position) or (end - consumed <= output_capacity):
+                    break
+                if (parent is not None) and (not parent.is_alive()):
+                    return
+                time.sleep(0.001)
+
+            pos = start % output_capacity
+            if num_decoded > 0:
+                output[pos:pos + num_decoded] = event_records
+                pos += num_decoded
+            if num_filtered > 0:
+                output[pos:pos + num_filtered] = filtered_records
+            write_position = end
+
+            result_queue.put((slot, start, end, num_decoded, num_filtered, collector.take(), tag))
+
+    except Exception:
+        result_queue.put(("error", traceback.format_exc()))
+
+    finally:
+        # Views must be released before the shared memory can be closed.
+        input_slots = read_position = output = None  # type: ignore
+        input_shm.close()
+        output_shm.close()
+
+
+class _DecoderWorker:
+    """Run the event processing in a separate worker process.
+
+    Raw FIFO data is read directly into one of `num_slots` input slots in shared memory,
+    which is handed to the worker process. The worker decodes, analyzes and filters the data
+    and writes the resulting event records to a ring buffer in shared memory. Only small
+    messages, real-time histograms and count rates pass through the multiprocessing queues.
+
+    Blocks are processed in order. An input slot becomes available again when the result of
+    its block is received.
+
+    This class is not thread-safe. All methods except `call()` must be called from the event fetching thread.
+    """
+
+    def __init__(self,
+                 processor_factory: Callable[..., "_EventProcessor"],
+                 slot_size: int,
+                 num_slots: int = 4
+                 ) -> None:
+        """Initialize the worker. The worker process is created by `start()`.
+
+        Parameters:
+            processor_factory: Picklable callable creating the event processor in the worker process,
+                               taking the histogram, count rate and correlation publishing functions.
+            slot_size:         Maximum number of 32-bit words in a block of FIFO data.
+            num_slots:         Number of input slots, i.e. the maximum number of blocks in flight.
+        """
+        assert slot_size > 0 and num_slots > 0
+        self._processor_factory = processor_factory
+        self._slot_size = slot_size
+        self._num_slots = num_slots
+        self._output_capacity = _MAX_OUTPUT_RECORDS_PER_WORD * slot_size + 1
+        self._context = multiprocessing.get_context("spawn")
+        self._command_queue = self._context.Queue()
+        self._result_queue = self._context.Queue()
+        self._process: multiprocessing.process.BaseProcess | None = None
+        self._input_shm: SharedMemory | None = None
+        self._output_shm: SharedMemory | None = None
+        self._input_slots = np.empty((0, slot_size), dtype=np.uint32)
+        self._read_position = np.zeros(1, dtype=np.uint64)
+        self._output = np.empty(0, dtype=EventDataType)
+        self._next_slot = 0
+        self._num_pending = 0
+
+    @property
+    def num_pending(self) -> int:
+        """Number of blocks submitted to the worker for which the result was not yet received."""
+        return self._num_pending
+
+    def start(self) -> None:
+        """Create the shared memory and start the worker process."""
+        input_size = self._num_slots * self._slot_size * np.dtype(np.uint32).itemsize
+        output_size = _OUTPUT_HEADER_SIZE + self._output_capacity * EventDataType.itemsize
+        self._input_shm = SharedMemory(create=True, size=input_size)
+        self._output_shm = SharedMemory(create=True, size=output_size)
+        self._input_slots = np.ndarray((self._num_slots, self._slot_size), dtype=np.uint32, buffer=self._input_shm.buf)
+        self._read_position = np.ndarray(1, dtype=np.uint64, buffer=self._output_shm.buf)
+        self._read_position[0] = 0
+        self._output = np.ndarray(self._output_capacity,
+                                  dtype=EventDataType,
+                                  buffer=self._output_shm.buf,
+                                  offset=_OUTPUT_HEADER_SIZE)
+        self._process = self._context.Process(target=_worker_main,
+                                              args=(self._processor_factory,
+                                                    self._command_queue,
+                                                    self._result_queue,
+                                                    self._input_shm.name,
+                                                    self._output_shm.name,
+                                                    self._num_slots,
+                                                    self._slot_size,
+                                                    self._output_capacity),
+                                              name="picoquant-decoder",
+                                              daemon=True)
+        self._process.start()
+
+    def stop(self) -> None:
+        """Stop the worker process and release the shared memory."""
+        if self._process is not None:
+            self._command_queue.put(("stop",))
+            self._process.join(timeout=5)
+            if self._process.is_alive():
+                _logger.warning("Decoder worker process did not stop, terminating it")
+                self._process.terminate()
+                self._process.join()
+            self._process = None
+        self._command_queue.close()
+        self._result_queue.close()
+
+        # Views must be released before the shared memory can be closed.
+        self._input_slots = np.empty((0, self._slot_size), dtype=np.uint32)
+        self._read_position = np.zeros(1, dtype=np.uint64)
+        self._output = np.empty(0, dtype=EventDataType)
+        for shm in (self._input_shm, self._output_shm):
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+        self._input_shm = None
+        self._output_shm = None
+
+    def call(self, method_name: str, *args: Any) -> None:
+        """Call a method of the event processor in the worker process.
+
+        The call is executed in order with the submitted blocks.
+
+        This method is thread-safe.
+        """
+        self._command_queue.put(("call", method_name, args))
+
+    def input_buffer(self) -> np.ndarray | None:
+        """Return the input slot for the next block, or None if all slots are in use."""
+        if self._num_pending >= self._num_slots:
+            return None
+        return self._input_slots[self._next_slot]
+
+    def submit_block(self, num_words: int, filter_events: bool, return_decoded: bool, tag: Any) -> None:
+        """Hand the FIFO data in the buffer returned by `input_buffer()` to the worker process.
+
+        The caller must not modify the buffer after this call.
+
+        Parameters:
+            num_words:      Number of words of FIFO data in the buffer.
+            filter_events:  True to apply the event filter to the decoded events.
+            return_decoded: True to also return all decoded events.
+            tag:            Picklable value returned with the result of the block.
+        """
+        assert self._num_pending < self._num_slots
+        self._command_queue.put(("block", self._next_slot, num_words, filter_events, return_decoded, tag))
+        self._next_slot = (self._next_slot + 1) % self._num_slots
+        self._num_pending += 1
+
+    def get_result(self, timeout: float) -> _WorkerResult | None:
+        """Return the result of the oldest pending block, or None if no result is available within `timeout`.
+
+        The previous result must have been released before calling this method.
+
+        Raises:
+            QMI_RuntimeException: If the worker process failed.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                message = self._result_queue.get(timeout=max(0.0, min(deadline - time.monotonic(), _POLL_INTERVAL)))
+                break
+            except queue.Empty:
+                if (self._process is None) or (not self._process.is_alive()):
+                    raise QMI_RuntimeException("Decoder worker process terminated unexpectedly")
+                if time.monotonic() >= deadline:
+                    return None
+
+        if message[0] == "error":
+            raise QMI_RuntimeException(f"Error in decoder worker process:\n{message[1]}")
+
+        (_slot, start, end, num_decoded, num_filtered, published, tag) = message
+        self._num_pending -= 1
+
+        pos = start % self._output_capacity
+        event_records = None
+        filtered_records = None
+        if num_decoded >= 0:
+            event_records = self._output[pos:pos + num_decoded]
+            pos += num_decoded
+        if num_filtered >= 0:
+            filtered_records = self._output[pos:pos + num_filtered]
+        return _WorkerResult(tag, event_records, filtered_records, published, end)
+
+    def release_result(self, result: _WorkerResult) -> None:
+        """Release the output space of a result, after its records have been copied."""
+        self._read_position[0] = result.output_end
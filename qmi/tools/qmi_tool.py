@@ -6,6 +6,10 @@ workgroup name ("default"). To see other contexts in other workgroups, use:
 You can also give timeout:
 `qmi_tool ls <workgroup-name> 10`.
 
+Run with `qmi_tool top` to show a live view of the RPC methods that are called in the QMI contexts on the network,
+with the call rate and timing of each method. Give a workgroup name and/or refresh interval in seconds as with `ls`:
+`qmi_tool top <workgroup-name> 5`. Press Ctrl-C to stop.
+
 You can also use this tool to kill all visible QMI contexts with the default workgroup name with:
 `qmi_tool hard-kill`. Use with care and never use without first checking which contexts will be killed,
 with `qmi_tool ls`.
@@ -18,8 +22,11 @@ import time
 import re
 
 from qmi.core.config_defs import CfgQmi
-from qmi.core.context import ping_qmi_contexts
+from qmi.core.context import QMI_Context, ping_qmi_contexts
+from qmi.core.exceptions import QMI_Exception
+from qmi.core.rpc import QMI_RpcMethodStatistics
 from qmi.core.udp_responder_packets import QMI_UdpResponderKillRequestPacket
+from qmi.core.util import QMI_TimingHistogram
 
 
 UDP_RESPONDER_PORT = 35999
@@ -81,11 +88,150 @@ def hard_kill() -> None:
         udp_socket.close()
 
 
+def _merge_histograms(hist1: QMI_TimingHistogram, hist2: QMI_TimingHistogram) -> QMI_TimingHistogram:
+    """Combine two timing histograms with the same bins."""
+    count = hist1.num_values + hist2.num_values
+    return QMI_TimingHistogram(
+        num_values=count,
+        mean=(hist1.mean * hist1.num_values + hist2.mean * hist2.num_values) / count if count else 0.0,
+        max=max(hist1.max, hist2.max),
+        bin_edges=hist1.bin_edges,
+        counts=tuple(c1 + c2 for (c1, c2) in zip(hist1.counts, hist2.counts))
+    )
+
+
+def merge_rpc_statistics(
+    statistics: list[list[QMI_RpcMethodStatistics]]
+) -> dict[tuple[str, str], QMI_RpcMethodStatistics]:
+    """Combine the RPC statistics reported by several contexts per (object, method).
+
+    Internal QMI objects (with a name starting with "$") are left out.
+
+    Parameters:
+        statistics: List of RPC statistics reported by each context.
+
+    Returns:
+        Dictionary mapping (object name, method name) to the combined statistics of the method.
+    """
+    merged: dict[tuple[str, str], QMI_RpcMethodStatistics] = {}
+    for context_statistics in statistics:
+        for stats in context_statistics:
+            if stats.object_name.split(".")[-1].startswith("$"):
+                continue
+            key = (stats.object_name, stats.method_name)
+            prev = merged.get(key)
+            if prev is None:
+                merged[key] = stats
+            else:
+                merged[key] = stats._replace(
+                    calls=prev.calls + stats.calls,
+                    errors=prev.errors + stats.errors,
+                    queue_wait=_merge_histograms(prev.queue_wait, stats.queue_wait),
+                    execution_time=_merge_histograms(prev.execution_time, stats.execution_time),
+                    round_trip_time=_merge_histograms(prev.round_trip_time, stats.round_trip_time)
+                )
+    return merged
+
+
+def format_rpc_top(
+    statistics: dict[tuple[str, str], QMI_RpcMethodStatistics],
+    previous: dict[tuple[str, str], QMI_RpcMethodStatistics],
+    interval: float,
+    max_rows: int = 40
+) -> list[str]:
+    """Format a table of RPC methods, with the most busy methods first.
+
+    Parameters:
+        statistics: Current combined RPC statistics, as returned by `merge_rpc_statistics()`.
+        previous:   Combined RPC statistics of the previous refresh, used to calculate call rates.
+        interval:   Time in seconds between the previous and the current statistics.
+        max_rows:   Maximum number of methods to show.
+
+    Returns:
+        Lines of the table.
+    """
+    rows = []
+    for (key, stats) in statistics.items():
+        prev = previous.get(key)
+        new_calls = stats.calls - (prev.calls if prev is not None else 0)
+        new_round_trips = stats.round_trip_time.num_values - (prev.round_trip_time.num_values if prev is not None else 0)
+        rate = max(new_calls, new_round_trips) / interval if interval > 0 else 0.0
+        busy = new_calls * stats.execution_time.mean
+        rows.append((busy, rate, stats))
+    rows.sort(key=lambda row: (row[0], row[1]), reverse=True)
+
+    lines = [f"{'object':<32} {'method':<24} {'calls/s':>9} {'calls':>9} {'errors':>7} "
+             f"{'queue ms':>9} {'exec ms':>9} {'p99 ms':>9} {'rtt ms':>9}"]
+    for (busy, rate, stats) in rows[:max_rows]:
+        lines.append(f"{stats.object_name:<32.32} {stats.method_name:<24.24} {rate:>9.1f} {stats.calls:>9} "
+                     f"{stats.errors:>7} {1e3 * stats.queue_wait.mean:>9.3f} {1e3 * stats.execution_time.mean:>9.3f} "
+                     f"{1e3 * stats.execution_time.percentile(99):>9.3f} {1e3 * stats.round_trip_time.mean:>9.3f}")
+    return lines
+
+
+def rpc_top(workgroup_name: str = CfgQmi.workgroup, interval: float = 2.0) -> None:
+    """Show a live view of RPC method statistics of all QMI contexts on the network, until Ctrl-C is pressed.
+
+    Parameters:
+        workgroup_name: The name of the workgroup to be searched for. Default is the CfgQmi.workgroup default.
+        interval:       Refresh interval in seconds (default: 2.0).
+    """
+    context_name = f"qmi_tool_{random.randint(0, 2**32 - 1):08x}"
+    config = CfgQmi()
+    config.workgroup = workgroup_name
+    context = QMI_Context(context_name, config)
+    context.start()
+    try:
+        previous: dict[tuple[str, str], QMI_RpcMethodStatistics] = {}
+        previous_time = time.monotonic()
+        while True:
+            statistics = []
+            for peer in context.discover_peer_contexts():
+                if peer.address_port.endswith(":0"):
+                    # Context does not accept peer connections.
+                    continue
+                try:
+                    context.connect_to_peer(peer.name, peer.address_port, ignore_duplicate=True)
+                    statistics.append(context.make_peer_context_proxy(peer.name).get_rpc_statistics())
+                except (QMI_Exception, OSError):
+                    # The context may have stopped in the meantime.
+                    continue
+
+            now = time.monotonic()
+            merged = merge_rpc_statistics(statistics)
+            lines = format_rpc_top(merged, previous, now - previous_time)
+            previous = merged
+            previous_time = now
+
+            # Clear the terminal and print the table.
+            print("\x1b[H\x1b[2J", end="")
+            print(f"QMI RPC statistics of {len(statistics)} contexts in workgroup {workgroup_name!r}"
+                  f" ({time.strftime('%H:%M:%S')}, refresh every {interval:.1f} s, Ctrl-C to stop)")
+            print()
+            print("\n".join(lines), flush=True)
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        context.stop()
+
+
 def run() -> None | str:
     for e, arg in enumerate(sys.argv[1:]):
-        if arg not in ["ls", "lsqmi", "hard-kill", "hard-kill-yes-really-i-am-sure"]:
+        if arg not in ["ls", "lsqmi", "top", "hard-kill", "hard-kill-yes-really-i-am-sure"]:
             return f"Invalid argument {arg}."
 
+        if arg == "top":
+            # The optional arguments are a workgroup name and/or a refresh interval.
+            top_kwargs: dict = {}
+            for top_arg in sys.argv[e + 2:e + 4]:
+                if len(re.findall(r"[a-zA-z]+", top_arg)) == 0:
+                    top_kwargs["interval"] = float(top_arg)
+                else:
+                    top_kwargs["workgroup_name"] = top_arg
+            rpc_top(**top_kwargs)
+            break
+
         if arg in {"ls", "lsqmi"}:
             if len(sys.argv) == (e + 3):
                 # we have one input and need to check if it is timeout or workgroup name
@@ -2,6 +2,7 @@
 """Unit-tests for testing context managing for `QMI_Instrument` class."""
 import logging
 import unittest
+import unittest.mock
 
 from numpy import random
 
@@ -72,6 +73,19 @@ class TestInstrumentContextManager(unittest.TestCase):
         # Also see extra action in the instrument driver's `close` has been executed
         self.assertFalse(instr.is_it_open_then())
 
+    def test_get_transport_statistics(self):
+        """Test transport statistics are returned only for transports that collect them."""
+        instr = MyInstrument_TestDriver(self.qmi_patcher, self._ctx_qmi_id)
+        # Without transport there are no statistics.
+        self.assertIsNone(instr.get_transport_statistics())
+        # Transport without statistics.
+        instr._transport = object()
+        self.assertIsNone(instr.get_transport_statistics())
+        # Transport with statistics.
+        instr._transport = unittest.mock.Mock()
+        instr._transport.get_statistics.return_value = (1, 2, 3)
+        self.assertEqual((1, 2, 3), instr.get_transport_statistics())
+
 
 class TestInstrumentMakeFunction(unittest.TestCase):
 
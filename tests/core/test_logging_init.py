@@ -1,4 +1,7 @@
+import json
 import os
+import queue
+import tempfile
 import unittest
 import unittest.mock
 import sys
@@ -8,6 +11,9 @@ from time import monotonic, sleep
 
 import qmi.core.logging_init
 from qmi.core.logging_init import start_logging, WatchedRotatingFileHandler, _RateLimitFilter, _log_excepthook
+from qmi.core.logging_init import (
+    get_dropped_log_messages, _DroppingQueueHandler, _JsonLineFormatter, _LogWriterThread, _stop_async_logging
+)
 
 
 class TestStartLoggingOptions(unittest.TestCase):
@@ -350,5 +356,102 @@ class Test_RateLimitFilter(unittest.TestCase):
         self.assertDictEqual(exp_record, rounded_filter_obj)
 
 
+class TestAsyncLogging(unittest.TestCase):
+
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.logfile = os.path.join(self._tempdir.name, "log.file")
+        self._saved_disable = logging.root.manager.disable
+        self._saved_handlers = list(logging.getLogger().handlers)
+        logging.disable(logging.NOTSET)
+        self.logger = logging.getLogger("qmi.test_async_logging")
+        self.logger.setLevel(logging.INFO)
+
+    def tearDown(self):
+        _stop_async_logging()
+        root = logging.getLogger()
+        for hdlr in list(root.handlers):
+            if hdlr not in self._saved_handlers:
+                root.removeHandler(hdlr)
+                hdlr.close()
+        if qmi.core.logging_init._file_handler is not None:
+            qmi.core.logging_init._file_handler.close()
+            qmi.core.logging_init._file_handler = None
+        self.logger.setLevel(logging.NOTSET)
+        logging.disable(self._saved_disable)
+        self._tempdir.cleanup()
+
+    def _read_lines(self):
+        with open(self.logfile) as f:
+            return f.read().splitlines()
+
+    def test_async_logging(self):
+        """Log messages are written to file by the writer thread."""
+        start_logging(logfile=self.logfile, async_logging=True)
+        self.assertIsInstance(qmi.core.logging_init._queue_handler, _DroppingQueueHandler)
+        self.assertNotIn(qmi.core.logging_init._file_handler, logging.getLogger().handlers)
+
+        for i in range(1000):
+            self.logger.info("Message %d", i)
+        _stop_async_logging()
+
+        lines = self._read_lines()
+        self.assertEqual(len(lines), 1000)
+        self.assertTrue(lines[0].endswith("| Message 0"))
+        self.assertTrue(lines[-1].endswith("| Message 999"))
+        self.assertEqual(get_dropped_log_messages(), 0)
+
+    def test_json_lines(self):
+        """Log messages are written as JSON objects, one per line."""
+        start_logging(logfile=self.logfile, async_logging=True, json_lines=True)
+        self.logger.info("Value %d", 5)
+        try:
+            raise ValueError("bad value")
+        except ValueError:
+            self.logger.exception("Failed")
+        _stop_async_logging()
+
+        entries = [json.loads(line) for line in self._read_lines()]
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(entries[0]["message"], "Value 5")
+        self.assertEqual(entries[0]["level"], "INFO")
+        self.assertEqual(entries[0]["logger"], "qmi.test_async_logging")
+        self.assertEqual(entries[0]["process"], os.getpid())
+        self.assertNotIn("exception", entries[0])
+        self.assertEqual(entries[1]["level"], "ERROR")
+        self.assertIn("ValueError: bad value", entries[1]["exception"])
+
+    def test_json_formatter(self):
+        """The JSON formatter produces a single line for multi-line messages."""
+        record = logging.makeLogRecord({"name": "test", "levelno": logging.WARNING, "levelname": "WARNING",
+                                        "msg": "line 1\nline %s", "args": ("2",)})
+        line = _JsonLineFormatter().format(record)
+        self.assertNotIn("\n", line)
+        self.assertEqual(json.loads(line)["message"], "line 1\nline 2")
+
+    def test_dropped_messages(self):
+        """Messages are dropped and counted when the queue is full, and the drops are reported in the log file."""
+        log_queue = queue.Queue(maxsize=3)
+        queue_handler = _DroppingQueueHandler(log_queue)
+        self.logger.addHandler(queue_handler)
+        try:
+            for i in range(5):
+                self.logger.info("Message %d", i)
+        finally:
+            self.logger.removeHandler(queue_handler)
+        self.assertEqual(queue_handler.dropped, 2)
+
+        file_handler = WatchedRotatingFileHandler(self.logfile, delay=True)
+        writer = _LogWriterThread(log_queue, queue_handler, file_handler)
+        writer.start()
+        writer.stop()
+        file_handler.close()
+
+        lines = self._read_lines()
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[:3], ["Message 0", "Message 1", "Message 2"])
+        self.assertEqual(lines[3], "2 log messages dropped because the log queue was full")
+
+
 if __name__ == '__main__':
     unittest.main()
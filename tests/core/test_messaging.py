@@ -1,6 +1,8 @@
 #! /usr/bin/env python3
 
 import logging
+import os
+import pickle
 import time
 import unittest
 from unittest.mock import ANY
@@ -8,6 +10,7 @@ from unittest.mock import ANY
 from qmi.core.config_defs import CfgQmi, CfgContext
 from qmi.core.context import QMI_Context
 from qmi.core.messaging import QMI_Message, QMI_MessageHandler, QMI_MessageHandlerAddress
+from qmi.core.messaging import _PeerTcpConnection, _PeerUnixConnection, _SAME_HOST_TRANSPORT_SUPPORTED
 from qmi.core.exceptions import QMI_MessageDeliveryException
 
 
@@ -177,6 +180,82 @@ class TestBasicMessaging(unittest.TestCase):
         self.c3.unregister_message_handler(mh3)
 
 
+class LargeBuffer:
+    """Object which pickles its data out-of-band, like Numpy arrays."""
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return (LargeBuffer, (pickle.PickleBuffer(self.data),))
+        return (LargeBuffer, (bytes(self.data),))
+
+
+@unittest.skipUnless(_SAME_HOST_TRANSPORT_SUPPORTED, "Unix domain sockets not supported")
+class TestSameHostMessaging(unittest.TestCase):
+    """Test message sending between contexts on the same host via Unix domain sockets."""
+
+    def setUp(self):
+        config = CfgQmi(
+            contexts={
+                "c1": CfgContext(tcp_server_port=0),
+                "c2": CfgContext(tcp_server_port=0, same_host_transport=False),
+                "c3": CfgContext()
+            }
+        )
+
+        self.c1 = QMI_Context("c1", config)
+        self.c1.start()
+        self.c2 = QMI_Context("c2", config)
+        self.c2.start()
+        self.c3 = QMI_Context("c3", config)
+        self.c3.start()
+
+        self.c3.connect_to_peer("c1", "127.0.0.1:{}".format(self.c1.get_tcp_server_port()))
+        self.c3.connect_to_peer("c2", "127.0.0.1:{}".format(self.c2.get_tcp_server_port()))
+
+    def tearDown(self):
+        socket_path = self.c1._message_router.unix_server_path
+
+        self.c1.stop()
+        self.c2.stop()
+        self.c3.stop()
+
+        # The socket file is removed when the context stops.
+        self.assertFalse(os.path.exists(socket_path))
+
+    def test_transport_selection(self):
+        """A peer on the same host is connected via a Unix domain socket, unless it disables that."""
+        peer_connections = self.c3._message_router._socket_manager._peer_context_map
+        self.assertIsInstance(peer_connections["c1"], _PeerUnixConnection)
+        self.assertNotIsInstance(peer_connections["c2"], _PeerUnixConnection)
+        self.assertIsInstance(peer_connections["c2"], _PeerTcpConnection)
+
+    def test_delivery(self):
+        """Messages are delivered in both directions, including large buffers in shared memory."""
+        mh1 = TestMessageHandler(QMI_MessageHandlerAddress("c1", "mh1"))
+        mh3 = TestMessageHandler(QMI_MessageHandlerAddress("c3", "mh3"))
+        self.c1.register_message_handler(mh1)
+        self.c3.register_message_handler(mh3)
+
+        # Larger than the maximum size of a pickled message.
+        data = bytearray(os.urandom(1000)) * 12000
+        large_buffer = LargeBuffer(data)
+        self.c3.send_message(TestMessage(mh3.address, mh1.address, large_buffer))
+        time.sleep(0.5)
+
+        self.assertIsNotNone(mh1.last_message)
+        self.assertEqual(bytes(mh1.last_message.value.data), bytes(data))
+
+        # Reply to the local alias of c3.
+        self.c1.send_message(TestMessage(mh1.address, mh1.last_message.source_address, 1))
+        time.sleep(0.1)
+        self.assertEqual(mh3.received, {1})
+
+        self.c1.unregister_message_handler(mh1)
+        self.c3.unregister_message_handler(mh3)
+
+
 class TestUdpMessaging(unittest.TestCase):
     """Test UDP message handling."""
 
@@ -2,15 +2,18 @@
 
 """Test publish/subscribe functionality."""
 import random
+import threading
 import time
 import unittest
+import unittest.mock
 
 import qmi
 import qmi.core.exceptions
 from qmi.core.config_defs import CfgQmi, CfgContext
 from qmi.core.context import QMI_Context
 from qmi.core.rpc import QMI_RpcObject, rpc_method
-from qmi.core.pubsub import SignalDescription, QMI_Signal, QMI_SignalReceiver
+from qmi.core.pubsub import (
+    SignalDescription, SignalFilter, QMI_Signal, QMI_SignalReceiver, QMI_CallbackSignalReceiver)
 
 
 class MyPublisher(QMI_RpcObject):
@@ -37,6 +40,11 @@ class MyPublisher(QMI_RpcObject):
     def send3(self, x, s):
         self.sig3.publish(x, s)
 
+    @rpc_method
+    def send_many(self, n):
+        for i in range(n):
+            self.sig2.publish(i)
+
     @rpc_method
     def send_slow(self):
         for i in range(5):
@@ -475,6 +483,218 @@ class TestLocalPubSub(unittest.TestCase):
         sig = recv.get_next_signal(timeout=0)
         self.assertEqual(sig, (self.context_name, "pub1", "sig2", (4,), 4))
 
+    def test_get_signals(self):
+        # Take signals from the queue in batches.
+
+        pub1 = qmi.make_rpc_object("pub1", MyPublisher)
+        recv = QMI_SignalReceiver()
+        pub1.sig3.subscribe(recv)
+
+        # Empty queue gives an empty list after the timeout.
+        self.assertEqual(recv.get_signals(), [])
+        self.assertEqual(recv.get_signals(timeout=0.1), [])
+
+        for i in range(10):
+            pub1.send3(i, "x")
+
+        sigs = recv.get_signals(max_count=4)
+        self.assertEqual(sigs, [(self.context_name, "pub1", "sig3", (i, "x"), i) for i in range(4)])
+        self.assertEqual(recv.get_queue_length(), 6)
+
+        sigs = recv.get_signals()
+        self.assertEqual([sig.args[0] for sig in sigs], list(range(4, 10)))
+        self.assertFalse(recv.has_signal_ready())
+
+        # Blocking wait for signals published from the RPC thread.
+        pub2 = qmi.make_rpc_object("pub2", MyPublisher)
+        pub2.sig2.subscribe(recv)
+        future = pub2.rpc_nonblocking.send_slow()
+        sigs = recv.get_signals(timeout=2.0)
+        self.assertEqual(sigs, [(self.context_name, "pub2", "sig2", (0,), 10)])
+        future.wait()
+        sigs = recv.get_signals(timeout=0)
+        self.assertEqual([sig.args[0] for sig in sigs], [1, 2, 3, 4])
+
+        pub1.sig3.unsubscribe(recv)
+        pub2.sig2.unsubscribe(recv)
+
+    def test_multiple_waiters(self):
+        # Several threads waiting on the same receiver all receive signals.
+
+        pub1 = qmi.make_rpc_object("pub1", MyPublisher)
+        recv = QMI_SignalReceiver()
+        pub1.sig2.subscribe(recv)
+
+        received = []
+        lock = threading.Lock()
+
+        def consume():
+            sigs = recv.get_signals(max_count=1, timeout=5.0)
+            with lock:
+                received.extend(sigs)
+
+        threads = [threading.Thread(target=consume) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        for _ in range(3):
+            pub1.send2()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(sig.receiver_seqnr for sig in received), [0, 1, 2])
+        pub1.sig2.unsubscribe(recv)
+
+    def test_callback_receiver(self):
+        # Signals are passed to the callback function in batches.
+
+        pub1 = qmi.make_rpc_object("pub1", MyPublisher)
+
+        batches = []
+        release = threading.Event()
+
+        def callback(signals):
+            batches.append(signals)
+            # Block the first call, so that the following signals are collected in batches.
+            release.wait()
+
+        recv = QMI_CallbackSignalReceiver(callback, max_batch_size=4)
+        pub1.sig3.subscribe(recv)
+        for i in range(10):
+            pub1.send3(i, "")
+        release.set()
+        pub1.sig3.unsubscribe(recv)
+        recv.close()
+
+        # All signals are delivered in order, none of the batches exceeds the maximum size.
+        signals = [sig for batch in batches for sig in batch]
+        self.assertEqual([sig.args[0] for sig in signals], list(range(10)))
+        self.assertTrue(all(1 <= len(batch) <= 4 for batch in batches))
+        self.assertLess(len(batches), 10)
+
+    def test_callback_receiver_exception(self):
+        # An exception in the callback function does not stop delivery of further signals.
+
+        pub1 = qmi.make_rpc_object("pub1", MyPublisher)
+
+        received = []
+
+        def callback(signals):
+            received.extend(signals)
+            raise ValueError("callback failed")
+
+        recv = QMI_CallbackSignalReceiver(callback)
+        pub1.sig2.subscribe(recv)
+        with unittest.mock.patch("qmi.core.pubsub._logger") as logger:
+            pub1.send2()
+            time.sleep(0.1)
+            pub1.send2()
+            pub1.sig2.unsubscribe(recv)
+            recv.close()
+
+        self.assertEqual([sig.receiver_seqnr for sig in received], [0, 1])
+        logger.exception.assert_called_with("Error in signal callback function")
+
+    def test_conflating_subscription(self):
+        # A conflating subscriber receives at most max_rate signals per second, including the latest value.
+
+        pub1 = qmi.make_rpc_object("pub1", MyPublisher)
+        recv = QMI_SignalReceiver()
+        recv_all = QMI_SignalReceiver()
+        pub1.sig2.subscribe(recv, max_rate=10)
+        pub1.sig2.subscribe(recv_all)
+
+        pub1.send_many(100)
+
+        # The first signal is delivered immediately, the latest value at the end of the interval.
+        self.assertEqual(recv_all.get_queue_length(), 100)
+        sigs = recv.get_signals()
+        self.assertEqual(sigs, [(self.context_name, "pub1", "sig2", (0,), 0)])
+        sigs = recv.get_signals(timeout=1.0)
+        self.assertEqual(sigs, [(self.context_name, "pub1", "sig2", (99,), 1)])
+        time.sleep(0.2)
+        self.assertFalse(recv.has_signal_ready())
+
+        # After the interval, the next signal is again delivered immediately.
+        pub1.send2()
+        self.assertEqual(recv.get_signals(), [(self.context_name, "pub1", "sig2", (24,), 2)])
+
+        # No signals are delivered after unsubscribing.
+        pub1.send_many(5)
+        pub1.sig2.unsubscribe(recv)
+        time.sleep(0.2)
+        self.assertFalse(recv.has_signal_ready())
+        self.assertEqual(recv_all.get_queue_length(), 106)
+        pub1.sig2.unsubscribe(recv_all)
+
+        with self.assertRaises(qmi.core.exceptions.QMI_UsageException):
+            pub1.sig2.subscribe(recv, max_rate=0)
+
+    def test_filtered_subscription(self):
+        # The publishing context only sends signals which pass the filter of the subscription.
+
+        pub1 = qmi.make_rpc_object("pub1", MyPublisher)
+        publisher = MyPublisher.last_instance
+
+        recv_equal = QMI_SignalReceiver()
+        recv_range = QMI_SignalReceiver()
+        recv_field = QMI_SignalReceiver()
+        recv_all = QMI_SignalReceiver()
+        pub1.sig3.subscribe(recv_equal, signal_filter=SignalFilter(arg_index=1, equals=("a", "c")))
+        pub1.sig3.subscribe(recv_range, signal_filter=SignalFilter(min_value=3, max_value=6, decimation=2))
+        pub1.sig2.subscribe(recv_field, signal_filter=SignalFilter(field="chan", equals=(1,)))
+        pub1.sig3.subscribe(recv_all)
+
+        for i in range(10):
+            pub1.send3(i, "abc"[i % 3])
+        for chan in (0, 1, 2, 1):
+            publisher.sig2.publish({"chan": chan})
+        # Signals without the field, or with an argument that can not be compared, are dropped.
+        publisher.sig2.publish(5)
+        publisher.sig3.publish("x", "b")
+
+        self.assertEqual([sig.args for sig in recv_equal.get_signals()],
+                         [(0, "a"), (2, "c"), (3, "a"), (5, "c"), (6, "a"), (8, "c"), (9, "a")])
+        self.assertEqual([sig.args for sig in recv_range.get_signals()], [(3, "a"), (5, "c")])
+        self.assertEqual([sig.args for sig in recv_field.get_signals()], [({"chan": 1},), ({"chan": 1},)])
+        self.assertEqual(recv_all.get_queue_length(), 11)
+
+        # A filter can be combined with a maximum rate.
+        recv_rate = QMI_SignalReceiver()
+        pub1.sig3.subscribe(recv_rate, max_rate=5, signal_filter=SignalFilter(equals=(7, 8, 9)))
+        for i in range(10):
+            pub1.send3(i, "")
+        self.assertEqual([sig.args for sig in recv_rate.get_signals(timeout=1.0)], [(7, "")])
+        self.assertEqual([sig.args for sig in recv_rate.get_signals(timeout=1.0)], [(9, "")])
+        self.assertEqual(len(recv_all.get_signals()), 21)
+        self.assertEqual([sig.args for sig in recv_range.get_signals()], [(3, ""), (5, "")])
+
+        for recv in (recv_equal, recv_range, recv_all, recv_rate):
+            pub1.sig3.unsubscribe(recv)
+        pub1.sig2.unsubscribe(recv_field)
+        pub1.send3(8, "a")
+        for recv in (recv_equal, recv_range, recv_field, recv_all, recv_rate):
+            self.assertFalse(recv.has_signal_ready())
+
+    def test_invalid_signal_filter(self):
+        # Filters may only contain plain data.
+
+        pub1 = qmi.make_rpc_object("pub1", MyPublisher)
+        recv = QMI_SignalReceiver()
+        invalid_filters = [
+            SignalFilter(arg_index=-1),
+            SignalFilter(field="__class__"),
+            SignalFilter(field=1.5),
+            SignalFilter(equals=[1, 2]),
+            SignalFilter(equals=(object(),)),
+            SignalFilter(min_value="0"),
+            SignalFilter(decimation=0),
+            (0, None, None, None, None, 1),
+        ]
+        for signal_filter in invalid_filters:
+            with self.assertRaises(qmi.core.exceptions.QMI_UsageException):
+                pub1.sig2.subscribe(recv, signal_filter=signal_filter)
+
     def test_subscribe_unknown_object(self):
         # Subscribing to a non-existing object gives an error.
 
@@ -518,6 +738,40 @@ class TestLocalPubSub(unittest.TestCase):
         sig = recv.get_next_signal(timeout=0)
         self.assertEqual(sig, (self.context_name, "pub1", "sig1", (), 1))
 
+    def test_subscribe_while_publishing(self):
+        # Subscribe and unsubscribe receivers while other threads publish signals.
+
+        pub1 = qmi.make_rpc_object("pub1", MyPublisher)
+        publisher = MyPublisher.last_instance
+
+        # This receiver stays subscribed and must receive every signal.
+        recv = QMI_SignalReceiver(max_queue_length=10000)
+        pub1.sig2.subscribe(recv)
+
+        num_threads = 4
+        num_signals = 1000
+
+        def publish():
+            for i in range(num_signals):
+                publisher.sig2.publish(i)
+
+        threads = [threading.Thread(target=publish) for _ in range(num_threads)]
+        for thread in threads:
+            thread.start()
+
+        # Meanwhile, keep changing the set of subscribed receivers.
+        while any(thread.is_alive() for thread in threads):
+            other_recv = QMI_SignalReceiver()
+            pub1.sig2.subscribe(other_recv)
+            pub1.sig2.unsubscribe(other_recv)
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(recv.get_queue_length(), num_threads * num_signals)
+        values = sorted(sig.args[0] for sig in recv.get_signals(num_threads * num_signals))
+        self.assertEqual(values, sorted(num_threads * list(range(num_signals))))
+
 
 class TestRemotePubSub(unittest.TestCase):
     """Test publish/subscribe between contexts."""
@@ -616,6 +870,91 @@ class TestRemotePubSub(unittest.TestCase):
         sig = recv2.get_next_signal()
         self.assertEqual(sig, ("context2", "pub2", "sig3", (22, "D"), 2))
 
+    def test_plain_subscription_messages(self):
+        # Messages of a plain subscription do not carry the attributes of subscription options,
+        # so that they can be unpickled by a peer running an older version of QMI.
+
+        self.context1.make_rpc_object("pub1", MyPublisher)
+        proxy = self.context2.get_rpc_object_by_name("context1.pub1")
+
+        recv = QMI_SignalReceiver()
+        with unittest.mock.patch.object(self.context2, "send_message", wraps=self.context2.send_message) as send2, \
+                unittest.mock.patch.object(self.context1, "send_message", wraps=self.context1.send_message) as send1:
+            proxy.sig2.subscribe(recv)
+            proxy.send_many(3)
+            time.sleep(0.2)
+
+        requests = [call.args[0] for call in send2.call_args_list
+                    if isinstance(call.args[0], qmi.core.pubsub.QMI_SignalSubscriptionRequest)]
+        self.assertEqual(len(requests), 1)
+        self.assertFalse(hasattr(requests[0], "max_rate"))
+        self.assertFalse(hasattr(requests[0], "signal_filter"))
+        signals = [call.args[0] for call in send1.call_args_list
+                   if isinstance(call.args[0], qmi.core.pubsub.QMI_SignalMessage)]
+        self.assertEqual(len(signals), 3)
+        self.assertFalse(any(hasattr(message, "subscription_tag") for message in signals))
+        self.assertEqual(recv.get_queue_length(), 3)
+
+        proxy.sig2.unsubscribe(recv)
+
+    def test_conflating_subscription_remote(self):
+        # Conflation of signals to a remote subscriber is done by the publishing context.
+
+        self.context1.make_rpc_object("pub1", MyPublisher)
+        proxy = self.context2.get_rpc_object_by_name("context1.pub1")
+
+        recv_fast = QMI_SignalReceiver()
+        recv_slow = QMI_SignalReceiver()
+        recv_all = QMI_SignalReceiver()
+        proxy.sig2.subscribe(recv_fast, max_rate=20)
+        proxy.sig2.subscribe(recv_slow, max_rate=2)
+        proxy.sig2.subscribe(recv_all)
+
+        proxy.send_many(1000)
+        time.sleep(1.0)
+
+        self.assertEqual(recv_all.get_queue_length(), 1000)
+        for (recv, max_count) in ((recv_fast, 21), (recv_slow, 3)):
+            sigs = recv.get_signals()
+            self.assertEqual(sigs[0].args, (0,))
+            self.assertEqual(sigs[-1].args, (999,))
+            self.assertLessEqual(len(sigs), max_count)
+
+        # After unsubscribing, the publisher stops sending conflated signals.
+        proxy.sig2.unsubscribe(recv_fast)
+        proxy.sig2.unsubscribe(recv_slow)
+        proxy.send_many(10)
+        time.sleep(0.6)
+        self.assertFalse(recv_fast.has_signal_ready())
+        self.assertFalse(recv_slow.has_signal_ready())
+        self.assertEqual(recv_all.get_queue_length(), 1010)
+        proxy.sig2.unsubscribe(recv_all)
+
+    def test_filtered_subscription_remote(self):
+        # The filter of a remote subscription is applied by the publishing context.
+
+        self.context1.make_rpc_object("pub1", MyPublisher)
+        proxy = self.context2.get_rpc_object_by_name("context1.pub1")
+
+        recv = QMI_SignalReceiver()
+        recv_all = QMI_SignalReceiver()
+        proxy.sig2.subscribe(recv, signal_filter=SignalFilter(min_value=990, decimation=3))
+        proxy.sig2.subscribe(recv_all)
+
+        with unittest.mock.patch.object(self.context1, "send_message", wraps=self.context1.send_message) as send:
+            proxy.send_many(1000)
+            time.sleep(0.5)
+
+        self.assertEqual([sig.args for sig in recv.get_signals()], [(990,), (993,), (996,), (999,)])
+        self.assertEqual(recv_all.get_queue_length(), 1000)
+        tags = [getattr(call.args[0], "subscription_tag", "") for call in send.call_args_list
+                if isinstance(call.args[0], qmi.core.pubsub.QMI_SignalMessage)]
+        self.assertEqual(len(tags), 1004)
+        self.assertEqual(tags.count(""), 1000)
+
+        proxy.sig2.unsubscribe(recv)
+        proxy.sig2.unsubscribe(recv_all)
+
     def test_remote_async(self):
         # Test asynchronous delivery of signals between contexts.
 
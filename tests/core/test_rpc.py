@@ -3,10 +3,11 @@
 import inspect
 import logging
 import math
+import threading
 import time
 from typing import NamedTuple
 import unittest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
 
 from qmi.core.config_defs import CfgQmi, CfgContext
 from qmi.core.context import QMI_Context
@@ -14,7 +15,7 @@ from qmi.core.exceptions import (
     QMI_MessageDeliveryException, QMI_UsageException, QMI_InvalidOperationException, QMI_DuplicateNameException
 )
 from qmi.core.rpc import (
-    QMI_RpcObject, QMI_RpcTimeoutException, QMI_RpcFuture, QMI_RpcProxy, QMI_RpcNonBlockingProxy,
+    QMI_RpcObject, QMI_RpcTimeoutException, QMI_RpcFuture, QMI_RpcProxy, QMI_RpcNonBlockingProxy, QMI_RpcPriority,
     rpc_method, is_rpc_method
 )
 from threading import Timer
@@ -48,6 +49,42 @@ class MyRpcTestClass(QMI_RpcObject):
         pass
 
 
+class PriorityTestClass(QMI_RpcObject):
+    """An RPC test class with a blocking method, a high priority method and thread-safe methods."""
+    _rpc_max_concurrency = 2
+
+    def __init__(self, context, name):
+        super().__init__(context, name)
+        self.calls = []
+        self._started = threading.Event()
+        self._release = threading.Event()
+
+    @rpc_method
+    def block(self):
+        self._started.set()
+        self._release.wait(5.0)
+
+    @rpc_method(thread_safe=True)
+    def wait_started(self):
+        return self._started.wait(5.0)
+
+    @rpc_method(thread_safe=True)
+    def release(self):
+        self._release.set()
+
+    @rpc_method
+    def record(self, tag):
+        self.calls.append(tag)
+
+    @rpc_method(priority=QMI_RpcPriority.HIGH)
+    def abort(self):
+        self.calls.append("abort")
+
+    @rpc_method
+    def get_calls(self):
+        return self.calls
+
+
 class MyRpcSubClass(MyRpcTestClass):
     """An RPC sub class"""
     _rpc_constants = ["CONSTANT_STRING"]
@@ -522,6 +559,83 @@ class TestRPC(unittest.TestCase):
             with self.c1.make_rpc_object("tc1", MyRpcSubClass):
                 pass
 
+    def test_rpc_statistics(self):
+        """Test that the contexts collect timing statistics of RPC method calls."""
+        self.c1.make_rpc_object("tc1", MyRpcTestClass)
+        proxy = self.c2.get_rpc_object_by_name("c1.tc1")
+        for _ in range(5):
+            proxy.remote_sqrt(20)
+        with self.assertRaises(ValueError):
+            proxy.remote_sqrt(-1)
+
+        # The hosting context measures queue wait and execution time, also reported via its context RPC object.
+        stats = {(s.object_name, s.method_name): s
+                 for s in self.c2.make_peer_context_proxy("c1").get_rpc_statistics()}
+        sqrt_stats = stats[("c1.tc1", "remote_sqrt")]
+        self.assertEqual(sqrt_stats.calls, 6)
+        self.assertEqual(sqrt_stats.errors, 1)
+        self.assertEqual(sqrt_stats.queue_wait.num_values, 6)
+        self.assertEqual(sqrt_stats.execution_time.num_values, 6)
+        self.assertGreaterEqual(sqrt_stats.execution_time.max, 0.020)
+        self.assertEqual(sum(sqrt_stats.execution_time.counts), 6)
+        self.assertEqual(sqrt_stats.round_trip_time.num_values, 0)
+
+        # The calling context measures the round-trip time.
+        stats = {(s.object_name, s.method_name): s for s in self.c2.get_rpc_statistics()}
+        sqrt_stats = stats[("c1.tc1", "remote_sqrt")]
+        self.assertEqual(sqrt_stats.calls, 0)
+        self.assertEqual(sqrt_stats.round_trip_time.num_values, 6)
+        self.assertGreaterEqual(sqrt_stats.round_trip_time.max, 0.020)
+        self.assertEqual(sqrt_stats.round_trip_time.percentile(100), sqrt_stats.round_trip_time.max)
+
+        # Statistics can be reset.
+        self.c2.make_peer_context_proxy("c1").reset_rpc_statistics()
+        self.assertNotIn(("c1.tc1", "remote_sqrt"),
+                         [(s.object_name, s.method_name) for s in self.c1.get_rpc_statistics()])
+
+    def test_rpc_priorities(self):
+        """Test that pending requests are handled in order of priority, and thread-safe methods bypass the queue."""
+        self.c1.make_rpc_object("tc1", PriorityTestClass)
+        proxy = self.c2.get_rpc_object_by_name("c1.tc1")
+
+        # Keep the RPC thread busy; the thread-safe method runs concurrently.
+        f_block = proxy.rpc_nonblocking.block()
+        self.assertTrue(proxy.wait_started())
+
+        futures = [
+            proxy.rpc_nonblocking.record("low", rpc_priority=QMI_RpcPriority.LOW),
+            proxy.rpc_nonblocking.record("normal"),
+            proxy.rpc_nonblocking.abort(),
+            proxy.rpc_nonblocking.record("high", rpc_priority=QMI_RpcPriority.HIGH),
+            proxy.rpc_nonblocking.record("normal2")
+        ]
+        # Let all requests arrive while the RPC thread is still busy.
+        time.sleep(0.1)
+
+        # Release the blocking call without going through the queue.
+        proxy.release()
+        f_block.wait()
+        for future in futures:
+            future.wait()
+
+        self.assertEqual(proxy.get_calls(), ["abort", "high", "normal", "normal2", "low"])
+
+    def test_concurrent_request_failure(self):
+        """Test that an unexpected error while handling a thread-safe method in a worker thread is logged."""
+        self.c1.make_rpc_object("tc1", PriorityTestClass)
+        proxy = self.c2.get_rpc_object_by_name("c1.tc1")
+        proxy.release()
+
+        with patch("qmi.core.rpc._logger") as logger, \
+                patch.object(self.c1, "send_message", side_effect=RuntimeError("send failed")):
+            proxy.rpc_nonblocking.release()
+            deadline = time.monotonic() + 2.0
+            while (not logger.exception.called) and (time.monotonic() < deadline):
+                time.sleep(0.01)
+
+        logger.exception.assert_called_once()
+        self.assertIn("Failed to handle concurrent RPC request", logger.exception.call_args[0][0])
+
 
 class TestRpcMethodDecorator(unittest.TestCase):
     class ObjectWithGoodMethodName(QMI_RpcObject):
@@ -549,6 +663,14 @@ class TestRpcMethodDecorator(unittest.TestCase):
         obj = self.ObjectWithGoodMethodName(Mock(), "good_object")
         self.assertTrue(hasattr(obj, "some_method"))
 
+    def test_decorator_with_options(self):
+        """Test that the decorator records the priority and thread-safety of the method."""
+        self.assertTrue(is_rpc_method(PriorityTestClass.abort))
+        self.assertEqual(PriorityTestClass.abort._rpc_priority, QMI_RpcPriority.HIGH)
+        self.assertFalse(PriorityTestClass.abort._rpc_thread_safe)
+        self.assertTrue(PriorityTestClass.release._rpc_thread_safe)
+        self.assertEqual(PriorityTestClass.record._rpc_priority, QMI_RpcPriority.NORMAL)
+
     def test_bad_name_lock(self):
         """Test unacceptable method name."""
         with self.assertRaises(QMI_UsageException):
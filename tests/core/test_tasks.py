@@ -3,12 +3,13 @@
 """Test QMI task functionality."""
 
 import logging
+import os
 import random
 import threading
 import time
 import unittest
 from collections import namedtuple
-from unittest.mock import sentinel
+from unittest.mock import patch, sentinel
 
 import qmi
 import qmi.core.exceptions
@@ -19,7 +20,9 @@ from qmi.core.task import (
     QMI_Task,
     QMI_LoopTask,
     QMI_LoopTaskMissedLoopPolicy,
+    QMI_ReactiveTask,
     QMI_TaskRunner,
+    _LoopTaskScheduler,
 )
 
 from tests.patcher import PatcherQmiContext
@@ -120,6 +123,11 @@ class TestPublisher(QMI_RpcObject):
     def send_signal(self, value):
         self.sig_test.publish(value)
 
+    @rpc_method
+    def send_signals(self, values):
+        for value in values:
+            self.sig_test.publish(value)
+
 
 class SignalWaitingTask(QMI_Task):
     """A test task that waits for signals.
@@ -249,6 +257,141 @@ class LoopTestTask(QMI_LoopTask):
         self.sig_status_updated.publish(self.status.value)
 
 
+class ScheduledCountingTask(QMI_LoopTask):
+    """A loop task which runs on the central loop task scheduler and counts its iterations."""
+
+    use_scheduler = True
+
+    def __init__(self, task_runner, name, loop_period, fail_at_iteration=None):
+        super().__init__(task_runner, name, loop_period)
+        self.status = 0
+        self.threads = set()
+        self.finalized = False
+        self._fail_at_iteration = fail_at_iteration
+
+    def loop_iteration(self):
+        self.threads.add(threading.get_ident())
+        self.status += 1
+        if self.status == self._fail_at_iteration:
+            raise ValueError("iteration failed")
+
+    def loop_finalize(self):
+        self.finalized = True
+
+
+class TimedLoopTask(QMI_LoopTask):
+    """A loop task of which each iteration takes a configurable time."""
+
+    def __init__(self, task_runner, name, loop_period, iteration_time):
+        super().__init__(task_runner, name, loop_period)
+        self.status = 0
+        self._iteration_time = iteration_time
+
+    def loop_iteration(self):
+        self.status += 1
+        time.sleep(self._iteration_time)
+
+
+class PreciseLoopTask(QMI_LoopTask):
+    """A loop task with precise pacing which records the start time of its iterations."""
+
+    precise_pacing = True
+
+    def __init__(self, task_runner, name, loop_period):
+        super().__init__(task_runner, name, loop_period)
+        self.status = []
+
+    def loop_iteration(self):
+        self.status.append(time.monotonic())
+
+
+class PinnedLoopTask(QMI_LoopTask):
+    """A loop task restricted to CPU 0 which records the CPU affinity of its thread."""
+
+    cpu_affinity = {0}
+
+    def __init__(self, task_runner, name, loop_period):
+        super().__init__(task_runner, name, loop_period)
+        self.status = None
+
+    def loop_iteration(self):
+        self.status = os.sched_getaffinity(0)
+
+
+class ScheduledPreciseLoopTask(ScheduledCountingTask):
+    precise_pacing = True
+
+
+class ReactiveTestTask(QMI_ReactiveTask):
+    """A reactive task which records the signals and settings it receives.
+
+    It subscribes to the test publisher and to a second publisher through an extra receiver.
+    Once subscribed, its status is a tuple of the received signal values, the signal batch sizes,
+    the received settings values and the number of idle timeouts.
+    """
+
+    Settings = namedtuple("Settings", "value")
+
+    idle_timeout = 0.1
+
+    def __init__(self, task_runner, name, context_id, handler_delay=0.0, timeout_delay=0.0):
+        super().__init__(task_runner, name)
+        self._handler_delay = handler_delay
+        self._timeout_delay = timeout_delay
+        self._publishers = [
+            qmi.get_rpc_object(f"{context_id}.test_publisher"),
+            qmi.get_rpc_object(f"{context_id}.other_publisher")
+        ]
+        self._other_receiver = QMI_SignalReceiver()
+        self.add_signal_receiver(self._other_receiver)
+        self.values = []
+        self.batch_sizes = []
+        self.settings_values = []
+        self.timeouts = 0
+
+    def _update_status(self):
+        self.status = (list(self.values), list(self.batch_sizes), list(self.settings_values), self.timeouts)
+
+    def on_start(self):
+        self._publishers[0].sig_test.subscribe(self.receiver)
+        self._publishers[1].sig_test.subscribe(self._other_receiver)
+        self._update_status()
+
+    def on_settings(self):
+        self.settings_values.append(self.settings.value)
+        self._update_status()
+
+    def on_signals(self, signals):
+        self.batch_sizes.append(len(signals))
+        time.sleep(self._handler_delay)
+        super().on_signals(signals)
+        self._update_status()
+
+    def on_signal(self, signal):
+        self.values.append(signal.args[0])
+
+    def on_timeout(self):
+        self.timeouts += 1
+        self._update_status()
+        time.sleep(self._timeout_delay)
+
+    def on_stop(self):
+        self._publishers[0].sig_test.unsubscribe(self.receiver)
+        self._publishers[1].sig_test.unsubscribe(self._other_receiver)
+
+
+class ScheduledCountingTaskRunner(QMI_TaskRunner):
+    """Task runner which exposes internals of a ScheduledCountingTask."""
+
+    @rpc_method
+    def get_worker_threads(self):
+        return self._thread.task.threads
+
+    @rpc_method
+    def is_finalized(self):
+        return self._thread.task.finalized
+
+
 class TestQMITaskContextManager(unittest.TestCase):
     """Test the various context managers."""
     def test_with_context_manager(self):
@@ -1182,5 +1325,346 @@ class TestQMITasks(unittest.TestCase):
         self.assertEqual(actual, sentinel.custom_taskrunner_attr)
 
 
+class TestScheduledLoopTasks(unittest.TestCase):
+    def setUp(self):
+        logging.getLogger("qmi.core.task").setLevel(logging.ERROR)
+        self._ctx_qmi_id = f"test-scheduled-tasks-{random.randint(0, 100)}"
+        self.qmi_patcher = PatcherQmiContext()
+        self.qmi_patcher.start(self._ctx_qmi_id)
+
+    def tearDown(self):
+        self.qmi_patcher.stop()
+        logging.getLogger("qmi.core.task").setLevel(logging.NOTSET)
+
+    def test_run_iterations(self):
+        """Scheduled loop task runs its iterations at the loop period and finalizes on stop."""
+        task_proxy = qmi.make_task(
+            "scheduled_task", ScheduledCountingTask, task_runner=ScheduledCountingTaskRunner, loop_period=0.05
+        )
+        task_proxy.start()
+        self.assertTrue(task_proxy.is_running())
+        time.sleep(0.5)
+        task_proxy.stop()
+        task_proxy.join()
+
+        iterations = task_proxy.get_status()
+        self.assertFalse(task_proxy.is_running())
+        self.assertTrue(task_proxy.is_finalized())
+        self.assertGreaterEqual(iterations, 7)
+        self.assertLessEqual(iterations, 12)
+
+        stats = task_proxy.get_scheduling_statistics()
+        self.assertEqual(stats.iterations, iterations)
+        self.assertGreaterEqual(stats.max_latency, stats.mean_latency)
+        self.assertLess(stats.mean_latency, 0.05)
+
+    def test_thread_task_has_no_scheduling_statistics(self):
+        """Loop tasks in a dedicated thread do not report scheduling statistics."""
+        task_proxy = qmi.make_task(
+            "thread_task",
+            LoopTestTask,
+            increase_loop=False,
+            nr_of_loops=1,
+            status_value=0,
+            loop_period=0.1,
+            policy=QMI_LoopTaskMissedLoopPolicy.IMMEDIATE,
+        )
+        self.assertIsNone(task_proxy.get_scheduling_statistics())
+        task_proxy.stop()
+        task_proxy.join()
+
+    def test_many_tasks_share_worker_threads(self):
+        """Many scheduled loop tasks run on a small shared pool of threads."""
+        num_tasks = 20
+        num_threads = threading.active_count()
+        task_proxies = [
+            qmi.make_task(
+                f"scheduled_task_{i}", ScheduledCountingTask, task_runner=ScheduledCountingTaskRunner, loop_period=0.02
+            )
+            for i in range(num_tasks)
+        ]
+        for task_proxy in task_proxies:
+            task_proxy.start()
+        time.sleep(0.3)
+        threads_while_running = threading.active_count()
+        for task_proxy in task_proxies:
+            task_proxy.stop()
+        for task_proxy in task_proxies:
+            task_proxy.join()
+
+        worker_threads = set().union(*(task_proxy.get_worker_threads() for task_proxy in task_proxies))
+        self.assertLessEqual(len(worker_threads), 4)
+        for task_proxy in task_proxies:
+            self.assertGreater(task_proxy.get_status(), 5)
+        # One RPC thread per task runner, plus the scheduler and its worker threads.
+        self.assertLessEqual(threads_while_running - num_threads, num_tasks + 5)
+
+    def test_stop_while_waiting(self):
+        """Stopping a scheduled loop task does not wait for the next loop period."""
+        task_proxy = qmi.make_task("scheduled_task", ScheduledCountingTask, loop_period=10.0)
+        task_proxy.start()
+        time.sleep(0.1)
+        tstart = time.monotonic()
+        task_proxy.stop()
+        task_proxy.join()
+        self.assertLess(time.monotonic() - tstart, 1.0)
+        self.assertEqual(task_proxy.get_scheduling_statistics().iterations, 1)
+
+    def test_scheduler_sleeps_until_due(self):
+        """The scheduler thread does not wake up every tick while tasks are waiting."""
+        next_due_tick = _LoopTaskScheduler._next_due_tick
+        with patch.object(_LoopTaskScheduler, "_next_due_tick", autospec=True,
+                          side_effect=next_due_tick) as mock_next_due_tick:
+            task_proxy = qmi.make_task("scheduled_task", ScheduledCountingTask, loop_period=0.5)
+            task_proxy.start()
+            time.sleep(1.2)
+            task_proxy.stop()
+            task_proxy.join()
+        self.assertGreaterEqual(task_proxy.get_scheduling_statistics().iterations, 3)
+        # About one wake-up per iteration, instead of one per 5 ms tick.
+        self.assertLess(mock_next_due_tick.call_count, 20)
+
+    def test_stop_before_start(self):
+        """A scheduled loop task can be stopped before it is started."""
+        task_proxy = qmi.make_task("scheduled_task", ScheduledCountingTask, loop_period=0.05)
+        task_proxy.stop()
+        task_proxy.join()
+        self.assertFalse(task_proxy.is_running())
+        self.assertEqual(task_proxy.get_scheduling_statistics().iterations, 0)
+
+    def test_exception_during_iteration(self):
+        """An exception in a loop iteration is re-raised by join()."""
+        task_proxy = qmi.make_task(
+            "scheduled_task",
+            ScheduledCountingTask,
+            task_runner=ScheduledCountingTaskRunner,
+            loop_period=0.02,
+            fail_at_iteration=3,
+        )
+        task_proxy.start()
+        with self.assertRaises(qmi.core.exceptions.QMI_TaskRunException):
+            task_proxy.join()
+        self.assertEqual(task_proxy.get_status(), 3)
+        self.assertTrue(task_proxy.is_finalized())
+
+
+class TestLoopStatistics(unittest.TestCase):
+    def setUp(self):
+        logging.getLogger("qmi.core.task").setLevel(logging.ERROR)
+        self._ctx_qmi_id = f"test-loop-statistics-{random.randint(0, 100)}"
+        self.qmi_patcher = PatcherQmiContext()
+        self.qmi_patcher.start(self._ctx_qmi_id)
+
+    def tearDown(self):
+        self.qmi_patcher.stop()
+        logging.getLogger("qmi.core.task").setLevel(logging.NOTSET)
+
+    def test_statistics_disabled(self):
+        """Loop statistics are not collected unless enabled."""
+        task_proxy = qmi.make_task("loop_task", TimedLoopTask, loop_period=0.02, iteration_time=0.0)
+        with task_proxy:
+            time.sleep(0.1)
+            self.assertIsNone(task_proxy.get_loop_statistics())
+
+    def test_statistics(self):
+        """Loop statistics record iteration durations and lateness over a rolling window."""
+        task_proxy = qmi.make_task("loop_task", TimedLoopTask, loop_period=0.02, iteration_time=0.005)
+        task_proxy.enable_loop_statistics(window=5)
+        with task_proxy:
+            time.sleep(0.3)
+            stats = task_proxy.get_loop_statistics()
+
+        self.assertGreaterEqual(stats.iterations, 10)
+        self.assertEqual(stats.missed_periods, 0)
+        for histogram in (stats.wakeup_lateness, stats.iteration_duration, stats.overhead):
+            self.assertEqual(histogram.num_values, 5)
+            self.assertEqual(sum(histogram.counts), 5)
+            self.assertEqual(len(histogram.counts), len(histogram.bin_edges))
+            self.assertLessEqual(histogram.mean, histogram.max)
+        self.assertGreaterEqual(stats.iteration_duration.mean, 0.005)
+        self.assertLess(stats.iteration_duration.max, 0.02)
+        self.assertGreaterEqual(stats.iteration_duration.percentile(50), 0.005)
+        self.assertLessEqual(stats.iteration_duration.percentile(100), stats.iteration_duration.max)
+        self.assertLess(stats.wakeup_lateness.mean, 0.01)
+
+        task_proxy.disable_loop_statistics()
+        self.assertIsNone(task_proxy.get_loop_statistics())
+
+    def test_missed_periods(self):
+        """Loop statistics count missed loop periods."""
+        task_proxy = qmi.make_task("loop_task", TimedLoopTask, loop_period=0.02, iteration_time=0.05)
+        task_proxy.enable_loop_statistics()
+        with task_proxy:
+            time.sleep(0.3)
+            stats = task_proxy.get_loop_statistics()
+
+        self.assertGreater(stats.iterations, 0)
+        self.assertGreaterEqual(stats.missed_periods, 2 * stats.iterations - 2)
+
+    def test_publish_statistics(self):
+        """Loop statistics are published periodically when a publish interval is specified."""
+        task_proxy = qmi.make_task("loop_task", TimedLoopTask, loop_period=0.01, iteration_time=0.0)
+        receiver = QMI_SignalReceiver()
+        task_proxy.sig_loop_statistics.subscribe(receiver)
+        task_proxy.enable_loop_statistics(publish_interval=0.1)
+        with task_proxy:
+            stats = receiver.get_next_signal(timeout=1.0).args[0]
+
+        self.assertGreaterEqual(stats.iterations, 5)
+        self.assertEqual(stats.iteration_duration.num_values, stats.iterations)
+
+    def test_scheduled_task_statistics(self):
+        """Loop statistics are also collected for loop tasks on the central scheduler."""
+        task_proxy = qmi.make_task("scheduled_task", ScheduledCountingTask, loop_period=0.02)
+        task_proxy.enable_loop_statistics()
+        with task_proxy:
+            time.sleep(0.2)
+        stats = task_proxy.get_loop_statistics()
+        self.assertEqual(stats.iterations, task_proxy.get_status())
+
+    def test_not_a_loop_task(self):
+        """Loop statistics can only be enabled for loop tasks."""
+        task_proxy = qmi.make_task(
+            "simple_task",
+            SimpleTestTask,
+            raise_exception_in_init=False,
+            raise_exception_in_run=False,
+            duration=0.1,
+            value=1,
+        )
+        with self.assertRaises(qmi.core.exceptions.QMI_UsageException):
+            task_proxy.enable_loop_statistics()
+        self.assertIsNone(task_proxy.get_loop_statistics())
+        task_proxy.stop()
+        task_proxy.join()
+
+
+class TestPreciseLoopPacing(unittest.TestCase):
+    def setUp(self):
+        logging.getLogger("qmi.core.task").setLevel(logging.ERROR)
+        self._ctx_qmi_id = f"test-precise-pacing-{random.randint(0, 100)}"
+        self.qmi_patcher = PatcherQmiContext()
+        self.qmi_patcher.start(self._ctx_qmi_id)
+
+    def tearDown(self):
+        self.qmi_patcher.stop()
+        logging.getLogger("qmi.core.task").setLevel(logging.NOTSET)
+
+    def test_precise_pacing(self):
+        """A precisely paced loop task runs its iterations at the loop period."""
+        loop_period = 0.01
+        task_proxy = qmi.make_task("precise_task", PreciseLoopTask, loop_period=loop_period)
+        with task_proxy:
+            time.sleep(0.3)
+        timestamps = task_proxy.get_status()
+
+        self.assertGreaterEqual(len(timestamps), 20)
+        self.assertLessEqual(len(timestamps), 31)
+        mean_interval = (timestamps[-1] - timestamps[0]) / (len(timestamps) - 1)
+        self.assertAlmostEqual(mean_interval, loop_period, delta=0.2 * loop_period)
+
+    def test_stop_while_sleeping(self):
+        """A precisely paced loop task stops promptly while waiting for a long loop period."""
+        task_proxy = qmi.make_task("precise_task", PreciseLoopTask, loop_period=10.0)
+        task_proxy.start()
+        time.sleep(0.1)
+        tstart = time.monotonic()
+        task_proxy.stop()
+        task_proxy.join()
+        self.assertLess(time.monotonic() - tstart, 1.0)
+        self.assertEqual(len(task_proxy.get_status()), 1)
+
+    @unittest.skipUnless(hasattr(os, "sched_setaffinity"), "CPU affinity not supported")
+    def test_cpu_affinity(self):
+        """The CPU affinity of a loop task is applied to its thread."""
+        task_proxy = qmi.make_task("pinned_task", PinnedLoopTask, loop_period=0.01)
+        with task_proxy:
+            time.sleep(0.1)
+        self.assertEqual(task_proxy.get_status(), {0})
+
+    def test_scheduled_task_can_not_use_precise_pacing(self):
+        """Precise pacing is not available for loop tasks on the central scheduler."""
+        with self.assertRaises(qmi.core.exceptions.QMI_UsageException):
+            qmi.make_task("scheduled_task", ScheduledPreciseLoopTask, loop_period=0.01)
+
+
+class TestReactiveTasks(unittest.TestCase):
+    def setUp(self):
+        logging.getLogger("qmi.core.task").setLevel(logging.ERROR)
+        self._ctx_qmi_id = f"test-reactive-tasks-{random.randint(0, 100)}"
+        self.qmi_patcher = PatcherQmiContext()
+        self.qmi_patcher.start(self._ctx_qmi_id)
+        self.publisher = qmi.context().make_rpc_object("test_publisher", TestPublisher)
+        self.other_publisher = qmi.context().make_rpc_object("other_publisher", TestPublisher)
+
+    def tearDown(self):
+        self.qmi_patcher.stop()
+        logging.getLogger("qmi.core.task").setLevel(logging.NOTSET)
+
+    def _wait_for_status(self, task_proxy, predicate, timeout=1.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            status = task_proxy.get_status()
+            if predicate(status):
+                return status
+            time.sleep(0.001)
+        self.fail(f"Unexpected task status {task_proxy.get_status()}")
+
+    def test_signals_and_settings(self):
+        """Signals from several receivers and new settings are handled as soon as they arrive."""
+        task_proxy = qmi.make_task("reactive_task", ReactiveTestTask, context_id=self._ctx_qmi_id)
+        with task_proxy:
+            self._wait_for_status(task_proxy, lambda status: status is not None)
+            self.publisher.send_signal(1)
+            self._wait_for_status(task_proxy, lambda status: status[0] == [1], timeout=0.05)
+            self.other_publisher.send_signal(2)
+            self._wait_for_status(task_proxy, lambda status: status[0] == [1, 2], timeout=0.05)
+            task_proxy.set_settings(ReactiveTestTask.Settings(3))
+            self._wait_for_status(task_proxy, lambda status: status[2] == [3], timeout=0.05)
+
+    def test_signal_bursts_are_batched(self):
+        """Signals which arrive while the task is busy are handled in batches."""
+        task_proxy = qmi.make_task("reactive_task", ReactiveTestTask, context_id=self._ctx_qmi_id, handler_delay=0.05)
+        with task_proxy:
+            self._wait_for_status(task_proxy, lambda status: status is not None)
+            self.publisher.send_signals(list(range(250)))
+            status = self._wait_for_status(task_proxy, lambda status: len(status[0]) == 250)
+
+        (values, batch_sizes, _, _) = status
+        self.assertEqual(values, list(range(250)))
+        self.assertLessEqual(max(batch_sizes), ReactiveTestTask.max_batch_size)
+        self.assertLess(len(batch_sizes), 10)
+
+    def test_idle_timeout(self):
+        """The task calls on_timeout() when no events arrive."""
+        task_proxy = qmi.make_task("reactive_task", ReactiveTestTask, context_id=self._ctx_qmi_id)
+        with task_proxy:
+            time.sleep(0.35)
+            status = task_proxy.get_status()
+        self.assertIn(status[3], (2, 3, 4))
+
+    def test_publish_during_timeout_handler(self):
+        """Publishing a signal does not wait for a slow on_timeout() to finish."""
+        task_proxy = qmi.make_task("reactive_task", ReactiveTestTask, context_id=self._ctx_qmi_id,
+                                   timeout_delay=0.5)
+        with task_proxy:
+            # Wait until the task is in its first on_timeout().
+            self._wait_for_status(task_proxy, lambda status: (status is not None) and (status[3] == 1))
+            tstart = time.monotonic()
+            self.publisher.send_signal(1)
+            self.assertLess(time.monotonic() - tstart, 0.2)
+            self._wait_for_status(task_proxy, lambda status: status[0] == [1])
+
+    def test_stop_while_waiting(self):
+        """A reactive task waiting for events stops promptly."""
+        task_proxy = qmi.make_task("reactive_task", ReactiveTestTask, context_id=self._ctx_qmi_id)
+        task_proxy.start()
+        time.sleep(0.05)
+        tstart = time.monotonic()
+        task_proxy.stop()
+        task_proxy.join()
+        self.assertLess(time.monotonic() - tstart, 0.05)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,213 @@
+#! /usr/bin/env python
+
+"""Test tracing of RPC calls across contexts."""
+
+import json
+import logging
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from qmi.core.config_defs import CfgQmi, CfgContext
+from qmi.core.context import QMI_Context
+from qmi.core.messaging import QMI_ReplyMessage
+from qmi.core.rpc import QMI_RpcObject, rpc_method
+from qmi.core.tracing import (
+    QMI_TraceContext, QMI_Tracer, SpanKind,
+    get_current_trace_context, set_current_trace_context, make_child_trace_context
+)
+
+
+def read_spans(path):
+    """Return a list of (service name, span) of all spans in a trace file."""
+    spans = []
+    with open(path, encoding="utf-8") as trace_file:
+        for line in trace_file:
+            for resource_spans in json.loads(line)["resourceSpans"]:
+                service_name = resource_spans["resource"]["attributes"][0]["value"]["stringValue"]
+                for scope_spans in resource_spans["scopeSpans"]:
+                    for span in scope_spans["spans"]:
+                        spans.append((service_name, span))
+    return spans
+
+
+class Instrument(QMI_RpcObject):
+
+    @rpc_method
+    def read(self, value):
+        if value < 0:
+            raise ValueError("negative value")
+        time.sleep(0.01)
+        return value
+
+
+class Measurement(QMI_RpcObject):
+
+    @rpc_method
+    def measure(self):
+        instrument = self._context.get_rpc_object_by_name("c1.instrument")
+        return instrument.read(1) + instrument.read(2)
+
+
+class TestTraceContext(unittest.TestCase):
+
+    def test_make_child_trace_context(self):
+        """A span without parent starts a new trace; child spans continue the trace of their parent."""
+        root = make_child_trace_context(None)
+        self.assertEqual(len(root.trace_id), 32)
+        self.assertEqual(len(root.span_id), 16)
+        self.assertIsNone(root.parent_span_id)
+
+        child = make_child_trace_context(root)
+        self.assertEqual(child.trace_id, root.trace_id)
+        self.assertEqual(child.parent_span_id, root.span_id)
+        self.assertNotEqual(child.span_id, root.span_id)
+
+    def test_current_trace_context(self):
+        """The current trace context is set per thread and can be restored."""
+        trace_context = QMI_TraceContext("0" * 32, "1" * 16)
+        previous = set_current_trace_context(trace_context)
+        try:
+            self.assertEqual(get_current_trace_context(), trace_context)
+        finally:
+            set_current_trace_context(previous)
+        self.assertEqual(get_current_trace_context(), previous)
+
+
+class TestTracer(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, "trace.jsonl")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_record_span(self):
+        """Recorded spans are written to the file in the OTLP JSON format."""
+        tracer = QMI_Tracer(self.path, "my_context")
+        tracer.start()
+        root = make_child_trace_context(None)
+        child = make_child_trace_context(root)
+        now = time.monotonic()
+        tracer.record_span("root", SpanKind.SERVER, root, now - 0.5, now, {"count": 3, "ok": True})
+        tracer.record_span("child", SpanKind.INTERNAL, child, now - 0.25, now, error="failed")
+        tracer.stop()
+
+        spans = read_spans(self.path)
+        self.assertEqual([service for (service, _) in spans], ["my_context", "my_context"])
+        (root_span, child_span) = [span for (_, span) in spans]
+
+        self.assertEqual(root_span["traceId"], root.trace_id)
+        self.assertEqual(root_span["spanId"], root.span_id)
+        self.assertNotIn("parentSpanId", root_span)
+        self.assertEqual(root_span["kind"], 2)
+        duration = int(root_span["endTimeUnixNano"]) - int(root_span["startTimeUnixNano"])
+        self.assertAlmostEqual(duration, 500_000_000, delta=1000)
+        self.assertAlmostEqual(int(root_span["endTimeUnixNano"]) * 1.0e-9, time.time(), delta=5.0)
+        self.assertEqual(root_span["attributes"], [{"key": "count", "value": {"intValue": "3"}},
+                                                   {"key": "ok", "value": {"boolValue": True}}])
+        self.assertEqual(root_span["status"], {})
+
+        self.assertEqual(child_span["parentSpanId"], root.span_id)
+        self.assertEqual(child_span["status"], {"code": 2, "message": "failed"})
+
+
+class TestRpcTracing(unittest.TestCase):
+
+    def setUp(self):
+        logging.getLogger("qmi.core.rpc").setLevel(logging.CRITICAL)
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path1 = os.path.join(self.tempdir.name, "c1.jsonl")
+        self.path3 = os.path.join(self.tempdir.name, "c3.jsonl")
+
+        # Context c3 calls a method in c2 which calls methods in c1. Context c2 does not record spans.
+        config = CfgQmi(contexts={
+            "c1": CfgContext(tcp_server_port=0, trace_file=self.path1),
+            "c2": CfgContext(tcp_server_port=0),
+            "c3": CfgContext(trace_file=self.path3)
+        })
+        self.c1 = QMI_Context("c1", config)
+        self.c1.start()
+        self.c2 = QMI_Context("c2", config)
+        self.c2.start()
+        self.c3 = QMI_Context("c3", config)
+        self.c3.start()
+        self.c2.connect_to_peer("c1", f"localhost:{self.c1.get_tcp_server_port()}")
+        self.c3.connect_to_peer("c2", f"localhost:{self.c2.get_tcp_server_port()}")
+        self.c1.make_rpc_object("instrument", Instrument)
+        self.c2.make_rpc_object("measurement", Measurement)
+
+    def tearDown(self):
+        if self.c1 is not None:
+            self._stop_contexts()
+        self.tempdir.cleanup()
+        logging.getLogger("qmi.core.rpc").setLevel(logging.NOTSET)
+
+    def _stop_contexts(self):
+        for context in (self.c3, self.c2, self.c1):
+            context.stop()
+        self.c1 = self.c2 = self.c3 = None
+
+    def test_trace_across_contexts(self):
+        """Spans of a call which fans out through an untraced context belong to one trace."""
+        proxy = self.c3.get_rpc_object_by_name("c2.measurement")
+        self.assertEqual(proxy.measure(), 3)
+        self._stop_contexts()
+
+        spans = read_spans(self.path1) + read_spans(self.path3)
+        (client_span,) = [span for (service, span) in spans if span["name"] == "c2.measurement/measure"]
+        self.assertEqual(client_span["kind"], 3)
+        trace_spans = [(service, span) for (service, span) in spans if span["traceId"] == client_span["traceId"]]
+
+        # Both calls to the instrument are children of the client span, because context c2 does not trace.
+        server_spans = [span for (service, span) in trace_spans if span["name"] == "c1.instrument/read"]
+        self.assertEqual(len(server_spans), 2)
+        for server_span in server_spans:
+            self.assertEqual(server_span["kind"], 2)
+            self.assertEqual(server_span["parentSpanId"], client_span["spanId"])
+            children = {span["name"]: span for (service, span) in trace_spans
+                        if span.get("parentSpanId") == server_span["spanId"]}
+            self.assertIn("qmi.rpc.queue", children)
+            self.assertIn("qmi.rpc.execute", children)
+            self.assertIn("qmi.rpc.reply", children)
+            self.assertIn("qmi.send", children)
+            execute_span = children["qmi.rpc.execute"]
+            duration = int(execute_span["endTimeUnixNano"]) - int(execute_span["startTimeUnixNano"])
+            self.assertGreaterEqual(duration, 10_000_000)
+
+        # The request sent by c3 is recorded as a child of the client span.
+        self.assertIn(("c3", "qmi.send"), [(service, span["name"]) for (service, span) in trace_spans
+                                           if span.get("parentSpanId") == client_span["spanId"]])
+
+    def test_failed_call(self):
+        """A method which raises an exception is recorded with an error status."""
+        proxy = self.c2.get_rpc_object_by_name("c1.instrument")
+        with self.assertRaises(ValueError):
+            proxy.read(-1)
+        self._stop_contexts()
+
+        spans = [span for (service, span) in read_spans(self.path1)]
+        (execute_span,) = [span for span in spans if span["name"] == "qmi.rpc.execute" and span["status"]]
+        self.assertEqual(execute_span["status"]["code"], 2)
+        self.assertIn("negative value", execute_span["status"]["message"])
+
+    def test_untraced_request(self):
+        """A reply to a request without trace context does not carry a trace context."""
+        proxy = self.c2.get_rpc_object_by_name("c1.instrument")
+        with patch.object(self.c1, "send_message", wraps=self.c1.send_message) as send_message:
+            self.assertEqual(proxy.read(1), 1)
+        (reply,) = [call.args[0] for call in send_message.call_args_list
+                    if isinstance(call.args[0], QMI_ReplyMessage)]
+        self.assertIsNone(getattr(reply, "trace_context", None))
+
+        # The server span is still recorded by the traced context.
+        self._stop_contexts()
+        spans = [span for (service, span) in read_spans(self.path1)]
+        self.assertIn("c1.instrument/read", [span["name"] for span in spans])
+
+
+if __name__ == "__main__":
+    unittest.main()
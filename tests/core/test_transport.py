@@ -20,6 +20,7 @@ from qmi.core.transport import (
     QMI_SocketTransport,
     QMI_UdpTransport,
     QMI_TcpTransport,
+    QMI_ResilientTcpTransport,
     QMI_SerialTransport,
     QMI_Vxi11Transport,
     QMI_UsbTmcTransport
@@ -249,6 +250,24 @@ class TestQmiTransportFactory(unittest.TestCase):
         self.assertIs(trans, mock.return_value)
         mock.assert_called_once_with(host="localhost", port=21)
 
+    @unittest.mock.patch("qmi.core.transport.QMI_TcpTransport")
+    def test_parse_tcp_keepalive(self, mock):
+        trans = create_transport("tcp:localhost:1234:keepalive=True")
+        self.assertIs(trans, mock.return_value)
+        mock.assert_called_once_with(host="localhost", port=1234, keepalive=True)
+
+    @unittest.mock.patch("qmi.core.transport.QMI_ResilientTcpTransport")
+    def test_parse_tcp_reconnect(self, mock):
+        trans = create_transport("tcp:localhost:1234:reconnect=3:connect_timeout=2")
+        self.assertIs(trans, mock.return_value)
+        mock.assert_called_once_with(host="localhost", port=1234, connect_timeout=2.0, reconnect=3, standby=False)
+
+    @unittest.mock.patch("qmi.core.transport.QMI_ResilientTcpTransport")
+    def test_parse_tcp_standby(self, mock):
+        trans = create_transport("tcp:localhost:1234:standby=True")
+        self.assertIs(trans, mock.return_value)
+        mock.assert_called_once_with(host="localhost", port=1234, standby=True)
+
     @unittest.mock.patch("qmi.core.transport.QMI_Vxi11Transport")
     def test_parse_vxi11(self, mock):
         trans = create_transport("vxi11:localhost")
@@ -1139,6 +1158,138 @@ class TestQmiTcpTransport(unittest.TestCase):
             QMI_TcpTransport("192.168.1.300", 22)
 
 
+class TestQmiResilientTcpTransport(unittest.TestCase):
+    """Test QMI_ResilientTcpTransport class."""
+
+    def setUp(self):
+        # Filter out warnings about unclosed sockets
+        warnings.filterwarnings("ignore", "unclosed", ResourceWarning)
+        # Create TCP server socket.
+        self.server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM, 0)
+        self.server_sock.bind(("127.0.0.1", 0))
+        (server_host, self.server_port) = self.server_sock.getsockname()
+        self.server_sock.listen(5)
+        self.server_sock.settimeout(1.0)
+
+    def tearDown(self):
+        self.server_sock.close()
+
+    def test_invalid_reconnect(self):
+        """Test that the number of reconnect attempts must be positive."""
+        with self.assertRaises(qmi.core.exceptions.QMI_TransportDescriptorException):
+            QMI_ResilientTcpTransport("127.0.0.1", self.server_port, reconnect=0)
+
+    def test_reconnect_after_remote_close(self):
+        """Test the transport reconnects after the remote side closed the connection."""
+        with open_close(QMI_ResilientTcpTransport("127.0.0.1", self.server_port, connect_timeout=1)) as trans:
+            self.assertEqual(f"QMI_ResilientTcpTransport(remote=127.0.0.1:{self.server_port})", str(trans))
+            (server_conn, _) = self.server_sock.accept()
+            trans.write(b"ping\n")
+            self.assertEqual(b"ping\n", server_conn.recv(100))
+            server_conn.sendall(b"pong\n")
+            self.assertEqual(b"pong\n", trans.read_until(b"\n", timeout=1.0))
+
+            # Drop the connection on the server side; the pending read fails.
+            server_conn.close()
+            with self.assertRaises(qmi.core.exceptions.QMI_EndOfInputException):
+                trans.read_until(b"\n", timeout=1.0)
+
+            # The next write transparently uses a new connection.
+            trans.write(b"again\n")
+            (server_conn, _) = self.server_sock.accept()
+            server_conn.settimeout(1.0)
+            self.assertEqual(b"again\n", server_conn.recv(100))
+            server_conn.sendall(b"ok\n")
+            self.assertEqual(b"ok\n", trans.read_until(b"\n", timeout=1.0))
+            server_conn.close()
+
+            stats = trans.get_statistics()
+            self.assertEqual(1, stats.reconnects)
+            self.assertEqual(len(b"ping\nagain\n"), stats.bytes_written)
+            self.assertEqual(len(b"pong\nok\n"), stats.bytes_read)
+
+    def test_reconnect_uses_standby(self):
+        """Test the standby connection replaces a lost connection."""
+        with open_close(QMI_ResilientTcpTransport("127.0.0.1", self.server_port, standby=True)) as trans:
+            (server_conn, _) = self.server_sock.accept()
+            (standby_conn, _) = self.server_sock.accept()
+            server_conn.close()
+            with self.assertRaises(qmi.core.exceptions.QMI_EndOfInputException):
+                trans.read(1, timeout=1.0)
+
+            trans.write(b"hello")
+            standby_conn.settimeout(1.0)
+            self.assertEqual(b"hello", standby_conn.recv(100))
+            # A new standby connection is opened after the old one was taken into use.
+            (new_standby_conn, _) = self.server_sock.accept()
+            self.assertEqual(1, trans.get_statistics().reconnects)
+            standby_conn.close()
+            new_standby_conn.close()
+
+    def test_read_after_reconnect(self):
+        """Test a read on a new connection uses the read timeout, not the connect timeout."""
+        with open_close(QMI_ResilientTcpTransport("127.0.0.1", self.server_port, connect_timeout=3)) as trans:
+            (server_conn, _) = self.server_sock.accept()
+            server_conn.close()
+            with self.assertRaises(qmi.core.exceptions.QMI_EndOfInputException):
+                trans.read(1, timeout=1.0)
+
+            # The read reconnects, then times out after the read timeout.
+            t0 = time.monotonic()
+            with self.assertRaises(qmi.core.exceptions.QMI_TimeoutException):
+                trans.read(1, timeout=0.5)
+            self.assertGreaterEqual(time.monotonic() - t0, 0.4)
+            self.assertLess(time.monotonic() - t0, 2.0)
+
+            (server_conn, _) = self.server_sock.accept()
+            server_conn.sendall(b"ok\n")
+            self.assertEqual(b"ok\n", trans.read_until(b"\n", timeout=1.0))
+            self.assertEqual(1, trans.get_statistics().reconnects)
+            server_conn.close()
+
+    def test_read_after_reconnect_with_standby(self):
+        """Test a read on the standby connection waits for the read timeout."""
+        with open_close(QMI_ResilientTcpTransport("127.0.0.1", self.server_port, standby=True)) as trans:
+            (server_conn, _) = self.server_sock.accept()
+            (standby_conn, _) = self.server_sock.accept()
+            server_conn.close()
+            with self.assertRaises(qmi.core.exceptions.QMI_EndOfInputException):
+                trans.read(1, timeout=1.0)
+
+            t0 = time.monotonic()
+            with self.assertRaises(qmi.core.exceptions.QMI_TimeoutException):
+                trans.read(1, timeout=0.5)
+            self.assertGreaterEqual(time.monotonic() - t0, 0.4)
+
+            # Data sent on the standby connection during the read is received.
+            timer = threading.Timer(0.2, standby_conn.sendall, args=(b"ok\n",))
+            timer.start()
+            self.assertEqual(b"ok\n", trans.read_until(b"\n", timeout=1.0))
+            timer.join()
+            self.assertEqual(1, trans.get_statistics().reconnects)
+            (new_standby_conn, _) = self.server_sock.accept()
+            standby_conn.close()
+            new_standby_conn.close()
+
+    def test_reconnect_fails(self):
+        """Test an exception is raised when all reconnect attempts fail."""
+        trans = QMI_ResilientTcpTransport("127.0.0.1", self.server_port, reconnect=2)
+        trans.RECONNECT_INITIAL_DELAY = 0.01
+        trans.open()
+        (server_conn, _) = self.server_sock.accept()
+        server_conn.close()
+        with self.assertRaises(qmi.core.exceptions.QMI_EndOfInputException):
+            trans.read(1, timeout=1.0)
+
+        # Stop listening, so that reconnecting is impossible.
+        self.server_sock.close()
+        with self.assertRaises(qmi.core.exceptions.QMI_EndOfInputException):
+            trans.write(b"lost")
+
+        self.assertEqual(0, trans.get_statistics().reconnects)
+        trans.close()
+
+
 class TestQmiSerialTransportInit(unittest.TestCase):
 
     def test_correct_construction(self):
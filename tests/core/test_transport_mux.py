@@ -0,0 +1,178 @@
+#! /usr/bin/env python3
+
+"""Test QMI_TransportMultiplexer and QMI_MuxTransport functionality."""
+import threading
+import time
+import unittest
+import unittest.mock
+
+import qmi.core.transport_mux
+from qmi.core.exceptions import (
+    QMI_InvalidOperationException, QMI_TimeoutException, QMI_TransportDescriptorException, QMI_UsageException
+)
+from qmi.core.transport import create_transport
+from qmi.core.transport_mux import (
+    QMI_MuxTransport, create_transport_multiplexer, get_transport_multiplexer, remove_transport_multiplexer
+)
+
+
+class TestTransportMultiplexer(unittest.TestCase):
+    """Test sharing one transport between multiple multiplexed transports."""
+
+    def setUp(self):
+        patcher = unittest.mock.patch("qmi.core.transport_mux.create_transport")
+        self.create_transport = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.shared = self.create_transport.return_value
+        self.mux = create_transport_multiplexer("bus", "serial:/dev/ttyS0:baudrate=9600", lease_timeout=0.2)
+
+    def tearDown(self):
+        qmi.core.transport_mux._multiplexers.clear()
+
+    def test_create(self):
+        """Test creating and removing a multiplexer."""
+        self.create_transport.assert_called_once_with("serial:/dev/ttyS0:baudrate=9600")
+        self.assertIs(self.mux, get_transport_multiplexer("bus"))
+        with self.assertRaises(QMI_UsageException):
+            create_transport_multiplexer("bus", "serial:/dev/ttyS1:baudrate=9600")
+
+        remove_transport_multiplexer("bus")
+        with self.assertRaises(QMI_TransportDescriptorException):
+            get_transport_multiplexer("bus")
+        with self.assertRaises(QMI_UsageException):
+            remove_transport_multiplexer("bus")
+
+    def test_descriptor(self):
+        """Test creating a multiplexed transport from a transport descriptor."""
+        trans = create_transport("mux:bus:3:request_timeout=2.5")
+        self.assertIsInstance(trans, QMI_MuxTransport)
+        self.assertEqual(3, trans.address)
+        self.assertEqual("QMI_MuxTransport('bus', address=3)", str(trans))
+
+        with self.assertRaises(QMI_TransportDescriptorException):
+            create_transport("mux:nobus:1")
+
+    def test_open_close(self):
+        """Test the shared transport is open while any client is open."""
+        trans1 = QMI_MuxTransport("bus", 1)
+        trans2 = QMI_MuxTransport("bus", 2)
+        trans1.open()
+        trans2.open()
+        self.shared.open.assert_called_once_with()
+
+        # Duplicate address not allowed.
+        with self.assertRaises(QMI_InvalidOperationException):
+            QMI_MuxTransport("bus", 1).open()
+
+        with self.assertRaises(QMI_UsageException):
+            remove_transport_multiplexer("bus")
+
+        trans1.close()
+        self.shared.close.assert_not_called()
+        trans2.close()
+        self.shared.close.assert_called_once_with()
+        remove_transport_multiplexer("bus")
+
+    def test_request_response(self):
+        """Test a request is forwarded to the shared transport."""
+        self.shared.read_until.return_value = b"1TS000033\r\n"
+        trans = QMI_MuxTransport("bus", 1)
+        trans.open()
+        trans.discard_read()
+        trans.write(b"1TS\r\n")
+        self.assertEqual(b"1TS000033\r\n", trans.read_until(b"\r\n", timeout=1.0))
+        self.shared.discard_read.assert_called_once_with()
+        self.shared.write.assert_called_once_with(b"1TS\r\n")
+        self.shared.read_until.assert_called_once_with(b"\r\n", 1.0)
+
+        trans.read(4, timeout=1.0)
+        self.shared.read.assert_called_once_with(4, 1.0)
+        trans.read_until_timeout(4, timeout=1.0)
+        self.shared.read_until_timeout.assert_called_once_with(4, 1.0)
+        trans.close()
+
+    def test_request_is_not_interrupted(self):
+        """Test another client can not use the bus between a command and its response."""
+        trans1 = QMI_MuxTransport("bus", 1)
+        trans2 = QMI_MuxTransport("bus", 2, request_timeout=1.0)
+        trans1.open()
+        trans2.open()
+        events = []
+        self.shared.write.side_effect = events.append
+        self.shared.read_until.side_effect = lambda term, timeout: events.append(b"reply") or b"reply"
+
+        trans1.write(b"cmd1")
+        thread = threading.Thread(target=trans2.write, args=(b"cmd2",))
+        thread.start()
+        time.sleep(0.05)
+        trans1.read_until(b"\n", timeout=1.0)
+        thread.join()
+
+        self.assertEqual([b"cmd1", b"reply", b"cmd2"], events)
+        trans1.close()
+        trans2.close()
+
+    def test_request_timeout(self):
+        """Test waiting for the bus times out when another client is busy."""
+        trans1 = QMI_MuxTransport("bus", 1)
+        trans2 = QMI_MuxTransport("bus", 2, request_timeout=0.1)
+        trans1.open()
+        trans2.open()
+        read_started = threading.Event()
+
+        def slow_read(term, timeout):
+            read_started.set()
+            time.sleep(0.5)
+            return b"reply"
+
+        self.shared.read_until.side_effect = slow_read
+        thread = threading.Thread(target=trans1.read_until, args=(b"\n", 1.0))
+        thread.start()
+        read_started.wait()
+        # Lease can not expire during an operation.
+        with self.assertRaises(QMI_TimeoutException):
+            trans2.write(b"cmd2")
+        thread.join()
+        trans1.close()
+        trans2.close()
+
+    def test_lease_expires(self):
+        """Test an unused lease expires so that write-only clients do not block the bus."""
+        trans1 = QMI_MuxTransport("bus", 1)
+        trans2 = QMI_MuxTransport("bus", 2, request_timeout=1.0)
+        trans1.open()
+        trans2.open()
+        trans1.write(b"no reply")
+        tstart = time.monotonic()
+        trans2.write(b"cmd2")
+        self.assertGreaterEqual(time.monotonic() - tstart, 0.15)
+        trans1.close()
+        trans2.close()
+
+    def test_fair_order(self):
+        """Test waiting clients are served in order of arrival."""
+        clients = [QMI_MuxTransport("bus", addr, request_timeout=2.0) for addr in range(4)]
+        for client in clients:
+            client.open()
+        order = []
+        self.shared.write.side_effect = order.append
+        self.shared.read.side_effect = lambda n, timeout: order.append(threading.current_thread().name) or b"x"
+
+        clients[0].write(b"0")
+        threads = []
+        for addr in range(1, 4):
+            thread = threading.Thread(target=clients[addr].read, args=(1, 1.0))
+            threads.append(thread)
+            thread.start()
+            time.sleep(0.02)
+        clients[0].read(1, 1.0)
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([b"0", threading.current_thread().name] + [t.name for t in threads], order)
+        for client in clients:
+            client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
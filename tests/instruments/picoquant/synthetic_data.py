@@ -0,0 +1,112 @@
+"""Synthetic TTTR data streams for testing and benchmarking the PicoQuant event processing.
+
+The generated data has the same raw 32-bit record format as the FIFO data read from a
+MultiHarp or HydraHarp, including overflow records, so that it can be fed through the
+complete decoding and processing pipeline without an instrument.
+"""
+
+import numpy as np
+
+from qmi.instruments.picoquant.support._decoders import EventDataType, SYNC_TYPE
+
+
+def make_t2_events(num_events: int,
+                   sync_period: int = 2500,
+                   channels: tuple[int, ...] = (0, 1),
+                   sync_fraction: float = 0.25,
+                   seed: int = 0
+                   ) -> np.ndarray:
+    """Generate decoded T2 event records with SYNC events at a fixed period.
+
+    Parameters:
+        num_events:    Total number of event records, including SYNC events.
+        sync_period:   SYNC period in units of the instrument base resolution.
+        channels:      Input channels to generate events for.
+        sync_fraction: Fraction of the records that are SYNC events.
+        seed:          Seed for the random number generator.
+
+    Returns:
+        Array of `EventDataType` records, sorted by timestamp.
+    """
+    rng = np.random.default_rng(seed)
+    num_sync = max(1, int(num_events * sync_fraction))
+    num_channel_events = num_events - num_sync
+    total_time = num_sync * sync_period
+
+    events = np.empty(num_events, dtype=EventDataType)
+    events["type"][:num_sync] = SYNC_TYPE
+    events["timestamp"][:num_sync] = sync_period * np.arange(1, num_sync + 1, dtype=np.uint64)
+    events["type"][num_sync:] = rng.choice(channels, size=num_channel_events)
+    events["timestamp"][num_sync:] = rng.integers(sync_period, total_time, size=num_channel_events, dtype=np.uint64)
+    events.sort(order="timestamp", kind="stable")
+    return events
+
+
+def t2_events_to_fifo(events: np.ndarray) -> np.ndarray:
+    """Encode T2 event records as raw MultiHarp T2 FIFO records, inserting overflow records.
+
+    Parameters:
+        events: Array of `EventDataType` records, sorted by timestamp.
+
+    Returns:
+        Array of raw 32-bit T2 FIFO records.
+    """
+    event_types = events["type"].astype(np.uint32)
+    # SYNC events are special records on channel 0.
+    channel_bits = np.where(event_types == SYNC_TYPE, np.uint32(1 << 6), event_types)
+    words = (channel_bits << 25) | (events["timestamp"].astype(np.uint32) & 0x1ffffff)
+
+    # Insert overflow records at positions where the MSB part of the timestamp changes.
+    periods = events["timestamp"] >> 25
+    previous_periods = np.concatenate(([0], periods[:-1])).astype(np.uint64)
+    (overflow_idx,) = np.nonzero(periods != previous_periods)
+    overflow_counts = (periods[overflow_idx] - previous_periods[overflow_idx]).astype(np.uint32)
+    overflow_words = overflow_counts | np.uint32((1 << 31) | (63 << 25))
+    return np.insert(words, overflow_idx, overflow_words)
+
+
+def make_t2_fifo_data(num_events: int, seed: int = 0, **kwargs) -> np.ndarray:
+    """Generate a synthetic raw T2 FIFO stream containing approximately `num_events` events.
+
+    Additional keyword arguments are passed to `make_t2_events()`.
+    """
+    return t2_events_to_fifo(make_t2_events(num_events, seed=seed, **kwargs))
+
+
+def make_t3_fifo_data(num_events: int,
+                      channels: tuple[int, ...] = (0, 1),
+                      events_per_sync: float = 0.5,
+                      max_dtime: int = 1 << 15,
+                      seed: int = 0
+                      ) -> np.ndarray:
+    """Generate a synthetic raw T3 FIFO stream.
+
+    Parameters:
+        num_events:      Number of channel events.
+        channels:        Input channels to generate events for.
+        events_per_sync: Average number of channel events per SYNC period.
+        max_dtime:       Upper limit (exclusive) of the 15-bit `d_time` field.
+        seed:            Seed for the random number generator.
+
+    Returns:
+        Array of raw 32-bit T3 FIFO records, including sync counter overflow records.
+    """
+    rng = np.random.default_rng(seed)
+    num_sync = max(1, int(num_events / events_per_sync))
+    sync_numbers = np.sort(rng.integers(0, num_sync, size=num_events, dtype=np.uint64))
+    dtimes = rng.integers(0, max_dtime, size=num_events, dtype=np.uint32)
+    event_channels = rng.choice(np.asarray(channels, dtype=np.uint32), size=num_events)
+    words = (event_channels << 25) | (dtimes << 10) | (sync_numbers & 0x3ff).astype(np.uint32)
+
+    # Insert an overflow record (with count 1) for each wrap of the 10-bit sync counter.
+    periods = sync_numbers >> 10
+    previous_periods = np.concatenate(([0], periods[:-1])).astype(np.uint64)
+    (overflow_idx,) = np.nonzero(periods != previous_periods)
+    overflow_counts = (periods[overflow_idx] - previous_periods[overflow_idx]).astype(np.uint32)
+    overflow_words = overflow_counts | np.uint32((1 << 31) | (63 << 25))
+    return np.insert(words, overflow_idx, overflow_words)
+
+
+def split_blocks(fifo_data: np.ndarray, block_size: int) -> list[np.ndarray]:
+    """Split a FIFO stream into blocks as returned by successive FIFO reads."""
+    return [fifo_data[pos:pos + block_size] for pos in range(0, len(fifo_data), block_size)]
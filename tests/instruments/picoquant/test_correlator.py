@@ -0,0 +1,86 @@
+"""Unit tests for the real-time correlator of the PicoQuant drivers."""
+
+import unittest
+
+import numpy as np
+
+from qmi.instruments.picoquant.support._decoders import EventDataType
+from qmi.instruments.picoquant.support._correlator import CorrelationMode, _RealTimeCorrelator
+
+
+def make_events(num_events, seed):
+    rng = np.random.default_rng(seed)
+    events = np.empty(num_events, dtype=EventDataType)
+    events["type"] = rng.choice([0, 1, 2], size=num_events)
+    events["timestamp"] = 1000 + np.cumsum(rng.integers(0, 30, size=num_events))
+    return events
+
+
+def reference_histograms(events, pairs, bin_resolution, num_bins, integration_time, mode):
+    """Straightforward pair-by-pair implementation, returning the list of published histograms."""
+    timestamps = events["timestamp"].astype(np.int64)
+    types = events["type"]
+    min_delay = -(num_bins // 2) * bin_resolution if mode == CorrelationMode.MULTI_STOP else 0
+    max_delay = min_delay + num_bins * bin_resolution
+    first = int(timestamps[0])
+    num_intervals = (int(timestamps[-1]) - first) // integration_time
+    hist = np.zeros((num_intervals + 1, len(pairs), num_bins), dtype=np.uint32)
+
+    for (pair_pos, (start_chan, stop_chan)) in enumerate(pairs):
+        for i in np.flatnonzero(types == start_chan):
+            stop_candidates = np.flatnonzero(types == stop_chan)
+            stop_candidates = stop_candidates[stop_candidates != i]
+            if mode == CorrelationMode.START_STOP:
+                # Only the next stop event in the event stream.
+                stop_candidates = stop_candidates[stop_candidates > i][:1]
+            for j in stop_candidates:
+                delay = timestamps[j] - timestamps[i]
+                if min_delay <= delay < max_delay:
+                    # The pair belongs to the interval of the later event.
+                    later = timestamps[max(i, j)]
+                    hist[(later - first) // integration_time, pair_pos, (delay - min_delay) // bin_resolution] += 1
+    return hist[:num_intervals]
+
+
+class TestRealTimeCorrelator(unittest.TestCase):
+
+    def _check(self, mode, pairs):
+        events = make_events(3000, seed=7)
+        expected = reference_histograms(events, pairs, 4, 10, 5000, mode)
+        self.assertGreater(len(expected), 5)
+
+        rng = np.random.default_rng(3)
+        for num_blocks in (1, 10, 500):
+            published = []
+            correlator = _RealTimeCorrelator(published.append)
+            correlator.set_correlation_config(pairs, 4, 10, 5000, mode)
+            split_points = np.sort(rng.integers(0, len(events), size=num_blocks - 1))
+            for block in np.split(events, split_points):
+                correlator.process_events(block)
+
+            self.assertEqual(len(published), len(expected))
+            for (interval, correlation) in enumerate(published):
+                self.assertEqual(correlation.start_timestamp, int(events["timestamp"][0]) + interval * 5000)
+                self.assertEqual(correlation.integration_time, 5000)
+                self.assertEqual(correlation.mode, mode)
+                self.assertEqual(correlation.channel_pairs, pairs)
+                np.testing.assert_array_equal(correlation.histogram_data, expected[interval])
+
+    def test_multi_stop(self):
+        """Test multi-start multi-stop correlation, independent of the block size."""
+        self._check(CorrelationMode.MULTI_STOP, [(0, 1), (1, 0), (2, 2)])
+
+    def test_start_stop(self):
+        """Test start-stop correlation, independent of the block size."""
+        self._check(CorrelationMode.START_STOP, [(0, 1), (2, 2)])
+
+    def test_disabled(self):
+        """Test nothing is published when correlation is not configured."""
+        published = []
+        correlator = _RealTimeCorrelator(published.append)
+        correlator.process_events(make_events(100, seed=1))
+        self.assertEqual(published, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
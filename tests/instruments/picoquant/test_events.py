@@ -0,0 +1,154 @@
+"""Unit tests for the background event fetching of the PicoQuant drivers."""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+import h5py
+import numpy as np
+
+from qmi.instruments.picoquant.support._decoders import EventFilterMode, SYNC_TYPE, _T2EventDecoder
+from qmi.instruments.picoquant.support._events import _FetchEventsThread, _FifoBufferPool, _MODE
+from qmi.instruments.picoquant.support._recording import RecordingFormat, _EventRecorder
+from tests.instruments.picoquant.synthetic_data import make_t2_fifo_data, split_blocks
+
+
+class TestFifoBufferPool(unittest.TestCase):
+
+    def test_reuse(self):
+        """Test released buffers are reused."""
+        pool = _FifoBufferPool(16, max_free_buffers=1)
+        buffer1 = pool.acquire()
+        buffer2 = pool.acquire()
+        self.assertEqual(len(buffer1), 16)
+        self.assertEqual(buffer1.dtype, np.uint32)
+        self.assertIsNot(buffer1, buffer2)
+
+        pool.release(buffer1)
+        pool.release(buffer2)
+        self.assertIs(pool.acquire(), buffer1)
+        self.assertIsNot(pool.acquire(), buffer2)
+
+
+class TestFetchEventsThread(unittest.TestCase):
+
+    BUFFER_SIZE = 64
+
+    def setUp(self):
+        self.buffers = []
+        self.num_full_reads = 0
+        self.reads_done = threading.Event()
+        self.thread = _FetchEventsThread(self._read_fifo, self.BUFFER_SIZE, None, None, None)
+        self.thread.start()
+
+    def tearDown(self):
+        self.thread.shutdown()
+        self.thread.join()
+
+    def _read_fifo(self, fifo_data):
+        self.buffers.append(fifo_data)
+        if self.num_full_reads > 0:
+            # T2 SYNC records with increasing time tags.
+            fifo_data[:] = (1 << 31) | np.arange(self.BUFFER_SIZE, dtype=np.uint32)
+            self.num_full_reads -= 1
+            return self.BUFFER_SIZE
+        self.reads_done.set()
+        return 0
+
+    def test_full_reads_without_sleep(self):
+        """Test the FIFO is read again immediately after a full read, using recycled buffers."""
+        self.num_full_reads = 50
+        self.thread.set_event_filter_config({SYNC_TYPE: EventFilterMode.ALL_EVENTS}, (0, 0))
+        tstart = time.monotonic()
+        self.thread.activate(_MODE.T2)
+        self.assertTrue(self.reads_done.wait(timeout=5))
+        duration = time.monotonic() - tstart
+        self.thread.deactivate()
+
+        # With a sleep after every read, this would take at least 0.5 seconds.
+        self.assertLess(duration, 50 * _FetchEventsThread._LOOP_SLEEP_DURATION)
+        self.assertLessEqual(len({id(buffer) for buffer in self.buffers}), 2)
+
+        (_timestamp, events) = self.thread.get_events(10000)
+        self.assertEqual(len(events), 50 * self.BUFFER_SIZE)
+
+
+class TestFetchEventsWorkerProcess(unittest.TestCase):
+
+    BUFFER_SIZE = 256
+
+    def _fetch_all(self, use_worker_process, block_events=False, recorder=None):
+        """Fetch a synthetic T2 stream and return (events, histograms)."""
+        blocks = split_blocks(make_t2_fifo_data(20000), self.BUFFER_SIZE)
+        reads_done = threading.Event()
+        histograms = []
+
+        def read_fifo(fifo_data):
+            if not blocks:
+                reads_done.set()
+                return 0
+            block = blocks.pop(0)
+            fifo_data[:len(block)] = block
+            return len(block)
+
+        thread = _FetchEventsThread(read_fifo, self.BUFFER_SIZE, histograms.append, None, None,
+                                    use_worker_process=use_worker_process)
+        thread.start()
+        try:
+            thread.set_event_filter_config({0: EventFilterMode.APERTURE,
+                                            SYNC_TYPE: EventFilterMode.APERTURE}, (100, 2000))
+            thread.set_histogram_config([0, 1], 4, 256, 100)
+            thread.set_block_events(block_events)
+            if recorder is not None:
+                recorder.start()
+                thread.start_recording(recorder)
+            thread.activate(_MODE.T2)
+            self.assertTrue(reads_done.wait(timeout=30))
+            thread.deactivate()
+            # Wait for the worker to finish the last blocks.
+            time.sleep(0.5)
+            (_timestamp, events) = thread.get_events(10**6)
+        finally:
+            if thread.stop_recording() is not None:
+                recorder.shutdown()
+                recorder.join()
+            thread.shutdown()
+            thread.join()
+        return events, histograms
+
+    def test_same_result_as_in_thread(self):
+        """Test processing in the worker process gives the same events and histograms."""
+        (expected_events, expected_histograms) = self._fetch_all(use_worker_process=False)
+        (events, histograms) = self._fetch_all(use_worker_process=True)
+
+        self.assertGreater(len(expected_events), 0)
+        np.testing.assert_array_equal(events, expected_events)
+        self.assertEqual(len(histograms), len(expected_histograms))
+        for (histogram, expected_histogram) in zip(histograms, expected_histograms):
+            self.assertEqual(histogram.start_timestamp, expected_histogram.start_timestamp)
+            np.testing.assert_array_equal(histogram.histogram_data, expected_histogram.histogram_data)
+
+    def test_block_events(self):
+        """Test blocked events are not returned, while histograms are still published."""
+        (events, histograms) = self._fetch_all(use_worker_process=True, block_events=True)
+        self.assertEqual(len(events), 0)
+        self.assertGreater(len(histograms), 0)
+
+    def test_recording(self):
+        """Test all decoded events are recorded when processing in the worker process."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "events.h5")
+            recorder = _EventRecorder(path, RecordingFormat.HDF5, "MH", "T2", 5e-12, 5e-12)
+            (events, _histograms) = self._fetch_all(use_worker_process=True, recorder=recorder)
+            with h5py.File(path, "r") as f:
+                recorded_events = f["events"][:]
+
+        expected_events = _T2EventDecoder().process_data(make_t2_fifo_data(20000))
+        np.testing.assert_array_equal(recorded_events, expected_events)
+        self.assertGreater(len(events), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
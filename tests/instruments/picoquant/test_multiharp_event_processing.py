@@ -3,16 +3,20 @@
 """Unit test for T2 mode event processing in MultiHarp driver."""
 
 import ctypes
+import os
+import tempfile
 import threading
 import unittest
 from unittest.mock import patch, PropertyMock
 
+import h5py
 import numpy as np
 
-from qmi.core.exceptions import QMI_RuntimeException
+from qmi.core.exceptions import QMI_InvalidOperationException, QMI_RuntimeException
 from qmi.core.pubsub import QMI_SignalReceiver
 from qmi.instruments.picoquant.support._mhlib_function_signatures import _mhlib_function_signatures
 from qmi.instruments.picoquant.support._events import EventDataType, EventFilterMode
+from qmi.instruments.picoquant.support._ringbuffer import EventOverflowPolicy
 from qmi.instruments.picoquant import PicoQuant_MultiHarp150
 
 from tests.patcher import PatcherQmiContext as QMI_Context
@@ -408,6 +412,13 @@ class TestMultiHarpEventFilter(unittest.TestCase):
         with self.assertRaises(QMI_RuntimeException):
             _ = self._multiharp.get_events()
 
+        # Check the discarded events are counted.
+        status = self._multiharp.get_event_buffer_status()
+        self.assertEqual(status.capacity, self.PATCHED_MAX_PENDING_EVENTS)
+        self.assertEqual(status.pending_events, 0)
+        self.assertGreater(status.dropped_events, 0)
+        self.assertEqual(status.overflow_policy, EventOverflowPolicy.RAISE)
+
         # Stop the measurement.
         self._multiharp.stop_measurement()
 
@@ -440,6 +451,46 @@ class TestMultiHarpEventFilter(unittest.TestCase):
         events = self._multiharp.get_events()
         self.assertEqual(len(events), 0)
 
+    def test_recording(self):
+        # Test that all events are recorded to file, independent of the event filter.
+        events_in = self.events_in_slow
+        fifo_words_in = events_to_fifo(events_in)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for format_str in ("HDF5", "PTU"):
+                path = os.path.join(tmpdir, "events." + format_str.lower())
+                done_event = threading.Event()
+                self._library_mock.ReadFiFo.side_effect = make_patched_read_fifo(fifo_words_in, done_event)
+                self._multiharp.set_event_filter(channel_filter={1: EventFilterMode.NO_EVENTS})
+
+                self._multiharp.start_recording(path, format_str)
+                with self.assertRaises(QMI_InvalidOperationException):
+                    self._multiharp.start_recording(path, format_str)
+
+                self._multiharp.start_measurement(1000)
+                done_event.wait()
+                self._multiharp.stop_measurement()
+                status = self._multiharp.stop_recording()
+
+                if format_str == "HDF5":
+                    self.assertEqual(status.records_written, len(events_in))
+                    with h5py.File(path, "r") as f:
+                        self.assertTrue(np.all(f["events"][:] == events_in))
+                else:
+                    self.assertEqual(status.records_written, len(fifo_words_in))
+                    with open(path, "rb") as f:
+                        records = np.frombuffer(f.read(), dtype="<u4")
+                    self.assertTrue(np.all(records[-len(fifo_words_in):] == fifo_words_in))
+
+                # The event filter still applies to fetched events.
+                events = self._multiharp.get_events()
+                self.assertTrue(np.all(events == events_in[events_in["type"] != 1]))
+
+        with self.assertRaises(QMI_InvalidOperationException):
+            self._multiharp.stop_recording()
+        with self.assertRaises(ValueError):
+            self._multiharp.start_recording(path, "CSV")
+
 
 class TestMultiHarpRealtime(unittest.TestCase):
     """Test class to test real-time functionalities of event processing. This requires a running QMI context.
@@ -572,6 +623,119 @@ class TestMultiHarpRealtime(unittest.TestCase):
 
         self._multiharp.sig_histogram.unsubscribe(recv)
 
+    def test_event_streaming(self):
+
+        # Generate a random set of events.
+        events_in = self.events_in_fast
+
+        # Patch the readFifo() function.
+        fifo_words_in = events_to_fifo(events_in)
+        done_event = threading.Event()
+        self._library_mock.ReadFiFo.side_effect = make_patched_read_fifo(fifo_words_in, done_event)
+
+        # Subscribe to event chunks.
+        recv = QMI_SignalReceiver()
+        self._multiharp.sig_events.subscribe(recv)
+
+        # Accept all events and stream them in small chunks.
+        max_chunk_events = 1000
+        self._multiharp.set_event_filter(reset_filter=True)
+        self._multiharp.set_event_streaming(max_chunk_events, 0.05)
+
+        # Start the measurement.
+        self._multiharp.start_measurement(1000)
+
+        # Wait to make sure all events are processed.
+        done_event.wait()
+
+        # Stop the measurement.
+        self._multiharp.stop_measurement()
+
+        # Collect the published chunks; the last chunk is published when the measurement stops.
+        chunks = []
+        num_events = 0
+        while num_events < len(events_in):
+            (chunk,) = recv.get_next_signal(timeout=5).args
+            chunks.append(chunk)
+            num_events += len(chunk.events)
+
+        self.assertEqual([chunk.sequence_number for chunk in chunks], list(range(len(chunks))))
+        self.assertTrue(all(0 < len(chunk.events) <= max_chunk_events for chunk in chunks))
+        events = np.concatenate([chunk.events for chunk in chunks])
+        self.assertTrue(np.all(events == events_in))
+
+        # Streamed events are not kept as pending events.
+        self.assertEqual(len(self._multiharp.get_events()), 0)
+
+        # Invalid chunk sizes are rejected.
+        with self.assertRaises(ValueError):
+            self._multiharp.set_event_streaming(-1)
+
+        self._multiharp.sig_events.unsubscribe(recv)
+
+    def test_realtime_correlation(self):
+
+        # Generate a random set of events.
+        events_in = self.events_in_fast
+
+        # Patch the readFifo() function.
+        fifo_words_in = events_to_fifo(events_in)
+        done_event = threading.Event()
+        self._library_mock.ReadFiFo.side_effect = make_patched_read_fifo(fifo_words_in, done_event)
+
+        # Subscribe to real-time correlation histograms.
+        recv = QMI_SignalReceiver()
+        self._multiharp.sig_correlation.subscribe(recv)
+
+        # Configure start-stop correlation between SYNC and channel 0.
+        bin_resolution = 25
+        num_bins = 1000
+        integration_time = 10**8
+        self._multiharp.set_realtime_correlation(
+            channel_pairs=[(64, 0)],
+            bin_resolution=bin_resolution,
+            num_bins=num_bins,
+            integration_time=integration_time,
+            mode_str="START_STOP")
+
+        # Start the measurement.
+        self._multiharp.start_measurement(1000)
+
+        # Wait to make sure all events are processed.
+        done_event.wait()
+
+        # Stop the measurement.
+        self._multiharp.stop_measurement()
+
+        # Determine expected delays from each SYNC to the next event on channel 0.
+        timestamps = events_in["timestamp"].astype(np.int64)
+        sync_pos = np.flatnonzero(events_in["type"] == 64)
+        chan_pos = np.flatnonzero(events_in["type"] == 0)
+        stop_idx = np.searchsorted(chan_pos, sync_pos, side="right")
+        sync_pos = sync_pos[stop_idx < len(chan_pos)]
+        stop_pos = chan_pos[stop_idx[stop_idx < len(chan_pos)]]
+        delays = timestamps[stop_pos] - timestamps[sync_pos]
+
+        # Check published histograms; the last incomplete interval is not published.
+        num_intervals = (timestamps[-1] - timestamps[0]) // integration_time
+        histogram_sum = np.zeros(num_bins, dtype=np.uint64)
+        for interval in range(num_intervals):
+            sig = recv.get_next_signal()
+            (correlation,) = sig.args
+            self.assertEqual(correlation.start_timestamp, timestamps[0] + interval * integration_time)
+            self.assertEqual(correlation.channel_pairs, [(64, 0)])
+            self.assertEqual(correlation.min_delay, 0)
+            self.assertEqual(correlation.histogram_data.shape, (1, num_bins))
+            histogram_sum += correlation.histogram_data[0]
+        self.assertFalse(recv.has_signal_ready())
+
+        selected = (timestamps[stop_pos] < timestamps[0] + num_intervals * integration_time)
+        selected &= (delays < num_bins * bin_resolution)
+        expect_histogram = np.bincount(delays[selected] // bin_resolution, minlength=num_bins)
+        self.assertTrue(np.all(histogram_sum == expect_histogram))
+
+        self._multiharp.sig_correlation.unsubscribe(recv)
+
     def test_realtime_countrate(self):
 
         # Generate a random set of events.
@@ -0,0 +1,152 @@
+"""Unit tests for the real-time event processing helpers of the PicoQuant drivers."""
+
+import unittest
+
+import numpy as np
+
+from qmi.instruments.picoquant.support._decoders import EventDataType, EventFilterMode
+from qmi.instruments.picoquant.support._events import _EventFilter
+from qmi.instruments.picoquant.support._realtime import _RealTimeHistogramProcessor, _SyncTracker
+
+
+def make_events(types, timestamps):
+    events = np.empty(len(types), dtype=EventDataType)
+    events["type"] = types
+    events["timestamp"] = timestamps
+    return events
+
+
+class TestSyncTracker(unittest.TestCase):
+
+    def test_first_block(self):
+        """Test SYNC deltas in the first block are only valid after the first SYNC."""
+        tracker = _SyncTracker()
+        events = make_events([0, 64, 1, 0, 64, 1], [5, 10, 12, 17, 30, 31])
+        sync_info = tracker.process(events)
+
+        self.assertListEqual(list(sync_info.sync_events_idx), [1, 4])
+        self.assertEqual(sync_info.previous_sync_timestamp, -1)
+        self.assertEqual(sync_info.first_valid_idx, 1)
+        self.assertListEqual(list(sync_info.sync_deltas[1:]), [0, 2, 7, 0, 1])
+        self.assertEqual(tracker.previous_sync_timestamp, 30)
+
+    def test_carried_sync(self):
+        """Test events at the start of a block use the SYNC of the previous block."""
+        tracker = _SyncTracker()
+        tracker.process(make_events([64, 0], [100, 101]))
+        sync_info = tracker.process(make_events([0, 1, 64, 0], [105, 107, 200, 203]))
+
+        self.assertEqual(sync_info.previous_sync_timestamp, 100)
+        self.assertEqual(sync_info.first_valid_idx, 0)
+        self.assertListEqual(list(sync_info.sync_deltas), [5, 7, 0, 3])
+
+        # Block without SYNC events.
+        sync_info = tracker.process(make_events([1], [250]))
+        self.assertEqual(len(sync_info.sync_events_idx), 0)
+        self.assertListEqual(list(sync_info.sync_deltas), [50])
+
+        tracker.reset()
+        sync_info = tracker.process(make_events([1], [260]))
+        self.assertEqual(sync_info.first_valid_idx, 1)
+
+
+class TestEventFilterBlocks(unittest.TestCase):
+
+    def _random_events(self, num_events, seed):
+        rng = np.random.default_rng(seed)
+        types = rng.choice([0, 1, 64], size=num_events, p=[0.3, 0.3, 0.4])
+        timestamps = np.cumsum(rng.integers(1, 100, size=num_events))
+        return make_events(types, timestamps)
+
+    def test_block_size_independent(self):
+        """Test the filter result does not depend on how the event stream is split into blocks."""
+        events = self._random_events(20000, seed=42)
+        channel_filter = {0: EventFilterMode.APERTURE, 1: EventFilterMode.ALL_EVENTS, 64: EventFilterMode.APERTURE}
+
+        event_filter = _EventFilter()
+        event_filter.set_event_filter_config(channel_filter, (20, 120))
+        expected = event_filter.process_events(events)
+
+        rng = np.random.default_rng(1)
+        split_points = np.sort(rng.integers(0, len(events), size=200))
+        event_filter = _EventFilter()
+        event_filter.set_event_filter_config(channel_filter, (20, 120))
+        result = np.concatenate([event_filter.process_events(block) for block in np.split(events, split_points)])
+
+        self.assertEqual(len(result), len(expected))
+        self.assertTrue(np.all(result == expected))
+
+
+class TestRealTimeHistogramBlocks(unittest.TestCase):
+
+    def _random_events(self, num_events, seed):
+        rng = np.random.default_rng(seed)
+        types = rng.choice([0, 1, 2, 64], size=num_events, p=[0.3, 0.2, 0.2, 0.3])
+        timestamps = np.cumsum(rng.integers(1, 20, size=num_events))
+        return make_events(types, timestamps)
+
+    def _reference_histograms(self, events, channels, resolution, num_bins, num_sync):
+        """Straightforward event-by-event implementation of the real-time histograms."""
+        histograms = []
+        data = None
+        sync_count = 0
+        start_timestamp = 0
+        last_sync = 0
+        for (event_type, timestamp) in zip(events["type"], events["timestamp"]):
+            if event_type == 64:
+                if data is None:
+                    data = np.zeros((len(channels), num_bins), dtype=np.uint32)
+                else:
+                    sync_count += 1
+                    if sync_count == num_sync:
+                        histograms.append((start_timestamp, data))
+                        data = np.zeros((len(channels), num_bins), dtype=np.uint32)
+                        sync_count = 0
+                if sync_count == 0:
+                    start_timestamp = timestamp
+                last_sync = timestamp
+            elif data is not None and event_type in channels:
+                data[channels.index(event_type), min((timestamp - last_sync) // resolution, num_bins - 1)] += 1
+        return histograms
+
+    def _check_histograms(self, num_sync, max_cells=None):
+        events = self._random_events(5000, seed=num_sync)
+        channels = [2, 0]
+        expected = self._reference_histograms(events, channels, 3, 8, num_sync)
+        self.assertGreater(len(expected), 10)
+
+        rng = np.random.default_rng(2)
+        for num_blocks in (1, 7, 300):
+            histograms = []
+            processor = _RealTimeHistogramProcessor(histograms.append, lambda countrate: None)
+            if max_cells is not None:
+                processor.MAX_HISTOGRAM_CELLS = max_cells
+            processor.set_histogram_config(channels, 3, 8, num_sync)
+            split_points = np.sort(rng.integers(0, len(events), size=num_blocks - 1))
+            for block in np.split(events, split_points):
+                processor.process_events(block)
+
+            self.assertEqual(len(histograms), len(expected))
+            for (hist, (start_timestamp, data)) in zip(histograms, expected):
+                self.assertEqual(hist.start_timestamp, start_timestamp)
+                self.assertEqual(hist.num_sync, num_sync)
+                self.assertEqual(hist.channels, channels)
+                self.assertEqual(hist.histogram_data.dtype, np.uint32)
+                np.testing.assert_array_equal(hist.histogram_data, data)
+
+    def test_single_sync(self):
+        """Test histograms integrated over one SYNC period, independent of the block size."""
+        self._check_histograms(num_sync=1)
+
+    def test_multiple_sync(self):
+        """Test histograms integrated over multiple SYNC periods, independent of the block size."""
+        self._check_histograms(num_sync=3)
+
+    def test_chunked_bincount(self):
+        """Test histograms are correct when the intervals of one block are counted in multiple chunks."""
+        self._check_histograms(num_sync=1, max_cells=40)
+        self._check_histograms(num_sync=3, max_cells=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+"""Unit tests for recording PicoQuant TTTR records to disk."""
+
+import os
+import struct
+import tempfile
+import unittest
+
+import h5py
+import numpy as np
+
+from qmi.instruments.picoquant.support._decoders import EventDataType
+from qmi.instruments.picoquant.support._recording import RecordingFormat, _EventRecorder, _RecordingWriter
+
+
+def read_ptu(path):
+    """Minimal PTU reader returning (tags, records)."""
+    tags = {}
+    with open(path, "rb") as f:
+        assert f.read(8) == b"PQTTTR\0\0"
+        f.read(8)
+        while True:
+            (ident, _idx, tag_type) = struct.unpack("<32siI", f.read(40))
+            name = ident.rstrip(b"\0").decode()
+            if tag_type == 0x20000008:
+                (value,) = struct.unpack("<d", f.read(8))
+            else:
+                (value,) = struct.unpack("<q", f.read(8))
+                if tag_type == 0x4001FFFF:
+                    value = f.read(value).rstrip(b"\0").decode()
+            tags[name] = value
+            if name == "Header_End":
+                break
+        records = np.frombuffer(f.read(), dtype="<u4")
+    return tags, records
+
+
+class TestEventRecorder(unittest.TestCase):
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.tmpdir = tmpdir.name
+
+    def test_hdf5(self):
+        """Test decoded events are appended to the HDF5 dataset."""
+        path = os.path.join(self.tmpdir, "events.h5")
+        events = np.empty(1000, dtype=EventDataType)
+        events["type"] = np.arange(1000) % 3
+        events["timestamp"] = np.arange(1000) * 7
+
+        recorder = _EventRecorder(path, RecordingFormat.HDF5, "MH", "T2", 5e-12, 5e-12)
+        self.assertFalse(recorder.raw)
+        recorder.start()
+        for block in np.split(events, [10, 400, 401]):
+            recorder.submit(block)
+        recorder.shutdown()
+        recorder.join()
+
+        self.assertIsNone(recorder.error)
+        status = recorder.get_status()
+        self.assertEqual(status.records_written, 1000)
+        self.assertEqual(status.records_dropped, 0)
+        with h5py.File(path, "r") as f:
+            np.testing.assert_array_equal(f["events"][:], events)
+            self.assertEqual(f["events"].attrs["mode"], "T2")
+            self.assertEqual(f["events"].attrs["global_resolution"], 5e-12)
+
+    def test_ptu(self):
+        """Test raw records are written after a PTU header with the number of records."""
+        path = os.path.join(self.tmpdir, "events.ptu")
+        records = np.arange(5000, dtype=np.uint32)
+
+        recorder = _EventRecorder(path, RecordingFormat.PTU, "HH", "T3", 1e-7, 1e-12)
+        self.assertTrue(recorder.raw)
+        recorder.start()
+        recorder.submit(records[:2000])
+        recorder.submit(records[2000:])
+        recorder.shutdown()
+        recorder.join()
+
+        (tags, records_out) = read_ptu(path)
+        np.testing.assert_array_equal(records_out, records)
+        self.assertEqual(tags["TTResultFormat_TTTRRecType"], 0x01010304)
+        self.assertEqual(tags["TTResult_NumberOfRecords"], 5000)
+        self.assertEqual(tags["Measurement_Mode"], 3)
+        self.assertEqual(tags["MeasDesc_GlobalResolution"], 1e-7)
+        self.assertEqual(tags["MeasDesc_Resolution"], 1e-12)
+
+    def test_queue_full(self):
+        """Test blocks are dropped when the writer queue is full."""
+        path = os.path.join(self.tmpdir, "events.ptu")
+        recorder = _EventRecorder(path, RecordingFormat.PTU, "MH", "T2", 5e-12, 5e-12, max_queued_records=100)
+        # Thread not started, so nothing is written yet.
+        recorder.submit(np.zeros(60, dtype=np.uint32))
+        recorder.submit(np.zeros(60, dtype=np.uint32))
+        recorder.start()
+        recorder.shutdown()
+        recorder.join()
+
+        status = recorder.get_status()
+        self.assertEqual(status.records_written, 60)
+        self.assertEqual(status.records_dropped, 60)
+
+    def test_bad_path(self):
+        """Test an error is raised immediately when the file can not be created."""
+        path = os.path.join(self.tmpdir, "nodir", "events.h5")
+        with self.assertRaises(OSError):
+            _EventRecorder(path, RecordingFormat.HDF5, "MH", "T2", 5e-12, 5e-12)
+
+
+class TestRecordingWriter(unittest.TestCase):
+
+    def test_incomplete_writer(self):
+        """Test a writer which does not implement all methods can not be created."""
+        class IncompleteWriter(_RecordingWriter):
+            def write(self, records):
+                pass
+
+        with self.assertRaises(TypeError):
+            IncompleteWriter()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""Unit tests for the pending event buffer of the PicoQuant drivers."""
+
+import unittest
+
+import numpy as np
+
+from qmi.instruments.picoquant.support._decoders import EventDataType
+from qmi.instruments.picoquant.support._ringbuffer import EventOverflowPolicy, _EventRingBuffer
+
+
+def make_events(start, count):
+    events = np.empty(count, dtype=EventDataType)
+    events["type"] = 1
+    events["timestamp"] = np.arange(start, start + count)
+    return events
+
+
+class TestEventRingBuffer(unittest.TestCase):
+
+    def test_fifo_order(self):
+        """Test events are returned in order, also when the storage wraps around."""
+        buffer = _EventRingBuffer(10)
+        buffer.append(make_events(0, 7))
+        np.testing.assert_array_equal(buffer.pop(5)["timestamp"], np.arange(0, 5))
+        buffer.append(make_events(7, 8))
+        self.assertEqual(len(buffer), 10)
+
+        events = buffer.pop(4)
+        np.testing.assert_array_equal(events["timestamp"], np.arange(5, 9))
+        np.testing.assert_array_equal(buffer.pop(100)["timestamp"], np.arange(9, 15))
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(len(buffer.pop(100)), 0)
+        self.assertEqual(buffer.pop(100).dtype, EventDataType)
+
+    def test_popped_events_are_copies(self):
+        """Test returned events are not overwritten by subsequent events."""
+        buffer = _EventRingBuffer(4)
+        buffer.append(make_events(0, 4))
+        events = buffer.pop(4)
+        buffer.append(make_events(100, 4))
+        np.testing.assert_array_equal(events["timestamp"], np.arange(0, 4))
+
+    def test_storage_grows(self):
+        """Test storage is allocated on demand up to the capacity."""
+        buffer = _EventRingBuffer(100)
+        buffer.INITIAL_SIZE = 8
+        buffer.append(make_events(0, 5))
+        buffer.pop(3)
+        for start in range(5, 95, 10):
+            buffer.append(make_events(start, 10))
+        self.assertEqual(len(buffer), 92)
+        np.testing.assert_array_equal(buffer.pop(100)["timestamp"], np.arange(3, 95))
+
+    def test_raise_policy(self):
+        """Test events which do not fit are dropped and the overflow is flagged."""
+        buffer = _EventRingBuffer(10, EventOverflowPolicy.RAISE)
+        buffer.append(make_events(0, 6))
+        buffer.append(make_events(6, 6))
+        self.assertTrue(buffer.overflow)
+        self.assertEqual(len(buffer), 6)
+
+        buffer.discard()
+        self.assertFalse(buffer.overflow)
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(buffer.get_status().dropped_events, 12)
+
+    def test_drop_newest_policy(self):
+        """Test new events beyond the capacity are dropped."""
+        buffer = _EventRingBuffer(10, EventOverflowPolicy.DROP_NEWEST)
+        buffer.append(make_events(0, 6))
+        buffer.append(make_events(6, 6))
+        self.assertFalse(buffer.overflow)
+        np.testing.assert_array_equal(buffer.pop(100)["timestamp"], np.arange(0, 10))
+        self.assertEqual(buffer.get_status().dropped_events, 2)
+
+    def test_drop_oldest_policy(self):
+        """Test the oldest events are dropped to make room for new events."""
+        buffer = _EventRingBuffer(10, EventOverflowPolicy.DROP_OLDEST)
+        buffer.append(make_events(0, 6))
+        buffer.append(make_events(6, 6))
+        self.assertFalse(buffer.overflow)
+        np.testing.assert_array_equal(buffer.pop(100)["timestamp"], np.arange(2, 12))
+
+        buffer.append(make_events(0, 3))
+        buffer.append(make_events(3, 25))
+        np.testing.assert_array_equal(buffer.pop(100)["timestamp"], np.arange(18, 28))
+
+        status = buffer.get_status()
+        self.assertEqual(status.capacity, 10)
+        self.assertEqual(status.pending_events, 0)
+        self.assertEqual(status.dropped_events, 20)
+        self.assertEqual(status.overflow_policy, EventOverflowPolicy.DROP_OLDEST)
+
+        buffer.clear()
+        self.assertEqual(buffer.get_status().dropped_events, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
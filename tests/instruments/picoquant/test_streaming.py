@@ -0,0 +1,80 @@
+"""Unit tests for streaming PicoQuant event records in chunks."""
+
+import time
+import unittest
+
+import numpy as np
+
+from qmi.instruments.picoquant.support._decoders import EventDataType
+from qmi.instruments.picoquant.support._streaming import _EventStreamer
+
+
+def make_events(start, num_events):
+    events = np.zeros(num_events, dtype=EventDataType)
+    events["timestamp"] = np.arange(start, start + num_events)
+    return events
+
+
+class TestEventStreamer(unittest.TestCase):
+
+    def setUp(self):
+        self.chunks = []
+        self.streamer = _EventStreamer(self.chunks.append)
+
+    def test_disabled(self):
+        """Test streaming is initially disabled, and can not be enabled without publishing function."""
+        self.assertFalse(self.streamer.enabled)
+        with self.assertRaises(ValueError):
+            _EventStreamer(None).configure(100, 1.0)
+
+    def test_full_chunks(self):
+        """Test events are split into full chunks with consecutive sequence numbers."""
+        self.streamer.configure(100, 10.0)
+        self.assertTrue(self.streamer.enabled)
+        self.streamer.append(make_events(0, 150), 1.0)
+        self.streamer.append(make_events(150, 120), 2.0)
+
+        self.assertEqual([len(chunk.events) for chunk in self.chunks], [100, 100])
+        self.assertEqual([chunk.sequence_number for chunk in self.chunks], [0, 1])
+        self.assertEqual([chunk.timestamp for chunk in self.chunks], [1.0, 2.0])
+
+        self.streamer.flush()
+        self.assertEqual(len(self.chunks[2].events), 70)
+        events = np.concatenate([chunk.events for chunk in self.chunks])
+        np.testing.assert_array_equal(events, make_events(0, 270))
+
+    def test_chunk_age(self):
+        """Test a partial chunk is published once its oldest event reaches the maximum age."""
+        self.streamer.configure(100, 0.05)
+        self.streamer.append(make_events(0, 10), 1.0)
+        self.streamer.poll()
+        self.assertEqual(self.chunks, [])
+
+        time.sleep(0.06)
+        self.streamer.poll()
+        self.assertEqual(len(self.chunks), 1)
+        self.assertEqual(len(self.chunks[0].events), 10)
+
+    def test_reset(self):
+        """Test reset discards pending events and restarts the sequence numbers."""
+        self.streamer.configure(10, 10.0)
+        self.streamer.append(make_events(0, 15), 1.0)
+        self.streamer.reset()
+        self.streamer.flush()
+        self.assertEqual(len(self.chunks), 1)
+
+        self.streamer.append(make_events(0, 10), 2.0)
+        self.assertEqual(self.chunks[1].sequence_number, 0)
+
+    def test_configure_flushes(self):
+        """Test pending events are published before the configuration changes."""
+        self.streamer.configure(10, 10.0)
+        self.streamer.append(make_events(0, 5), 1.0)
+        self.streamer.configure(0, 0.0)
+        self.assertFalse(self.streamer.enabled)
+        self.assertEqual(len(self.chunks), 1)
+        self.assertEqual(len(self.chunks[0].events), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,9 @@ import unittest
 
 import numpy as np
 
-from qmi.instruments.picoquant.support._realtime import TttrHistogram
+from qmi.instruments.picoquant.support._decoders import SYNC_TYPE
+from qmi.instruments.picoquant.support._realtime import MultiChannelTttrHistogram, TttrHistogram
+from tests.instruments.picoquant.synthetic_data import make_t2_events
 
 
 class PicoQuantSomeHarpOpenTestCase(unittest.TestCase):
@@ -82,5 +84,47 @@ class PicoQuantSomeHarpOpenTestCase(unittest.TestCase):
         self.assertIsNone(self._tttr_histogram.deltas)
 
 
+class TestMultiChannelTttrHistogram(unittest.TestCase):
+
+    @staticmethod
+    def _reference_counts(events, channel, num_bins, bin_width):
+        """Straightforward per-event histogram of the time since the most recent SYNC event."""
+        counts = np.zeros(num_bins, dtype=np.uint64)
+        last_sync = None
+        for (event_type, timestamp) in events.tolist():
+            if event_type == SYNC_TYPE:
+                last_sync = timestamp
+            elif (event_type == channel) and (last_sync is not None):
+                delta = timestamp - last_sync
+                if delta < num_bins * bin_width:
+                    counts[delta // bin_width] += 1
+        return counts
+
+    def test_multi_channel_blocks(self):
+        """Test histograms of several channels with bin coarsening, processed in blocks."""
+        events = make_t2_events(5000, sync_period=1000, channels=(0, 1, 2), seed=1)
+        histogram = MultiChannelTttrHistogram([0, 2], 50, bin_width=16)
+        for pos in range(0, len(events), 333):
+            histogram.process(events[pos:pos + 333])
+
+        self.assertEqual(histogram.histogram_data.shape, (2, 50))
+        np.testing.assert_array_equal(histogram.histogram_data[0], self._reference_counts(events, 0, 50, 16))
+        np.testing.assert_array_equal(histogram.histogram_data[1], self._reference_counts(events, 2, 50, 16))
+        self.assertEqual(histogram.previous, int(events["timestamp"][events["type"] == SYNC_TYPE][-1]))
+
+    def test_get_plot_data(self):
+        """Test bin start times take the bin width into account."""
+        histogram = MultiChannelTttrHistogram([0, 1], 4, bin_width=10)
+        (bin_times, counts, num_bins) = histogram.get_plot_data(1e-12)
+        np.testing.assert_allclose(bin_times, [0.0, 0.01, 0.02, 0.03])
+        self.assertEqual(counts.shape, (2, 4))
+        self.assertEqual(num_bins, 4)
+
+    def test_invalid_bin_width(self):
+        """Test a bin width below 1 is rejected."""
+        with self.assertRaises(ValueError):
+            MultiChannelTttrHistogram([0], 10, bin_width=0)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,64 @@
+#! /usr/bin/env python
+
+"""Test qmi/tools/qmi_tool.py"""
+import unittest
+
+from qmi.core.rpc import QMI_RpcMethodStatistics
+from qmi.core.util import TimingHistogram
+from qmi.tools import qmi_tool
+
+
+def _make_statistics(object_name, method_name, calls, execution_times, round_trip_times):
+    execution_time = TimingHistogram()
+    for value in execution_times:
+        execution_time.add(value)
+    round_trip_time = TimingHistogram()
+    for value in round_trip_times:
+        round_trip_time.add(value)
+    return QMI_RpcMethodStatistics(object_name=object_name,
+                                   method_name=method_name,
+                                   calls=calls,
+                                   errors=0,
+                                   queue_wait=TimingHistogram().snapshot(),
+                                   execution_time=execution_time.snapshot(),
+                                   round_trip_time=round_trip_time.snapshot())
+
+
+class TestRpcTop(unittest.TestCase):
+
+    def test_merge_rpc_statistics(self):
+        """Statistics of the hosting context and calling contexts are combined per method."""
+        server = [_make_statistics("srv.obj", "slow", 2, [0.1, 0.3], []),
+                  _make_statistics("srv.$context", "get_rpc_statistics", 1, [0.001], [])]
+        client1 = [_make_statistics("srv.obj", "slow", 0, [], [0.2])]
+        client2 = [_make_statistics("srv.obj", "slow", 0, [], [0.4])]
+
+        merged = qmi_tool.merge_rpc_statistics([server, client1, client2])
+
+        self.assertEqual(list(merged.keys()), [("srv.obj", "slow")])
+        stats = merged[("srv.obj", "slow")]
+        self.assertEqual(stats.calls, 2)
+        self.assertAlmostEqual(stats.execution_time.mean, 0.2)
+        self.assertEqual(stats.round_trip_time.num_values, 2)
+        self.assertAlmostEqual(stats.round_trip_time.mean, 0.3)
+        self.assertEqual(stats.round_trip_time.max, 0.4)
+        self.assertEqual(sum(stats.round_trip_time.counts), 2)
+
+    def test_format_rpc_top(self):
+        """The busiest methods are shown first, with call rates since the previous refresh."""
+        previous = {("srv.obj", "fast"): _make_statistics("srv.obj", "fast", 100, [0.001], [])}
+        current = {("srv.obj", "fast"): _make_statistics("srv.obj", "fast", 300, [0.001], []),
+                   ("srv.obj", "slow"): _make_statistics("srv.obj", "slow", 10, [0.5], [])}
+
+        lines = qmi_tool.format_rpc_top(current, previous, interval=2.0)
+
+        self.assertEqual(len(lines), 3)
+        self.assertIn("calls/s", lines[0])
+        self.assertIn("slow", lines[1])
+        self.assertIn("fast", lines[2])
+        self.assertIn(" 100.0 ", lines[2])
+        self.assertIn(" 5.0 ", lines[1])
+
+
+if __name__ == "__main__":
+    unittest.main()